@@ -0,0 +1,26 @@
+"""Add bytes_balances guild/last_daily index
+
+Revision ID: a4c91e6b3d28
+Revises: f2b7d4e19a63
+Create Date: 2026-10-17 16:10:37.529184
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4c91e6b3d28'
+down_revision = 'f2b7d4e19a63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('bytes_balances', schema=None) as batch_op:
+        batch_op.create_index('ix_bytes_balances_guild_last_daily', ['guild_id', 'last_daily'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('bytes_balances', schema=None) as batch_op:
+        batch_op.drop_index('ix_bytes_balances_guild_last_daily')
@@ -0,0 +1,154 @@
+"""Partition security_logs by day and add rate limit index
+
+Revision ID: b7c41e9d2a6f
+Revises: 1f214f10f9ba
+Create Date: 2026-10-17 09:12:44.318205
+
+"""
+from datetime import datetime, timedelta, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7c41e9d2a6f'
+down_revision = '1f214f10f9ba'
+branch_labels = None
+depends_on = None
+
+
+# Days of partitions created ahead of today; the maintenance task keeps this topped up
+DAYS_AHEAD = 7
+
+COLUMNS_SQL = """
+    id UUID NOT NULL,
+    action VARCHAR(100) NOT NULL,
+    api_key_id UUID,
+    user_identifier VARCHAR(255),
+    ip_address VARCHAR(45),
+    user_agent VARCHAR(512),
+    request_id VARCHAR(100),
+    success BOOLEAN NOT NULL,
+    details TEXT NOT NULL,
+    event_metadata JSON,
+    timestamp TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL
+"""
+
+COLUMN_NAMES = (
+    "id, action, api_key_id, user_identifier, ip_address, user_agent, request_id, "
+    "success, details, event_metadata, timestamp, created_at, updated_at"
+)
+
+INDEXES = [
+    ('ix_security_logs_action', ['action']),
+    ('ix_security_logs_action_timestamp', ['action', 'timestamp']),
+    ('ix_security_logs_api_key_id', ['api_key_id']),
+    ('ix_security_logs_api_key_timestamp', ['api_key_id', 'timestamp']),
+    ('ix_security_logs_api_key_action_created', ['api_key_id', 'action', 'created_at']),
+    ('ix_security_logs_ip_address', ['ip_address']),
+    ('ix_security_logs_ip_timestamp', ['ip_address', 'timestamp']),
+    ('ix_security_logs_request_id', ['request_id']),
+    ('ix_security_logs_success', ['success']),
+    ('ix_security_logs_success_timestamp', ['success', 'timestamp']),
+    ('ix_security_logs_timestamp', ['timestamp']),
+    ('ix_security_logs_user_identifier', ['user_identifier']),
+    ('ix_security_logs_user_timestamp', ['user_identifier', 'timestamp']),
+]
+
+
+def _create_indexes() -> None:
+    for name, columns in INDEXES:
+        op.create_index(name, 'security_logs', columns, unique=False)
+
+
+def _create_daily_partition(day) -> None:
+    start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    end = start + timedelta(days=1)
+    op.execute(
+        f"CREATE TABLE IF NOT EXISTS security_logs_p{day:%Y%m%d} "
+        f"PARTITION OF security_logs "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name != 'postgresql':
+        # No native partitioning; just add the rate limit index
+        with op.batch_alter_table('security_logs', schema=None) as batch_op:
+            batch_op.create_index('ix_security_logs_api_key_action_created', ['api_key_id', 'action', 'created_at'], unique=False)
+        return
+
+    # Build the partitioned table next to the existing one
+    op.execute(f"""
+        CREATE TABLE security_logs_partitioned (
+            {COLUMNS_SQL},
+            CONSTRAINT pk_security_logs_partitioned PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("ALTER TABLE security_logs RENAME TO security_logs_unpartitioned")
+    op.execute("ALTER TABLE security_logs_partitioned RENAME TO security_logs")
+    op.execute("ALTER TABLE security_logs RENAME CONSTRAINT pk_security_logs_partitioned TO pk_security_logs_new")
+    op.execute("CREATE TABLE security_logs_default PARTITION OF security_logs DEFAULT")
+
+    # One partition per day that has data, plus the days ahead
+    today = datetime.now(timezone.utc).date()
+    oldest = bind.execute(sa.text("SELECT min(created_at) FROM security_logs_unpartitioned")).scalar()
+    first_day = oldest.astimezone(timezone.utc).date() if oldest else today
+    day = first_day
+    while day <= today + timedelta(days=DAYS_AHEAD):
+        _create_daily_partition(day)
+        day += timedelta(days=1)
+
+    op.execute(f"""
+        INSERT INTO security_logs ({COLUMN_NAMES})
+        SELECT {COLUMN_NAMES} FROM security_logs_unpartitioned
+    """)
+    op.execute("DROP TABLE security_logs_unpartitioned")
+    op.execute("ALTER TABLE security_logs RENAME CONSTRAINT pk_security_logs_new TO pk_security_logs")
+
+    op.create_foreign_key(
+        op.f('fk_security_logs_api_key_id_api_keys'),
+        'security_logs', 'api_keys',
+        ['api_key_id'], ['id'],
+        ondelete='SET NULL'
+    )
+    _create_indexes()
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name != 'postgresql':
+        with op.batch_alter_table('security_logs', schema=None) as batch_op:
+            batch_op.drop_index('ix_security_logs_api_key_action_created')
+        return
+
+    op.execute("ALTER TABLE security_logs RENAME TO security_logs_partitioned")
+    op.execute(f"""
+        CREATE TABLE security_logs (
+            {COLUMNS_SQL},
+            CONSTRAINT pk_security_logs_plain PRIMARY KEY (id)
+        )
+    """)
+    op.execute(f"""
+        INSERT INTO security_logs ({COLUMN_NAMES})
+        SELECT {COLUMN_NAMES} FROM security_logs_partitioned
+    """)
+    # Dropping the parent drops every partition and its indexes
+    op.execute("DROP TABLE security_logs_partitioned")
+    op.execute("ALTER TABLE security_logs RENAME CONSTRAINT pk_security_logs_plain TO pk_security_logs")
+
+    op.create_foreign_key(
+        op.f('fk_security_logs_api_key_id_api_keys'),
+        'security_logs', 'api_keys',
+        ['api_key_id'], ['id'],
+        ondelete='SET NULL'
+    )
+    for name, columns in INDEXES:
+        if name != 'ix_security_logs_api_key_action_created':
+            op.create_index(name, 'security_logs', columns, unique=False)
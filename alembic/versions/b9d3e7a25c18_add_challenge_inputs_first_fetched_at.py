@@ -0,0 +1,29 @@
+"""Add challenge_inputs.first_fetched_at
+
+Revision ID: b9d3e7a25c18
+Revises: a4c91e6b3d28
+Create Date: 2026-10-17 17:05:12.418302
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9d3e7a25c18'
+down_revision = 'a4c91e6b3d28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('challenge_inputs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('first_fetched_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Existing inputs were generated on first fetch, so their timer started then
+    op.execute("UPDATE challenge_inputs SET first_fetched_at = created_at")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('challenge_inputs', schema=None) as batch_op:
+        batch_op.drop_column('first_fetched_at')
@@ -0,0 +1,26 @@
+"""Add bytes_balances leaderboard index
+
+Revision ID: c3a8f0d14e27
+Revises: b7c41e9d2a6f
+Create Date: 2026-10-17 11:03:27.540912
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3a8f0d14e27'
+down_revision = 'b7c41e9d2a6f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('bytes_balances', schema=None) as batch_op:
+        batch_op.create_index('ix_bytes_balances_guild_balance', ['guild_id', 'balance'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('bytes_balances', schema=None) as batch_op:
+        batch_op.drop_index('ix_bytes_balances_guild_balance')
@@ -0,0 +1,68 @@
+"""Add campaign_squad_scores table
+
+Revision ID: c6e1f4a83d27
+Revises: b9d3e7a25c18
+Create Date: 2026-10-17 17:48:33.150927
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6e1f4a83d27'
+down_revision = 'b9d3e7a25c18'
+branch_labels = None
+depends_on = None
+
+
+# Same totals campaign_scores.rebuild_campaign_scores computes, for every campaign
+BACKFILL_SQL = """
+INSERT INTO campaign_squad_scores (
+    campaign_id, squad_id, total_points, challenges_completed, submission_count,
+    challenge_points, created_at, updated_at
+)
+SELECT
+    c.campaign_id,
+    s.squad_id,
+    coalesce(sum(s.points_earned) FILTER (WHERE s.is_first_success), 0),
+    count(*) FILTER (WHERE s.is_first_success),
+    count(*),
+    coalesce(
+        json_object_agg(s.challenge_id::text, coalesce(s.points_earned, 0)) FILTER (WHERE s.is_first_success),
+        '{}'::json
+    ),
+    now(),
+    now()
+FROM challenge_submissions AS s
+JOIN challenges AS c ON c.id = s.challenge_id
+GROUP BY c.campaign_id, s.squad_id
+"""
+
+
+def upgrade() -> None:
+    op.create_table('campaign_squad_scores',
+    sa.Column('campaign_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('squad_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('total_points', sa.Integer(), nullable=False),
+    sa.Column('challenges_completed', sa.Integer(), nullable=False),
+    sa.Column('submission_count', sa.Integer(), nullable=False),
+    sa.Column('challenge_points', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.id'], name=op.f('fk_campaign_squad_scores_campaign_id_campaigns'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['squad_id'], ['squads.id'], name=op.f('fk_campaign_squad_scores_squad_id_squads'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('campaign_id', 'squad_id', name=op.f('pk_campaign_squad_scores'))
+    )
+    with op.batch_alter_table('campaign_squad_scores', schema=None) as batch_op:
+        batch_op.create_index('ix_campaign_squad_scores_campaign_points', ['campaign_id', 'total_points'], unique=False)
+
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('campaign_squad_scores', schema=None) as batch_op:
+        batch_op.drop_index('ix_campaign_squad_scores_campaign_points')
+
+    op.drop_table('campaign_squad_scores')
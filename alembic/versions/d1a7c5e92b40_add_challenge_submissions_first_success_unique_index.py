@@ -0,0 +1,89 @@
+"""Add unique partial index on challenge_submissions first successes
+
+Revision ID: d1a7c5e92b40
+Revises: c6e1f4a83d27
+Create Date: 2026-10-17 18:31:07.662514
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd1a7c5e92b40'
+down_revision = 'c6e1f4a83d27'
+branch_labels = None
+depends_on = None
+
+
+# Concurrent correct submissions could both be recorded as the first success
+# before this index existed; keep only the earliest of each
+DEDUPLICATE_SQL = """
+UPDATE challenge_submissions
+SET is_first_success = false, points_earned = NULL
+WHERE is_first_success
+  AND id NOT IN (
+    SELECT DISTINCT ON (challenge_id, squad_id) id
+    FROM challenge_submissions
+    WHERE is_first_success
+    ORDER BY challenge_id, squad_id, submitted_at, id
+  )
+RETURNING challenge_id, squad_id
+"""
+
+# campaign_squad_scores rows for a squad in a challenge's campaign, rebuilt
+# with the same totals as BACKFILL_SQL in c6e1f4a83d27
+DELETE_SCORES_SQL = """
+DELETE FROM campaign_squad_scores
+WHERE squad_id = :squad_id
+  AND campaign_id = (SELECT campaign_id FROM challenges WHERE id = :challenge_id)
+"""
+
+RESCORE_SQL = """
+INSERT INTO campaign_squad_scores (
+    campaign_id, squad_id, total_points, challenges_completed, submission_count,
+    challenge_points, created_at, updated_at
+)
+SELECT
+    c.campaign_id,
+    s.squad_id,
+    coalesce(sum(s.points_earned) FILTER (WHERE s.is_first_success), 0),
+    count(*) FILTER (WHERE s.is_first_success),
+    count(*),
+    coalesce(
+        json_object_agg(s.challenge_id::text, coalesce(s.points_earned, 0)) FILTER (WHERE s.is_first_success),
+        '{}'::json
+    ),
+    now(),
+    now()
+FROM challenge_submissions AS s
+JOIN challenges AS c ON c.id = s.challenge_id
+WHERE s.squad_id = :squad_id
+  AND c.campaign_id = (SELECT campaign_id FROM challenges WHERE id = :challenge_id)
+GROUP BY c.campaign_id, s.squad_id
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    demoted = set(bind.execute(sa.text(DEDUPLICATE_SQL)).fetchall())
+
+    # The demoted points were counted in the campaign scoreboard
+    for challenge_id, squad_id in demoted:
+        params = {"challenge_id": challenge_id, "squad_id": squad_id}
+        bind.execute(sa.text(DELETE_SCORES_SQL), params)
+        bind.execute(sa.text(RESCORE_SQL), params)
+
+    with op.batch_alter_table('challenge_submissions', schema=None) as batch_op:
+        batch_op.create_index(
+            'uq_challenge_submissions_first_success',
+            ['challenge_id', 'squad_id'],
+            unique=True,
+            postgresql_where=sa.text('is_first_success'),
+            sqlite_where=sa.text('is_first_success')
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('challenge_submissions', schema=None) as batch_op:
+        batch_op.drop_index('uq_challenge_submissions_first_success')
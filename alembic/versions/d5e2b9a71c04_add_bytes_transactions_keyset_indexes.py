@@ -0,0 +1,35 @@
+"""Add bytes_transactions keyset pagination indexes
+
+Revision ID: d5e2b9a71c04
+Revises: c3a8f0d14e27
+Create Date: 2026-10-17 12:21:08.114630
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5e2b9a71c04'
+down_revision = 'c3a8f0d14e27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('bytes_transactions', schema=None) as batch_op:
+        batch_op.create_index('ix_bytes_transactions_guild_giver_created', ['guild_id', 'giver_id', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_bytes_transactions_guild_receiver_created', ['guild_id', 'receiver_id', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_bytes_transactions_guild_created', ['guild_id', 'created_at', 'id'], unique=False)
+        # Prefixes of the new indexes
+        batch_op.drop_index('ix_bytes_transactions_guild_giver')
+        batch_op.drop_index('ix_bytes_transactions_guild_receiver')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('bytes_transactions', schema=None) as batch_op:
+        batch_op.create_index('ix_bytes_transactions_guild_giver', ['guild_id', 'giver_id'], unique=False)
+        batch_op.create_index('ix_bytes_transactions_guild_receiver', ['guild_id', 'receiver_id'], unique=False)
+        batch_op.drop_index('ix_bytes_transactions_guild_created')
+        batch_op.drop_index('ix_bytes_transactions_guild_receiver_created')
+        batch_op.drop_index('ix_bytes_transactions_guild_giver_created')
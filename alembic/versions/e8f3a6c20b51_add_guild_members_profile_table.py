@@ -0,0 +1,59 @@
+"""Add guild_members profile table
+
+Revision ID: e8f3a6c20b51
+Revises: d5e2b9a71c04
+Create Date: 2026-10-17 13:40:52.907316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8f3a6c20b51'
+down_revision = 'd5e2b9a71c04'
+branch_labels = None
+depends_on = None
+
+
+# Latest non-empty username per (guild_id, user_id) across both sides of
+# every transaction, the same derivation the members page used to run per load
+BACKFILL_SQL = """
+INSERT INTO guild_members (guild_id, user_id, username, last_seen_at, created_at, updated_at)
+SELECT guild_id, user_id, substr(username, 1, 100), last_seen_at, last_seen_at, last_seen_at
+FROM (
+    SELECT
+        guild_id,
+        user_id,
+        username,
+        max(created_at) OVER (PARTITION BY guild_id, user_id) AS last_seen_at,
+        row_number() OVER (PARTITION BY guild_id, user_id ORDER BY created_at DESC) AS rn
+    FROM (
+        SELECT guild_id, giver_id AS user_id, giver_username AS username, created_at
+        FROM bytes_transactions
+        WHERE giver_id <> 'SYSTEM' AND giver_username IS NOT NULL AND giver_username <> ''
+        UNION ALL
+        SELECT guild_id, receiver_id AS user_id, receiver_username AS username, created_at
+        FROM bytes_transactions
+        WHERE receiver_id <> 'SYSTEM' AND receiver_username IS NOT NULL AND receiver_username <> ''
+    ) AS activity
+) AS ranked
+WHERE rn = 1
+"""
+
+
+def upgrade() -> None:
+    op.create_table('guild_members',
+    sa.Column('guild_id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('username', sa.String(length=100), nullable=False),
+    sa.Column('last_seen_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('guild_id', 'user_id', name=op.f('pk_guild_members'))
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    op.drop_table('guild_members')
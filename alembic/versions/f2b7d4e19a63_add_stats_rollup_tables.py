@@ -0,0 +1,47 @@
+"""Add daily_stats and guild_stats rollup tables
+
+Revision ID: f2b7d4e19a63
+Revises: e8f3a6c20b51
+Create Date: 2026-10-17 15:02:16.483920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b7d4e19a63'
+down_revision = 'e8f3a6c20b51'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Filled by the stats rollup task on its first run
+    op.create_table('daily_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('transaction_count', sa.BigInteger(), nullable=False),
+    sa.Column('api_request_count', sa.BigInteger(), nullable=False),
+    sa.Column('help_conversation_count', sa.BigInteger(), nullable=False),
+    sa.Column('help_tokens', sa.BigInteger(), nullable=False),
+    sa.Column('help_response_time_total_ms', sa.BigInteger(), nullable=False),
+    sa.Column('help_response_count', sa.BigInteger(), nullable=False),
+    sa.Column('forum_tokens', sa.BigInteger(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('day', name=op.f('pk_daily_stats'))
+    )
+    op.create_table('guild_stats',
+    sa.Column('guild_id', sa.String(), nullable=False),
+    sa.Column('user_count', sa.BigInteger(), nullable=False),
+    sa.Column('squad_count', sa.BigInteger(), nullable=False),
+    sa.Column('bytes_total', sa.BigInteger(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('guild_id', name=op.f('pk_guild_stats'))
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('guild_stats')
+    op.drop_table('daily_stats')
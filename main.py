@@ -8,6 +8,7 @@ from starlette.requests import Request
 from starlette.middleware import Middleware
 from starlette.middleware.sessions import SessionMiddleware
 import uvicorn
+from contextlib import asynccontextmanager
 from sqlalchemy import select
 
 # Import FastAPI app
@@ -207,10 +208,18 @@ middleware = [
     )
 ]
 
+@asynccontextmanager
+async def lifespan(app):
+    # Mounted applications do not receive lifespan events, so run the API's
+    # startup/shutdown (background writers, listeners) from here
+    async with api.router.lifespan_context(api):
+        yield
+
 app = Starlette(
     routes=routes,
     exception_handlers=exception_handlers,
     middleware=middleware,
+    lifespan=lifespan,
 )
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
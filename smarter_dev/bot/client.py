@@ -7,7 +7,6 @@ import logging
 import random
 import uuid
 from dataclasses import dataclass
-from datetime import UTC
 from datetime import datetime
 
 import hikari
@@ -16,10 +15,20 @@ import lightbulb
 from smarter_dev.shared.config import Settings
 from smarter_dev.shared.config import get_settings
 from smarter_dev.bot.services.api_client import APIClient
+from smarter_dev.bot.services.daily_claim_store import DailyClaimStore
+from smarter_dev.bot.services.rate_scheduler import Priority, request_priority
 
 logger = logging.getLogger(__name__)
 
 
+class BotApp(lightbulb.BotApp):
+    """Lightbulb bot whose slash commands get first claim on API rate limits."""
+
+    async def invoke_application_command(self, context: lightbulb.ApplicationContext) -> None:
+        with request_priority(Priority.INTERACTIVE):
+            await super().invoke_application_command(context)
+
+
 async def store_streak_celebration(
     guild_id: str,
     channel_id: str,
@@ -100,11 +109,6 @@ async def store_streak_celebration(
         return False
 
 
-# Cache to track users who have already claimed their daily reward today
-# Format: {f"{guild_id}:{user_id}": "YYYY-MM-DD"}
-daily_claim_cache: dict[str, str] = {}
-
-
 @dataclass
 class ForumPostData:
     """Data structure for forum post information."""
@@ -118,36 +122,6 @@ class ForumPostData:
     guild_id: str
 
 
-def get_utc_date_string() -> str:
-    """Get current UTC date as YYYY-MM-DD string."""
-    return datetime.now(UTC).strftime("%Y-%m-%d")
-
-
-def has_claimed_today(guild_id: str, user_id: str) -> bool:
-    """Check if user has already claimed their daily reward today."""
-    cache_key = f"{guild_id}:{user_id}"
-    today = get_utc_date_string()
-    return daily_claim_cache.get(cache_key) == today
-
-
-def mark_claimed_today(guild_id: str, user_id: str) -> None:
-    """Mark user as having claimed their daily reward today."""
-    cache_key = f"{guild_id}:{user_id}"
-    today = get_utc_date_string()
-    daily_claim_cache[cache_key] = today
-    logger.debug(f"Marked {user_id} as claimed for {today} in guild {guild_id}")
-
-
-def cleanup_old_cache_entries() -> None:
-    """Remove cache entries from previous days to prevent memory leaks."""
-    today = get_utc_date_string()
-    old_keys = [key for key, date_str in daily_claim_cache.items() if date_str != today]
-    for key in old_keys:
-        del daily_claim_cache[key]
-    if old_keys:
-        logger.debug(f"Cleaned up {len(old_keys)} old cache entries")
-
-
 # Fun and techy status messages that rotate every 5 minutes
 STATUS_MESSAGES = [
     "🚀 Compiling bytes...",
@@ -214,26 +188,23 @@ async def start_status_rotation(bot: lightbulb.BotApp) -> None:
     logger.info("Started status rotation (5-minute intervals)")
 
 
-async def start_cache_cleanup() -> None:
-    """Start the periodic cache cleanup for daily claim tracking."""
-    async def cleanup_cache():
-        """Clean up old cache entries every hour."""
-        while True:
-            try:
-                # Clean up old entries
-                cleanup_old_cache_entries()
-
-                # Wait 1 hour before next cleanup
-                await asyncio.sleep(3600)  # 3600 seconds = 1 hour
-
-            except Exception as e:
-                logger.error(f"Error cleaning up cache: {e}")
-                # Wait a bit before retrying
-                await asyncio.sleep(300)  # 5 minutes
+async def warm_daily_claim_store(bot: lightbulb.BotApp) -> None:
+    """Load today's daily claims for every guild the bot is in.
+    
+    Args:
+        bot: Bot application instance
+    """
+    store = getattr(bot, "d", {}).get("daily_claim_store")
+    bytes_service = getattr(bot, "d", {}).get("bytes_service")
+    if not store or not bytes_service:
+        return
 
-    # Start the cleanup task
-    asyncio.create_task(cleanup_cache())
-    logger.info("Started daily claim cache cleanup (hourly intervals)")
+    try:
+        guild_ids = [str(guild_id) for guild_id in bot.cache.get_guilds_view()]
+        loaded = await store.warm(guild_ids, bytes_service.get_daily_claimers)
+        logger.info(f"Loaded {loaded} daily claims for {len(guild_ids)} guilds")
+    except Exception as e:
+        logger.error(f"Failed to warm daily claim store: {e}")
 
 
 async def initialize_single_guild_configuration(guild_id: str) -> None:
@@ -305,7 +276,7 @@ def create_bot(settings: Settings | None = None) -> lightbulb.BotApp:
     )
 
     # Create bot instance using Lightbulb BotApp (v2 syntax)
-    bot = lightbulb.BotApp(
+    bot = BotApp(
         token=settings.discord_bot_token,
         intents=intents,
         logs={
@@ -340,11 +311,55 @@ async def setup_bot_services(bot: lightbulb.BotApp) -> None:
         api_client = APIClient(
             base_url=api_base_url,  # Web API base URL from settings
             api_key=api_key,  # Use secure API key for auth
-            default_timeout=30.0
+            default_timeout=30.0,
+            http2=settings.bot_api_http2,
+            http2_connections=settings.bot_api_http2_connections,
+            keepalive_expiry=settings.bot_api_keepalive_expiry,
+            coalesce_gets=settings.bot_api_coalesce_gets,
+            batch_window=settings.bot_api_batch_window_ms / 1000
         )
+        if settings.bot_api_warmup_connections > 0:
+            await api_client.warmup(settings.bot_api_warmup_connections)
 
-        # Bot doesn't use caching - pass None for cache manager
+        # In-process LRU, optionally in front of a shared Redis cache
         cache_manager = None
+        if settings.bot_cache_enabled:
+            from smarter_dev.bot.services.tiered_cache import TieredCache
+            remote_cache = None
+            if settings.bot_cache_redis_enabled:
+                from smarter_dev.bot.services.cache_manager import CacheManager
+                remote_cache = CacheManager(
+                    settings.effective_redis_url,
+                    serialization=settings.bot_cache_serialization,
+                    compression_threshold=settings.bot_cache_compression_threshold
+                )
+            local_ttls = None
+            if settings.bot_cache_invalidation_enabled:
+                from smarter_dev.bot.services.bytes_service import BytesService
+                from smarter_dev.bot.services.forum_agent_service import ForumAgentService
+                # Admin edits evict these on every process, so local copies can live longer
+                local_ttls = {
+                    "config": BytesService.CACHE_TTL_CONFIG_EVENT_DRIVEN,
+                    "forum_agents": ForumAgentService.CACHE_TTL_AGENTS_EVENT_DRIVEN,
+                }
+            cache_manager = TieredCache(
+                remote=remote_cache,
+                max_entries=settings.bot_cache_max_entries,
+                local_ttls=local_ttls
+            )
+
+        # Evict cached guild data when the web app changes it
+        cache_invalidation_listener = None
+        if cache_manager is not None and settings.bot_cache_invalidation_enabled:
+            from smarter_dev.bot.services.cache_invalidation import CacheInvalidationListener
+            cache_invalidation_listener = CacheInvalidationListener(cache_manager)
+
+        # Daily claims are tracked locally, optionally shared through Redis
+        claim_redis = None
+        if settings.bot_daily_claim_store == "redis":
+            from smarter_dev.shared.redis_client import create_redis_client
+            claim_redis = create_redis_client(settings)
+        daily_claim_store = DailyClaimStore(redis_client=claim_redis)
 
         # Create services
         from smarter_dev.bot.services.bytes_service import BytesService
@@ -365,6 +380,18 @@ async def setup_bot_services(bot: lightbulb.BotApp) -> None:
         scheduled_message_service = ScheduledMessageService(api_client, cache_manager, bot)
         repeating_message_service = RepeatingMessageService(api_client, cache_manager, bot)
 
+        if cache_invalidation_listener is not None:
+            bytes_service.cache_events_enabled = True
+            forum_agent_service.cache_events_enabled = True
+            cache_invalidation_listener.start()
+
+        # Export per-route API client metrics
+        metrics_server = None
+        if settings.bot_metrics_port:
+            from smarter_dev.bot.metrics_server import MetricsServer
+            metrics_server = MetricsServer(api_client, port=settings.bot_metrics_port)
+            await metrics_server.start()
+
         # Initialize services
         logger.info("Initializing bytes service...")
         await bytes_service.initialize()
@@ -429,6 +456,9 @@ async def setup_bot_services(bot: lightbulb.BotApp) -> None:
 
         bot.d["api_client"] = api_client
         bot.d["cache_manager"] = cache_manager
+        bot.d["cache_invalidation_listener"] = cache_invalidation_listener
+        bot.d["metrics_server"] = metrics_server
+        bot.d["daily_claim_store"] = daily_claim_store
         bot.d["bytes_service"] = bytes_service
         bot.d["squads_service"] = squads_service
         bot.d["forum_agent_service"] = forum_agent_service
@@ -707,6 +737,15 @@ async def cleanup_bot_services(bot: lightbulb.BotApp) -> None:
         if hasattr(bot, "d") and "repeating_message_service" in bot.d:
             await bot.d["repeating_message_service"].cleanup()
 
+        if hasattr(bot, "d") and bot.d.get("cache_invalidation_listener"):
+            await bot.d["cache_invalidation_listener"].stop()
+
+        if hasattr(bot, "d") and bot.d.get("metrics_server"):
+            await bot.d["metrics_server"].stop()
+
+        if hasattr(bot, "d") and "daily_claim_store" in bot.d:
+            await bot.d["daily_claim_store"].close()
+
         # Clean up cache manager (if used)
         if hasattr(bot, "d") and "cache_manager" in bot.d and bot.d["cache_manager"]:
             await bot.d["cache_manager"].cleanup()
@@ -808,8 +847,8 @@ async def run_bot() -> None:
         # Start status rotation
         await start_status_rotation(bot)
 
-        # Start cache cleanup
-        await start_cache_cleanup()
+        # Load today's daily claims so restarts don't re-probe the API
+        await warm_daily_claim_store(bot)
 
         logger.info("Bot is now fully ready and will stay online")
 
@@ -859,11 +898,15 @@ async def run_bot() -> None:
             logger.warning("No bytes service available for daily message reward")
             return
 
-        # Check cache first to avoid unnecessary API calls
+        # Check the claim store first to avoid unnecessary API calls
         guild_id_str = str(event.guild_id)
         user_id_str = str(event.author.id)
+        claim_store = getattr(bot, "d", {}).get("daily_claim_store")
+        if claim_store is None:
+            claim_store = DailyClaimStore()
+            bot.d["daily_claim_store"] = claim_store
 
-        if has_claimed_today(guild_id_str, user_id_str):
+        if claim_store.has_claimed(guild_id_str, user_id_str):
             # User already claimed today, skip API call
             logger.debug(f"User {event.author} already claimed daily reward today (cached)")
             return
@@ -880,7 +923,7 @@ async def run_bot() -> None:
 
             if result.success:
                 # Mark as claimed in cache to prevent future API calls today
-                mark_claimed_today(guild_id_str, user_id_str)
+                await claim_store.mark_claimed(guild_id_str, user_id_str)
 
                 # Handle squad auto-assignment if user was assigned to a squad
                 if result.squad_assignment:
@@ -977,7 +1020,7 @@ async def run_bot() -> None:
                 "409" in error_str or
                 "conflict" in error_str):
                 # Mark as claimed in cache to prevent future API calls today
-                mark_claimed_today(guild_id_str, user_id_str)
+                await claim_store.mark_claimed(guild_id_str, user_id_str)
                 logger.debug(f"Daily reward already claimed today for {event.author} (from API): {e}")
             else:
                 logger.error(f"Unexpected error in daily reward for {event.author}: {e}", exc_info=True)
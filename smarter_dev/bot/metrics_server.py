@@ -0,0 +1,67 @@
+"""HTTP endpoint exporting the bot's API client metrics.
+
+Serves ``GET /metrics`` in the Prometheus text format so the client-side
+view of each API route (latency percentiles, retries, payload sizes,
+rate limit waits) can be scraped next to the web API's own ``/metrics``.
+Requests carry an ``x-request-id`` header, so a slow request on this side
+can be matched to the server's log line for the same ID.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from aiohttp import web
+
+from smarter_dev.bot.services.api_client import APIClient
+
+logger = logging.getLogger(__name__)
+
+METRICS_PREFIX = "smarter_dev_bot_api"
+
+
+class MetricsServer:
+    """Minimal aiohttp server for the ``/metrics`` endpoint."""
+
+    def __init__(self, api_client: APIClient, host: str = "0.0.0.0", port: int = 9100):
+        """Initialize the server.
+
+        Args:
+            api_client: Client whose request metrics are exported
+            host: Interface to bind
+            port: Port to bind
+        """
+        self._api_client = api_client
+        self._host = host
+        self._port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    def create_app(self) -> web.Application:
+        """Build the aiohttp application."""
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle_metrics)
+        return app
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        """Render the API client metrics."""
+        return web.Response(
+            text=self._api_client.metrics.render_prometheus(METRICS_PREFIX),
+            content_type="text/plain",
+        )
+
+    async def start(self) -> None:
+        """Start serving in the background."""
+        if self._runner is not None:
+            return
+        self._runner = web.AppRunner(self.create_app())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self._host, self._port).start()
+        logger.info(f"Metrics endpoint listening on {self._host}:{self._port}/metrics")
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is None:
+            return
+        await self._runner.cleanup()
+        self._runner = None
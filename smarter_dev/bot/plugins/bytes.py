@@ -78,7 +78,8 @@ async def balance_command(ctx: lightbulb.Context) -> None:
             streak_count=balance.streak_count,
             last_daily=last_daily_str,
             total_received=balance.total_received,
-            total_sent=balance.total_sent
+            total_sent=balance.total_sent,
+            rank=balance.rank
         )
         
         # Create share view with balance data
@@ -351,11 +352,12 @@ async def history_command(ctx: lightbulb.Context) -> None:
         limit = 10
     
     try:
-        transactions = await service.get_transaction_history(
+        page = await service.get_transaction_page(
             str(ctx.guild_id),
             user_id=str(ctx.user.id),
             limit=limit
         )
+        transactions = page.transactions
         
         # Use image embed for 10 or fewer transactions, Discord embed for more
         if limit <= 10:
@@ -366,7 +368,9 @@ async def history_command(ctx: lightbulb.Context) -> None:
             from smarter_dev.bot.views.history_views import HistoryShareView
             share_view = HistoryShareView(
                 transactions=transactions,
-                user_id=str(ctx.user.id)
+                user_id=str(ctx.user.id),
+                next_cursor=page.next_cursor,
+                limit=limit
             )
             
             await ctx.respond(
@@ -201,6 +201,8 @@ async def handle_component_interaction(event: hikari.InteractionCreateEvent) ->
             await handle_leaderboard_share_interaction(event)
         elif custom_id == "share_history":
             await handle_history_share_interaction(event)
+        elif custom_id.startswith("history_page:"):
+            await handle_history_page_interaction(event)
         elif custom_id == "share_squad_list":
             await handle_squad_list_share_interaction(event)
         elif custom_id.startswith("share_tldr:"):
@@ -531,6 +533,85 @@ async def handle_history_share_interaction(event: hikari.InteractionCreateEvent)
             logger.error(f"Failed to send history share error response: {e2}")
 
 
+async def handle_history_page_interaction(event: hikari.InteractionCreateEvent) -> None:
+    """Handle the history "Older" button by showing the next page in place.
+    
+    Args:
+        event: The interaction event
+    """
+    if not isinstance(event.interaction, hikari.ComponentInteraction):
+        return
+    
+    # custom_id is history_page:{limit}:{cursor}
+    custom_id_parts = event.interaction.custom_id.split(":")
+    if len(custom_id_parts) != 3:
+        logger.error(f"Invalid history_page custom_id format: {event.interaction.custom_id}")
+        return
+    limit, cursor = int(custom_id_parts[1]), custom_id_parts[2]
+    
+    user_id = str(event.interaction.user.id)
+    guild_id = str(event.interaction.guild_id) if event.interaction.guild_id else None
+    
+    if not guild_id:
+        logger.error("History page interaction without guild context")
+        return
+    
+    try:
+        service = None
+        if hasattr(event.app, 'd') and hasattr(event.app.d, '_services'):
+            service = event.app.d._services.get('bytes_service')
+        elif hasattr(event.app, 'bytes_service'):
+            service = event.app.bytes_service
+        elif hasattr(event.app, 'd') and isinstance(event.app.d, dict):
+            services = event.app.d.get('_services', {})
+            service = services.get('bytes_service')
+        
+        if not service:
+            await event.interaction.create_initial_response(
+                hikari.ResponseType.MESSAGE_CREATE,
+                content="❌ Service not available. Please try again later.",
+                flags=hikari.MessageFlag.EPHEMERAL
+            )
+            return
+        
+        page = await service.get_transaction_page(
+            guild_id,
+            user_id=user_id,
+            limit=limit,
+            before=cursor
+        )
+        
+        from smarter_dev.bot.utils.image_embeds import get_generator
+        from smarter_dev.bot.views.history_views import HistoryShareView
+        generator = get_generator()
+        image_file = generator.create_history_embed(page.transactions, user_id)
+        share_view = HistoryShareView(
+            transactions=page.transactions,
+            user_id=user_id,
+            next_cursor=page.next_cursor,
+            limit=limit
+        )
+        
+        await event.interaction.create_initial_response(
+            hikari.ResponseType.MESSAGE_UPDATE,
+            attachment=image_file,
+            components=share_view.build_components()
+        )
+        
+    except Exception as e:
+        logger.exception(f"Error in history page interaction: {e}")
+        
+        try:
+            if not event.interaction.is_responded():
+                await event.interaction.create_initial_response(
+                    hikari.ResponseType.MESSAGE_CREATE,
+                    content="❌ Failed to load older transactions. Please try again later.",
+                    flags=hikari.MessageFlag.EPHEMERAL
+                )
+        except Exception as e2:
+            logger.error(f"Failed to send history page error response: {e2}")
+
+
 async def handle_squad_list_share_interaction(event: hikari.InteractionCreateEvent) -> None:
     """Handle squad list share button interactions.
     
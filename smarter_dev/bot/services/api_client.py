@@ -10,7 +10,8 @@ import asyncio
 import json
 import logging
 import time
-from typing import Any, Dict, Optional
+import uuid
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 
 import httpx
@@ -24,6 +25,8 @@ from smarter_dev.bot.services.exceptions import (
     ServiceError
 )
 from smarter_dev.bot.services.models import ServiceHealth
+from smarter_dev.bot.services.rate_scheduler import RateLimitScheduler
+from smarter_dev.shared.request_metrics import RequestMetrics, route_template
 
 logger = logging.getLogger(__name__)
 
@@ -64,8 +67,11 @@ class APIClient(APIClientProtocol):
     - Comprehensive error handling
     - Request/response logging
     - Health monitoring
-    - Connection pooling
+    - Connection pooling, optionally over HTTP/2
+    - Connection warmup
     - Timeout management
+    - Optional sharing of identical in-flight GETs
+    - Optional micro-batching of POSTs to bulk endpoints
     """
     
     def __init__(
@@ -75,7 +81,14 @@ class APIClient(APIClientProtocol):
         retry_config: Optional[RetryConfig] = None,
         default_timeout: float = 30.0,
         max_connections: int = 100,
-        max_keepalive_connections: int = 20
+        max_keepalive_connections: int = 20,
+        http2: bool = False,
+        http2_connections: int = 4,
+        keepalive_expiry: float = 5.0,
+        coalesce_gets: bool = False,
+        batch_window: float = 0.0,
+        max_batch_size: int = 50,
+        rate_limiter: Optional[RateLimitScheduler] = None
     ):
         """Initialize API client.
         
@@ -86,6 +99,16 @@ class APIClient(APIClientProtocol):
             default_timeout: Default request timeout in seconds
             max_connections: Maximum number of connections
             max_keepalive_connections: Maximum keepalive connections
+            http2: Multiplex requests over HTTP/2 when the API is served over
+                https (requires the h2 package)
+            http2_connections: Connections kept in HTTP/2 mode, replacing
+                the connection limits above
+            keepalive_expiry: Seconds an idle connection is kept open
+            coalesce_gets: Share one response among identical concurrent GETs
+            batch_window: Seconds ``post_batched`` waits to collect items
+                before sending them; 0 disables batching
+            max_batch_size: Items that trigger sending a batch immediately
+            rate_limiter: Scheduler pacing requests to the API's rate limits
         """
         self._base_url = base_url.rstrip('/')
         
@@ -101,16 +124,34 @@ class APIClient(APIClientProtocol):
         self._request_count = 0
         self._error_count = 0
         self._total_response_time = 0.0
+        # Per-route latency histograms, retries and payload sizes
+        self.metrics = RequestMetrics()
         
-        # Rate limiting state
-        self._rate_limit_reset_time = 0.0
-        self._rate_limit_remaining = float('inf')
+        # Paces and prioritizes requests using the API's rate limit headers
+        self._rate_limiter = rate_limiter or RateLimitScheduler()
+        
+        # In-flight GETs shared by identical requests
+        self._coalesce_gets = coalesce_gets
+        self._inflight_gets: Dict[Tuple, asyncio.Task] = {}
+        self._coalesced_requests = 0
+        
+        # Pending batches: path -> [(item, future)] and their flush tasks
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._pending_batches: Dict[str, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        self._batch_flushers: Dict[str, asyncio.Task] = {}
+        self._batch_senders: Set[asyncio.Task] = set()
+        self._batches_sent = 0
+        self._batched_items = 0
         
         # Create httpx client with optimal settings
         self._client: Optional[httpx.AsyncClient] = None
+        self._http2 = http2
+        self._http2_connections = http2_connections
         self._limits = httpx.Limits(
             max_connections=max_connections,
-            max_keepalive_connections=max_keepalive_connections
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
         )
         
         self._logger = logging.getLogger(f"{__name__}.APIClient")
@@ -127,6 +168,25 @@ class APIClient(APIClientProtocol):
     async def _ensure_client(self) -> None:
         """Ensure HTTP client is initialized."""
         if self._client is None:
+            limits = self._limits
+            if self._http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    self._logger.warning("HTTP/2 requested but the h2 package is missing, using HTTP/1.1")
+                    self._http2 = False
+            if self._http2 and not self._base_url.startswith("https://"):
+                # httpx only negotiates HTTP/2 through TLS
+                self._logger.warning("HTTP/2 requested for a non-https API URL, using HTTP/1.1")
+                self._http2 = False
+            if self._http2:
+                # Concurrent requests share streams, so a few connections are enough
+                limits = httpx.Limits(
+                    max_connections=self._http2_connections,
+                    max_keepalive_connections=self._http2_connections,
+                    keepalive_expiry=self._limits.keepalive_expiry
+                )
+            
             self._client = httpx.AsyncClient(
                 base_url=self._base_url,
                 headers={
@@ -135,12 +195,41 @@ class APIClient(APIClientProtocol):
                     "Accept": "application/json",
                     "Content-Type": "application/json"
                 },
-                limits=self._limits,
+                limits=limits,
                 timeout=httpx.Timeout(self._default_timeout),
-                http2=False,  # Disable HTTP/2 for now (requires h2 package)
+                http2=self._http2,
                 follow_redirects=True  # Enable redirect following
             )
     
+    async def warmup(self, connections: int = 1, timeout: float = 5.0) -> int:
+        """Open connections to the API before the first real request.
+        
+        Sends ``connections`` concurrent health checks so TCP and TLS setup
+        (and HTTP/2 negotiation) happen at startup instead of on the first
+        command. Failures are logged, not raised.
+        
+        Args:
+            connections: Number of concurrent warmup requests
+            timeout: Timeout for each warmup request in seconds
+            
+        Returns:
+            Number of warmup requests that succeeded
+        """
+        await self._ensure_client()
+        
+        async def ping() -> bool:
+            try:
+                await self._client.get(f"{self._base_url}/health", timeout=timeout)
+                return True
+            except Exception as e:
+                self._logger.warning(f"API connection warmup failed: {e}")
+                return False
+        
+        results = await asyncio.gather(*[ping() for _ in range(connections)])
+        warmed = sum(results)
+        self._logger.info(f"Warmed up {warmed}/{connections} API connections (http2={self._http2})")
+        return warmed
+    
     async def get(
         self,
         path: str,
@@ -162,13 +251,134 @@ class APIClient(APIClientProtocol):
         Raises:
             APIError: On API communication failures
         """
-        return await self._request(
-            "GET",
+        if not self._coalesce_gets:
+            return await self._request(
+                "GET",
+                path,
+                params=params,
+                headers=headers,
+                timeout=timeout
+            )
+        
+        key = (
             path,
-            params=params,
-            headers=headers,
-            timeout=timeout
+            tuple(sorted((params or {}).items())),
+            tuple(sorted((headers or {}).items()))
         )
+        inflight = self._inflight_gets.get(key)
+        if inflight is not None:
+            self._coalesced_requests += 1
+        else:
+            # The fetch runs in its own task so that cancelling the caller
+            # that started it doesn't cancel it for everyone else waiting
+            inflight = asyncio.create_task(self._request(
+                "GET",
+                path,
+                params=params,
+                headers=headers,
+                timeout=timeout
+            ))
+            self._inflight_gets[key] = inflight
+            inflight.add_done_callback(lambda task: self._finish_inflight_get(key, task))
+        return await asyncio.shield(inflight)
+    
+    def _finish_inflight_get(self, key: Tuple, task: asyncio.Task) -> None:
+        del self._inflight_gets[key]
+        if not task.cancelled():
+            # Mark retrieved so a failure nobody waited for isn't logged
+            task.exception()
+    
+    @property
+    def batching_enabled(self) -> bool:
+        """Whether ``post_batched`` collects items into batches."""
+        return self._batch_window > 0
+    
+    async def post_batched(
+        self,
+        path: str,
+        item: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> httpx.Response:
+        """Send one item to a bulk endpoint together with concurrent items.
+        
+        Items for the same path are collected for up to ``batch_window``
+        seconds (or until ``max_batch_size`` are waiting) and sent as
+        ``{"items": [...]}``. The endpoint answers with
+        ``{"results": [{"status_code": ..., "body": ...}, ...]}`` in the
+        same order, and each caller gets its own result as a response, so
+        it can be handled exactly like the response of a single request.
+        
+        Args:
+            path: Bulk API endpoint path
+            item: JSON body of this item
+            timeout: Request timeout for the whole batch in seconds
+            
+        Returns:
+            HTTP response for this item
+            
+        Raises:
+            APIError: If the batch request fails
+        """
+        if not self.batching_enabled:
+            raise ServiceError("Request batching is disabled")
+        
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending_batches.setdefault(path, [])
+        pending.append((item, future))
+        
+        if len(pending) >= self._max_batch_size:
+            flusher = self._batch_flushers.pop(path, None)
+            if flusher is not None:
+                flusher.cancel()
+            # Sent from its own task so cancelling this caller doesn't
+            # cancel the request for the rest of the batch
+            sender = asyncio.create_task(self._send_batch(path, timeout))
+            self._batch_senders.add(sender)
+            sender.add_done_callback(self._batch_senders.discard)
+        elif path not in self._batch_flushers:
+            self._batch_flushers[path] = asyncio.create_task(self._flush_after_window(path, timeout))
+        
+        return await future
+    
+    async def _flush_after_window(self, path: str, timeout: Optional[float]) -> None:
+        await asyncio.sleep(self._batch_window)
+        self._batch_flushers.pop(path, None)
+        await self._send_batch(path, timeout)
+    
+    async def _send_batch(self, path: str, timeout: Optional[float]) -> None:
+        """Send the items waiting for a path and resolve their futures."""
+        batch = self._pending_batches.pop(path, [])
+        if not batch:
+            return
+        
+        self._batches_sent += 1
+        self._batched_items += len(batch)
+        try:
+            response = await self._request(
+                "POST",
+                path,
+                json_data={"items": [item for item, _ in batch]},
+                timeout=timeout
+            )
+            results = response.json()["results"]
+            if len(results) != len(batch):
+                raise APIError(
+                    f"Batch returned {len(results)} results for {len(batch)} items",
+                    status_code=response.status_code
+                )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(httpx.Response(result["status_code"], json=result.get("body")))
     
     async def post(
         self,
@@ -277,6 +487,10 @@ class APIClient(APIClientProtocol):
     ) -> httpx.Response:
         """Execute HTTP request with comprehensive error handling and retry logic.
         
+        Every attempt carries the same ``x-request-id`` header, which the API
+        echoes and logs, and the request is recorded once in ``metrics``
+        under its route template.
+        
         Args:
             method: HTTP method
             path: API endpoint path
@@ -291,20 +505,69 @@ class APIClient(APIClientProtocol):
         Raises:
             APIError: On API communication failures
         """
-        await self._ensure_client()
+        request_headers = dict(headers or {})
+        request_headers.setdefault("x-request-id", uuid.uuid4().hex)
+        span: Dict[str, Any] = {"attempts": 0, "response": None}
+        start_time = time.perf_counter()
+        try:
+            return await self._send(method, path, json_data, params, request_headers, timeout, span)
+        finally:
+            response = span["response"]
+            bytes_sent, bytes_received = self._payload_sizes(response)
+            self.metrics.record(
+                method,
+                route_template(path),
+                (time.perf_counter() - start_time) * 1000,
+                status_code=getattr(response, "status_code", None),
+                bytes_sent=bytes_sent,
+                bytes_received=bytes_received,
+                retries=max(span["attempts"] - 1, 0)
+            )
+    
+    @staticmethod
+    def _payload_sizes(response: Optional[httpx.Response]) -> Tuple[int, int]:
+        """Request and response body sizes, zero where unavailable."""
+        # No response, no attached request, or a streamed body all count as 0
+        sent = received = 0
+        try:
+            sent = len(response.request.content)
+        except (AttributeError, RuntimeError, TypeError):
+            pass
+        try:
+            received = len(response.content)
+        except (AttributeError, RuntimeError, TypeError):
+            pass
+        return sent, received
+    
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        request_headers: Dict[str, str],
+        timeout: Optional[float],
+        span: Dict[str, Any]
+    ) -> httpx.Response:
+        """Send a request, retrying failures; see ``_request``.
         
-        # Wait for rate limit if needed
-        await self._handle_rate_limit()
+        ``span`` receives the attempt count and the last response.
+        """
+        await self._ensure_client()
         
         # Prepare request
         url = f"{self._base_url}{path}" if path.startswith('/') else f"{self._base_url}/{path}"
-        request_headers = headers or {}
         request_timeout = timeout or self._default_timeout
         
         # Execute request with retry logic
         last_exception = None
         
         for attempt in range(self._retry_config.max_retries + 1):
+            span["attempts"] = attempt + 1
+            
+            # Wait for rate limit budget; retries spend budget too
+            ticket = await self._handle_rate_limit()
+            
             try:
                 start_time = time.time()
                 self._request_count += 1
@@ -329,13 +592,14 @@ class APIClient(APIClientProtocol):
                     headers=request_headers,
                     timeout=request_timeout
                 )
+                span["response"] = response
                 
                 # Track response time
                 response_time = (time.time() - start_time) * 1000  # Convert to ms
                 self._total_response_time += response_time
                 
                 # Update rate limit information
-                self._update_rate_limit_info(response)
+                self._update_rate_limit_info(response, ticket)
                 
                 # Log successful request
                 self._logger.debug(
@@ -500,6 +764,7 @@ class APIClient(APIClientProtocol):
             extra={
                 "method": method,
                 "url": url,
+                "request_id": request_headers["x-request-id"],
                 "total_attempts": self._retry_config.max_retries + 1
             }
         )
@@ -624,44 +889,41 @@ class APIClient(APIClientProtocol):
         
         return delay
     
-    async def _handle_rate_limit(self) -> None:
-        """Handle rate limiting by waiting if necessary."""
-        current_time = time.time()
-        
-        # Only wait if we're actually rate limited (remaining = 0)
-        # Don't wait just because we have a reset time from a successful response
-        if (current_time < self._rate_limit_reset_time and 
-            self._rate_limit_remaining == 0):
-            wait_time = self._rate_limit_reset_time - current_time
-            
-            self._logger.warning(
-                f"Rate limit active, waiting {wait_time:.1f}s",
+    async def _handle_rate_limit(self) -> int:
+        """Wait until the rate limit scheduler releases the next request.
+        
+        Returns:
+            Scheduler ticket for the request
+        """
+        start_time = time.monotonic()
+        ticket = await self._rate_limiter.acquire()
+        wait_time = time.monotonic() - start_time
+        
+        if wait_time > 0.001:
+            self._logger.debug(
+                f"Rate limit budget exhausted, waited {wait_time:.2f}s",
                 extra={"wait_time": wait_time}
             )
-            
-            await asyncio.sleep(wait_time)
+            self.metrics.record_rate_limit_wait(wait_time)
+        
+        return ticket
     
-    def _update_rate_limit_info(self, response: httpx.Response) -> None:
+    def _update_rate_limit_info(self, response: httpx.Response, ticket: int) -> None:
         """Update rate limit information from response headers.
         
         Args:
             response: HTTP response with rate limit headers
+            ticket: Scheduler ticket the request was sent with
         """
-        # Check for X-RateLimit headers
-        remaining = response.headers.get("x-ratelimit-remaining")
-        reset_time = response.headers.get("x-ratelimit-reset")
-        
-        if remaining:
-            try:
-                self._rate_limit_remaining = int(remaining)
-            except ValueError:
-                pass
+        self._rate_limiter.update(response.headers, ticket)
         
-        if reset_time:
+        if response.status_code == 429:
+            retry_after = None
             try:
-                self._rate_limit_reset_time = float(reset_time)
+                retry_after = float(response.headers.get("retry-after", ""))
             except ValueError:
                 pass
+            self._rate_limiter.throttle(retry_after)
     
     async def health_check(self) -> ServiceHealth:
         """Check the health of the API connection.
@@ -689,6 +951,14 @@ class APIClient(APIClientProtocol):
             if self._request_count > 0:
                 avg_response_time = self._total_response_time / self._request_count
             
+            # Taken from the latency histogram of all requests
+            percentiles = {}
+            if self.metrics.latency.count:
+                percentiles = {
+                    f"p{p}_response_time_ms": self.metrics.latency.percentile(p)
+                    for p in (50, 95, 99)
+                }
+            
             return ServiceHealth(
                 service_name="APIClient",
                 is_healthy=True,
@@ -699,7 +969,13 @@ class APIClient(APIClientProtocol):
                     "total_requests": self._request_count,
                     "total_errors": self._error_count,
                     "avg_response_time_ms": avg_response_time,
-                    "rate_limit_remaining": self._rate_limit_remaining,
+                    "rate_limiter": self._rate_limiter.get_stats(),
+                    "coalesced_requests": self._coalesced_requests,
+                    "batches_sent": self._batches_sent,
+                    "batched_items": self._batched_items,
+                    "http2": self._http2,
+                    **percentiles,
+                    "rate_limit_wait_seconds": self.metrics.rate_limit_wait_seconds,
                     "base_url": self._base_url
                 }
             )
@@ -782,6 +1058,15 @@ class APIClient(APIClientProtocol):
 
     async def close(self) -> None:
         """Close the API client and cleanup resources."""
+        # Send anything still waiting for its batch window
+        for path, flusher in list(self._batch_flushers.items()):
+            flusher.cancel()
+            await self._send_batch(path, None)
+        self._batch_flushers.clear()
+        await asyncio.gather(*self._batch_senders)
+        
+        self._rate_limiter.close()
+        
         if self._client:
             await self._client.aclose()
             self._client = None
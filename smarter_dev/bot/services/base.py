@@ -23,6 +23,14 @@ ServiceType = TypeVar('ServiceType', bound='BaseService')
 
 logger = logging.getLogger(__name__)
 
+# Cached in place of a value to remember that the API returned 404
+MISSING = {"__missing__": True}
+
+
+def is_missing(value: Any) -> bool:
+    """Whether a cached value is the negative-cache marker."""
+    return value == MISSING
+
 
 class UserProtocol(Protocol):
     """Protocol for Discord User objects to support planning document compatibility."""
@@ -247,6 +255,13 @@ class BaseService(ABC):
     - Dependency Inversion: Depends on abstractions (protocols)
     """
     
+    # How long a 404 is remembered (in seconds)
+    CACHE_TTL_MISSING = 30
+    
+    # Set when web change events evict this service's cached config, which
+    # lets it be cached for longer
+    cache_events_enabled = False
+    
     def __init__(
         self,
         api_client: APIClientProtocol,
@@ -437,6 +452,43 @@ class BaseService(ABC):
         except Exception as e:
             self._logger.warning(f"Cache set failed for key {key}: {e}")
     
+    async def _set_missing(self, key: str) -> None:
+        """Remember that the resource behind a cache key doesn't exist.
+        
+        Args:
+            key: Cache key
+        """
+        await self._set_cached(key, MISSING, ttl=self.CACHE_TTL_MISSING)
+    
+    async def _coalesced_get(self, key: str, path: str, **kwargs: Any) -> Any:
+        """GET from the API, sharing one request among concurrent callers.
+        
+        Falls back to a plain request when the cache manager can't coalesce.
+        
+        Args:
+            key: Cache key identifying the request
+            path: API endpoint path
+            **kwargs: Arguments passed to the API client
+            
+        Returns:
+            Response object
+        """
+        if getattr(type(self._cache_manager), "coalesce", None) is None:
+            return await self._api_client.get(path, **kwargs)
+        return await self._cache_manager.coalesce(
+            key, lambda: self._api_client.get(path, **kwargs)
+        )
+    
+    async def _get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get statistics from the cache manager, if it reports any."""
+        if getattr(type(self._cache_manager), "get_stats", None) is None:
+            return None
+        try:
+            return await self._cache_manager.get_stats()
+        except Exception as e:
+            self._logger.warning(f"Cache stats unavailable: {e}")
+            return None
+    
     async def _invalidate_cache(self, key: str) -> None:
         """Invalidate cache entry.
         
@@ -12,7 +12,13 @@ import logging
 from datetime import date, datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from smarter_dev.bot.services.base import BaseService, APIClientProtocol, CacheManagerProtocol, UserProtocol
+from smarter_dev.bot.services.base import (
+    BaseService,
+    APIClientProtocol,
+    CacheManagerProtocol,
+    UserProtocol,
+    is_missing
+)
 from smarter_dev.bot.services.exceptions import (
     AlreadyClaimedError,
     APIError,
@@ -27,6 +33,7 @@ from smarter_dev.bot.services.models import (
     BytesTransaction,
     DailyClaimResult,
     LeaderboardEntry,
+    TransactionPage,
     TransferResult
 )
 from smarter_dev.bot.services.streak_service import StreakService
@@ -60,8 +67,12 @@ class BytesService(BaseService):
     CACHE_TTL_BALANCE = 300  # 5 minutes (only used when explicitly requested)
     CACHE_TTL_LEADERBOARD = 60  # 1 minute
     CACHE_TTL_CONFIG = 600  # 10 minutes
+    CACHE_TTL_CONFIG_EVENT_DRIVEN = 6000  # 100 minutes, evicted on admin edits
     CACHE_TTL_TRANSACTION_HISTORY = 120  # 2 minutes
     
+    # Matches the API's limit for /bytes/balances
+    MAX_BALANCES_PER_REQUEST = 100
+    
     def __init__(
         self,
         api_client: APIClientProtocol,
@@ -178,6 +189,9 @@ class BytesService(BaseService):
         # Try cache first if enabled
         if use_cache and self.has_cache:
             cached_balance = await self._get_cached(cache_key)
+            if is_missing(cached_balance):
+                self._cache_hits += 1
+                raise ResourceNotFoundError("user_balance", f"{guild_id}:{user_id}")
             if cached_balance:
                 try:
                     self._cache_hits += 1
@@ -196,12 +210,15 @@ class BytesService(BaseService):
             # Fetch from API
             self._log_operation("get_balance", guild_id=guild_id, user_id=user_id)
             
-            response = await self._api_client.get(
+            response = await self._coalesced_get(
+                cache_key,
                 f"/guilds/{guild_id}/bytes/balance/{user_id}",
                 timeout=10.0
             )
             
             if response.status_code == 404:
+                if use_cache and self.has_cache:
+                    await self._set_missing(cache_key)
                 raise ResourceNotFoundError("user_balance", f"{guild_id}:{user_id}")
             
             # Check if response was successful before parsing
@@ -236,6 +253,95 @@ class BytesService(BaseService):
             sanitized_message = self._sanitize_error_message(e)
             raise ServiceError(f"Failed to get balance: {sanitized_message}") from e
     
+    async def get_balances(
+        self,
+        guild_id: str,
+        user_ids: List[str],
+        use_cache: bool = True
+    ) -> Dict[str, BytesBalance]:
+        """Get the balances of several users with one request per 100 users.
+        
+        Cached balances are used where available and every balance fetched
+        is cached, so following ``get_balance(use_cache=True)`` calls for
+        these users don't reach the API. Balances fetched this way carry no
+        leaderboard rank.
+        
+        Args:
+            guild_id: Discord guild ID
+            user_ids: Discord user IDs
+            use_cache: Whether to read and fill the cache
+            
+        Returns:
+            Dict[str, BytesBalance]: Balances by user ID; users without a
+                balance are left out
+            
+        Raises:
+            ValidationError: If IDs are invalid
+            ServiceError: On service failures
+        """
+        self._ensure_initialized()
+        
+        self._validate_discord_id("guild_id", guild_id)
+        user_ids = list(dict.fromkeys(user_ids))
+        for user_id in user_ids:
+            self._validate_discord_id("user_id", user_id)
+        
+        balances: Dict[str, BytesBalance] = {}
+        to_fetch: List[str] = []
+        for user_id in user_ids:
+            if use_cache and self.has_cache:
+                cached_balance = await self._get_cached(self._build_cache_key("balance", guild_id, user_id))
+                if is_missing(cached_balance):
+                    self._cache_hits += 1
+                    continue
+                if cached_balance:
+                    try:
+                        balances[user_id] = self._parse_balance_data(cached_balance)
+                        self._cache_hits += 1
+                        continue
+                    except Exception as e:
+                        self._logger.warning(f"Corrupted cache data for balance {guild_id}:{user_id}: {e}")
+                self._cache_misses += 1
+            to_fetch.append(user_id)
+        
+        try:
+            for start in range(0, len(to_fetch), self.MAX_BALANCES_PER_REQUEST):
+                chunk = to_fetch[start:start + self.MAX_BALANCES_PER_REQUEST]
+                self._balance_requests += 1
+                self._log_operation("get_balances", guild_id=guild_id, user_count=len(chunk))
+                
+                response = await self._api_client.get(
+                    f"/guilds/{guild_id}/bytes/balances",
+                    params={"user_ids": ",".join(chunk)},
+                    timeout=10.0
+                )
+                if response.status_code != 200:
+                    error_data = response.json()
+                    error_message = error_data.get('detail', 'Unknown API error')
+                    raise APIError(f"API error: {error_message}", status_code=response.status_code)
+                
+                data = response.json()
+                for balance_data in data["balances"]:
+                    balances[balance_data["user_id"]] = self._parse_balance_data(balance_data)
+                    if use_cache and self.has_cache:
+                        await self._set_cached(
+                            self._build_cache_key("balance", guild_id, balance_data["user_id"]),
+                            balance_data,
+                            ttl=self.CACHE_TTL_BALANCE
+                        )
+                if use_cache and self.has_cache:
+                    for user_id in data["missing"]:
+                        await self._set_missing(self._build_cache_key("balance", guild_id, user_id))
+            
+            return balances
+            
+        except APIError:
+            raise
+        except Exception as e:
+            self._log_error("get_balances", e, guild_id=guild_id)
+            sanitized_message = self._sanitize_error_message(e)
+            raise ServiceError(f"Failed to get balances: {sanitized_message}") from e
+    
     async def claim_daily(
         self,
         guild_id: str,
@@ -277,15 +383,20 @@ class BytesService(BaseService):
                 username=username
             )
             
-            # Make claim request to API
-            response = await self._api_client.post(
-                f"/guilds/{guild_id}/bytes/daily",
-                json_data={
-                    "user_id": user_id,
-                    "username": username
-                },
-                timeout=15.0
-            )
+            # Make claim request to API, batched with concurrent claims if enabled
+            claim = {"user_id": user_id, "username": username}
+            if self._batches_daily_claims:
+                response = await self._api_client.post_batched(
+                    f"/guilds/{guild_id}/bytes/daily/batch",
+                    claim,
+                    timeout=15.0
+                )
+            else:
+                response = await self._api_client.post(
+                    f"/guilds/{guild_id}/bytes/daily",
+                    json_data=claim,
+                    timeout=15.0
+                )
             
             # Handle already claimed error
             if response.status_code == 409:
@@ -343,7 +454,53 @@ class BytesService(BaseService):
         except Exception as e:
             self._log_error("claim_daily", e, guild_id=guild_id, user_id=user_id)
             raise ServiceError(f"Failed to claim daily reward: {e}") from e
+
+    @property
+    def _batches_daily_claims(self) -> bool:
+        """Whether the API client sends daily claims through the bulk endpoint."""
+        if getattr(type(self._api_client), "post_batched", None) is None:
+            return False
+        return self._api_client.batching_enabled
     
+    async def get_daily_claimers(self, guild_id: str) -> List[str]:
+        """Get the users who have already claimed today's reward in a guild.
+
+        Args:
+            guild_id: Discord guild ID
+
+        Returns:
+            User IDs that have claimed on the current UTC date
+
+        Raises:
+            ValidationError: If inputs are invalid
+            ServiceError: On service failures
+        """
+        self._ensure_initialized()
+
+        if not guild_id or not guild_id.strip():
+            raise ValidationError("guild_id", "Guild ID is required")
+
+        try:
+            self._log_operation("get_daily_claimers", guild_id=guild_id)
+
+            response = await self._api_client.get(
+                f"/guilds/{guild_id}/bytes/daily/claimed",
+                timeout=10.0
+            )
+
+            if response.status_code >= 400:
+                error_data = response.json()
+                error_message = error_data.get("detail", f"API error: {response.status_code}")
+                raise APIError(error_message, status_code=response.status_code)
+
+            return list(response.json().get("user_ids", []))
+
+        except (ValidationError, APIError):
+            raise
+        except Exception as e:
+            self._log_error("get_daily_claimers", e, guild_id=guild_id)
+            raise ServiceError(f"Failed to get daily claimers: {e}") from e
+
     async def transfer_bytes(
         self,
         guild_id: str,
@@ -759,7 +916,8 @@ class BytesService(BaseService):
         try:
             self._log_operation("get_config", guild_id=guild_id)
             
-            response = await self._api_client.get(
+            response = await self._coalesced_get(
+                cache_key,
                 f"/guilds/{guild_id}/bytes/config",
                 timeout=10.0
             )
@@ -781,7 +939,7 @@ class BytesService(BaseService):
                 await self._set_cached(
                     cache_key,
                     config_dict,
-                    ttl=self.CACHE_TTL_CONFIG
+                    ttl=self.CACHE_TTL_CONFIG_EVENT_DRIVEN if self.cache_events_enabled else self.CACHE_TTL_CONFIG
                 )
             
             return config
@@ -833,7 +991,8 @@ class BytesService(BaseService):
         try:
             self._log_operation("get_leaderboard", guild_id=guild_id, limit=limit)
             
-            response = await self._api_client.get(
+            response = await self._coalesced_get(
+                cache_key,
                 f"/guilds/{guild_id}/bytes/leaderboard",
                 params={"limit": limit},
                 timeout=10.0
@@ -894,6 +1053,33 @@ class BytesService(BaseService):
         Returns:
             List of transactions ordered by creation time (newest first)
             
+        Raises:
+            ValidationError: If inputs are invalid
+            ServiceError: On service failures
+        """
+        page = await self.get_transaction_page(guild_id, user_id, limit, use_cache=use_cache)
+        return page.transactions
+    
+    async def get_transaction_page(
+        self,
+        guild_id: str,
+        user_id: Optional[str] = None,
+        limit: int = 20,
+        before: Optional[str] = None,
+        use_cache: bool = True
+    ) -> TransactionPage:
+        """Get one page of transaction history for guild or specific user.
+        
+        Args:
+            guild_id: Discord guild ID
+            user_id: Optional user ID to filter by
+            limit: Maximum number of transactions to return
+            before: Cursor from a previous page's next_cursor
+            use_cache: Whether to use cache for this request
+            
+        Returns:
+            Page of transactions ordered by creation time (newest first)
+            
         Raises:
             ValidationError: If inputs are invalid
             ServiceError: On service failures
@@ -906,14 +1092,19 @@ class BytesService(BaseService):
         if limit <= 0 or limit > 100:
             raise ValidationError("limit", "Limit must be between 1 and 100")
         
-        cache_key = self._build_cache_key("transactions", guild_id, user_id or "all", str(limit))
+        cache_key = self._build_cache_key(
+            "transactions", guild_id, user_id or "all", str(limit), before or "latest"
+        )
         
         # Try cache first if enabled
         if use_cache and self.has_cache:
-            cached_transactions = await self._get_cached(cache_key)
-            if cached_transactions:
+            cached_page = await self._get_cached(cache_key)
+            if cached_page:
                 self._cache_hits += 1
-                return [BytesTransaction(**tx) for tx in cached_transactions]
+                return TransactionPage(
+                    transactions=[BytesTransaction(**tx) for tx in cached_page["transactions"]],
+                    next_cursor=cached_page.get("next_cursor")
+                )
             self._cache_misses += 1
         
         try:
@@ -921,14 +1112,18 @@ class BytesService(BaseService):
                 "get_transaction_history",
                 guild_id=guild_id,
                 user_id=user_id,
-                limit=limit
+                limit=limit,
+                before=before
             )
             
             params = {"limit": limit}
             if user_id:
                 params["user_id"] = user_id
+            if before:
+                params["before"] = before
             
-            response = await self._api_client.get(
+            response = await self._coalesced_get(
+                cache_key,
                 f"/guilds/{guild_id}/bytes/transactions",
                 params=params,
                 timeout=10.0
@@ -940,16 +1135,19 @@ class BytesService(BaseService):
                 raise APIError(error_message, status_code=response.status_code)
             
             transaction_data = response.json()
-            transactions = [
-                BytesTransaction(**tx)
-                for tx in transaction_data.get("transactions", [])
-            ]
+            page = TransactionPage(
+                transactions=[
+                    BytesTransaction(**tx)
+                    for tx in transaction_data.get("transactions", [])
+                ],
+                next_cursor=transaction_data.get("next_cursor")
+            )
             
             # Cache the result
             if use_cache and self.has_cache:
                 # Convert to serializable format
                 cache_data = []
-                for tx in transactions:
+                for tx in page.transactions:
                     tx_dict = tx.__dict__.copy()
                     # Convert datetime to ISO string for serialization
                     if tx_dict.get("created_at") and hasattr(tx_dict["created_at"], "isoformat"):
@@ -958,11 +1156,11 @@ class BytesService(BaseService):
                 
                 await self._set_cached(
                     cache_key,
-                    cache_data,
+                    {"transactions": cache_data, "next_cursor": page.next_cursor},
                     ttl=self.CACHE_TTL_TRANSACTION_HISTORY
                 )
             
-            return transactions
+            return page
             
         except (ValidationError, APIError):
             raise
@@ -1065,7 +1263,8 @@ class BytesService(BaseService):
             "cache_hits": self._cache_hits,
             "cache_misses": self._cache_misses,
             "cache_hit_rate": cache_hit_rate,
-            "cache_enabled": self.has_cache
+            "cache_enabled": self.has_cache,
+            "cache": await self._get_cache_stats()
         }
     
     # Cache management helper methods
@@ -0,0 +1,174 @@
+"""Evicts bot cache entries when the web side changes guild data.
+
+The web app publishes a JSON message on a Redis pub/sub channel after it
+commits a change to bytes configuration, squads, squad sale events or forum
+agents (see ``smarter_dev.web.cache_events``)::
+
+    {"guild_id": "123", "entity": "squads"}
+
+The listener maps each entity to the service cache keys built from it and
+evicts just those for the guild. Because admin edits now reach the bot as
+they happen, slowly changing data can be cached for much longer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from smarter_dev.bot.services.base import CacheManagerProtocol
+
+logger = logging.getLogger(__name__)
+
+# Must match smarter_dev.web.cache_events.CHANGES_CHANNEL
+CHANGES_CHANNEL = "cache:changes"
+
+# Entity -> cache key templates it affects; "*" entries are glob patterns
+ENTITY_KEYS: Dict[str, Tuple[str, ...]] = {
+    "bytes_config": (
+        "bytesservice:config:{guild_id}",
+    ),
+    "squads": (
+        "squadsservice:squads:{guild_id}:*",
+        "squadsservice:squad:{guild_id}:*",
+        "squadsservice:squad_members:{guild_id}:*",
+        "squadsservice:user_squad:{guild_id}:*",
+    ),
+    # Sale events change the prices embedded in squad listings
+    "squad_sales": (
+        "squadsservice:squads:{guild_id}:*",
+        "squadsservice:squad:{guild_id}:*",
+    ),
+    "forum_agents": (
+        "forumagentservice:forum_agents:{guild_id}",
+    ),
+}
+
+
+def keys_for_change(guild_id: str, entity: str) -> List[str]:
+    """Cache keys and patterns to evict for a change, empty if unknown."""
+    return [template.format(guild_id=guild_id) for template in ENTITY_KEYS.get(entity, ())]
+
+
+class CacheInvalidationListener:
+    """Subscribes to web change events and evicts the affected cache keys."""
+
+    def __init__(self, cache_manager: CacheManagerProtocol, redis_client=None):
+        """Initialize the listener.
+
+        Args:
+            cache_manager: Cache the bot services read through
+            redis_client: Async Redis client to subscribe with
+        """
+        self._cache = cache_manager
+        self._redis = redis_client
+        self._task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.events_received = 0
+        self.keys_evicted = 0
+        self.resyncs = 0
+
+    def _get_redis(self):
+        if self._redis is None:
+            from smarter_dev.shared.config import get_settings
+            from smarter_dev.shared.redis_client import create_redis_client
+            self._redis = create_redis_client(get_settings())
+        return self._redis
+
+    def start(self) -> None:
+        """Start listening in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def handle_message(self, data: Any) -> int:
+        """Evict the keys for one published change.
+
+        Returns:
+            Number of keys and patterns evicted
+        """
+        try:
+            change = json.loads(data)
+            guild_id = str(change["guild_id"])
+            entity = change["entity"]
+        except (ValueError, TypeError, KeyError):
+            logger.warning(f"Ignoring invalid cache change event: {data!r}")
+            return 0
+
+        self.events_received += 1
+        keys = keys_for_change(guild_id, entity)
+        if not keys:
+            logger.debug(f"Ignoring cache change event for unknown entity {entity}")
+            return 0
+
+        await self._evict(keys)
+        logger.debug(f"Evicted {entity} cache for guild {guild_id}")
+        return len(keys)
+
+    async def evict_all(self) -> None:
+        """Evict every key the listener is responsible for, in all guilds."""
+        self.resyncs += 1
+        patterns = {
+            template.format(guild_id="*")
+            for templates in ENTITY_KEYS.values()
+            for template in templates
+        }
+        await self._evict(sorted(patterns))
+
+    async def _evict(self, keys: List[str]) -> None:
+        for key in keys:
+            if "*" in key:
+                await self._cache.clear_pattern(key)
+            else:
+                await self._cache.delete(key)
+            self.keys_evicted += 1
+
+    async def _listen(self) -> None:
+        retry_delay = 1
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._get_redis().pubsub()
+                await pubsub.subscribe(CHANGES_CHANNEL)
+                # Changes published while we were disconnected were missed
+                await self.evict_all()
+                retry_delay = 1
+
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    await self.handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error, retrying in {retry_delay}s: {e}")
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 60)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get listener counters."""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "events_received": self.events_received,
+            "keys_evicted": self.keys_evicted,
+            "resyncs": self.resyncs,
+        }
@@ -10,8 +10,10 @@ import json
 import logging
 import pickle
 import time
+import zlib
 from typing import Any, Dict, Optional, Union
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID
 
 import redis.asyncio as redis
 from redis.exceptions import ConnectionError, TimeoutError, RedisError
@@ -20,8 +22,50 @@ from smarter_dev.bot.services.base import CacheManagerProtocol
 from smarter_dev.bot.services.exceptions import CacheError
 from smarter_dev.bot.services.models import ServiceHealth
 
+try:
+    import msgpack
+except ImportError:  # Optional, only needed for serialization="msgpack"
+    msgpack = None
+
 logger = logging.getLogger(__name__)
 
+# Every stored value starts with one of these flags. Values written before
+# flags were introduced start with anything else and are read as-is.
+FLAG_RAW = b"\x00"
+FLAG_ZLIB = b"\x01"
+
+# msgpack extension types
+EXT_DATETIME = 1
+EXT_DATE = 2
+EXT_UUID = 3
+EXT_TABLE = 4
+
+# Keys with more parts than this ("service:namespace:guild_id:...") are also
+# added to a tag set named after their first parts, so "service:namespace:guild_id:*"
+# can be cleared without scanning the keyspace
+TAG_SCOPE_PARTS = 3
+
+# Set a value and tag it; the tag set lives as long as its longest-lived member
+SET_TAGGED_SCRIPT = """
+redis.call('SETEX', KEYS[1], ARGV[1], ARGV[2])
+redis.call('SADD', KEYS[2], KEYS[1])
+if redis.call('TTL', KEYS[2]) < tonumber(ARGV[1]) then
+    redis.call('EXPIRE', KEYS[2], ARGV[1])
+end
+return 1
+"""
+
+# Delete every key in a tag set, then the set itself
+CLEAR_TAG_SCRIPT = """
+local members = redis.call('SMEMBERS', KEYS[1])
+local deleted = 0
+for i = 1, #members, 500 do
+    deleted = deleted + redis.call('DEL', unpack(members, i, math.min(i + 499, #members)))
+end
+redis.call('DEL', KEYS[1])
+return deleted
+"""
+
 
 class SerializationStrategy:
     """Strategy pattern for data serialization."""
@@ -45,19 +89,76 @@ class SerializationStrategy:
     def deserialize_pickle(data: bytes) -> Any:
         """Deserialize pickle data."""
         return pickle.loads(data)
+    
+    @staticmethod
+    def serialize_msgpack(data: Any) -> bytes:
+        """Serialize data as msgpack.
+        
+        Unlike JSON, datetimes, dates and UUIDs come back with their types,
+        so cached model dicts rebuild the same dataclasses as API responses.
+        Lists of dicts sharing the same keys (leaderboards, transaction
+        pages, member lists) are stored as one key header plus value rows.
+        """
+        return msgpack.packb(_tabulate(data), default=_msgpack_default, use_bin_type=True)
+    
+    @staticmethod
+    def deserialize_msgpack(data: bytes) -> Any:
+        """Deserialize msgpack data."""
+        return msgpack.unpackb(data, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False)
+
+
+def _tabulate(data: Any) -> Any:
+    """Replace lists of same-shaped dicts with msgpack table extensions."""
+    if isinstance(data, dict):
+        return {key: _tabulate(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        if len(data) > 1 and all(isinstance(item, dict) for item in data):
+            columns = list(data[0])
+            if all(len(item) == len(columns) and all(c in item for c in columns) for item in data):
+                rows = [[_tabulate(item[c]) for c in columns] for item in data]
+                return msgpack.ExtType(
+                    EXT_TABLE,
+                    msgpack.packb([columns, rows], default=_msgpack_default, use_bin_type=True)
+                )
+        return [_tabulate(item) for item in data]
+    return data
+
+
+def _msgpack_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return msgpack.ExtType(EXT_DATETIME, obj.isoformat().encode())
+    if isinstance(obj, date):
+        return msgpack.ExtType(EXT_DATE, obj.isoformat().encode())
+    if isinstance(obj, UUID):
+        return msgpack.ExtType(EXT_UUID, obj.bytes)
+    # Match the JSON strategy for anything else
+    return str(obj)
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == EXT_DATE:
+        return date.fromisoformat(data.decode())
+    if code == EXT_UUID:
+        return UUID(bytes=data)
+    if code == EXT_TABLE:
+        columns, rows = msgpack.unpackb(data, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False)
+        return [dict(zip(columns, row)) for row in rows]
+    return msgpack.ExtType(code, data)
 
 
 class CacheManager(CacheManagerProtocol):
     """Production-grade Redis cache manager for bot services.
     
     Features:
-    - Multiple serialization strategies (JSON, pickle)
+    - Multiple serialization strategies (JSON, pickle, msgpack)
     - Automatic key prefixing and namespacing
     - Connection pooling and retry logic
     - Health monitoring and metrics
-    - Pattern-based cache invalidation
+    - Pattern-based cache invalidation (tag sets for per-guild namespaces)
     - TTL management and expiration
-    - Compression for large values
+    - zlib compression for values above a size threshold
     """
     
     def __init__(
@@ -70,7 +171,9 @@ class CacheManager(CacheManagerProtocol):
         socket_connect_timeout: float = 5.0,
         socket_timeout: float = 5.0,
         retry_on_timeout: bool = True,
-        health_check_interval: int = 30
+        health_check_interval: int = 30,
+        compression_threshold: Optional[int] = 1024,
+        compression_level: int = 6
     ):
         """Initialize cache manager.
         
@@ -78,12 +181,15 @@ class CacheManager(CacheManagerProtocol):
             redis_url: Redis connection URL
             key_prefix: Prefix for all cache keys
             default_ttl: Default time-to-live in seconds
-            serialization: Serialization strategy ('json' or 'pickle')
+            serialization: Serialization strategy ('json', 'pickle' or 'msgpack')
             max_connections: Maximum Redis connections
             socket_connect_timeout: Connection timeout in seconds
             socket_timeout: Socket timeout in seconds
             retry_on_timeout: Whether to retry on timeout
             health_check_interval: Health check interval in seconds
+            compression_threshold: Compress serialized values larger than
+                this many bytes, or None to never compress
+            compression_level: zlib compression level
         """
         self._redis_url = redis_url
         self._key_prefix = key_prefix
@@ -93,6 +199,8 @@ class CacheManager(CacheManagerProtocol):
         self._socket_timeout = socket_timeout
         self._retry_on_timeout = retry_on_timeout
         self._health_check_interval = health_check_interval
+        self._compression_threshold = compression_threshold
+        self._compression_level = compression_level
         
         # Serialization strategy
         if serialization == "json":
@@ -101,11 +209,18 @@ class CacheManager(CacheManagerProtocol):
         elif serialization == "pickle":
             self._serialize = SerializationStrategy.serialize_pickle
             self._deserialize = SerializationStrategy.deserialize_pickle
+        elif serialization == "msgpack":
+            if msgpack is None:
+                raise ValueError("msgpack serialization requires the msgpack package")
+            self._serialize = SerializationStrategy.serialize_msgpack
+            self._deserialize = SerializationStrategy.deserialize_msgpack
         else:
             raise ValueError(f"Unsupported serialization strategy: {serialization}")
         
-        # Redis client
+        # Redis client and scripts, created on first use
         self._redis: Optional[redis.Redis] = None
+        self._set_tagged = None
+        self._clear_tag = None
         
         # Metrics
         self._operations_count = 0
@@ -113,6 +228,8 @@ class CacheManager(CacheManagerProtocol):
         self._cache_misses = 0
         self._errors_count = 0
         self._total_response_time = 0.0
+        self._bytes_written = 0
+        self._bytes_uncompressed = 0
         self._last_health_check = datetime.now(timezone.utc)
         
         self._logger = logging.getLogger(f"{__name__}.CacheManager")
@@ -142,6 +259,9 @@ class CacheManager(CacheManagerProtocol):
                 # Test connection
                 await self._redis.ping()
                 
+                self._set_tagged = self._redis.register_script(SET_TAGGED_SCRIPT)
+                self._clear_tag = self._redis.register_script(CLEAR_TAG_SCRIPT)
+                
                 self._logger.info(
                     "Redis connection established",
                     extra={"redis_url": self._redis_url}
@@ -162,6 +282,56 @@ class CacheManager(CacheManagerProtocol):
         """
         return f"{self._key_prefix}:{key}"
     
+    def _encode(self, value: Any) -> bytes:
+        """Serialize a value, compressing it if it's large enough."""
+        payload = self._serialize(value)
+        self._bytes_uncompressed += len(payload)
+        if self._compression_threshold is not None and len(payload) > self._compression_threshold:
+            compressed = zlib.compress(payload, self._compression_level)
+            if len(compressed) < len(payload):
+                encoded = FLAG_ZLIB + compressed
+                self._bytes_written += len(encoded)
+                return encoded
+        encoded = FLAG_RAW + payload
+        self._bytes_written += len(encoded)
+        return encoded
+    
+    def _decode(self, raw_value: bytes) -> Any:
+        """Deserialize a stored value written by ``_encode``."""
+        flag, payload = raw_value[:1], raw_value[1:]
+        if flag == FLAG_ZLIB:
+            return self._deserialize(zlib.decompress(payload))
+        if flag == FLAG_RAW:
+            return self._deserialize(payload)
+        # Written before values were flagged
+        return self._deserialize(raw_value)
+    
+    def _build_tag_key(self, scope: str) -> str:
+        """Build the key of the tag set for a scope."""
+        return f"{self._key_prefix}:tag:{scope}"
+    
+    @staticmethod
+    def _tag_scope(key: str) -> Optional[str]:
+        """Scope a key is tagged under, or None for untagged keys."""
+        parts = key.split(":")
+        if len(parts) <= TAG_SCOPE_PARTS:
+            return None
+        return ":".join(parts[:TAG_SCOPE_PARTS])
+    
+    @staticmethod
+    def _pattern_scope(pattern: str) -> Optional[str]:
+        """Scope a pattern clears entirely, or None if it needs a scan.
+        
+        Only "service:namespace:guild_id:*" patterns with no other wildcards
+        map onto a tag set.
+        """
+        if not pattern.endswith(":*"):
+            return None
+        scope = pattern[:-2]
+        if any(char in scope for char in "*?[") or scope.count(":") != TAG_SCOPE_PARTS - 1:
+            return None
+        return scope
+    
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache.
         
@@ -196,7 +366,7 @@ class CacheManager(CacheManagerProtocol):
             
             # Deserialize value
             try:
-                value = self._deserialize(raw_value)
+                value = self._decode(raw_value)
                 self._cache_hits += 1
                 
                 self._logger.debug(
@@ -254,13 +424,20 @@ class CacheManager(CacheManagerProtocol):
             
             # Serialize value
             try:
-                serialized_value = self._serialize(value)
+                serialized_value = self._encode(value)
             except Exception as e:
                 self._logger.error(f"Failed to serialize value for key {key}: {e}")
                 raise CacheError(f"Serialization failed: {e}")
             
-            # Set value in Redis with TTL
-            await self._redis.setex(full_key, expire_time, serialized_value)
+            # Set value in Redis with TTL, tagging it if it belongs to a scope
+            scope = self._tag_scope(key)
+            if scope is None:
+                await self._redis.setex(full_key, expire_time, serialized_value)
+            else:
+                await self._set_tagged(
+                    keys=[full_key, self._build_tag_key(scope)],
+                    args=[expire_time, serialized_value]
+                )
             
             # Track response time
             response_time = (time.time() - start_time) * 1000
@@ -332,6 +509,10 @@ class CacheManager(CacheManagerProtocol):
     async def clear_pattern(self, pattern: str) -> int:
         """Clear all keys matching pattern.
         
+        "service:namespace:guild_id:*" patterns delete the members of that
+        scope's tag set in one round trip, at a cost independent of the
+        size of the keyspace. Other patterns fall back to scanning.
+        
         Args:
             pattern: Pattern to match (supports wildcards)
             
@@ -349,20 +530,11 @@ class CacheManager(CacheManagerProtocol):
             start_time = time.time()
             self._operations_count += 1
             
-            # Scan for matching keys (safer than KEYS command)
-            keys_to_delete = []
-            async for key in self._redis.scan_iter(match=full_pattern, count=100):
-                keys_to_delete.append(key)
-            
-            # Delete matching keys in batches
-            deleted_count = 0
-            if keys_to_delete:
-                # Use pipeline for batch deletion
-                pipe = self._redis.pipeline()
-                for key in keys_to_delete:
-                    pipe.delete(key)
-                results = await pipe.execute()
-                deleted_count = sum(results)
+            scope = self._pattern_scope(pattern)
+            if scope is not None:
+                deleted_count = await self._clear_tag(keys=[self._build_tag_key(scope)])
+            else:
+                deleted_count = await self._scan_and_delete(full_pattern)
             
             # Track response time
             response_time = (time.time() - start_time) * 1000
@@ -389,6 +561,23 @@ class CacheManager(CacheManagerProtocol):
             self._logger.error(f"Redis error during clear_pattern({pattern}): {e}")
             raise CacheError(f"Cache clear pattern operation failed: {e}")
     
+    async def _scan_and_delete(self, full_pattern: str) -> int:
+        """Delete keys matching a full pattern by scanning the keyspace."""
+        # Scan for matching keys (safer than KEYS command)
+        keys_to_delete = []
+        async for key in self._redis.scan_iter(match=full_pattern, count=100):
+            keys_to_delete.append(key)
+        
+        if not keys_to_delete:
+            return 0
+        
+        # Use pipeline for batch deletion
+        pipe = self._redis.pipeline()
+        for key in keys_to_delete:
+            pipe.delete(key)
+        results = await pipe.execute()
+        return sum(results)
+    
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache.
         
@@ -482,12 +671,12 @@ class CacheManager(CacheManagerProtocol):
             test_value = {"timestamp": current_time.isoformat()}
             
             # Set test value
-            await self._redis.setex(test_key, 10, self._serialize(test_value))
+            await self._redis.setex(test_key, 10, self._encode(test_value))
             
             # Get test value
             retrieved_value = await self._redis.get(test_key)
             if retrieved_value:
-                deserialized_value = self._deserialize(retrieved_value)
+                deserialized_value = self._decode(retrieved_value)
             
             # Clean up
             await self._redis.delete(test_key)
@@ -566,6 +755,10 @@ class CacheManager(CacheManagerProtocol):
             "avg_response_time_ms": avg_response_time,
             "total_errors": self._errors_count,
             "error_rate": error_rate,
+            "bytes_written": self._bytes_written,
+            "compression_ratio": (
+                self._bytes_written / self._bytes_uncompressed if self._bytes_uncompressed else 1.0
+            ),
             "last_health_check": self._last_health_check.isoformat() if self._last_health_check else None
         }
     
@@ -574,6 +767,8 @@ class CacheManager(CacheManagerProtocol):
         if self._redis:
             await self._redis.close()
             self._redis = None
+            self._set_tagged = None
+            self._clear_tag = None
         
         self._logger.info(
             "Cache manager closed",
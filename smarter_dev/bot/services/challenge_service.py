@@ -18,6 +18,7 @@ from smarter_dev.bot.services.api_client import APIClient
 from smarter_dev.bot.services.cache_manager import CacheManager
 from smarter_dev.bot.services.exceptions import ServiceError
 from smarter_dev.bot.services.models import ServiceHealth
+from smarter_dev.bot.services.rate_scheduler import Priority, request_priority
 
 logger = logging.getLogger(__name__)
 
@@ -102,20 +103,22 @@ class ChallengeService(BaseService):
     
     async def _announcement_loop(self) -> None:
         """Main loop for checking and announcing challenges."""
-        while self._running:
-            try:
-                # Check every 30 seconds for upcoming challenges
-                await self._check_and_queue_challenges()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in challenge announcement loop: {e}")
+        # Announcement polling runs behind command traffic
+        with request_priority(Priority.BACKGROUND):
+            while self._running:
+                try:
+                    # Check every 30 seconds for upcoming challenges
+                    await self._check_and_queue_challenges()
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.error(f"Error in challenge announcement loop: {e}")
             
-            # Wait 30 seconds before checking again for more precise timing
-            try:
-                await asyncio.sleep(30)  # 30 seconds
-            except asyncio.CancelledError:
-                break
+                # Wait 30 seconds before checking again for more precise timing
+                try:
+                    await asyncio.sleep(30)  # 30 seconds
+                except asyncio.CancelledError:
+                    break
     
     async def _check_and_queue_challenges(self) -> None:
         """Check for challenges and queue them for precise timing."""
@@ -0,0 +1,160 @@
+"""Tracks which members have claimed their daily bytes reward today.
+
+The bot awards the daily reward on a member's first message of the UTC day.
+Checking the store first lets every later message skip the claim request
+entirely. Lookups are answered from a local set, so the per-message check
+never leaves the process.
+
+The local set is warmed at startup from the API's list of today's claimers,
+so a restart doesn't send every active member's next message to the API
+just to get a 409 back. Optionally, claims are also written through to a
+Redis set per UTC day and guild; warming then reads Redis first, which lets
+shards and restarted processes share state without hitting the API.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import UTC, date, datetime
+from typing import Awaitable, Callable, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Fetches the user IDs that have claimed today in a guild
+ClaimersFetcher = Callable[[str], Awaitable[Iterable[str]]]
+
+
+def utc_today() -> date:
+    """Current UTC date, the day boundary used for daily claims."""
+    return datetime.now(UTC).date()
+
+
+class DailyClaimStore:
+    """Per-day set of (guild_id, user_id) pairs that have claimed.
+
+    Only the current day is kept; the set is dropped when the UTC date
+    changes, so there is nothing to clean up.
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        key_prefix: str = "daily_claims",
+        ttl_seconds: int = 2 * 24 * 60 * 60
+    ):
+        """Initialize the store.
+
+        Args:
+            redis_client: Optional async Redis client to share claims through
+            key_prefix: Prefix for the per-day Redis keys
+            ttl_seconds: Expiry for each day's Redis keys
+        """
+        self._redis = redis_client
+        self.key_prefix = key_prefix
+        self.ttl_seconds = ttl_seconds
+        self._day = utc_today()
+        self._claimed: Set[Tuple[str, str]] = set()
+
+    @property
+    def has_redis(self) -> bool:
+        return self._redis is not None
+
+    def _roll_over(self, today: date) -> None:
+        if today != self._day:
+            self._day = today
+            self._claimed = set()
+
+    def _key(self, day: date, guild_id: str) -> str:
+        return f"{self.key_prefix}:{day.isoformat()}:{guild_id}"
+
+    def has_claimed(self, guild_id: str, user_id: str, today: Optional[date] = None) -> bool:
+        """Whether the user is known to have claimed today."""
+        self._roll_over(today or utc_today())
+        return (guild_id, user_id) in self._claimed
+
+    def __len__(self) -> int:
+        return len(self._claimed)
+
+    async def mark_claimed(self, guild_id: str, user_id: str, today: Optional[date] = None) -> None:
+        """Record a claim locally and, if configured, in Redis."""
+        today = today or utc_today()
+        self._roll_over(today)
+        self._claimed.add((guild_id, user_id))
+
+        if self._redis is None:
+            return
+        key = self._key(today, guild_id)
+        try:
+            pipe = self._redis.pipeline()
+            pipe.sadd(key, user_id)
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+        except Exception as e:
+            # The local set still has the claim; other processes fall back to the API
+            logger.warning(f"Failed to record daily claim in Redis: {e}")
+
+    async def warm(
+        self,
+        guild_ids: Iterable[str],
+        fetch_claimers: Optional[ClaimersFetcher] = None,
+        today: Optional[date] = None
+    ) -> int:
+        """Load today's claims for the given guilds.
+
+        Redis is tried first when configured. A guild with no Redis entry is
+        loaded with ``fetch_claimers`` and, if Redis is configured, copied
+        into it for the next process.
+
+        Returns:
+            Number of claims loaded
+        """
+        today = today or utc_today()
+        self._roll_over(today)
+        loaded = 0
+
+        for guild_id in guild_ids:
+            user_ids = await self._read_redis(today, guild_id)
+            if user_ids is None and fetch_claimers is not None:
+                try:
+                    user_ids = set(await fetch_claimers(guild_id))
+                except Exception as e:
+                    logger.warning(f"Failed to load daily claimers for guild {guild_id}: {e}")
+                    continue
+                await self._write_redis(today, guild_id, user_ids)
+            if not user_ids:
+                continue
+            self._claimed.update((guild_id, user_id) for user_id in user_ids)
+            loaded += len(user_ids)
+
+        return loaded
+
+    async def _read_redis(self, day: date, guild_id: str) -> Optional[Set[str]]:
+        """Claimers recorded in Redis, or None when Redis has nothing for the guild."""
+        if self._redis is None:
+            return None
+        try:
+            members = await self._redis.smembers(self._key(day, guild_id))
+        except Exception as e:
+            logger.warning(f"Failed to read daily claims from Redis: {e}")
+            return None
+        if not members:
+            return None
+        return {m.decode() if isinstance(m, bytes) else m for m in members}
+
+    async def _write_redis(self, day: date, guild_id: str, user_ids: Set[str]) -> None:
+        if self._redis is None or not user_ids:
+            return
+        key = self._key(day, guild_id)
+        try:
+            pipe = self._redis.pipeline()
+            pipe.sadd(key, *user_ids)
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to copy daily claims to Redis: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis client; claims are tracked locally from then on."""
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
@@ -17,6 +17,10 @@ logger = logging.getLogger(__name__)
 class ForumAgentService(BaseService):
     """Service for managing forum monitoring agents and processing posts."""
     
+    # Cache TTL configurations (in seconds)
+    CACHE_TTL_AGENTS = 300  # 5 minutes
+    CACHE_TTL_AGENTS_EVENT_DRIVEN = 3000  # 50 minutes, evicted on admin edits
+    
     def __init__(self, api_client, cache_manager=None):
         super().__init__(api_client, cache_manager, "ForumAgentService")
         self._evaluations_processed = 0
@@ -39,6 +43,11 @@ class ForumAgentService(BaseService):
         Returns:
             List of forum agent configurations
         """
+        cache_key = self._build_cache_key("forum_agents", guild_id)
+        cached = await self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             response = await self._api_client.get(f"/guilds/{guild_id}/forum-agents")
             
@@ -51,6 +60,11 @@ class ForumAgentService(BaseService):
             # Parse successful response
             agents = response.json()
             logger.debug(f"Loaded {len(agents)} forum agents for guild {guild_id}")
+            await self._set_cached(
+                cache_key,
+                agents,
+                ttl=self.CACHE_TTL_AGENTS_EVENT_DRIVEN if self.cache_events_enabled else self.CACHE_TTL_AGENTS
+            )
             return agents
         except Exception as e:
             logger.error(f"Failed to load forum agents for guild {guild_id}: {e}")
@@ -32,6 +32,7 @@ class BytesBalance:
     last_daily: Optional[date] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    rank: Optional[int] = None
     
     def __post_init__(self):
         """Validate balance data after initialization."""
@@ -177,6 +178,18 @@ class BytesTransaction:
         return result
 
 
+@dataclass(frozen=True)
+class TransactionPage:
+    """One page of transaction history, newest first.
+    
+    ``next_cursor`` is passed back as ``before`` to fetch the next older
+    page and is None on the last page.
+    """
+    
+    transactions: List[BytesTransaction]
+    next_cursor: Optional[str] = None
+
+
 @dataclass(frozen=True)
 class TransferResult:
     """Result of a bytes transfer operation.
@@ -0,0 +1,288 @@
+"""Client-side pacing for the API's multi-tier rate limits.
+
+The API limits each key per second, per minute and per 15 minutes, and
+reports the state of every window on each response through
+``x-ratelimit-{limit,remaining,reset}-{second,minute,15min}`` headers (see
+``MultiTierRateLimiter._add_rate_limit_headers``).
+
+``RateLimitScheduler`` models each window as a token bucket refilling at
+``limit / duration`` tokens per second. A request goes out immediately
+while every bucket has a token, so the bot never waits while it still has
+budget. Otherwise it queues by priority and the next request is released as
+soon as all buckets have refilled:
+
+- ``INTERACTIVE``: slash commands and component interactions
+- ``NORMAL``: everything else (message events, startup)
+- ``BACKGROUND``: scheduler polls and retries of failed channels
+
+Background requests additionally leave a share of the minute and 15 minute
+budgets unused, so a long polling burst can't starve the next command.
+
+Server headers correct the local model on every response. The number of
+requests issued after the one that produced the headers is subtracted, so
+the correction stays right with requests in flight. The server counts
+requests in sliding logs, so a window it reports as used up frees nothing
+until its ``reset``; such a bucket stops refilling until then instead of
+releasing requests the server would reject. A 429 pauses all traffic for
+its ``retry-after``.
+
+Priority is taken from a context variable, so callers mark whole code paths
+with ``request_priority`` instead of passing a flag through every service
+method.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+
+class Priority(IntEnum):
+    """Request priority, lower values are served first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+_current_priority: ContextVar[Priority] = ContextVar("api_request_priority", default=Priority.NORMAL)
+
+
+def current_priority() -> Priority:
+    """Priority of API requests made from the current context."""
+    return _current_priority.get()
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Make API requests in this block (and tasks it creates) use ``priority``."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+# (header suffix, duration in seconds, default limit); defaults match the
+# APIKey model until the server reports the key's actual limits
+DEFAULT_WINDOWS: Tuple[Tuple[str, float, int], ...] = (
+    ("second", 1.0, 10),
+    ("minute", 60.0, 180),
+    ("15min", 900.0, 2500),
+)
+
+
+class TokenBucket:
+    """Token bucket modelling one server rate limit window."""
+
+    def __init__(self, name: str, duration: float, limit: int):
+        self.name = name
+        self.duration = duration
+        self.limit = limit
+        self.tokens = float(limit)
+        self._updated = time.monotonic()
+        self._reset_at: Optional[float] = None
+
+    def refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        if self._reset_at is not None:
+            if now < self._reset_at:
+                self._updated = now
+                return
+            # Everything the server counted when the window ran out has expired
+            self.tokens = min(float(self.limit), self.tokens + self.limit)
+            self._updated = self._reset_at
+            self._reset_at = None
+        elapsed = max(now - self._updated, 0.0)
+        self.tokens = min(float(self.limit), self.tokens + elapsed * self.limit / self.duration)
+        self._updated = now
+
+    def wait_time(self, now: float, needed: float = 1.0) -> float:
+        """Seconds until ``needed`` tokens are available."""
+        self.refill(now)
+        deficit = needed - self.tokens
+        if deficit <= 0:
+            return 0.0
+        if self._reset_at is not None:
+            return self._reset_at - now
+        if self.limit <= 0:
+            return self.duration
+        return deficit * self.duration / self.limit
+
+    def sync(self, limit: int, remaining: float, now: float, reset_in: Optional[float] = None) -> None:
+        """Replace the local estimate with the server's numbers.
+
+        Args:
+            limit: Window limit
+            remaining: Requests left, less any issued since the response
+            now: Monotonic time
+            reset_in: Seconds until the server's window resets; if nothing
+                is left, the bucket is held empty until then
+        """
+        self.refill(now)
+        self.limit = limit
+        self.tokens = min(float(limit), remaining)
+        if remaining > 0:
+            self._reset_at = None
+        elif reset_in is not None:
+            # The window can't take longer than its duration to clear
+            self._reset_at = now + min(max(reset_in, 0.0), self.duration)
+
+
+class RateLimitScheduler:
+    """Paces and prioritizes API requests to stay inside the server's limits."""
+
+    def __init__(
+        self,
+        windows: Tuple[Tuple[str, float, int], ...] = DEFAULT_WINDOWS,
+        background_reserve: float = 0.2
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            windows: (header suffix, duration, limit) per server window
+            background_reserve: Share of the minute and longer windows that
+                background requests leave for everything else
+        """
+        self._buckets = [TokenBucket(name, duration, limit) for name, duration, limit in windows]
+        self._background_reserve = background_reserve
+        self._queue: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._issued = 0
+        self._paused_until = 0.0
+        self._wakeup = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.granted = 0
+        self.queued = 0
+        self.wait_seconds = 0.0
+        self.throttled = 0
+
+    def _needed(self, bucket: TokenBucket, priority: Priority) -> float:
+        if priority == Priority.BACKGROUND and bucket.duration > 1:
+            return 1 + bucket.limit * self._background_reserve
+        return 1.0
+
+    def _wait_time(self, priority: Priority, now: float) -> float:
+        wait = max(self._paused_until - now, 0.0)
+        for bucket in self._buckets:
+            wait = max(wait, bucket.wait_time(now, self._needed(bucket, priority)))
+        return wait
+
+    def _take(self) -> int:
+        for bucket in self._buckets:
+            bucket.tokens -= 1
+        self._issued += 1
+        self.granted += 1
+        return self._issued
+
+    async def acquire(self, priority: Optional[Priority] = None) -> int:
+        """Wait until a request may be sent.
+
+        Args:
+            priority: Defaults to the context's ``request_priority``
+
+        Returns:
+            Ticket to pass to ``update`` with the response headers
+        """
+        if priority is None:
+            priority = current_priority()
+
+        # Go straight out if nothing at this priority or above is waiting
+        queue_ahead = self._queue and self._queue[0][0] <= priority
+        if not queue_ahead and self._wait_time(priority, time.monotonic()) == 0:
+            return self._take()
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (int(priority), next(self._sequence), future))
+        self.queued += 1
+        self._wakeup.set()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        start_time = time.monotonic()
+        try:
+            return await future
+        finally:
+            self.wait_seconds += time.monotonic() - start_time
+
+    async def _dispatch(self) -> None:
+        while self._queue:
+            priority, _, future = self._queue[0]
+            if future.done():
+                # Cancelled while waiting
+                heapq.heappop(self._queue)
+                continue
+
+            wait = self._wait_time(Priority(priority), time.monotonic())
+            if wait > 0:
+                # Wake early if a more urgent request or fresh headers arrive
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._queue)
+            future.set_result(self._take())
+
+    def update(self, headers: Mapping[str, str], ticket: int) -> None:
+        """Correct the local budget from a response's rate limit headers.
+
+        Args:
+            headers: Response headers
+            ticket: Ticket returned by ``acquire`` for that request
+        """
+        issued_since = self._issued - ticket
+        now = time.monotonic()
+        wall_now = time.time()
+        for bucket in self._buckets:
+            remaining = headers.get(f"x-ratelimit-remaining-{bucket.name}")
+            if remaining is None:
+                continue
+            try:
+                limit = int(headers.get(f"x-ratelimit-limit-{bucket.name}", bucket.limit))
+                reset = headers.get(f"x-ratelimit-reset-{bucket.name}")
+                # Reset is a Unix timestamp truncated to whole seconds
+                reset_in = float(reset) + 1 - wall_now if reset is not None else None
+                bucket.sync(limit, int(remaining) - issued_since, now, reset_in)
+            except ValueError:
+                continue
+        self._wakeup.set()
+
+    def throttle(self, retry_after: Optional[float]) -> None:
+        """Pause all requests after the server rejected one with a 429."""
+        self.throttled += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + (retry_after or 1.0))
+
+    def close(self) -> None:
+        """Stop dispatching and cancel waiting requests."""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        for _, _, future in self._queue:
+            if not future.done():
+                future.cancel()
+        self._queue.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler counters and the current budget per window."""
+        now = time.monotonic()
+        for bucket in self._buckets:
+            bucket.refill(now)
+        return {
+            "granted": self.granted,
+            "queued": self.queued,
+            "waiting": sum(1 for _, _, future in self._queue if not future.done()),
+            "wait_seconds": self.wait_seconds,
+            "throttled": self.throttled,
+            "budget": {bucket.name: int(bucket.tokens) for bucket in self._buckets},
+        }
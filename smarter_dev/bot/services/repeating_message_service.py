@@ -19,6 +19,7 @@ from smarter_dev.bot.services.api_client import APIClient
 from smarter_dev.bot.services.cache_manager import CacheManager
 from smarter_dev.bot.services.exceptions import ServiceError
 from smarter_dev.bot.services.models import ServiceHealth
+from smarter_dev.bot.services.rate_scheduler import Priority, request_priority
 
 logger = logging.getLogger(__name__)
 
@@ -104,20 +105,22 @@ class RepeatingMessageService(BaseService):
     
     async def _message_loop(self) -> None:
         """Main loop for checking and sending repeating messages."""
-        while self._running:
-            try:
-                # Check for due messages
-                await self._check_and_send_due_messages()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in repeating message loop: {e}")
+        # Polls yield rate limit budget to commands
+        with request_priority(Priority.BACKGROUND):
+            while self._running:
+                try:
+                    # Check for due messages
+                    await self._check_and_send_due_messages()
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.error(f"Error in repeating message loop: {e}")
             
-            # Wait until the next minute boundary
-            try:
-                await self._wait_until_next_minute()
-            except asyncio.CancelledError:
-                break
+                # Wait until the next minute boundary
+                try:
+                    await self._wait_until_next_minute()
+                except asyncio.CancelledError:
+                    break
     
     async def _wait_until_next_minute(self) -> None:
         """Wait until the next minute boundary (xx:xx:00)."""
@@ -18,6 +18,7 @@ from smarter_dev.bot.services.api_client import APIClient
 from smarter_dev.bot.services.cache_manager import CacheManager
 from smarter_dev.bot.services.exceptions import ServiceError
 from smarter_dev.bot.services.models import ServiceHealth
+from smarter_dev.bot.services.rate_scheduler import Priority, request_priority
 
 logger = logging.getLogger(__name__)
 
@@ -102,20 +103,22 @@ class ScheduledMessageService(BaseService):
     
     async def _message_loop(self) -> None:
         """Main loop for checking and sending scheduled messages."""
-        while self._running:
-            try:
-                # Check every 30 seconds for upcoming messages
-                await self._check_and_queue_scheduled_messages()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in scheduled message loop: {e}")
+        # Scheduler polls are background API traffic
+        with request_priority(Priority.BACKGROUND):
+            while self._running:
+                try:
+                    # Check every 30 seconds for upcoming messages
+                    await self._check_and_queue_scheduled_messages()
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.error(f"Error in scheduled message loop: {e}")
             
-            # Wait 30 seconds before checking again
-            try:
-                await asyncio.sleep(30)  # 30 seconds for more precise timing
-            except asyncio.CancelledError:
-                break
+                # Wait 30 seconds before checking again
+                try:
+                    await asyncio.sleep(30)  # 30 seconds for more precise timing
+                except asyncio.CancelledError:
+                    break
     
     async def _check_and_queue_scheduled_messages(self) -> None:
         """Check for scheduled messages and queue them for precise timing."""
@@ -12,7 +12,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from smarter_dev.bot.services.base import BaseService, APIClientProtocol, CacheManagerProtocol
+from smarter_dev.bot.services.base import BaseService, APIClientProtocol, CacheManagerProtocol, is_missing
 from smarter_dev.bot.services.exceptions import (
     AlreadyInSquadError,
     APIError,
@@ -128,7 +128,8 @@ class SquadsService(BaseService):
             if include_inactive:
                 params["include_inactive"] = "true"
             
-            response = await self._api_client.get(
+            response = await self._coalesced_get(
+                cache_key,
                 f"/guilds/{guild_id}/squads",
                 params=params,
                 timeout=10.0
@@ -201,6 +202,9 @@ class SquadsService(BaseService):
         # Try cache first if enabled
         if use_cache and self.has_cache:
             cached_squad = await self._get_cached(cache_key)
+            if is_missing(cached_squad):
+                self._cache_hits += 1
+                raise ResourceNotFoundError("squad", str(squad_id))
             if cached_squad:
                 self._cache_hits += 1
                 return self._parse_squad_data(cached_squad)
@@ -209,12 +213,15 @@ class SquadsService(BaseService):
         try:
             self._log_operation("get_squad", guild_id=guild_id, squad_id=str(squad_id))
             
-            response = await self._api_client.get(
+            response = await self._coalesced_get(
+                cache_key,
                 f"/guilds/{guild_id}/squads/{squad_id}",
                 timeout=10.0
             )
             
             if response.status_code == 404:
+                if use_cache and self.has_cache:
+                    await self._set_missing(cache_key)
                 raise ResourceNotFoundError("squad", str(squad_id))
             
             if response.status_code >= 400:
@@ -301,7 +308,8 @@ class SquadsService(BaseService):
             
             self._log_operation("get_user_squad", guild_id=guild_id, user_id=user_id)
             
-            response = await self._api_client.get(
+            response = await self._coalesced_get(
+                cache_key,
                 f"/guilds/{guild_id}/squads/members/{user_id}",
                 timeout=10.0
             )
@@ -808,7 +816,8 @@ class SquadsService(BaseService):
             "cache_hits": self._cache_hits,
             "cache_misses": self._cache_misses,
             "cache_hit_rate": cache_hit_rate,
-            "cache_enabled": self.has_cache
+            "cache_enabled": self.has_cache,
+            "cache": await self._get_cache_stats()
         }
     
     # Cache management helper methods
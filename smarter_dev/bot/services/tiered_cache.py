@@ -0,0 +1,226 @@
+"""Two-tier cache for bot services.
+
+A bounded in-process LRU sits in front of an optional shared cache (the
+Redis-backed ``CacheManager``). Reads are answered locally when possible and
+fall back to the shared tier, whose hits are copied into the LRU. Writes and
+invalidations go to both tiers.
+
+Local entries live for at most the namespace's local TTL (the second part of
+a service cache key, e.g. ``balance`` in ``bytesservice:balance:...``) so one
+shard's copy never drifts far from the shared tier. The cache also coalesces
+concurrent loads of the same key into a single call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from smarter_dev.bot.services.base import CacheManagerProtocol
+from smarter_dev.bot.services.models import ServiceHealth
+
+logger = logging.getLogger(__name__)
+
+
+class TieredCache(CacheManagerProtocol):
+    """In-process LRU in front of an optional shared cache manager."""
+
+    # Upper bound on how long a local copy is served, per key namespace
+    DEFAULT_LOCAL_TTLS = {
+        "balance": 30,
+        "leaderboard": 30,
+        "transactions": 30,
+        "config": 120,
+        "squads": 60,
+        "squad": 60,
+        "user_squad": 30,
+    }
+
+    def __init__(
+        self,
+        remote: Optional[CacheManagerProtocol] = None,
+        max_entries: int = 5000,
+        default_ttl: int = 300,
+        local_ttls: Optional[Dict[str, int]] = None,
+        default_local_ttl: int = 60
+    ):
+        """Initialize the cache.
+
+        Args:
+            remote: Shared cache tier, or None for a local-only cache
+            max_entries: Maximum number of local entries before evicting
+            default_ttl: TTL used when a caller doesn't pass one
+            local_ttls: Local TTL caps per key namespace
+            default_local_ttl: Local TTL cap for namespaces not in local_ttls
+        """
+        self._remote = remote
+        self._max_entries = max_entries
+        self._default_ttl = default_ttl
+        self._local_ttls = {**self.DEFAULT_LOCAL_TTLS, **(local_ttls or {})}
+        self._default_local_ttl = default_local_ttl
+
+        # key -> (expires_at, value), least recently used first
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # Metrics
+        self._local_hits = 0
+        self._remote_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._coalesced = 0
+        self._remote_errors = 0
+
+    @staticmethod
+    def _namespace(key: str) -> str:
+        parts = key.split(":", 2)
+        return parts[1] if len(parts) > 1 else parts[0]
+
+    def _local_ttl(self, key: str, ttl: int) -> int:
+        return min(ttl, self._local_ttls.get(self._namespace(key), self._default_local_ttl))
+
+    def _store_local(self, key: str, value: Any, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + self._local_ttl(key, ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _get_local(self, key: str) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value, trying the local tier before the shared one."""
+        found, value = self._get_local(key)
+        if found:
+            self._local_hits += 1
+            return value
+
+        if self._remote is not None:
+            try:
+                value = await self._remote.get(key)
+            except Exception as e:
+                self._remote_errors += 1
+                logger.warning(f"Shared cache get failed for key {key}: {e}")
+                value = None
+            if value is not None:
+                self._remote_hits += 1
+                # The shared tier doesn't report the remaining TTL; the local cap bounds it
+                self._store_local(key, value, self._default_ttl)
+                return value
+
+        self._misses += 1
+        return None
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set a value in both tiers."""
+        ttl = ttl or self._default_ttl
+        self._store_local(key, value, ttl)
+        if self._remote is not None:
+            try:
+                await self._remote.set(key, value, ttl)
+            except Exception as e:
+                self._remote_errors += 1
+                logger.warning(f"Shared cache set failed for key {key}: {e}")
+
+    async def delete(self, key: str) -> None:
+        """Delete a value from both tiers."""
+        self._entries.pop(key, None)
+        if self._remote is not None:
+            try:
+                await self._remote.delete(key)
+            except Exception as e:
+                self._remote_errors += 1
+                logger.warning(f"Shared cache delete failed for key {key}: {e}")
+
+    async def clear_pattern(self, pattern: str) -> int:
+        """Delete keys matching a glob pattern from both tiers.
+
+        Returns:
+            Number of keys deleted from the shared tier, or from the local
+            tier when there is no shared tier
+        """
+        matching = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+        for key in matching:
+            del self._entries[key]
+        if self._remote is not None:
+            return await self._remote.clear_pattern(pattern)
+        return len(matching)
+
+    async def coalesce(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``loader`` once for all concurrent callers with the same key.
+
+        Callers arriving while a load is in flight wait for its result (or
+        its exception) instead of starting their own. The load runs in its
+        own task, so cancelling the caller that started it doesn't cancel it
+        for the others.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._coalesced += 1
+        else:
+            inflight = asyncio.create_task(loader())
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda task: self._finish_load(key, task))
+        return await asyncio.shield(inflight)
+
+    def _finish_load(self, key: str, task: asyncio.Task) -> None:
+        del self._inflight[key]
+        if not task.cancelled():
+            # Mark retrieved so an unawaited failure isn't logged
+            task.exception()
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get hit rates and sizes for both tiers."""
+        lookups = self._local_hits + self._remote_hits + self._misses
+        stats = {
+            "local_entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "local_hits": self._local_hits,
+            "remote_hits": self._remote_hits,
+            "misses": self._misses,
+            "hit_rate": (self._local_hits + self._remote_hits) / lookups if lookups else 0.0,
+            "local_hit_rate": self._local_hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "coalesced_requests": self._coalesced,
+            "remote_errors": self._remote_errors,
+            "remote_enabled": self._remote is not None,
+        }
+        if self._remote is not None and hasattr(self._remote, "get_stats"):
+            stats["remote"] = await self._remote.get_stats()
+        return stats
+
+    async def health_check(self) -> ServiceHealth:
+        """Report health; the local tier keeps serving if the shared tier is down."""
+        details: Dict[str, Any] = await self.get_stats()
+        response_time = None
+        if self._remote is not None:
+            remote_health = await self._remote.health_check()
+            details["remote_healthy"] = remote_health.is_healthy
+            response_time = remote_health.response_time_ms
+        return ServiceHealth(
+            service_name="TieredCache",
+            is_healthy=True,
+            response_time_ms=response_time,
+            last_check=datetime.now(timezone.utc),
+            details=details
+        )
+
+    async def cleanup(self) -> None:
+        """Drop local entries and close the shared tier."""
+        self._entries.clear()
+        if self._remote is not None and hasattr(self._remote, "close"):
+            await self._remote.close()
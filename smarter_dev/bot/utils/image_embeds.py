@@ -1420,7 +1420,8 @@ class EmbedImageGenerator:
         streak_count: int = 0,
         last_daily: Optional[str] = None,
         total_received: int = 0,
-        total_sent: int = 0
+        total_sent: int = 0,
+        rank: Optional[int] = None
     ) -> hikari.files.Bytes:
         """Create a compact balance embed with table layout matching other commands.
         
@@ -1431,6 +1432,7 @@ class EmbedImageGenerator:
             last_daily: Last daily claim date string
             total_received: Total bytes received
             total_sent: Total bytes sent
+            rank: Position on the guild leaderboard
             
         Returns:
             Bytes object containing the embed image
@@ -1480,6 +1482,9 @@ class EmbedImageGenerator:
             ("Balance:", f"{balance:,} bytes", "#00E1FF"),
         ]
         
+        if rank:
+            rows.append(("Rank:", f"#{rank:,}", "#FFD700"))
+        
         if streak_count > 0:
             rows.append(("Streak:", f"{streak_count} days", "#FF6B35"))
         
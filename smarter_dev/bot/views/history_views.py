@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import hikari
 import logging
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 if TYPE_CHECKING:
     from smarter_dev.bot.services.models import Transaction
@@ -18,15 +18,25 @@ logger = logging.getLogger(__name__)
 class HistoryShareView:
     """View with share button for history command."""
     
-    def __init__(self, transactions: List['Transaction'], user_id: str):
+    def __init__(
+        self,
+        transactions: List['Transaction'],
+        user_id: str,
+        next_cursor: Optional[str] = None,
+        limit: int = 10
+    ):
         """Initialize the history share view.
         
         Args:
             transactions: Transaction history
             user_id: User ID for display context
+            next_cursor: Cursor for the next older page, if there is one
+            limit: Page size to keep when paging
         """
         self.transactions = transactions
         self.user_id = user_id
+        self.next_cursor = next_cursor
+        self.limit = limit
         self._timeout = 300  # 5 minutes
     
     def build_components(self) -> list[hikari.api.ComponentBuilder]:
@@ -40,4 +50,14 @@ class HistoryShareView:
         
         action_row = hikari.impl.MessageActionRowBuilder()
         action_row.add_component(share_button)
-        return [action_row]
\ No newline at end of file
+        
+        if self.next_cursor:
+            older_button = hikari.impl.InteractiveButtonBuilder(
+                style=hikari.ButtonStyle.SECONDARY,
+                custom_id=f"history_page:{self.limit}:{self.next_cursor}",
+                emoji="⏪",
+                label="Older"
+            )
+            action_row.add_component(older_button)
+        
+        return [action_row]
@@ -48,6 +48,34 @@ class Settings(BaseSettings):
         default="",
         description="Discord application ID",
     )
+    bot_daily_claim_store: str = Field(
+        default="memory",
+        description="Where the bot tracks today's daily claims (memory or redis)",
+    )
+    bot_cache_enabled: bool = Field(
+        default=True,
+        description="Cache API reads in bot services",
+    )
+    bot_cache_max_entries: int = Field(
+        default=5000,
+        description="Maximum entries in the bot's in-process cache",
+    )
+    bot_cache_redis_enabled: bool = Field(
+        default=False,
+        description="Share the bot's cache across processes through Redis",
+    )
+    bot_cache_serialization: str = Field(
+        default="json",
+        description="Serialization for the shared bot cache (json, pickle, or msgpack)",
+    )
+    bot_cache_compression_threshold: int = Field(
+        default=1024,
+        description="Compress shared bot cache values larger than this many bytes",
+    )
+    bot_cache_invalidation_enabled: bool = Field(
+        default=False,
+        description="Evict cached config, squads and forum agents on web change events",
+    )
 
     # API
     api_secret_key: str = Field(
@@ -64,6 +92,34 @@ class Settings(BaseSettings):
         default="",
         description="Secure API key for bot to authenticate with web API (sk-xxxxx format)",
     )
+    bot_api_http2: bool = Field(
+        default=False,
+        description="Multiplex bot API requests over a few HTTP/2 connections",
+    )
+    bot_api_http2_connections: int = Field(
+        default=4,
+        description="Connections the bot keeps to the API in HTTP/2 mode",
+    )
+    bot_api_keepalive_expiry: float = Field(
+        default=60.0,
+        description="Seconds the bot keeps an idle API connection open",
+    )
+    bot_api_warmup_connections: int = Field(
+        default=2,
+        description="API connections the bot opens at startup (0 disables warmup)",
+    )
+    bot_metrics_port: int = Field(
+        default=0,
+        description="Port for the bot's Prometheus /metrics endpoint (0 disables it)",
+    )
+    bot_api_coalesce_gets: bool = Field(
+        default=True,
+        description="Share one response among identical concurrent bot API GETs",
+    )
+    bot_api_batch_window_ms: int = Field(
+        default=0,
+        description="Collect daily claims for this many ms into one bulk request (0 disables)",
+    )
 
     # Web Application
     web_session_secret: str = Field(
@@ -136,6 +192,91 @@ class Settings(BaseSettings):
         default=60,
         description="Rate limit window in seconds",
     )
+    rate_limit_backend: str = Field(
+        default="database",
+        description="API key rate limit counter backend (database, memory or redis)",
+    )
+
+    # Security Log Writer
+    security_log_queue_size: int = Field(
+        default=10000,
+        description="Maximum security log events waiting for the background writer",
+    )
+    security_log_batch_size: int = Field(
+        default=500,
+        description="Maximum security log rows written per INSERT",
+    )
+    security_log_flush_interval_ms: int = Field(
+        default=250,
+        description="Milliseconds the background writer waits to fill a batch",
+    )
+    security_log_overflow_policy: str = Field(
+        default="drop",
+        description="What to do when the security log queue is full (drop or block)",
+    )
+
+    security_log_retention_days: int = Field(
+        default=90,
+        description="Days of security logs to keep",
+    )
+    security_log_partition_days_ahead: int = Field(
+        default=7,
+        description="Daily security log partitions to create ahead of time",
+    )
+    security_log_maintenance_interval_minutes: int = Field(
+        default=60,
+        description="Minutes between security log partition maintenance runs",
+    )
+
+    # Admin Dashboard Stats
+    stats_rollup_interval_minutes: int = Field(
+        default=5,
+        description="Minutes between refreshes of the admin dashboard stats rollup",
+    )
+
+    # Challenge Input Generation
+    challenge_script_workers: int = Field(
+        default=2,
+        description="Worker processes that run challenge input generator scripts",
+    )
+    challenge_script_timeout: float = Field(
+        default=10.0,
+        description="Seconds a generator script may run before its worker is killed",
+    )
+    challenge_script_cpu_limit: float = Field(
+        default=5.0,
+        description="CPU seconds a generator script may use (0 disables the limit)",
+    )
+    challenge_script_max_output: int = Field(
+        default=1_000_000,
+        description="Maximum characters a generator script may print",
+    )
+
+    # API Key Cache
+    api_key_cache_ttl: int = Field(
+        default=60,
+        description="Seconds a verified API key is cached (0 disables the cache)",
+    )
+    api_key_cache_size: int = Field(
+        default=1024,
+        description="Maximum number of verified API keys kept in the cache",
+    )
+    api_key_cache_pubsub_enabled: bool = Field(
+        default=True,
+        description="Propagate API key cache invalidations to other replicas via Redis",
+    )
+    leaderboard_cache_enabled: bool = Field(
+        default=True,
+        description="Serve leaderboards and ranks from a Redis sorted set per guild",
+    )
+    leaderboard_cache_ttl: int = Field(
+        default=900,
+        description="Seconds before a guild leaderboard is rebuilt from the database",
+    )
+    cache_change_events_enabled: bool = Field(
+        default=True,
+        description="Publish config, squad and forum agent changes so the bot can evict its cache",
+    )
 
     # Security Settings
     api_docs_enabled: bool = Field(
@@ -174,6 +315,46 @@ class Settings(BaseSettings):
             raise ValueError(f"Log level must be one of: {valid_levels}")
         return v
 
+    @field_validator("rate_limit_backend")
+    @classmethod
+    def validate_rate_limit_backend(cls, v: str) -> str:
+        """Validate rate limit backend."""
+        valid_backends = {"database", "memory", "redis"}
+        v = v.lower()
+        if v not in valid_backends:
+            raise ValueError(f"Rate limit backend must be one of: {valid_backends}")
+        return v
+
+    @field_validator("bot_daily_claim_store")
+    @classmethod
+    def validate_bot_daily_claim_store(cls, v: str) -> str:
+        """Validate daily claim store backend."""
+        valid_backends = {"memory", "redis"}
+        v = v.lower()
+        if v not in valid_backends:
+            raise ValueError(f"Daily claim store must be one of: {valid_backends}")
+        return v
+
+    @field_validator("bot_cache_serialization")
+    @classmethod
+    def validate_bot_cache_serialization(cls, v: str) -> str:
+        """Validate bot cache serialization."""
+        valid_serializations = {"json", "pickle", "msgpack"}
+        v = v.lower()
+        if v not in valid_serializations:
+            raise ValueError(f"Bot cache serialization must be one of: {valid_serializations}")
+        return v
+
+    @field_validator("security_log_overflow_policy")
+    @classmethod
+    def validate_security_log_overflow_policy(cls, v: str) -> str:
+        """Validate security log overflow policy."""
+        valid_policies = {"drop", "block"}
+        v = v.lower()
+        if v not in valid_policies:
+            raise ValueError(f"Security log overflow policy must be one of: {valid_policies}")
+        return v
+
     @field_validator("discord_bot_token")
     @classmethod
     def validate_discord_bot_token(cls, v: str) -> str:
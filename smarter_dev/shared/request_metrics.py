@@ -0,0 +1,240 @@
+"""Per-route request metrics shared by the bot API client and the web API.
+
+Both sides of bot-to-API traffic record each request under its route
+template (``/guilds/{id}/bytes/balance/{id}``) so one slow endpoint or guild
+doesn't disappear into a global average. Latencies go into log-linear
+histograms in the style of HDR histograms: every power of two is split into
+a fixed number of linear sub-buckets, which keeps relative error bounded
+(about 6% with 16 sub-buckets) in constant memory per route.
+
+``RequestMetrics.render_prometheus`` exports everything in the Prometheus
+text format for the ``/metrics`` endpoints.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# Path segments replaced with placeholders when building route templates
+_ID_SEGMENT = re.compile(r"^\d+$")
+_UUID_SEGMENT = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
+
+def route_template(path: str) -> str:
+    """Collapse IDs in a request path into placeholders.
+
+    Example: ``/guilds/123/bytes/balance/456`` -> ``/guilds/{id}/bytes/balance/{id}``
+    """
+    path = path.split("?", 1)[0]
+    segments = []
+    for segment in path.split("/"):
+        if _ID_SEGMENT.match(segment):
+            segments.append("{id}")
+        elif _UUID_SEGMENT.match(segment):
+            segments.append("{uuid}")
+        else:
+            segments.append(segment)
+    return "/".join(segments)
+
+
+class LatencyHistogram:
+    """Log-linear histogram of latencies in milliseconds."""
+
+    def __init__(self, sub_buckets: int = 16, min_value: float = 0.01):
+        """Initialize the histogram.
+
+        Args:
+            sub_buckets: Linear buckets per power of two
+            min_value: Smallest distinguished value; anything below shares
+                the first bucket
+        """
+        self._sub_buckets = sub_buckets
+        self._min_value = min_value
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _index(self, value: float) -> int:
+        scaled = max(value / self._min_value, 1.0)
+        exponent = int(math.floor(math.log2(scaled)))
+        sub = int((scaled / (2 ** exponent) - 1) * self._sub_buckets)
+        return exponent * self._sub_buckets + min(sub, self._sub_buckets - 1)
+
+    def _upper_bound(self, index: int) -> float:
+        exponent, sub = divmod(index, self._sub_buckets)
+        return (2 ** exponent) * (1 + (sub + 1) / self._sub_buckets) * self._min_value
+
+    def record(self, value: float) -> None:
+        """Record one latency."""
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, percentile: float) -> float:
+        """Latency at or below which ``percentile`` percent of values fall.
+
+        Reported as the upper bound of the bucket, capped at the maximum.
+        """
+        if self.count == 0:
+            return 0.0
+        target = max(1, math.ceil(percentile / 100 * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        """Summary of the histogram."""
+        return {
+            "count": self.count,
+            "mean_ms": self.mean,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max,
+        }
+
+
+@dataclass
+class RouteStats:
+    """Counters and latency histogram for one route."""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    status_codes: Dict[int, int] = field(default_factory=dict)
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            **self.latency.snapshot(),
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "status_codes": dict(self.status_codes),
+        }
+
+
+class RequestMetrics:
+    """Request metrics keyed by method and route template."""
+
+    def __init__(self, max_routes: int = 200):
+        """Initialize the registry.
+
+        Args:
+            max_routes: Routes tracked individually; the rest are grouped
+                under "other" so unexpected paths can't grow memory
+        """
+        self._max_routes = max_routes
+        self._routes: Dict[str, RouteStats] = {}
+        # Latency of every request, whatever its route
+        self.latency = LatencyHistogram()
+        self.rate_limit_waits = 0
+        self.rate_limit_wait_seconds = 0.0
+
+    def _stats(self, method: str, route: str) -> RouteStats:
+        key = f"{method} {route}"
+        stats = self._routes.get(key)
+        if stats is None:
+            if len(self._routes) >= self._max_routes:
+                key = f"{method} other"
+                stats = self._routes.get(key)
+                if stats is not None:
+                    return stats
+            stats = self._routes[key] = RouteStats()
+        return stats
+
+    def record(
+        self,
+        method: str,
+        route: str,
+        duration_ms: float,
+        status_code: Optional[int] = None,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        retries: int = 0
+    ) -> None:
+        """Record one completed request (including all of its retries).
+
+        Args:
+            method: HTTP method
+            route: Route template
+            duration_ms: Total time spent on the request
+            status_code: Final status code, or None if no response arrived
+            bytes_sent: Request body size
+            bytes_received: Response body size
+            retries: Attempts after the first
+        """
+        stats = self._stats(method, route)
+        stats.requests += 1
+        stats.latency.record(duration_ms)
+        self.latency.record(duration_ms)
+        stats.retries += retries
+        stats.bytes_sent += bytes_sent
+        stats.bytes_received += bytes_received
+        if status_code is None or status_code >= 500:
+            stats.errors += 1
+        if status_code is not None:
+            stats.status_codes[status_code] = stats.status_codes.get(status_code, 0) + 1
+
+    def record_rate_limit_wait(self, seconds: float) -> None:
+        """Record time spent waiting for a rate limit window."""
+        self.rate_limit_waits += 1
+        self.rate_limit_wait_seconds += seconds
+
+    def snapshot(self) -> Dict[str, object]:
+        """All metrics as a JSON-serializable dict."""
+        return {
+            "routes": {key: stats.snapshot() for key, stats in sorted(self._routes.items())},
+            "rate_limit_waits": self.rate_limit_waits,
+            "rate_limit_wait_seconds": self.rate_limit_wait_seconds,
+        }
+
+    def render_prometheus(self, prefix: str) -> str:
+        """Metrics in the Prometheus text exposition format."""
+        routes = []
+        for key, stats in sorted(self._routes.items()):
+            method, route = key.split(" ", 1)
+            routes.append((f'method="{method}",route="{route}"', stats))
+        lines: List[str] = []
+        # Each family's TYPE line and samples must be contiguous
+        for name, field in (
+            ("requests_total", "requests"),
+            ("request_errors_total", "errors"),
+            ("request_retries_total", "retries"),
+            ("request_bytes_total", "bytes_sent"),
+            ("response_bytes_total", "bytes_received"),
+        ):
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for labels, stats in routes:
+                lines.append(f"{prefix}_{name}{{{labels}}} {getattr(stats, field)}")
+        lines.append(f"# TYPE {prefix}_request_duration_ms summary")
+        for labels, stats in routes:
+            for quantile in (0.5, 0.9, 0.99):
+                value = stats.latency.percentile(quantile * 100)
+                lines.append(
+                    f'{prefix}_request_duration_ms{{{labels},quantile="{quantile}"}} {value:.3f}'
+                )
+            lines.append(f"{prefix}_request_duration_ms_sum{{{labels}}} {stats.latency.total:.3f}")
+            lines.append(f"{prefix}_request_duration_ms_count{{{labels}}} {stats.latency.count}")
+        lines.append(f"# TYPE {prefix}_rate_limit_wait_seconds_total counter")
+        lines.append(f"{prefix}_rate_limit_wait_seconds_total {self.rate_limit_wait_seconds:.3f}")
+        return "\n".join(lines) + "\n"
@@ -33,6 +33,7 @@ from smarter_dev.web.models import (
 )
 from smarter_dev.web.crud import BytesOperations, BytesConfigOperations, SquadOperations, SquadSaleEventOperations, APIKeyOperations, ForumAgentOperations, CampaignOperations, ScheduledMessageOperations, RepeatingMessageOperations, ConflictError
 from smarter_dev.web.security import generate_secure_api_key
+from smarter_dev.web.stats_rollup import get_dashboard_stats, run_stats_rollup
 from smarter_dev.web.admin.auth import admin_required
 from smarter_dev.web.admin.discord import (
     get_bot_guilds,
@@ -53,108 +54,39 @@ async def dashboard(request: Request) -> Response:
         # Get bot guilds from Discord
         guilds = await get_bot_guilds()
         
-        # Get overall statistics from database
+        # Read overall and per-guild statistics from the rollup
         async with get_db_session_context() as session:
-            # Total unique users across all guilds
-            total_users_result = await session.execute(
-                select(func.count(distinct(BytesBalance.user_id)))
-            )
-            total_users = total_users_result.scalar() or 0
-            
-            # Total transactions
-            total_transactions_result = await session.execute(
-                select(func.count(BytesTransaction.id))
-            )
-            total_transactions = total_transactions_result.scalar() or 0
-            
-            # Total squads
-            total_squads_result = await session.execute(
-                select(func.count(Squad.id))
-            )
-            total_squads = total_squads_result.scalar() or 0
-            
-            # Total bytes in circulation
-            total_bytes_result = await session.execute(
-                select(func.coalesce(func.sum(BytesBalance.balance), 0))
-            )
-            total_bytes = total_bytes_result.scalar() or 0
-            
-            # Help conversation statistics
-            total_conversations_result = await session.execute(
-                select(func.count(HelpConversation.id))
-            )
-            total_conversations = total_conversations_result.scalar() or 0
-            
-            # Total tokens used by help agent
-            help_tokens_result = await session.execute(
-                select(func.coalesce(func.sum(HelpConversation.tokens_used), 0))
-            )
-            help_tokens = help_tokens_result.scalar() or 0
-            
-            # Total tokens used by forum agents
-            forum_tokens_result = await session.execute(
-                select(func.coalesce(func.sum(ForumAgentResponse.tokens_used), 0))
-            )
-            forum_tokens = forum_tokens_result.scalar() or 0
-            
-            # Combined total tokens
-            total_tokens = help_tokens + forum_tokens
-            
-            # Conversations today
-            from datetime import datetime, timezone
-            today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-            conversations_today_result = await session.execute(
-                select(func.count(HelpConversation.id))
-                .where(HelpConversation.started_at >= today_start)
-            )
-            conversations_today = conversations_today_result.scalar() or 0
-            
-            # Average response time
-            avg_response_time_result = await session.execute(
-                select(func.avg(HelpConversation.response_time_ms))
-                .where(HelpConversation.response_time_ms.is_not(None))
-            )
-            avg_response_time = avg_response_time_result.scalar()
-            avg_response_time_ms = int(avg_response_time) if avg_response_time else None
+            stats = await get_dashboard_stats(session)
+            if stats.is_empty:
+                # First load before the rollup task has run
+                await run_stats_rollup(session)
+                stats = await get_dashboard_stats(session)
         
-        # Add basic stats to each guild
         guild_stats = []
-        async with get_db_session_context() as session:
-            for guild in guilds:
-                # Get guild-specific stats
-                guild_users_result = await session.execute(
-                    select(func.count(BytesBalance.user_id))
-                    .where(BytesBalance.guild_id == guild.id)
-                )
-                guild_users = guild_users_result.scalar() or 0
-                
-                guild_squads_result = await session.execute(
-                    select(func.count(Squad.id))
-                    .where(Squad.guild_id == guild.id)
-                )
-                guild_squads = guild_squads_result.scalar() or 0
-                
-                guild_stats.append({
-                    "guild": guild,
-                    "user_count": guild_users,
-                    "squad_count": guild_squads
-                })
+        for guild in guilds:
+            rollup = stats.guilds.get(guild.id)
+            guild_stats.append({
+                "guild": guild,
+                "user_count": rollup.user_count if rollup else 0,
+                "squad_count": rollup.squad_count if rollup else 0
+            })
         
         return templates.TemplateResponse(
             request,
             "admin/dashboard.html",
             {
                 "guilds": guild_stats,
-                "total_users": total_users,
-                "total_transactions": total_transactions,
-                "total_squads": total_squads,
-                "total_bytes": total_bytes,
-                "total_conversations": total_conversations,
-                "total_tokens": total_tokens,
-                "help_tokens": help_tokens,
-                "forum_tokens": forum_tokens,
-                "conversations_today": conversations_today,
-                "avg_response_time_ms": avg_response_time_ms
+                "total_users": stats.total_users,
+                "total_transactions": stats.total_transactions,
+                "total_squads": stats.total_squads,
+                "total_bytes": stats.total_bytes,
+                "total_conversations": stats.total_conversations,
+                "total_tokens": stats.total_tokens,
+                "help_tokens": stats.help_tokens,
+                "forum_tokens": stats.forum_tokens,
+                "conversations_today": stats.conversations_today,
+                "api_requests_today": stats.api_requests_today,
+                "avg_response_time_ms": stats.avg_response_time_ms
             }
         )
     
@@ -175,6 +107,7 @@ async def dashboard(request: Request) -> Response:
                 "help_tokens": 0,
                 "forum_tokens": 0,
                 "conversations_today": 0,
+                "api_requests_today": 0,
                 "avg_response_time_ms": None
             }
         )
@@ -195,6 +128,7 @@ async def dashboard(request: Request) -> Response:
                 "help_tokens": 0,
                 "forum_tokens": 0,
                 "conversations_today": 0,
+                "api_requests_today": 0,
                 "avg_response_time_ms": None
             }
         )
@@ -847,6 +781,9 @@ async def api_keys_delete(request: Request) -> Response:
             api_key.updated_at = datetime.now(timezone.utc)
             
             await session.commit()
+            
+            from smarter_dev.web.api_key_cache import get_api_key_cache
+            await get_api_key_cache().invalidate(api_key.id)
         
         # Redirect back to API keys list
         from starlette.responses import RedirectResponse
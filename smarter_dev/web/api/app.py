@@ -7,6 +7,7 @@ management, authentication, and routing setup.
 from __future__ import annotations
 
 import logging
+import time
 import traceback
 import uuid
 from contextlib import asynccontextmanager
@@ -16,13 +17,14 @@ from typing import AsyncGenerator
 from fastapi import FastAPI, Request, Depends, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, PlainTextResponse
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from fastapi.openapi.utils import get_openapi
 from pydantic import ValidationError
 
 from smarter_dev.shared.config import get_settings
 from smarter_dev.shared.database import init_database, close_database
+from smarter_dev.shared.request_metrics import RequestMetrics
 from smarter_dev.web.api.routers.auth import router as auth_router
 from smarter_dev.web.api.routers.bytes import router as bytes_router
 from smarter_dev.web.api.routers.squads import router as squads_router
@@ -32,9 +34,16 @@ from smarter_dev.web.api.routers.forum_agents_simple import router as forum_agen
 from smarter_dev.web.api.routers.challenges import router as challenges_router
 from smarter_dev.web.api.routers.scheduled_messages import router as scheduled_messages_router
 from smarter_dev.web.api.routers.repeating_messages import router as repeating_messages_router
+from smarter_dev.web.api.dependencies import verify_api_key
+from smarter_dev.web.api_key_cache import get_api_key_cache
+from smarter_dev.web.challenge_inputs import get_input_pregenerator
 from smarter_dev.web.api.schemas import ErrorResponse, ValidationErrorResponse, ErrorDetail
 from smarter_dev.web.crud import DatabaseOperationError, NotFoundError, ConflictError
+from smarter_dev.web.script_runner import get_script_runner
 from smarter_dev.web.security_headers import SecurityHeadersMiddleware
+from smarter_dev.web.security_logger import get_security_logger
+from smarter_dev.web.security_log_partitions import create_maintenance_task
+from smarter_dev.web.stats_rollup import create_stats_rollup_task
 from smarter_dev.web.http_methods_middleware import HTTPMethodsMiddleware
 
 logger = logging.getLogger(__name__)
@@ -55,6 +64,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     # Startup
     settings = get_settings()
+    security_log_writer = get_security_logger().writer
+    security_log_maintenance = create_maintenance_task()
+    stats_rollup = create_stats_rollup_task()
     
     try:
         # Initialize database connection
@@ -63,10 +75,28 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Store settings in app state for access in dependencies
         app.state.settings = settings
         
+        # Start batching per-request security log writes
+        security_log_writer.start()
+        
+        # Keep security log partitions created ahead and drop expired ones
+        security_log_maintenance.start()
+        
+        # Keep the admin dashboard rollup fresh
+        stats_rollup.start()
+        
+        # Start challenge script workers before the first input request
+        await get_script_runner().start()
+        
         yield
         
     finally:
-        # Cleanup
+        # Cleanup: drain queued security logs before the database goes away
+        await get_input_pregenerator().stop()
+        await get_script_runner().close()
+        await stats_rollup.stop()
+        await security_log_maintenance.stop()
+        await security_log_writer.stop()
+        await get_api_key_cache().stop_listener()
         await close_database()
 
 
@@ -105,12 +135,22 @@ api = FastAPI(
     openapi_url=openapi_url
 )
 
+# Per-route server-side request metrics, exported at /metrics
+request_metrics = RequestMetrics()
+
+
 # Request ID and debug middleware
 @api.middleware("http")
 async def add_request_id_middleware(request: Request, call_next):
-    """Add request ID to request state for tracking."""
+    """Add request ID to request state for tracking.
+    
+    Also records the request under its route template. The bot sends its own
+    ``x-request-id``, so client and server timings for one request can be
+    matched by ID.
+    """
     request_id = request.headers.get("x-request-id", str(uuid.uuid4()))
     request.state.request_id = request_id
+    start_time = time.perf_counter()
     
     # Debug logging for squad join requests
     if "squad" in str(request.url) and request.method == "POST":
@@ -126,7 +166,12 @@ async def add_request_id_middleware(request: Request, call_next):
         
         logger.error(f"DEBUG MIDDLEWARE: POST {request.url}, method={request.method}, body={body[:500]}, headers={dict(request.headers)}")
     
-    response = await call_next(request)
+    try:
+        response = await call_next(request)
+    except Exception:
+        _record_request_span(request, request_id, start_time, None)
+        raise
+    _record_request_span(request, request_id, start_time, response)
     
     # Debug logging for failed squad join responses
     if "squad" in str(request.url) and request.method == "POST" and response.status_code >= 400:
@@ -136,6 +181,28 @@ async def add_request_id_middleware(request: Request, call_next):
     return response
 
 
+def _record_request_span(request: Request, request_id: str, start_time: float, response) -> None:
+    """Record a finished request in the route metrics."""
+    duration_ms = (time.perf_counter() - start_time) * 1000
+    # Unmatched paths are grouped so scanners can't create new series
+    route = request.scope.get("route")
+    route_path = getattr(route, "path", "unmatched")
+    status_code = response.status_code if response is not None else None
+
+    request_metrics.record(
+        request.method,
+        route_path,
+        duration_ms,
+        status_code=status_code,
+        bytes_sent=int(request.headers.get("content-length") or 0),
+        bytes_received=int(response.headers.get("content-length") or 0) if response is not None else 0
+    )
+    logger.debug(
+        f"{request.method} {route_path} -> {status_code} in {duration_ms:.1f}ms",
+        extra={"request_id": request_id, "route": route_path, "duration_ms": duration_ms}
+    )
+
+
 # Add HTTP methods middleware (first to handle method validation)
 api.add_middleware(HTTPMethodsMiddleware)
 
@@ -421,10 +488,22 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy", "version": "1.0.0"}
 
 
+# Request metrics endpoint
+@api.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def metrics(api_key = Depends(verify_api_key)) -> PlainTextResponse:
+    """Per-route request metrics in the Prometheus text format.
+    
+    Requires valid API key authentication to access.
+    """
+    text = request_metrics.render_prometheus("smarter_dev_api")
+    script_runner = get_script_runner()
+    if script_runner.started:
+        text += script_runner.render_prometheus("smarter_dev_challenge_script")
+    return PlainTextResponse(text)
+
+
 # Custom documentation endpoints with authentication
 if settings.api_docs_enabled and settings.api_docs_require_auth:
-    from smarter_dev.web.api.dependencies import verify_api_key
-    
     @api.get("/docs", include_in_schema=False)
     async def get_swagger_ui(api_key = Depends(verify_api_key)) -> HTMLResponse:
         """Authenticated Swagger UI documentation.
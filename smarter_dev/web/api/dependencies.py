@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from smarter_dev.shared.config import get_settings
 from smarter_dev.shared.database import get_db_session
+from smarter_dev.web.api_key_cache import APIKeySnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -43,11 +44,13 @@ async def verify_api_key(
     request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials, Security(security)],
     session: Annotated[AsyncSession, Depends(get_database_session)]
-) -> "APIKey":
+) -> APIKeySnapshot:
     """Verify API key authentication with cryptographic security.
     
     Validates the provided API key using secure hashing and database lookup.
-    Implements constant-time comparison to prevent timing attacks.
+    Verified keys are served from the API key cache until they expire or an
+    admin action invalidates them. Implements constant-time comparison to
+    prevent timing attacks.
     
     Args:
         request: FastAPI request object
@@ -55,14 +58,14 @@ async def verify_api_key(
         session: Database session for key lookup
         
     Returns:
-        APIKey: Validated API key model with metadata
+        APIKeySnapshot: Validated API key with metadata
         
     Raises:
         HTTPException: If key is invalid, expired, or revoked
     """
     from smarter_dev.web.security import validate_api_key_format, hash_api_key
     from smarter_dev.web.crud import APIKeyOperations
-    import asyncio
+    from smarter_dev.web.api_key_cache import get_api_key_cache
     
     # Check case-sensitive Bearer scheme from raw header
     auth_header = request.headers.get("Authorization")
@@ -101,9 +104,16 @@ async def verify_api_key(
     # Hash the token for database lookup
     token_hash = hash_api_key(token)
     
-    # Database lookup for API key
-    api_key_ops = APIKeyOperations()
-    api_key = await api_key_ops.get_api_key_by_hash(session, token_hash)
+    # Cache lookup, falling back to the database on a miss
+    api_key_cache = get_api_key_cache()
+    api_key_cache.ensure_listener()
+    api_key = api_key_cache.get(token_hash)
+    
+    if api_key is None:
+        api_key_ops = APIKeyOperations()
+        db_api_key = await api_key_ops.get_api_key_by_hash(session, token_hash)
+        if db_api_key:
+            api_key = api_key_cache.set(token_hash, db_api_key)
     
     # Import security logger here to avoid circular imports
     from smarter_dev.web.security_logger import get_security_logger
@@ -178,7 +188,7 @@ async def verify_api_key(
 async def verify_guild_access(
     request: Request,
     guild_id: str,
-    api_key: Annotated["APIKey", Depends(verify_api_key)]
+    api_key: Annotated[APIKeySnapshot, Depends(verify_api_key)]
 ) -> str:
     """Verify bot has access to the specified guild.
     
@@ -219,7 +229,7 @@ async def verify_guild_access(
 
 async def get_current_user_id(
     request: Request,
-    api_key: Annotated["APIKey", Depends(verify_api_key)]
+    api_key: Annotated[APIKeySnapshot, Depends(verify_api_key)]
 ) -> str:
     """Get current user ID from request context.
     
@@ -307,7 +317,7 @@ async def get_request_metadata(request: Request) -> dict[str, str]:
 
 # Type aliases for common dependencies
 DatabaseSession = Annotated[AsyncSession, Depends(get_database_session)]
-APIKey = Annotated["APIKey", Depends(verify_api_key)]
+APIKey = Annotated[APIKeySnapshot, Depends(verify_api_key)]
 GuildAccess = Annotated[str, Depends(verify_guild_access)]
 CurrentUser = Annotated[str, Depends(get_current_user_id)]
 RequestMetadata = Annotated[dict[str, str], Depends(get_request_metadata)]
\ No newline at end of file
@@ -34,6 +34,7 @@ from smarter_dev.web.api.schemas import (
     HelpConversationCreateResponse,
     HelpConversationStatsResponse
 )
+from smarter_dev.web.api_key_cache import get_api_key_cache
 from smarter_dev.web.crud import APIKeyOperations
 from smarter_dev.web.security import generate_secure_api_key
 from smarter_dev.web.models import APIKey as APIKeyModel, HelpConversation
@@ -78,7 +79,8 @@ async def get_admin_stats(
         expired_api_keys=stats.get("expired_api_keys", 0),
         total_api_requests=stats.get("total_api_requests", 0),
         api_requests_today=stats.get("api_requests_today", 0),
-        top_api_consumers=stats.get("top_api_consumers", [])
+        top_api_consumers=stats.get("top_api_consumers", []),
+        api_key_cache=get_api_key_cache().get_stats()
     )
 
 
@@ -264,6 +266,9 @@ async def update_api_key(
     await db.commit()
     await db.refresh(target_key)
     
+    # Scopes and rate limits are cached with verified keys
+    await get_api_key_cache().invalidate(key_id)
+    
     return APIKeyResponse.model_validate(target_key)
 
 
@@ -325,6 +330,7 @@ async def revoke_api_key(
     target_key.updated_at = revoked_at
     
     await db.commit()
+    await get_api_key_cache().invalidate(key_id)
     
     # Log API key deletion
     from smarter_dev.web.security_logger import get_security_logger
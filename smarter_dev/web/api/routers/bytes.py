@@ -6,13 +6,13 @@ including balances, transactions, daily claims, and configurations.
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime, date, timedelta, timezone
 from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Path, Query, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from smarter_dev.bot.services.streak_service import StreakService
 from smarter_dev.shared.date_provider import get_date_provider
 from smarter_dev.web.api.dependencies import (
     get_database_session,
@@ -29,10 +29,15 @@ from smarter_dev.web.api.exceptions import (
 )
 from smarter_dev.web.api.schemas import (
     BytesBalanceResponse,
+    BytesBalancesResponse,
     BytesTransactionCreate,
     BytesTransactionResponse,
     DailyClaimRequest,
     DailyClaimResponse,
+    DailyClaimersResponse,
+    DailyClaimBatchRequest,
+    BatchItemResult,
+    BatchResponse,
     BytesConfigResponse,
     BytesConfigUpdate,
     LeaderboardResponse,
@@ -46,11 +51,20 @@ from smarter_dev.web.crud import (
     BytesConfigOperations,
     DatabaseOperationError,
     NotFoundError,
-    ConflictError
+    ConflictError,
+    decode_transaction_cursor,
+    encode_transaction_cursor
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+DAILY_ALREADY_CLAIMED = "Daily reward has already been claimed today. Try again tomorrow!"
+
+# Most users one balances request may ask for
+MAX_BALANCES_PER_REQUEST = 100
+
 
 @router.get(
     "/balance/{user_id}", 
@@ -77,14 +91,57 @@ async def get_balance(
     """Get user's bytes balance.
     
     Returns the current bytes balance for a specific user in the guild,
-    including their streak information and transaction totals.
+    including their streak information, transaction totals and leaderboard rank.
     """
     # Validate user ID format
     validate_discord_id(user_id, "user ID")
     
     bytes_ops = BytesOperations()
     balance = await bytes_ops.get_or_create_balance(db, guild_id, user_id)
-    return BytesBalanceResponse.model_validate(balance)
+    balance_response = BytesBalanceResponse.model_validate(balance)
+    balance_response.rank = await bytes_ops.get_rank(db, guild_id, user_id)
+    return balance_response
+
+
+@router.get("/balances", response_model=BytesBalancesResponse)
+async def get_balances(
+    request: Request,
+    response: Response,
+    api_key: APIKey,
+    rate_limit_check: None = Depends(apply_rate_limiting),
+    user_ids: str = Query(..., description="Comma-separated Discord user IDs"),
+    guild_id: str = Depends(verify_guild_access),
+    db: AsyncSession = Depends(get_database_session),
+    metadata: dict = Depends(get_request_metadata)
+) -> BytesBalancesResponse:
+    """Get the balances of several users at once.
+    
+    Lets the bot render lists of users with one request and one query instead
+    of a balance request per user. Unlike the single-user endpoint, users
+    without a balance are reported in ``missing`` rather than created, and
+    leaderboard ranks are not included.
+    """
+    requested = list(dict.fromkeys(uid.strip() for uid in user_ids.split(",") if uid.strip()))
+    if not requested:
+        raise create_validation_error("At least one user ID is required", "user_ids", request)
+    if len(requested) > MAX_BALANCES_PER_REQUEST:
+        raise create_validation_error(
+            f"At most {MAX_BALANCES_PER_REQUEST} user IDs can be requested at once",
+            "user_ids",
+            request
+        )
+    for user_id in requested:
+        validate_discord_id(user_id, "user ID")
+    
+    bytes_ops = BytesOperations()
+    balances = await bytes_ops.get_balances(db, guild_id, requested)
+    found = {balance.user_id for balance in balances}
+    
+    return BytesBalancesResponse(
+        guild_id=guild_id,
+        balances=[BytesBalanceResponse.model_validate(balance) for balance in balances],
+        missing=[user_id for user_id in requested if user_id not in found]
+    )
 
 
 @router.post("/daily", response_model=DailyClaimResponse)
@@ -102,6 +159,8 @@ async def claim_daily(
     
     Claims the daily bytes reward for a user. Calculates streak bonuses
     based on consecutive daily claims and applies the appropriate multiplier.
+    The eligibility check, balance update, transaction record and default
+    squad assignment happen atomically in the database.
     """
     user_id = claim_request.user_id
     username = claim_request.username or f"User {user_id}"
@@ -109,106 +168,134 @@ async def claim_daily(
     # Validate user ID format
     validate_discord_id(user_id, "user ID")
     
-    bytes_ops = BytesOperations()
-    config_ops = BytesConfigOperations()
-    streak_service = StreakService(date_provider=get_date_provider())
-    
-    # Get guild configuration
     try:
-        config = await config_ops.get_config(db, guild_id)
-    except NotFoundError:
-        config = await config_ops.create_config(db, guild_id)
+        claim_response = await _claim_daily(db, guild_id, user_id, username)
+    except ConflictError:
+        raise create_conflict_error(DAILY_ALREADY_CLAIMED, request)
     
-    # Get or create balance (starts with 0 for new users)
-    try:
-        balance = await bytes_ops.get_balance(db, guild_id, user_id)
-        # Check if this is a new user (never claimed daily before)
-        is_new_user = balance.last_daily is None
-    except NotFoundError:
-        # Create new user with 0 balance - they'll get their "starting balance" as their first daily reward
-        from smarter_dev.web.models import BytesBalance
-        balance = BytesBalance(
-            guild_id=guild_id,
-            user_id=user_id,
-            balance=0,
-            total_received=0
-        )
-        db.add(balance)
-        await db.flush()  # Ensure timestamps are populated
-        is_new_user = True
-    
-    # Use StreakService to calculate streak result (works for both new and returning users)
-    # For new users, this will be their first "daily" claim which gives them starting balance
-    streak_result = streak_service.calculate_streak_result(
-        last_daily=balance.last_daily,
-        current_streak=balance.streak_count,
-        daily_amount=config.starting_balance if is_new_user else config.daily_amount,
-        streak_bonuses=config.streak_bonuses
-    )
+    await db.commit()
     
-    # Check if user can claim today (works for both new and returning users)
-    if not streak_result.can_claim:
-        raise create_conflict_error(
-            "Daily reward has already been claimed today. Try again tomorrow!",
-            request
-        )
+    return claim_response
+
+
+@router.post("/daily/batch", response_model=BatchResponse)
+async def claim_daily_batch(
+    request: Request,
+    response: Response,
+    batch_request: DailyClaimBatchRequest,
+    api_key: APIKey,
+    rate_limit_check: None = Depends(apply_rate_limiting),
+    guild_id: str = Depends(verify_guild_access),
+    db: AsyncSession = Depends(get_database_session),
+    metadata: dict = Depends(get_request_metadata)
+) -> BatchResponse:
+    """Claim daily bytes rewards for several users in one request.
+    
+    Each claim runs in its own savepoint, so one user's conflict or failure
+    doesn't affect the others, and all successful claims are committed
+    together. Results are returned in request order with the status and
+    body each claim would have had from ``POST /daily``.
+    """
+    results = []
+    for claim_request in batch_request.items:
+        user_id = claim_request.user_id
+        username = claim_request.username or f"User {user_id}"
+        try:
+            async with db.begin_nested():
+                claim_response = await _claim_daily(db, guild_id, user_id, username)
+            results.append(BatchItemResult(
+                status_code=200,
+                body=claim_response.model_dump(mode="json")
+            ))
+        except ConflictError:
+            results.append(BatchItemResult(status_code=409, body={"detail": DAILY_ALREADY_CLAIMED}))
+        except DatabaseOperationError:
+            # Same generic detail as the app's DatabaseOperationError handler
+            logger.exception(f"Daily claim failed for user {user_id} in guild {guild_id}")
+            results.append(BatchItemResult(status_code=500, body={"detail": "Internal server error"}))
+    
+    await db.commit()
+    
+    return BatchResponse(results=results)
+
+
+async def _claim_daily(
+    db: AsyncSession,
+    guild_id: str,
+    user_id: str,
+    username: str
+) -> DailyClaimResponse:
+    """Claim today's reward for a user and build the response, without committing.
+    
+    Raises:
+        ConflictError: If the user already claimed today
+    """
+    bytes_ops = BytesOperations()
     
     # Get current UTC date for database storage
     current_utc_date = get_date_provider().today()
     
-    # Determine the reward amount (starting balance for new users, daily amount for returning users)
-    reward_amount = config.starting_balance if is_new_user else config.daily_amount
-    
-    # Update balance with reward using calculated values
-    updated_balance, assigned_squad = await bytes_ops.update_daily_reward(
-        db, 
-        guild_id, 
-        user_id, 
-        username,
-        reward_amount, 
-        streak_result.streak_bonus,
-        streak_result.new_streak_count,
-        current_utc_date,
-        is_new_member=is_new_user
-    )
+    claim = await bytes_ops.claim_daily(db, guild_id, user_id, username, current_utc_date)
     
     # Calculate next claim time (midnight UTC tomorrow)
     next_claim_at = datetime.combine(
-        streak_result.next_claim_date, 
+        current_utc_date + timedelta(days=1),
         datetime.min.time()
     ).replace(tzinfo=timezone.utc)
     
-    # Refresh the balance to ensure all attributes are loaded
-    await db.refresh(updated_balance)
-    
     # Serialize model before commit to avoid session detachment issues
-    balance_response = BytesBalanceResponse.model_validate(updated_balance)
+    balance_response = BytesBalanceResponse.model_validate(claim.balance)
     
     # Serialize squad assignment if user was assigned to a squad
     squad_response = None
-    if assigned_squad:
+    if claim.squad_id:
         from smarter_dev.web.api.schemas import SquadResponse
         from smarter_dev.web.crud import SquadOperations
         
         # Get the full squad data with member_count from the database
         squad_ops = SquadOperations()
-        full_squad_data = await squad_ops.get_squad(db, assigned_squad.id)
-        member_count = await squad_ops._get_squad_member_count(db, assigned_squad.id)
+        full_squad_data = await squad_ops.get_squad(db, claim.squad_id)
+        member_count = await squad_ops._get_squad_member_count(db, claim.squad_id)
         squad_data = full_squad_data.__dict__.copy()
         squad_data['member_count'] = member_count
         squad_response = SquadResponse.model_validate(squad_data)
     
-    await db.commit()
-    
     return DailyClaimResponse(
         balance=balance_response,
-        reward_amount=streak_result.reward_amount,
-        streak_bonus=streak_result.streak_bonus,
+        reward_amount=claim.reward_amount,
+        streak_bonus=claim.streak_bonus,
         next_claim_at=next_claim_at,
         squad_assignment=squad_response
     )
 
 
+@router.get("/daily/claimed", response_model=DailyClaimersResponse)
+async def get_daily_claimers(
+    request: Request,
+    response: Response,
+    api_key: APIKey,
+    rate_limit_check: None = Depends(apply_rate_limiting),
+    guild_id: str = Depends(verify_guild_access),
+    db: AsyncSession = Depends(get_database_session),
+    metadata: dict = Depends(get_request_metadata)
+) -> DailyClaimersResponse:
+    """List the users who have claimed today's daily reward.
+    
+    Lets the bot load today's claims in one request at startup instead of
+    discovering each one through a rejected claim.
+    """
+    current_utc_date = get_date_provider().today()
+    
+    bytes_ops = BytesOperations()
+    user_ids = await bytes_ops.get_daily_claimers(db, guild_id, current_utc_date)
+    
+    return DailyClaimersResponse(
+        guild_id=guild_id,
+        claim_date=current_utc_date,
+        user_ids=user_ids
+    )
+
+
 @router.post("/transactions", response_model=BytesTransactionResponse)
 async def create_transaction(
     request: Request,
@@ -329,6 +416,7 @@ async def get_transactions(
     rate_limit_check: None = Depends(apply_rate_limiting),
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
     limit: int = Query(20, ge=1, le=100, description="Number of transactions to return"),
+    before: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     guild_id: str = Depends(verify_guild_access),
     db: AsyncSession = Depends(get_database_session),
     metadata: dict = Depends(get_request_metadata)
@@ -337,13 +425,26 @@ async def get_transactions(
     
     Returns recent transaction history, optionally filtered by a specific user.
     Transactions are returned in reverse chronological order (newest first).
+    Pass ``next_cursor`` back as ``before`` to fetch the next older page.
     """
     # Validate user_id if provided
     if user_id:
         validate_discord_id(user_id, "User ID")
     
+    cursor = None
+    if before:
+        try:
+            cursor = decode_transaction_cursor(before)
+        except ValueError:
+            raise create_validation_error("Invalid pagination cursor", "before", request)
+    
     bytes_ops = BytesOperations()
-    transactions = await bytes_ops.get_transaction_history(db, guild_id, user_id, limit)
+    # Fetch one extra row to tell whether an older page exists
+    transactions = await bytes_ops.get_transaction_history(
+        db, guild_id, user_id, limit + 1, before=cursor
+    )
+    has_more = len(transactions) > limit
+    transactions = transactions[:limit]
     transaction_responses = [
         BytesTransactionResponse.model_validate(tx) for tx in transactions
     ]
@@ -352,7 +453,8 @@ async def get_transactions(
         guild_id=guild_id,
         transactions=transaction_responses,
         total_count=len(transactions),
-        user_id=user_id
+        user_id=user_id,
+        next_cursor=encode_transaction_cursor(transactions[-1]) if has_more else None
     )
 
 
@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from smarter_dev.shared.database import get_db_session
 from smarter_dev.web.api.dependencies import verify_api_key
+from smarter_dev.web.challenge_inputs import get_input_pregenerator
 from smarter_dev.web.crud import CampaignOperations, ChallengeInputOperations, ChallengeSubmissionOperations, SquadOperations, DatabaseOperationError, ScriptExecutionError
 from smarter_dev.web.models import Campaign
 
@@ -57,6 +58,9 @@ async def get_upcoming_announcements(
         for challenge in challenges:
             campaign = challenge.campaign
             
+            # Have every squad's input ready before the announcement goes out
+            get_input_pregenerator().schedule(challenge.id)
+            
             # Calculate release time based on campaign start and challenge position
             release_time = campaign.start_time + timedelta(hours=campaign.release_cadence_hours * (challenge.order_position - 1))
             
@@ -174,6 +178,9 @@ async def mark_challenge_released(
         
         logger.info(f"Marked challenge {challenge_id} as released")
         
+        # Catch challenges that weren't seen as upcoming first
+        get_input_pregenerator().schedule(challenge_id)
+        
         return {"success": True}
         
     except DatabaseOperationError as e:
@@ -266,13 +273,12 @@ async def get_scoreboard(
                 "total_challenges": 0
             }
         
-        # Get scoreboard data for the campaign
+        # Get scoreboard data and counts for the campaign
         submission_ops = ChallengeSubmissionOperations(session)
-        scoreboard_data = await submission_ops.get_campaign_scoreboard(current_campaign.id)
-        
-        # Get total submission and challenge counts for stats
-        total_submissions = await submission_ops.get_campaign_submission_count(current_campaign.id)
-        total_challenges = await campaign_ops.get_campaign_challenge_count(current_campaign.id)
+        standings = await submission_ops.get_campaign_standings(current_campaign.id)
+        scoreboard_data = standings.scoreboard
+        total_submissions = standings.total_submissions
+        total_challenges = standings.total_challenges
         
         # Format campaign data
         campaign_data = {
@@ -396,13 +402,15 @@ async def get_detailed_scoreboard(
                 "total_challenges": 0
             }
         
-        # Get detailed scoreboard data for the campaign
+        # Get detailed scoreboard data and counts for the campaign
         submission_ops = ChallengeSubmissionOperations(session)
-        detailed_data = await submission_ops.get_detailed_campaign_scoreboard(current_campaign.id)
-        
-        # Get total submission and challenge counts for stats
-        total_submissions = await submission_ops.get_campaign_submission_count(current_campaign.id)
-        total_challenges = await campaign_ops.get_campaign_challenge_count(current_campaign.id)
+        standings = await submission_ops.get_campaign_standings(current_campaign.id)
+        detailed_data = {
+            "challenges_breakdown": standings.challenges_breakdown,
+            "squad_totals": standings.squad_totals
+        }
+        total_submissions = standings.total_submissions
+        total_challenges = standings.total_challenges
         
         # Format campaign data
         campaign_data = {
@@ -511,7 +519,7 @@ async def check_challenge_input_exists(
 ) -> Dict[str, bool]:
     """Check if challenge input data already exists for a user's squad.
     
-    This endpoint checks if input has been generated without actually generating it,
+    This endpoint checks if input has been fetched without actually fetching it,
     useful for determining whether to show a confirmation prompt.
     
     Args:
@@ -537,7 +545,9 @@ async def check_challenge_input_exists(
         input_ops = ChallengeInputOperations(session)
         existing_input = await input_ops.get_existing_input(challenge_id, user_squad.id)
         
-        return {"exists": existing_input is not None}
+        # Pre-generated inputs only count once fetched, since fetching starts the timer
+        exists = existing_input is not None and existing_input.first_fetched_at is not None
+        return {"exists": exists}
         
     except HTTPException:
         raise
@@ -729,7 +739,8 @@ async def submit_solution(
             squad_id=user_squad.id,
             user_id=submission_data.user_id,
             username=submission_data.username,
-            submitted_solution=submission_data.submitted_solution
+            submitted_solution=submission_data.submitted_solution,
+            challenge=challenge
         )
         
         logger.info(
@@ -7,7 +7,7 @@ endpoints, providing proper validation, serialization, and documentation.
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict, field_validator, field_serializer
@@ -56,6 +56,7 @@ class BytesBalanceResponse(BaseAPIModel):
     last_daily: Optional[date] = Field(None, description="Last daily claim date")
     created_at: datetime = Field(description="Record creation timestamp")
     updated_at: datetime = Field(description="Last update timestamp")
+    rank: Optional[int] = Field(None, description="Position on the guild leaderboard")
     
     @field_serializer('last_daily')
     def serialize_last_daily(self, value: Optional[date]) -> Optional[str]:
@@ -140,6 +141,45 @@ class DailyClaimResponse(BaseAPIModel):
         return value.isoformat()
 
 
+class BytesBalancesResponse(BaseAPIModel):
+    """Response model for the balances of several users."""
+    
+    guild_id: str = Field(description="Discord guild ID")
+    balances: List[BytesBalanceResponse] = Field(description="Balances of the requested users that have one")
+    missing: List[str] = Field(description="Requested users without a balance")
+
+
+class DailyClaimersResponse(BaseAPIModel):
+    """Response model for the users who have claimed a day's reward."""
+    
+    guild_id: str = Field(description="Discord guild ID")
+    claim_date: date = Field(description="UTC date of the claims")
+    user_ids: List[str] = Field(description="Users who have claimed on this date")
+
+
+class DailyClaimBatchRequest(BaseAPIModel):
+    """Request model for claiming daily rewards for several users at once."""
+    
+    items: List[DailyClaimRequest] = Field(
+        min_length=1,
+        max_length=100,
+        description="Claims to process, in order"
+    )
+
+
+class BatchItemResult(BaseAPIModel):
+    """Outcome of one item of a batch request."""
+    
+    status_code: int = Field(description="HTTP status the item would have had on its own")
+    body: Dict[str, Any] = Field(description="Response body the item would have had on its own")
+
+
+class BatchResponse(BaseAPIModel):
+    """Response model for batch requests, one result per item in order."""
+    
+    results: List[BatchItemResult] = Field(description="Per-item results")
+
+
 class BytesConfigResponse(BaseAPIModel):
     """Response model for guild bytes configuration."""
     
@@ -190,6 +230,7 @@ class TransactionHistoryResponse(BaseAPIModel):
     transactions: List[BytesTransactionResponse] = Field(description="Transaction list")
     total_count: int = Field(description="Total transaction count")
     user_id: Optional[str] = Field(None, description="User filter if applied")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next (older) page, if any")
 
 
 # ============================================================================
@@ -567,6 +608,7 @@ class AdminStatsResponse(BaseAPIModel):
     total_api_requests: int = Field(..., description="Total API requests made")
     api_requests_today: int = Field(..., description="API requests made today")
     top_api_consumers: List[dict] = Field(..., description="Top API key consumers by usage")
+    api_key_cache: Optional[dict] = Field(None, description="Verified API key cache hit/miss counters")
 
 
 # ============================================================================
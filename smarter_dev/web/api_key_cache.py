@@ -0,0 +1,269 @@
+"""Verified API key cache for request authentication.
+
+The bot authenticates every request with the same API key, so looking the key
+up by hash on each request is wasted database load. This module keeps a
+bounded TTL cache of immutable API key snapshots keyed by token hash.
+
+Admin operations that revoke, activate or delete a key invalidate the local
+entry and publish the key ID on a Redis pub/sub channel so that every replica
+drops its copy as well.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Set, Tuple
+from uuid import UUID
+
+from smarter_dev.shared.config import get_settings
+from smarter_dev.web.models import APIKey
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "api_keys:invalidate"
+
+
+@dataclass(frozen=True)
+class APIKeySnapshot:
+    """Immutable copy of the API key fields needed after authentication."""
+    id: UUID
+    name: str
+    key_prefix: str
+    scopes: Tuple[str, ...]
+    is_active: bool
+    expires_at: Optional[datetime]
+    created_by: str
+    usage_count: int
+    rate_limit_per_second: int
+    rate_limit_per_minute: int
+    rate_limit_per_15_minutes: int
+    rate_limit_per_hour: int
+
+    @classmethod
+    def from_model(cls, api_key: APIKey) -> APIKeySnapshot:
+        """Create a snapshot from an APIKey model."""
+        return cls(
+            id=api_key.id,
+            name=api_key.name,
+            key_prefix=api_key.key_prefix,
+            scopes=tuple(api_key.scopes or ()),
+            is_active=api_key.is_active,
+            expires_at=api_key.expires_at,
+            created_by=api_key.created_by,
+            usage_count=api_key.usage_count or 0,
+            rate_limit_per_second=api_key.rate_limit_per_second,
+            rate_limit_per_minute=api_key.rate_limit_per_minute,
+            rate_limit_per_15_minutes=api_key.rate_limit_per_15_minutes,
+            rate_limit_per_hour=api_key.rate_limit_per_hour,
+        )
+
+    @property
+    def is_expired(self) -> bool:
+        """Check if the API key has expired."""
+        if self.expires_at is None:
+            return False
+        return datetime.now(timezone.utc) > self.expires_at
+
+    @property
+    def is_valid(self) -> bool:
+        """Check if the API key is valid (active and not expired)."""
+        return self.is_active and not self.is_expired
+
+
+class APIKeyCache:
+    """Bounded LRU cache of verified API key snapshots with a per-entry TTL.
+
+    A TTL of zero disables caching entirely.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 60,
+        max_size: int = 1024,
+        pubsub_enabled: bool = True
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.pubsub_enabled = pubsub_enabled
+
+        self._entries: OrderedDict[str, Tuple[APIKeySnapshot, float]] = OrderedDict()
+        self._hashes_by_id: Dict[UUID, Set[str]] = {}
+        self._listener_task: Optional[asyncio.Task] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is enabled."""
+        return self.ttl_seconds > 0 and self.max_size > 0
+
+    def get(self, token_hash: str) -> Optional[APIKeySnapshot]:
+        """Get a cached snapshot, or None on miss or expiry."""
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(token_hash)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        snapshot, expires_at = entry
+        if time.monotonic() >= expires_at or snapshot.is_expired:
+            self._remove(token_hash)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(token_hash)
+        self.hits += 1
+        return snapshot
+
+    def set(self, token_hash: str, api_key: APIKey) -> APIKeySnapshot:
+        """Cache a snapshot of a verified API key and return it."""
+        snapshot = APIKeySnapshot.from_model(api_key)
+        if not self.enabled:
+            return snapshot
+
+        self._remove(token_hash)
+        self._entries[token_hash] = (snapshot, time.monotonic() + self.ttl_seconds)
+        self._hashes_by_id.setdefault(snapshot.id, set()).add(token_hash)
+
+        while len(self._entries) > self.max_size:
+            oldest_hash = next(iter(self._entries))
+            self._remove(oldest_hash)
+            self.evictions += 1
+
+        return snapshot
+
+    def _remove(self, token_hash: str) -> None:
+        """Remove a cache entry and its ID index."""
+        entry = self._entries.pop(token_hash, None)
+        if entry is None:
+            return
+        key_id = entry[0].id
+        hashes = self._hashes_by_id.get(key_id)
+        if hashes is not None:
+            hashes.discard(token_hash)
+            if not hashes:
+                del self._hashes_by_id[key_id]
+
+    def invalidate_local(self, key_id: UUID) -> int:
+        """Drop all cached entries for an API key in this process.
+
+        Returns:
+            Number of entries removed
+        """
+        hashes = self._hashes_by_id.pop(key_id, set())
+        for token_hash in hashes:
+            self._entries.pop(token_hash, None)
+        self.invalidations += 1
+        return len(hashes)
+
+    async def invalidate(self, key_id: UUID) -> None:
+        """Drop an API key locally and notify other replicas."""
+        self.invalidate_local(key_id)
+
+        if not self.pubsub_enabled:
+            return
+
+        try:
+            from smarter_dev.shared.redis_client import get_redis_client
+            await get_redis_client().publish(INVALIDATION_CHANNEL, str(key_id))
+        except Exception as e:
+            logger.warning(f"Failed to publish API key invalidation for {key_id}: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+        self._hashes_by_id.clear()
+
+    def ensure_listener(self) -> None:
+        """Start the pub/sub invalidation listener if it is not running."""
+        if not (self.enabled and self.pubsub_enabled):
+            return
+        if self._listener_task is not None and not self._listener_task.done():
+            return
+        self._listener_task = asyncio.create_task(self._listen_for_invalidations())
+
+    async def stop_listener(self) -> None:
+        """Stop the pub/sub invalidation listener."""
+        if self._listener_task is None:
+            return
+        self._listener_task.cancel()
+        try:
+            await self._listener_task
+        except asyncio.CancelledError:
+            pass
+        self._listener_task = None
+
+    async def _listen_for_invalidations(self) -> None:
+        """Apply invalidations published by other replicas."""
+        from smarter_dev.shared.redis_client import get_redis_client
+
+        retry_delay = 1
+        while True:
+            pubsub = None
+            try:
+                pubsub = get_redis_client().pubsub()
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Anything cached while we were disconnected may be stale
+                self.clear()
+                retry_delay = 1
+
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        self.invalidate_local(UUID(message["data"]))
+                    except (ValueError, TypeError):
+                        logger.warning(f"Ignoring invalid API key invalidation: {message['data']!r}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Without the channel we cannot trust remote revocations
+                self.clear()
+                logger.warning(f"API key invalidation listener error, retrying in {retry_delay}s: {e}")
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 60)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+# Global API key cache instance
+_settings = get_settings()
+api_key_cache = APIKeyCache(
+    ttl_seconds=_settings.api_key_cache_ttl,
+    max_size=_settings.api_key_cache_size,
+    pubsub_enabled=_settings.api_key_cache_pubsub_enabled,
+)
+
+
+def get_api_key_cache() -> APIKeyCache:
+    """Get the global API key cache instance."""
+    return api_key_cache
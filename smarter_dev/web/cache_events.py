@@ -0,0 +1,99 @@
+"""Change events for caches outside the web process.
+
+The bot caches guild configuration, squads and forum agents it reads from
+the API. When the web side changes one of those, CRUD operations record the
+change on the SQLAlchemy session with ``record_change``; once the session
+commits, each change is published as a small JSON message on a Redis
+pub/sub channel::
+
+    {"guild_id": "123", "entity": "squads"}
+
+Subscribers map the entity to the cache keys it affects. Rolled back
+changes are never published.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Iterable, Optional, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from smarter_dev.shared.config import get_settings
+from smarter_dev.web.commit_queue import CommitQueue
+
+logger = logging.getLogger(__name__)
+
+CHANGES_CHANNEL = "cache:changes"
+
+# Entities subscribers know how to invalidate
+BYTES_CONFIG = "bytes_config"
+SQUADS = "squads"
+SQUAD_SALES = "squad_sales"
+FORUM_AGENTS = "forum_agents"
+
+
+def record_change(session: AsyncSession, guild_id: str, entity: str) -> None:
+    """Queue a change event for a guild once the session commits."""
+    pending_changes.pending(session).add((guild_id, entity))
+
+
+def encode_change(guild_id: str, entity: str) -> str:
+    return json.dumps({"guild_id": guild_id, "entity": entity})
+
+
+class ChangePublisher:
+    """Publishes committed changes on the Redis changes channel."""
+
+    def __init__(self, redis_client=None, enabled: bool = True):
+        self._redis = redis_client
+        self.enabled = enabled
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _get_redis(self):
+        if self._redis is None:
+            from smarter_dev.shared.redis_client import get_redis_client
+            self._redis = get_redis_client()
+        return self._redis
+
+    async def publish(self, changes: Iterable[Tuple[str, str]]) -> None:
+        """Publish each change; failures are logged and dropped."""
+        for guild_id, entity in changes:
+            try:
+                await self._get_redis().publish(CHANGES_CHANNEL, encode_change(guild_id, entity))
+            except Exception as e:
+                logger.warning(f"Failed to publish {entity} change for guild {guild_id}: {e}")
+
+    def schedule(self, changes: Set[Tuple[str, str]]) -> None:
+        """Publish changes in the background without blocking the caller."""
+        if not self.enabled or not changes:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.publish(sorted(changes)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def _publish_changes(changes: Set[Tuple[str, str]]) -> None:
+    get_change_publisher().schedule(changes)
+
+
+# Changes recorded on each session, published once it commits
+pending_changes: CommitQueue[Set[Tuple[str, str]]] = CommitQueue("cache_changes", set, _publish_changes)
+
+
+# Global publisher, configured from settings on first use
+change_publisher: Optional[ChangePublisher] = None
+
+
+def get_change_publisher() -> ChangePublisher:
+    """Get the global change publisher."""
+    global change_publisher
+    if change_publisher is None:
+        change_publisher = ChangePublisher(enabled=get_settings().cache_change_events_enabled)
+    return change_publisher
@@ -0,0 +1,267 @@
+"""Incrementally maintained campaign scoreboards.
+
+The challenge scoreboard used to aggregate every submission of a campaign on
+each request, plus separate queries for the submission and challenge
+counts. Instead, ``campaign_squad_scores`` holds one row per squad per
+campaign with its points, solved challenges, submission count and points per
+challenge. ``record_submission`` updates the row in the submission's own
+transaction, so the scoreboard never disagrees with the submissions table,
+and ``get_campaign_standings`` serves the scoreboard, the per-challenge
+breakdown and the counts from the score rows and the campaign's challenge
+list.
+
+``rebuild_campaign_scores`` recomputes the rows from the submissions, and
+running this module checks or rebuilds them from the command line::
+
+    python -m smarter_dev.web.campaign_scores [--campaign UUID] [--rebuild]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from smarter_dev.web.models import CampaignSquadScore, Challenge, ChallengeSubmission, Squad
+
+logger = logging.getLogger(__name__)
+
+ScoreKey = Tuple[UUID, UUID]
+
+
+@dataclass
+class CampaignStandings:
+    """Scoreboard data for one campaign."""
+    scoreboard: List[Dict[str, Any]] = field(default_factory=list)
+    challenges_breakdown: List[Dict[str, Any]] = field(default_factory=list)
+    squad_totals: List[Dict[str, Any]] = field(default_factory=list)
+    total_submissions: int = 0
+    total_challenges: int = 0
+
+
+async def record_submission(
+    session: AsyncSession,
+    campaign_id: UUID,
+    squad_id: UUID,
+    challenge_id: UUID,
+    is_first_success: bool,
+    points: Optional[int]
+) -> None:
+    """Add a submission to its squad's campaign totals.
+
+    Must run in the transaction that stores the submission; the caller
+    commits.
+    """
+    points = (points or 0) if is_first_success else 0
+    solved = 1 if is_first_success else 0
+
+    dialect_insert = postgresql_insert if session.bind.dialect.name == "postgresql" else sqlite_insert
+    stmt = dialect_insert(CampaignSquadScore).values(
+        campaign_id=campaign_id,
+        squad_id=squad_id,
+        total_points=points,
+        challenges_completed=solved,
+        submission_count=1,
+        challenge_points={str(challenge_id): points} if is_first_success else {}
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CampaignSquadScore.campaign_id, CampaignSquadScore.squad_id],
+        set_={
+            "total_points": CampaignSquadScore.total_points + stmt.excluded.total_points,
+            "challenges_completed": CampaignSquadScore.challenges_completed + stmt.excluded.challenges_completed,
+            "submission_count": CampaignSquadScore.submission_count + 1,
+            "updated_at": func.now(),
+        }
+    )
+    await session.execute(stmt)
+
+    if not is_first_success:
+        return
+
+    # The upsert holds the row lock until commit, so merging here can't lose
+    # another challenge's entry
+    key = (CampaignSquadScore.campaign_id == campaign_id, CampaignSquadScore.squad_id == squad_id)
+    challenge_points = await session.scalar(select(CampaignSquadScore.challenge_points).where(*key))
+    if str(challenge_id) not in challenge_points:
+        await session.execute(
+            update(CampaignSquadScore).where(*key).values(
+                challenge_points={**challenge_points, str(challenge_id): points}
+            )
+        )
+
+
+async def get_campaign_standings(session: AsyncSession, campaign_id: UUID) -> CampaignStandings:
+    """Read a campaign's scoreboard, per-challenge breakdown and counts."""
+    result = await session.execute(
+        select(CampaignSquadScore, Squad.name)
+        .join(Squad, Squad.id == CampaignSquadScore.squad_id)
+        .where(CampaignSquadScore.campaign_id == campaign_id)
+        .order_by(CampaignSquadScore.total_points.desc(), Squad.name)
+    )
+    rows = result.all()
+    result = await session.execute(
+        select(Challenge.id, Challenge.title).where(Challenge.campaign_id == campaign_id)
+    )
+    titles = {str(challenge_id): title for challenge_id, title in result.all()}
+
+    standings = CampaignStandings(total_challenges=len(titles))
+    by_title: Dict[str, List[Dict[str, Any]]] = {}
+    for score, squad_name in rows:
+        standings.total_submissions += score.submission_count
+        standings.scoreboard.append({
+            "squad_name": squad_name,
+            "squad_id": score.squad_id,
+            "total_points": score.total_points,
+            "successful_submissions": score.challenges_completed
+        })
+        if not score.challenges_completed:
+            continue
+
+        standings.squad_totals.append({
+            "squad_name": squad_name,
+            "squad_id": str(score.squad_id),
+            "total_points": score.total_points,
+            "challenges_completed": score.challenges_completed
+        })
+        for challenge_id, points in score.challenge_points.items():
+            if challenge_id in titles:
+                by_title.setdefault(titles[challenge_id], []).append({
+                    "squad_name": squad_name,
+                    "squad_id": str(score.squad_id),
+                    "points_earned": points
+                })
+
+    for title in sorted(by_title):
+        submissions = sorted(by_title[title], key=lambda entry: entry["points_earned"], reverse=True)
+        standings.challenges_breakdown.append({"challenge_title": title, "submissions": submissions})
+
+    return standings
+
+
+async def compute_campaign_scores(
+    session: AsyncSession,
+    campaign_id: Optional[UUID] = None
+) -> Dict[ScoreKey, Dict[str, Any]]:
+    """Compute score rows from the submissions table.
+
+    Args:
+        session: Database session
+        campaign_id: Only this campaign; all campaigns if omitted
+    """
+    query = select(
+        Challenge.campaign_id,
+        ChallengeSubmission.squad_id,
+        ChallengeSubmission.challenge_id,
+        ChallengeSubmission.is_first_success,
+        ChallengeSubmission.points_earned
+    ).join(Challenge, Challenge.id == ChallengeSubmission.challenge_id)
+    if campaign_id is not None:
+        query = query.where(Challenge.campaign_id == campaign_id)
+
+    scores: Dict[ScoreKey, Dict[str, Any]] = {}
+    for row in (await session.execute(query)).all():
+        score = scores.setdefault((row.campaign_id, row.squad_id), {
+            "total_points": 0,
+            "challenges_completed": 0,
+            "submission_count": 0,
+            "challenge_points": {},
+        })
+        score["submission_count"] += 1
+        if row.is_first_success:
+            score["total_points"] += row.points_earned or 0
+            score["challenges_completed"] += 1
+            score["challenge_points"][str(row.challenge_id)] = row.points_earned or 0
+    return scores
+
+
+async def check_campaign_scores(
+    session: AsyncSession,
+    campaign_id: Optional[UUID] = None
+) -> List[ScoreKey]:
+    """Compare stored score rows with the submissions table.
+
+    Returns:
+        (campaign_id, squad_id) of rows that are missing, extra or wrong
+    """
+    expected = await compute_campaign_scores(session, campaign_id)
+    query = select(CampaignSquadScore)
+    if campaign_id is not None:
+        query = query.where(CampaignSquadScore.campaign_id == campaign_id)
+
+    stored = {
+        (score.campaign_id, score.squad_id): {
+            "total_points": score.total_points,
+            "challenges_completed": score.challenges_completed,
+            "submission_count": score.submission_count,
+            "challenge_points": score.challenge_points,
+        }
+        for score in (await session.execute(query)).scalars()
+    }
+    return sorted(
+        key for key in expected.keys() | stored.keys()
+        if expected.get(key) != stored.get(key)
+    )
+
+
+async def rebuild_campaign_scores(session: AsyncSession, campaign_id: Optional[UUID] = None) -> int:
+    """Replace stored score rows with ones computed from the submissions.
+
+    Args:
+        session: Database session
+        campaign_id: Only this campaign; all campaigns if omitted
+
+    Returns:
+        Number of rows written
+    """
+    scores = await compute_campaign_scores(session, campaign_id)
+
+    stmt = delete(CampaignSquadScore)
+    if campaign_id is not None:
+        stmt = stmt.where(CampaignSquadScore.campaign_id == campaign_id)
+    await session.execute(stmt)
+    if scores:
+        await session.execute(insert(CampaignSquadScore), [
+            {"campaign_id": key[0], "squad_id": key[1], **score}
+            for key, score in scores.items()
+        ])
+    await session.commit()
+    return len(scores)
+
+
+async def _main(campaign_id: Optional[UUID], rebuild: bool) -> int:
+    from smarter_dev.shared.database import close_database, get_db_session_context
+
+    try:
+        async with get_db_session_context() as session:
+            if rebuild:
+                written = await rebuild_campaign_scores(session, campaign_id)
+                print(f"Rebuilt {written} campaign score rows")
+                return 0
+
+            mismatched = await check_campaign_scores(session, campaign_id)
+            for campaign, squad in mismatched:
+                print(f"Mismatch: campaign {campaign} squad {squad}")
+            print(f"{len(mismatched)} campaign score rows out of date")
+            return 1 if mismatched else 0
+    finally:
+        await close_database()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check or rebuild campaign scoreboards.")
+    parser.add_argument("--campaign", type=UUID, help="Only this campaign (default: all)")
+    parser.add_argument("--rebuild", action="store_true", help="Rewrite the score rows")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(_main(args.campaign, args.rebuild)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Background pre-generation of challenge inputs around release time.
+
+Every squad fetches its input right after a challenge is announced, so
+generating inputs on demand runs the generator once per squad in a burst
+while members wait. ``InputPregenerator`` generates them for all active
+squads in the background instead, as soon as the bot reports a challenge as
+upcoming or released. Squads that fetch before it finishes still generate
+their own input on demand; scoring starts at each squad's first fetch either
+way (``ChallengeInput.first_fetched_at``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional, Set
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+
+class InputPregenerator:
+    """Runs at most one pre-generation pass per challenge per process."""
+
+    def __init__(self):
+        self._tasks: Set[asyncio.Task] = set()
+        self._scheduled: Set[UUID] = set()
+
+    def schedule(self, challenge_id: UUID) -> None:
+        """Pre-generate a challenge's inputs in the background."""
+        if challenge_id in self._scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._scheduled.add(challenge_id)
+        task = loop.create_task(self._run(challenge_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, challenge_id: UUID) -> None:
+        try:
+            created = await self.run_once(challenge_id)
+            logger.info(f"Pre-generated {created} inputs for challenge {challenge_id}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Let a later trigger try again
+            self._scheduled.discard(challenge_id)
+            logger.error(f"Failed to pre-generate inputs for challenge {challenge_id}: {e}")
+
+    async def run_once(self, challenge_id: UUID) -> int:
+        """Pre-generate a challenge's inputs in its own session.
+
+        Returns:
+            Number of inputs created
+        """
+        from smarter_dev.shared.database import get_db_session_context
+        from smarter_dev.web.crud import CampaignOperations, ChallengeInputOperations
+
+        async with get_db_session_context() as session:
+            challenge = await CampaignOperations(session).get_challenge_with_campaign(challenge_id)
+            if challenge is None:
+                return 0
+            return await ChallengeInputOperations(session).pregenerate_inputs(challenge)
+
+    async def stop(self) -> None:
+        """Cancel passes still running."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# Global pre-generator
+input_pregenerator: Optional[InputPregenerator] = None
+
+
+def get_input_pregenerator() -> InputPregenerator:
+    """Get the global challenge input pre-generator."""
+    global input_pregenerator
+    if input_pregenerator is None:
+        input_pregenerator = InputPregenerator()
+    return input_pregenerator
@@ -0,0 +1,79 @@
+"""Work queued on a SQLAlchemy session until its transaction commits.
+
+Side effects of a database change that live outside the database (Redis
+leaderboards, cache change events) must not happen for changes that are
+rolled back. A ``CommitQueue`` collects them in ``session.info`` and hands
+them to a flush function once the outermost transaction commits:
+
+- releasing a savepoint is not a commit, so its items wait for the outer
+  transaction
+- rolling back a savepoint discards only what was queued inside it
+- rolling back the whole transaction discards everything
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Callable, Generic, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+
+class CommitQueue(Generic[T]):
+    """Per-session collection flushed after the outermost commit."""
+
+    def __init__(self, key: str, factory: Callable[[], T], flush: Callable[[T], None]):
+        """Register the session hooks for a queue.
+
+        Args:
+            key: session.info key holding the queued items
+            factory: Creates an empty collection, e.g. ``dict`` or ``set``
+            flush: Called with the collection after commit, if not empty
+        """
+        self._key = key
+        self._savepoint_key = f"{key}_savepoints"
+        self._factory = factory
+        self._flush = flush
+
+        event.listen(Session, "after_commit", self._after_commit)
+        event.listen(Session, "after_transaction_create", self._after_transaction_create)
+        event.listen(Session, "after_soft_rollback", self._after_soft_rollback)
+        event.listen(Session, "after_transaction_end", self._after_transaction_end)
+
+    def pending(self, session: AsyncSession) -> T:
+        """The session's queued items, to add to."""
+        return session.info.setdefault(self._key, self._factory())
+
+    def _after_commit(self, session: Session) -> None:
+        if session.in_nested_transaction():
+            # A savepoint was released; wait for the outer commit
+            return
+        items = session.info.pop(self._key, None)
+        if items:
+            self._flush(items)
+
+    def _after_transaction_create(self, session: Session, transaction) -> None:
+        if transaction.nested:
+            # What to go back to if this savepoint rolls back
+            queued = session.info.get(self._key)
+            snapshot = copy.copy(queued) if queued else self._factory()
+            session.info.setdefault(self._savepoint_key, {})[transaction] = snapshot
+
+    def _after_soft_rollback(self, session: Session, previous_transaction) -> None:
+        if previous_transaction.nested:
+            # Only the savepoint rolled back; keep what was queued before it
+            queued = session.info.get(self._savepoint_key, {}).pop(previous_transaction, None)
+            if queued:
+                session.info[self._key] = queued
+            else:
+                session.info.pop(self._key, None)
+            return
+        session.info.pop(self._key, None)
+
+    def _after_transaction_end(self, session: Session, transaction) -> None:
+        if transaction.parent is None:
+            session.info.pop(self._savepoint_key, None)
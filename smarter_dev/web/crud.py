@@ -7,20 +7,28 @@ SQLAlchemy 2.0 syntax.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from typing import Optional, List, Dict, Any, Tuple
-from uuid import UUID
-from datetime import datetime, timezone, date
+import time
+from typing import Optional, List, Dict, Any, NamedTuple, Tuple
+from uuid import UUID, uuid4
+from datetime import datetime, timezone, date, timedelta
 
-from sqlalchemy import select, update, delete, func, desc, and_, or_
+from sqlalchemy import select, insert, update, delete, func, desc, and_, or_, text, tuple_, union
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
 from smarter_dev.web.models import (
+    FIRST_SUCCESS_PREDICATE,
     BytesBalance,
     BytesTransaction,
     BytesConfig,
+    GuildMember,
     Squad,
     SquadMembership,
     SquadSaleEvent,
@@ -31,13 +39,263 @@ from smarter_dev.web.models import (
     Challenge,
     ChallengeInput,
     ChallengeSubmission,
+    DailyStats,
     ScheduledMessage,
     RepeatingMessage,
 )
+from smarter_dev.web.cache_events import (
+    BYTES_CONFIG,
+    FORUM_AGENTS,
+    SQUAD_SALES,
+    SQUADS,
+    record_change
+)
+from smarter_dev.web.campaign_scores import CampaignStandings, get_campaign_standings, record_submission
+from smarter_dev.web.leaderboard import get_leaderboard, record_balance
+from smarter_dev.web.script_runner import ScriptExecutionError, get_script_runner
 
 logger = logging.getLogger(__name__)
 
 
+# Origin for transaction cursor timestamps
+CURSOR_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def encode_transaction_cursor(transaction: BytesTransaction) -> str:
+    """Encode a transaction's (created_at, id) as an opaque page cursor.
+
+    The cursor is short enough to fit in a Discord component custom_id.
+    """
+    created_at = transaction.created_at
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    micros = (created_at - CURSOR_EPOCH) // timedelta(microseconds=1)
+    return f"{micros}_{transaction.id.hex}"
+
+
+def decode_transaction_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a page cursor back into (created_at, id).
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    micros, _, id_hex = cursor.partition("_")
+    return CURSOR_EPOCH + timedelta(microseconds=int(micros)), UUID(hex=id_hex)
+
+
+class TransferResult(NamedTuple):
+    """Outcome of applying a transfer; created_at is None if the debit was refused."""
+    created_at: Optional[datetime]
+    giver_balance: Optional[int]
+    giver_new_balance: Optional[int] = None
+    receiver_new_balance: Optional[int] = None
+
+
+class DailyClaimResult(NamedTuple):
+    """Outcome of a successful daily claim."""
+    balance: BytesBalance
+    reward_amount: int
+    streak_bonus: int
+    squad_id: Optional[UUID]
+
+
+# Single-statement bytes transfer for PostgreSQL. Both balance rows are locked
+# in user_id order, the giver row is created if missing, and the debit only
+# applies while the balance covers the amount. The credit and transaction
+# insert are gated on the debit, so a refused transfer changes nothing, and
+# both users' guild_members profiles are refreshed with it.
+TRANSFER_SQL = """
+WITH locked AS (
+    SELECT user_id, balance
+    FROM bytes_balances
+    WHERE guild_id = :guild_id AND user_id IN (:giver_id, :receiver_id)
+    ORDER BY user_id
+    FOR UPDATE
+),
+ensure_giver AS (
+    INSERT INTO bytes_balances
+        (guild_id, user_id, balance, total_received, total_sent, streak_count)
+    VALUES (:guild_id, :giver_id, 0, 0, 0, 0)
+    ON CONFLICT (guild_id, user_id) DO NOTHING
+),
+debit AS (
+    UPDATE bytes_balances
+    SET balance = bytes_balances.balance - :amount,
+        total_sent = bytes_balances.total_sent + :amount,
+        updated_at = now()
+    FROM locked
+    WHERE bytes_balances.guild_id = :guild_id
+      AND bytes_balances.user_id = :giver_id
+      AND locked.user_id = :giver_id
+      AND bytes_balances.balance >= :amount
+    RETURNING bytes_balances.balance
+),
+credit AS (
+    INSERT INTO bytes_balances
+        (guild_id, user_id, balance, total_received, total_sent, streak_count)
+    SELECT :guild_id, :receiver_id, CAST(:amount AS BIGINT), CAST(:amount AS BIGINT), 0, 0 FROM debit
+    ON CONFLICT (guild_id, user_id) DO UPDATE
+    SET balance = bytes_balances.balance + EXCLUDED.balance,
+        total_received = bytes_balances.total_received + EXCLUDED.total_received,
+        updated_at = now()
+    RETURNING balance
+),
+txn AS (
+    INSERT INTO bytes_transactions
+        (id, guild_id, giver_id, giver_username, receiver_id, receiver_username, amount, reason)
+    SELECT CAST(:id AS UUID), :guild_id, :giver_id, :giver_username, :receiver_id, :receiver_username,
+           CAST(:amount AS BIGINT), :reason
+    FROM debit
+    RETURNING created_at
+),
+profiles AS (
+    INSERT INTO guild_members AS m (guild_id, user_id, username, last_seen_at)
+    SELECT :guild_id, member.user_id, left(member.username, 100), now()
+    FROM debit, (VALUES
+        (CAST(:giver_id AS VARCHAR), CAST(:giver_username AS VARCHAR)),
+        (CAST(:receiver_id AS VARCHAR), CAST(:receiver_username AS VARCHAR))
+    ) AS member (user_id, username)
+    WHERE member.user_id <> 'SYSTEM' AND member.username <> ''
+    ON CONFLICT (guild_id, user_id) DO UPDATE
+    SET username = EXCLUDED.username,
+        last_seen_at = EXCLUDED.last_seen_at,
+        updated_at = now()
+    WHERE m.last_seen_at <= EXCLUDED.last_seen_at
+)
+SELECT
+    (SELECT created_at FROM txn) AS created_at,
+    (SELECT balance FROM locked WHERE user_id = :giver_id) AS giver_balance,
+    (SELECT balance FROM debit) AS giver_new_balance,
+    (SELECT balance FROM credit) AS receiver_new_balance
+"""
+
+# Single-statement daily claim for PostgreSQL. The guild config is created
+# with defaults if missing, the balance row is locked, and the streak, bonus
+# and reward are computed in SQL. The balance upsert only applies while
+# last_daily is before the claim date, which makes (guild_id, user_id,
+# claim_date) the idempotency key: a repeated claim returns no row. The
+# transaction insert, guild_members profile update and default squad
+# assignment are gated on the claim.
+DAILY_CLAIM_SQL = """
+WITH new_config AS (
+    INSERT INTO bytes_configs
+        (guild_id, starting_balance, daily_amount, streak_bonuses, max_transfer,
+         transfer_cooldown_hours, role_rewards)
+    VALUES (:guild_id, :starting_balance, :daily_amount, CAST(:streak_bonuses AS JSON),
+            :max_transfer, :transfer_cooldown_hours, CAST(:role_rewards AS JSON))
+    ON CONFLICT (guild_id) DO NOTHING
+    RETURNING starting_balance, daily_amount, streak_bonuses
+),
+config AS (
+    SELECT starting_balance, daily_amount, streak_bonuses FROM bytes_configs WHERE guild_id = :guild_id
+    UNION ALL
+    SELECT starting_balance, daily_amount, streak_bonuses FROM new_config
+),
+existing AS (
+    SELECT streak_count, last_daily
+    FROM bytes_balances
+    WHERE guild_id = :guild_id AND user_id = :user_id
+    FOR UPDATE
+),
+plan AS (
+    SELECT
+        existing.last_daily IS NULL AS is_new_member,
+        CASE WHEN existing.last_daily = :previous_date THEN existing.streak_count + 1 ELSE 1 END AS streak_count,
+        config.starting_balance,
+        config.daily_amount,
+        config.streak_bonuses
+    FROM (SELECT * FROM config LIMIT 1) AS config
+    LEFT JOIN existing ON true
+    WHERE existing.last_daily IS NULL OR existing.last_daily < :claim_date
+),
+bonus AS (
+    SELECT
+        plan.*,
+        GREATEST(1, COALESCE((
+            SELECT max(CASE
+                WHEN milestone.key ~ '^[0-9]+$' AND milestone.value ~ '^[0-9]+$'
+                     AND milestone.key::bigint > 0 AND plan.streak_count % milestone.key::bigint = 0
+                THEN milestone.value::bigint
+            END)
+            FROM json_each_text(CAST(plan.streak_bonuses AS JSON)) AS milestone
+        ), 1)) AS streak_bonus
+    FROM plan
+),
+reward AS (
+    SELECT
+        bonus.is_new_member,
+        bonus.streak_count,
+        bonus.streak_bonus,
+        CASE WHEN bonus.is_new_member THEN bonus.starting_balance ELSE bonus.daily_amount END
+            * bonus.streak_bonus AS amount
+    FROM bonus
+),
+claim AS (
+    INSERT INTO bytes_balances AS b
+        (guild_id, user_id, balance, total_received, total_sent, streak_count, last_daily)
+    SELECT :guild_id, :user_id, reward.amount, reward.amount, 0, reward.streak_count, CAST(:claim_date AS DATE)
+    FROM reward
+    ON CONFLICT (guild_id, user_id) DO UPDATE
+    SET balance = b.balance + EXCLUDED.balance,
+        total_received = b.total_received + EXCLUDED.total_received,
+        streak_count = EXCLUDED.streak_count,
+        last_daily = EXCLUDED.last_daily,
+        updated_at = now()
+    WHERE b.last_daily IS NULL OR b.last_daily < EXCLUDED.last_daily
+    RETURNING b.guild_id, b.user_id, b.balance, b.total_received, b.total_sent,
+              b.streak_count, b.last_daily, b.created_at, b.updated_at
+),
+txn AS (
+    INSERT INTO bytes_transactions
+        (id, guild_id, giver_id, giver_username, receiver_id, receiver_username, amount, reason)
+    SELECT CAST(:transaction_id AS UUID), :guild_id, 'SYSTEM', 'System', :user_id, :username, reward.amount,
+        CASE
+            WHEN reward.is_new_member THEN 'New member welcome bonus'
+            WHEN reward.streak_bonus > 1 THEN
+                'Daily reward (Day ' || reward.streak_count || ', ' || reward.streak_bonus || 'x multiplier)'
+            ELSE 'Daily reward (Day ' || reward.streak_count || ')'
+        END
+    FROM claim, reward
+),
+profile AS (
+    INSERT INTO guild_members AS m (guild_id, user_id, username, last_seen_at)
+    SELECT :guild_id, :user_id, left(CAST(:username AS VARCHAR), 100), now()
+    FROM claim
+    WHERE CAST(:username AS VARCHAR) <> ''
+    ON CONFLICT (guild_id, user_id) DO UPDATE
+    SET username = EXCLUDED.username,
+        last_seen_at = EXCLUDED.last_seen_at,
+        updated_at = now()
+    WHERE m.last_seen_at <= EXCLUDED.last_seen_at
+),
+assign AS (
+    INSERT INTO squad_memberships (squad_id, user_id, guild_id, joined_at)
+    SELECT squads.id, :user_id, :guild_id, now()
+    FROM squads, claim
+    WHERE squads.guild_id = :guild_id
+      AND squads.is_default
+      AND squads.is_active
+      AND NOT EXISTS (
+          SELECT 1 FROM squad_memberships
+          WHERE guild_id = :guild_id AND user_id = :user_id
+      )
+      AND (
+          COALESCE(squads.max_members, 0) = 0
+          OR (SELECT count(*) FROM squad_memberships WHERE squad_id = squads.id) < squads.max_members
+      )
+    LIMIT 1
+    ON CONFLICT DO NOTHING
+    RETURNING squad_id
+)
+SELECT
+    claim.*,
+    reward.amount AS reward_amount,
+    reward.streak_bonus,
+    (SELECT squad_id FROM assign) AS assigned_squad_id
+FROM claim, reward
+"""
+
+
 class DatabaseOperationError(Exception):
     """Base exception for database operations."""
     pass
@@ -53,6 +311,62 @@ class ConflictError(DatabaseOperationError):
     pass
 
 
+class GuildMemberOperations:
+    """Database operations for denormalized guild member profiles.
+    
+    Keeps each user's latest display name and last activity time in
+    guild_members so listings don't have to derive them from transactions.
+    """
+    
+    async def record_activity(
+        self,
+        session: AsyncSession,
+        guild_id: str,
+        usernames: Dict[str, Optional[str]],
+        seen_at: Optional[datetime] = None
+    ) -> None:
+        """Upsert the latest username and last-seen time for users in a guild.
+        
+        The SYSTEM pseudo-user and missing usernames are skipped, and an
+        older activity never overwrites a newer one.
+        
+        Args:
+            session: Database session
+            guild_id: Discord guild snowflake ID
+            usernames: Username keyed by Discord user ID
+            seen_at: Activity time; defaults to now
+            
+        Raises:
+            DatabaseOperationError: If the upsert fails
+        """
+        seen_at = seen_at or datetime.now(timezone.utc)
+        rows = [
+            {"guild_id": guild_id, "user_id": user_id, "username": username[:100], "last_seen_at": seen_at}
+            for user_id, username in usernames.items()
+            if username and user_id != "SYSTEM"
+        ]
+        if not rows:
+            return
+        
+        try:
+            dialect_insert = (
+                postgresql_insert if session.bind.dialect.name == "postgresql" else sqlite_insert
+            )
+            stmt = dialect_insert(GuildMember).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[GuildMember.guild_id, GuildMember.user_id],
+                set_={
+                    "username": stmt.excluded.username,
+                    "last_seen_at": stmt.excluded.last_seen_at,
+                    "updated_at": func.now(),
+                },
+                where=GuildMember.last_seen_at <= stmt.excluded.last_seen_at
+            )
+            await session.execute(stmt)
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to record member activity: {e}") from e
+
+
 class SquadOperations:
     """Database operations for squad management system.
     
@@ -164,6 +478,7 @@ class SquadOperations:
                 **squad_data
             )
             session.add(squad)
+            record_change(session, guild_id, SQUADS)
             return squad
             
         except IntegrityError as e:
@@ -215,6 +530,7 @@ class SquadOperations:
                 if hasattr(squad, field):
                     setattr(squad, field, value)
             
+            record_change(session, squad.guild_id, SQUADS)
             return squad
             
         except (NotFoundError, ConflictError):
@@ -247,11 +563,13 @@ class SquadOperations:
             await session.execute(stmt)
             
             # Then delete the squad
-            stmt = delete(Squad).where(Squad.id == squad_id)
+            stmt = delete(Squad).where(Squad.id == squad_id).returning(Squad.guild_id)
             result = await session.execute(stmt)
+            guild_id = result.scalar_one_or_none()
             
-            if result.rowcount == 0:
+            if guild_id is None:
                 raise NotFoundError(f"Squad not found: {squad_id}")
+            record_change(session, guild_id, SQUADS)
             
         except NotFoundError:
             raise
@@ -341,6 +659,7 @@ class SquadOperations:
                 guild_id=guild_id
             )
             session.add(membership)
+            await GuildMemberOperations().record_activity(session, guild_id, {user_id: username})
             
             return membership
             
@@ -563,49 +882,8 @@ class SquadOperations:
             DatabaseOperationError: If query fails
         """
         try:
-            # Create subquery to get the most recent username for each user
-            # We'll check both giver and receiver transactions to find the latest username
-            latest_username_subq = (
-                select(
-                    BytesTransaction.giver_id.label('user_id'),
-                    BytesTransaction.giver_username.label('username'),
-                    BytesTransaction.created_at.label('last_transaction')
-                )
-                .where(
-                    BytesTransaction.guild_id == guild_id,
-                    BytesTransaction.giver_username.isnot(None),
-                    BytesTransaction.giver_username != ''
-                )
-                .union_all(
-                    select(
-                        BytesTransaction.receiver_id.label('user_id'),
-                        BytesTransaction.receiver_username.label('username'),
-                        BytesTransaction.created_at.label('last_transaction')
-                    )
-                    .where(
-                        BytesTransaction.guild_id == guild_id,
-                        BytesTransaction.receiver_username.isnot(None),
-                        BytesTransaction.receiver_username != ''
-                    )
-                )
-                .subquery()
-            )
-            
-            # Get the most recent username for each user_id
-            latest_username_cte = (
-                select(
-                    latest_username_subq.c.user_id,
-                    latest_username_subq.c.username,
-                    func.row_number().over(
-                        partition_by=latest_username_subq.c.user_id,
-                        order_by=desc(latest_username_subq.c.last_transaction)
-                    ).label('rn')
-                )
-                .select_from(latest_username_subq)
-                .cte('latest_usernames')
-            )
-            
-            # Build main query joining squad memberships with squads and usernames
+            # Usernames come from the guild_members profile table
+            username = func.coalesce(GuildMember.username, SquadMembership.user_id)
             stmt = (
                 select(
                     SquadMembership.user_id,
@@ -615,15 +893,15 @@ class SquadOperations:
                     Squad.role_id.label('squad_role_id'),
                     Squad.is_default.label('squad_is_default'),
                     Squad.is_active.label('squad_is_active'),
-                    func.coalesce(latest_username_cte.c.username, SquadMembership.user_id).label('username')
+                    username.label('username')
                 )
                 .select_from(SquadMembership)
                 .join(Squad, SquadMembership.squad_id == Squad.id)
                 .outerjoin(
-                    latest_username_cte,
+                    GuildMember,
                     and_(
-                        latest_username_cte.c.user_id == SquadMembership.user_id,
-                        latest_username_cte.c.rn == 1
+                        GuildMember.guild_id == SquadMembership.guild_id,
+                        GuildMember.user_id == SquadMembership.user_id
                     )
                 )
                 .where(Squad.guild_id == guild_id)
@@ -638,7 +916,7 @@ class SquadOperations:
                 search_pattern = f"%{username_search}%"
                 stmt = stmt.where(
                     or_(
-                        func.coalesce(latest_username_cte.c.username, SquadMembership.user_id).ilike(search_pattern),
+                        username.ilike(search_pattern),
                         SquadMembership.user_id.ilike(search_pattern)
                     )
                 )
@@ -651,7 +929,7 @@ class SquadOperations:
             for row in rows:
                 members.append({
                     'user_id': row.user_id,
-                    'username': row.username,  # Now contains actual username from transactions
+                    'username': row.username,
                     'joined_at': row.joined_at,
                     'squad_id': str(row.squad_id),
                     'squad_name': row.squad_name,
@@ -747,6 +1025,7 @@ class SquadOperations:
             # Set this squad as default
             squad.is_default = True
             
+            record_change(session, squad.guild_id, SQUADS)
             return squad
             
         except NotFoundError:
@@ -770,6 +1049,7 @@ class SquadOperations:
         """
         try:
             await self._clear_default_squad(session, guild_id)
+            record_change(session, guild_id, SQUADS)
         except Exception as e:
             raise DatabaseOperationError(f"Failed to clear default squad: {e}") from e
     
@@ -914,6 +1194,41 @@ class BytesOperations:
         except Exception as e:
             raise DatabaseOperationError(f"Failed to get balance: {e}") from e
     
+    async def get_balances(
+        self,
+        session: AsyncSession,
+        guild_id: str,
+        user_ids: List[str]
+    ) -> List[BytesBalance]:
+        """Get the balances of several users in one query.
+        
+        Users without a balance are left out; nothing is created.
+        
+        Args:
+            session: Database session
+            guild_id: Discord guild snowflake ID
+            user_ids: Discord user snowflake IDs
+            
+        Returns:
+            List[BytesBalance]: Balances that exist, in no particular order
+            
+        Raises:
+            DatabaseOperationError: If database operation fails
+        """
+        if not user_ids:
+            return []
+        
+        try:
+            stmt = select(BytesBalance).where(
+                BytesBalance.guild_id == guild_id,
+                BytesBalance.user_id.in_(user_ids)
+            )
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+            
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to get balances: {e}") from e
+    
     async def get_or_create_balance(
         self, 
         session: AsyncSession, 
@@ -951,6 +1266,7 @@ class BytesOperations:
                 )
                 session.add(balance)
                 await session.flush()  # Ensure timestamps are populated
+                record_balance(session, guild_id, user_id, balance.balance)
             
             return balance
             
@@ -970,6 +1286,12 @@ class BytesOperations:
     ) -> BytesTransaction:
         """Create transaction and update balances atomically.
         
+        Both balance rows are locked in user_id order so opposite transfers
+        between the same users cannot deadlock, and the debit is a guarded
+        ``UPDATE ... WHERE balance >= :amount`` so concurrent transfers can
+        never overdraw the giver. On PostgreSQL the locks, debit, credit and
+        transaction insert run as a single statement.
+        
         Args:
             session: Database session
             guild_id: Discord guild snowflake ID
@@ -988,24 +1310,6 @@ class BytesOperations:
             ConflictError: If insufficient balance
         """
         try:
-            # Get or create balances
-            giver_balance = await self.get_or_create_balance(session, guild_id, giver_id)
-            receiver_balance = await self.get_or_create_balance(session, guild_id, receiver_id)
-            
-            # Check sufficient balance
-            if giver_balance.balance < amount:
-                raise ConflictError(
-                    f"Insufficient balance: {giver_balance.balance} < {amount}"
-                )
-            
-            # Update balances
-            giver_balance.balance -= amount
-            giver_balance.total_sent += amount
-            
-            receiver_balance.balance += amount
-            receiver_balance.total_received += amount
-            
-            # Create transaction record
             transaction = BytesTransaction(
                 guild_id=guild_id,
                 giver_id=giver_id,
@@ -1016,8 +1320,30 @@ class BytesOperations:
                 reason=reason
             )
             
+            if session.bind.dialect.name == "postgresql":
+                result = await self._transfer_single_statement(session, transaction)
+            else:
+                result = await self._transfer_stepwise(session, transaction)
+            
+            if result.created_at is None:
+                raise ConflictError(
+                    f"Insufficient balance: {result.giver_balance or 0} < {amount}"
+                )
+            
+            record_balance(session, guild_id, giver_id, result.giver_new_balance)
+            record_balance(session, guild_id, receiver_id, result.receiver_new_balance)
+            
+            # The row is already written; attach it as persistent without another INSERT
+            transaction.created_at = result.created_at
+            transaction.updated_at = result.created_at
+            make_transient_to_detached(transaction)
             session.add(transaction)
-            await session.flush()  # Ensure timestamps are populated
+            
+            # Balances loaded earlier in this session no longer match the database
+            for user_id in (giver_id, receiver_id):
+                balance = session.identity_map.get(identity_key(BytesBalance, (guild_id, user_id)))
+                if balance is not None:
+                    session.expire(balance)
             
             # Auto-assign receiver to default squad if they aren't in any squad
             await self._auto_assign_default_squad_if_needed(session, guild_id, receiver_id, receiver_username)
@@ -1029,6 +1355,113 @@ class BytesOperations:
         except Exception as e:
             raise DatabaseOperationError(f"Failed to create transaction: {e}") from e
     
+    async def _transfer_single_statement(
+        self,
+        session: AsyncSession,
+        transaction: BytesTransaction
+    ) -> TransferResult:
+        """Apply a transfer in one PostgreSQL round trip."""
+        result = await session.execute(
+            text(TRANSFER_SQL),
+            {
+                "id": transaction.id,
+                "guild_id": transaction.guild_id,
+                "giver_id": transaction.giver_id,
+                "giver_username": transaction.giver_username,
+                "receiver_id": transaction.receiver_id,
+                "receiver_username": transaction.receiver_username,
+                "amount": transaction.amount,
+                "reason": transaction.reason,
+            }
+        )
+        row = result.one()
+        return TransferResult(row.created_at, row.giver_balance, row.giver_new_balance, row.receiver_new_balance)
+    
+    async def _transfer_stepwise(
+        self,
+        session: AsyncSession,
+        transaction: BytesTransaction
+    ) -> TransferResult:
+        """Apply a transfer with portable statements for databases without writable CTEs."""
+        guild_id = transaction.guild_id
+        amount = transaction.amount
+        
+        # Lock existing rows in a fixed order, then create any that are missing
+        result = await session.execute(
+            select(BytesBalance.user_id, BytesBalance.balance)
+            .where(
+                BytesBalance.guild_id == guild_id,
+                BytesBalance.user_id.in_([transaction.giver_id, transaction.receiver_id])
+            )
+            .order_by(BytesBalance.user_id)
+            .with_for_update()
+        )
+        existing = dict(result.all())
+        missing = [
+            {"guild_id": guild_id, "user_id": user_id, "balance": 0,
+             "total_received": 0, "total_sent": 0, "streak_count": 0}
+            for user_id in (transaction.giver_id, transaction.receiver_id)
+            if user_id not in existing
+        ]
+        if missing:
+            await session.execute(insert(BytesBalance), missing)
+        
+        debit = await session.execute(
+            update(BytesBalance)
+            .where(
+                BytesBalance.guild_id == guild_id,
+                BytesBalance.user_id == transaction.giver_id,
+                BytesBalance.balance >= amount
+            )
+            .values(
+                balance=BytesBalance.balance - amount,
+                total_sent=BytesBalance.total_sent + amount
+            )
+            .returning(BytesBalance.balance)
+            .execution_options(synchronize_session=False)
+        )
+        giver_new_balance = debit.scalar_one_or_none()
+        if giver_new_balance is None:
+            return TransferResult(None, existing.get(transaction.giver_id))
+        
+        credit = await session.execute(
+            update(BytesBalance)
+            .where(
+                BytesBalance.guild_id == guild_id,
+                BytesBalance.user_id == transaction.receiver_id
+            )
+            .values(
+                balance=BytesBalance.balance + amount,
+                total_received=BytesBalance.total_received + amount
+            )
+            .returning(BytesBalance.balance)
+            .execution_options(synchronize_session=False)
+        )
+        receiver_new_balance = credit.scalar_one()
+        
+        created_at = datetime.now(timezone.utc)
+        await session.execute(
+            insert(BytesTransaction).values(
+                id=transaction.id,
+                guild_id=guild_id,
+                giver_id=transaction.giver_id,
+                giver_username=transaction.giver_username,
+                receiver_id=transaction.receiver_id,
+                receiver_username=transaction.receiver_username,
+                amount=amount,
+                reason=transaction.reason,
+                created_at=created_at,
+                updated_at=created_at
+            )
+        )
+        await GuildMemberOperations().record_activity(
+            session,
+            guild_id,
+            {transaction.giver_id: transaction.giver_username, transaction.receiver_id: transaction.receiver_username},
+            seen_at=created_at
+        )
+        return TransferResult(created_at, existing.get(transaction.giver_id), giver_new_balance, receiver_new_balance)
+    
     async def create_system_charge(
         self,
         session: AsyncSession,
@@ -1068,6 +1501,7 @@ class BytesOperations:
             # Update balance
             balance.balance -= amount
             balance.total_sent += amount
+            record_balance(session, guild_id, user_id, balance.balance)
             
             # Create transaction record with system as receiver
             transaction = BytesTransaction(
@@ -1082,6 +1516,7 @@ class BytesOperations:
             
             session.add(transaction)
             await session.flush()  # Ensure timestamps are populated
+            await GuildMemberOperations().record_activity(session, guild_id, {user_id: username})
             
             return transaction
             
@@ -1122,6 +1557,7 @@ class BytesOperations:
             # Update balance
             balance.balance += amount
             balance.total_received += amount
+            record_balance(session, guild_id, user_id, balance.balance)
             
             # Create transaction record with system as giver
             transaction = BytesTransaction(
@@ -1136,6 +1572,7 @@ class BytesOperations:
             
             session.add(transaction)
             await session.flush()  # Ensure timestamps are populated
+            await GuildMemberOperations().record_activity(session, guild_id, {user_id: username})
             
             # Auto-assign user to default squad if they aren't in any squad
             await self._auto_assign_default_squad_if_needed(session, guild_id, user_id, username)
@@ -1153,6 +1590,10 @@ class BytesOperations:
     ) -> List[BytesBalance]:
         """Get top users by balance for a guild.
         
+        The ranking comes from the guild's leaderboard sorted set when it is
+        available, so only the top rows are read from the database. Falls
+        back to an index-ordered query otherwise.
+        
         Args:
             session: Database session
             guild_id: Discord guild snowflake ID
@@ -1164,6 +1605,22 @@ class BytesOperations:
         Raises:
             DatabaseOperationError: If query fails
         """
+        leaderboard = get_leaderboard()
+        if leaderboard.enabled:
+            try:
+                top = await leaderboard.top(session, guild_id, limit)
+                if not top:
+                    return []
+                result = await session.execute(
+                    select(BytesBalance).where(
+                        BytesBalance.guild_id == guild_id,
+                        BytesBalance.user_id.in_([user_id for user_id, _ in top])
+                    )
+                )
+                return sorted(result.scalars().all(), key=lambda balance: balance.balance, reverse=True)
+            except Exception as e:
+                logger.warning(f"Leaderboard unavailable for guild {guild_id}, querying database: {e}")
+        
         try:
             stmt = (
                 select(BytesBalance)
@@ -1177,20 +1634,78 @@ class BytesOperations:
         except Exception as e:
             raise DatabaseOperationError(f"Failed to get leaderboard: {e}") from e
     
+    async def get_rank(
+        self,
+        session: AsyncSession,
+        guild_id: str,
+        user_id: str
+    ) -> Optional[int]:
+        """Get a user's 1-based leaderboard position in a guild.
+        
+        Uses the guild's leaderboard sorted set when available and otherwise
+        counts the balances ranked above the user.
+        
+        Args:
+            session: Database session
+            guild_id: Discord guild snowflake ID
+            user_id: Discord user snowflake ID
+            
+        Returns:
+            Optional[int]: Position on the leaderboard, or None if the user has no balance
+            
+        Raises:
+            DatabaseOperationError: If query fails
+        """
+        leaderboard = get_leaderboard()
+        if leaderboard.enabled:
+            try:
+                return await leaderboard.rank(session, guild_id, user_id)
+            except Exception as e:
+                logger.warning(f"Leaderboard unavailable for guild {guild_id}, querying database: {e}")
+        
+        try:
+            balance = await session.scalar(
+                select(BytesBalance.balance).where(
+                    BytesBalance.guild_id == guild_id,
+                    BytesBalance.user_id == user_id
+                )
+            )
+            if balance is None:
+                return None
+            
+            higher = await session.scalar(
+                select(func.count()).select_from(BytesBalance).where(
+                    BytesBalance.guild_id == guild_id,
+                    BytesBalance.balance > balance
+                )
+            )
+            return higher + 1
+            
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to get rank: {e}") from e
+    
     async def get_transaction_history(
         self,
         session: AsyncSession,
         guild_id: str,
         user_id: Optional[str] = None,
-        limit: int = 20
+        limit: int = 20,
+        before: Optional[Tuple[datetime, UUID]] = None
     ) -> List[BytesTransaction]:
         """Get transaction history for a guild or user.
         
+        Pages by keyset on (created_at, id), so every page costs the same
+        regardless of how deep it is. A user's history is the union of the
+        sent and received branches, each read in order from its own index
+        and cut to the limit before merging.
+        
         Args:
             session: Database session
             guild_id: Discord guild snowflake ID
             user_id: Optional user ID to filter by
             limit: Maximum number of results
+            before: Optional (created_at, id) of the last transaction on the
+                previous page; only older transactions are returned
             
         Returns:
             List[BytesTransaction]: Transactions ordered by creation time descending
@@ -1199,19 +1714,31 @@ class BytesOperations:
             DatabaseOperationError: If query fails
         """
         try:
+            newest_first = (desc(BytesTransaction.created_at), desc(BytesTransaction.id))
+            
+            def page(*conditions):
+                stmt = select(BytesTransaction.id, BytesTransaction.created_at).where(
+                    BytesTransaction.guild_id == guild_id, *conditions
+                )
+                if before:
+                    stmt = stmt.where(
+                        tuple_(BytesTransaction.created_at, BytesTransaction.id) < tuple(before)
+                    )
+                return stmt.order_by(*newest_first).limit(limit)
+            
+            if user_id:
+                sent = page(BytesTransaction.giver_id == user_id).subquery()
+                received = page(BytesTransaction.receiver_id == user_id).subquery()
+                ids = union(select(sent.c.id), select(received.c.id)).subquery()
+            else:
+                ids = page().subquery()
+            
             stmt = (
                 select(BytesTransaction)
-                .where(BytesTransaction.guild_id == guild_id)
-                .order_by(desc(BytesTransaction.created_at))
+                .join(ids, BytesTransaction.id == ids.c.id)
+                .order_by(*newest_first)
                 .limit(limit)
             )
-            
-            if user_id:
-                stmt = stmt.where(
-                    (BytesTransaction.giver_id == user_id) |
-                    (BytesTransaction.receiver_id == user_id)
-                )
-            
             result = await session.execute(stmt)
             return list(result.scalars().all())
             
@@ -1259,6 +1786,206 @@ class BytesOperations:
         except Exception as e:
             raise DatabaseOperationError(f"Failed to get sent transaction history: {e}") from e
     
+    async def claim_daily(
+        self,
+        session: AsyncSession,
+        guild_id: str,
+        user_id: str,
+        username: str,
+        claim_date: date
+    ) -> DailyClaimResult:
+        """Claim the daily reward for a user in one atomic step.
+        
+        Checks eligibility, computes the streak and bonus, credits the balance,
+        records the transaction and auto-assigns the default squad. New members
+        receive the guild's starting balance as their first reward. On
+        PostgreSQL all of this is a single statement; the claim date is the
+        idempotency key, so a repeated claim for the same day is refused.
+        
+        Args:
+            session: Database session
+            guild_id: Discord guild snowflake ID
+            user_id: Discord user snowflake ID
+            username: Username for transaction audit
+            claim_date: UTC date of the claim
+            
+        Returns:
+            DailyClaimResult: Updated balance, reward, bonus and assigned squad ID
+            
+        Raises:
+            ConflictError: If the daily reward was already claimed for claim_date
+            DatabaseOperationError: If the claim fails
+        """
+        try:
+            if session.bind.dialect.name == "postgresql":
+                result = await self._claim_daily_single_statement(
+                    session, guild_id, user_id, username, claim_date
+                )
+            else:
+                result = await self._claim_daily_stepwise(
+                    session, guild_id, user_id, username, claim_date
+                )
+            
+            if result is None:
+                raise ConflictError(
+                    f"Daily reward already claimed for user {user_id} in guild {guild_id} on {claim_date}"
+                )
+            return result
+            
+        except ConflictError:
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to claim daily reward: {e}") from e
+
+    async def get_daily_claimers(
+        self,
+        session: AsyncSession,
+        guild_id: str,
+        claim_date: date
+    ) -> List[str]:
+        """Get the users who have claimed the daily reward on a date.
+
+        Args:
+            session: Database session
+            guild_id: Discord guild snowflake ID
+            claim_date: UTC date of the claims
+
+        Returns:
+            List[str]: User IDs whose last daily claim is claim_date
+
+        Raises:
+            DatabaseOperationError: If query fails
+        """
+        try:
+            result = await session.execute(
+                select(BytesBalance.user_id).where(
+                    BytesBalance.guild_id == guild_id,
+                    BytesBalance.last_daily == claim_date
+                )
+            )
+            return list(result.scalars())
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to get daily claimers: {e}") from e
+
+    async def _claim_daily_single_statement(
+        self,
+        session: AsyncSession,
+        guild_id: str,
+        user_id: str,
+        username: str,
+        claim_date: date
+    ) -> Optional[DailyClaimResult]:
+        """Run a daily claim as one PostgreSQL statement.
+        
+        Returns:
+            DailyClaimResult, or None if the user already claimed on claim_date
+        """
+        defaults = BytesConfig(guild_id=guild_id)
+        result = await session.execute(
+            text(DAILY_CLAIM_SQL),
+            {
+                "guild_id": guild_id,
+                "user_id": user_id,
+                "username": username,
+                "claim_date": claim_date,
+                "previous_date": claim_date - timedelta(days=1),
+                "transaction_id": uuid4(),
+                "starting_balance": defaults.starting_balance,
+                "daily_amount": defaults.daily_amount,
+                "streak_bonuses": json.dumps(defaults.streak_bonuses),
+                "max_transfer": defaults.max_transfer,
+                "transfer_cooldown_hours": defaults.transfer_cooldown_hours,
+                "role_rewards": json.dumps(defaults.role_rewards),
+            }
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        
+        # Merge the returned row into the session without reloading it
+        balance = BytesBalance(
+            guild_id=row.guild_id,
+            user_id=row.user_id,
+            balance=row.balance,
+            total_received=row.total_received,
+            total_sent=row.total_sent,
+            streak_count=row.streak_count,
+            last_daily=row.last_daily,
+            created_at=row.created_at,
+            updated_at=row.updated_at
+        )
+        make_transient_to_detached(balance)
+        balance = await session.merge(balance, load=False)
+        record_balance(session, guild_id, user_id, row.balance)
+        
+        return DailyClaimResult(
+            balance=balance,
+            reward_amount=row.reward_amount,
+            streak_bonus=row.streak_bonus,
+            squad_id=row.assigned_squad_id
+        )
+    
+    async def _claim_daily_stepwise(
+        self,
+        session: AsyncSession,
+        guild_id: str,
+        user_id: str,
+        username: str,
+        claim_date: date
+    ) -> Optional[DailyClaimResult]:
+        """Run a daily claim with ORM operations for databases without writable CTEs.
+        
+        Returns:
+            Same as ``_claim_daily_single_statement``
+        """
+        from smarter_dev.bot.services.streak_service import StreakService
+        
+        config = await self._get_or_create_config(session, guild_id)
+        
+        result = await session.execute(
+            select(BytesBalance)
+            .where(BytesBalance.guild_id == guild_id, BytesBalance.user_id == user_id)
+            .with_for_update()
+        )
+        balance = result.scalar_one_or_none()
+        if balance is None:
+            balance = BytesBalance(guild_id=guild_id, user_id=user_id)
+            session.add(balance)
+            await session.flush()
+        
+        is_new_member = balance.last_daily is None
+        daily_amount = config.starting_balance if is_new_member else config.daily_amount
+        streak_result = StreakService().calculate_streak_result(
+            last_daily=balance.last_daily,
+            current_streak=balance.streak_count,
+            daily_amount=daily_amount,
+            streak_bonuses=config.streak_bonuses,
+            current_date=claim_date
+        )
+        if not streak_result.can_claim:
+            return None
+        
+        balance, squad = await self.update_daily_reward(
+            session,
+            guild_id,
+            user_id,
+            username,
+            daily_amount,
+            streak_result.streak_bonus,
+            streak_result.new_streak_count,
+            claim_date,
+            is_new_member=is_new_member
+        )
+        # The flush expired the SQL-side updated_at; load it while we can still await
+        await session.refresh(balance, ["updated_at"])
+        
+        return DailyClaimResult(
+            balance=balance,
+            reward_amount=streak_result.reward_amount,
+            streak_bonus=streak_result.streak_bonus,
+            squad_id=squad.id if squad else None
+        )
+    
     async def update_daily_reward(
         self,
         session: AsyncSession,
@@ -1312,6 +2039,7 @@ class BytesOperations:
             balance.total_received += reward_amount
             balance.last_daily = claim_date or date.today()
             balance.streak_count = final_streak_count
+            record_balance(session, guild_id, user_id, balance.balance)
             
             # Create transaction record for audit trail
             transaction = BytesTransaction(
@@ -1326,6 +2054,7 @@ class BytesOperations:
             
             session.add(transaction)
             await session.flush()  # Ensure timestamps are populated
+            await GuildMemberOperations().record_activity(session, guild_id, {user_id: username})
             
             # Auto-assign to default squad if user isn't in any squad
             assigned_squad = await self._auto_assign_default_squad_if_needed(session, guild_id, user_id, username)
@@ -1500,6 +2229,7 @@ class BytesConfigOperations:
             config = BytesConfig(guild_id=guild_id, **config_data)
             session.add(config)
             await session.flush()  # This will trigger IntegrityError if duplicate
+            record_change(session, guild_id, BYTES_CONFIG)
             return config
             
         except IntegrityError as e:
@@ -1534,6 +2264,7 @@ class BytesConfigOperations:
                 if hasattr(config, field):
                     setattr(config, field, value)
             
+            record_change(session, guild_id, BYTES_CONFIG)
             return config
             
         except NotFoundError:
@@ -1562,6 +2293,7 @@ class BytesConfigOperations:
             
             if result.rowcount == 0:
                 raise NotFoundError(f"Configuration not found for guild {guild_id}")
+            record_change(session, guild_id, BYTES_CONFIG)
             
         except NotFoundError:
             raise
@@ -1754,19 +2486,23 @@ class APIKeyOperations:
             DatabaseOperationError: If operation fails
         """
         from smarter_dev.web.models import APIKey
+        from smarter_dev.web.api_key_cache import get_api_key_cache
         
         try:
+            now = datetime.now(timezone.utc)
             stmt = (
                 update(APIKey)
                 .where(APIKey.id == key_id)
                 .values(
                     is_active=False,
-                    updated_at=datetime.now(timezone.utc)
+                    revoked_at=now,
+                    updated_at=now
                 )
             )
             result = await session.execute(stmt)
             await session.commit()
             
+            await get_api_key_cache().invalidate(key_id)
             return result.rowcount > 0
             
         except Exception as e:
@@ -1790,6 +2526,7 @@ class APIKeyOperations:
             DatabaseOperationError: If operation fails
         """
         from smarter_dev.web.models import APIKey
+        from smarter_dev.web.api_key_cache import get_api_key_cache
         
         try:
             stmt = (
@@ -1797,12 +2534,14 @@ class APIKeyOperations:
                 .where(APIKey.id == key_id)
                 .values(
                     is_active=True,
+                    revoked_at=None,
                     updated_at=datetime.now(timezone.utc)
                 )
             )
             result = await session.execute(stmt)
             await session.commit()
             
+            await get_api_key_cache().invalidate(key_id)
             return result.rowcount > 0
             
         except Exception as e:
@@ -1826,12 +2565,14 @@ class APIKeyOperations:
             DatabaseOperationError: If operation fails
         """
         from smarter_dev.web.models import APIKey
+        from smarter_dev.web.api_key_cache import get_api_key_cache
         
         try:
             stmt = delete(APIKey).where(APIKey.id == key_id)
             result = await session.execute(stmt)
             await session.commit()
             
+            await get_api_key_cache().invalidate(key_id)
             return result.rowcount > 0
             
         except Exception as e:
@@ -1948,36 +2689,25 @@ class APIKeyOperations:
         from smarter_dev.web.models import APIKey
         
         try:
-            # Count total API keys
-            total_query = select(func.count(APIKey.id))
-            total_result = await db.execute(total_query)
-            total_api_keys = total_result.scalar() or 0
-            
-            # Count active API keys
-            active_query = select(func.count(APIKey.id)).where(APIKey.is_active == True)
-            active_result = await db.execute(active_query)
-            active_api_keys = active_result.scalar() or 0
-            
-            # Count revoked API keys
-            revoked_query = select(func.count(APIKey.id)).where(APIKey.is_active == False)
-            revoked_result = await db.execute(revoked_query)
-            revoked_api_keys = revoked_result.scalar() or 0
-            
-            # Count expired API keys (active but past expiration)
+            # Key counts in one pass, with today's requests from the stats rollup
             now = datetime.now(timezone.utc)
-            expired_query = select(func.count(APIKey.id)).where(
-                and_(
-                    APIKey.is_active == True,
-                    APIKey.expires_at < now
-                )
+            requests_today = (
+                select(DailyStats.api_request_count)
+                .where(DailyStats.day == now.date())
+                .scalar_subquery()
             )
-            expired_result = await db.execute(expired_query)
-            expired_api_keys = expired_result.scalar() or 0
-            
-            # Calculate total requests
-            usage_query = select(func.sum(APIKey.usage_count))
-            usage_result = await db.execute(usage_query)
-            total_api_requests = usage_result.scalar() or 0
+            counts = (await db.execute(
+                select(
+                    func.count(APIKey.id).label("total"),
+                    func.count(APIKey.id).filter(APIKey.is_active == True).label("active"),
+                    func.count(APIKey.id).filter(APIKey.is_active == False).label("revoked"),
+                    func.count(APIKey.id).filter(
+                        and_(APIKey.is_active == True, APIKey.expires_at < now)
+                    ).label("expired"),
+                    func.coalesce(func.sum(APIKey.usage_count), 0).label("usage"),
+                    func.coalesce(requests_today, 0).label("requests_today")
+                )
+            )).one()
             
             # Get top consumers (top 5 by usage count)
             top_consumers_query = (
@@ -1997,12 +2727,12 @@ class APIKeyOperations:
             ]
             
             return {
-                "total_api_keys": total_api_keys,
-                "active_api_keys": active_api_keys,
-                "revoked_api_keys": revoked_api_keys,
-                "expired_api_keys": expired_api_keys,
-                "total_api_requests": total_api_requests,
-                "api_requests_today": 0,  # TODO: Implement daily tracking
+                "total_api_keys": counts.total,
+                "active_api_keys": counts.active,
+                "revoked_api_keys": counts.revoked,
+                "expired_api_keys": counts.expired,
+                "total_api_requests": counts.usage,
+                "api_requests_today": counts.requests_today,
                 "top_api_consumers": top_consumers
             }
             
@@ -2066,6 +2796,7 @@ class ForumAgentOperations:
             )
             
             self.session.add(agent)
+            record_change(self.session, guild_id, FORUM_AGENTS)
             await self.session.commit()
             await self.session.refresh(agent)
             
@@ -2155,6 +2886,7 @@ class ForumAgentOperations:
             
             agent.updated_at = datetime.now(timezone.utc)
             
+            record_change(self.session, guild_id, FORUM_AGENTS)
             await self.session.commit()
             await self.session.refresh(agent)
             
@@ -2189,6 +2921,7 @@ class ForumAgentOperations:
                 return False
             
             await self.session.delete(agent)
+            record_change(self.session, guild_id, FORUM_AGENTS)
             await self.session.commit()
             
             return True
@@ -2215,6 +2948,7 @@ class ForumAgentOperations:
             agent.is_active = not agent.is_active
             agent.updated_at = datetime.now(timezone.utc)
             
+            record_change(self.session, guild_id, FORUM_AGENTS)
             await self.session.commit()
             await self.session.refresh(agent)
             
@@ -2453,6 +3187,7 @@ class ForumAgentOperations:
             else:
                 raise ValueError(f"Invalid bulk action: {action}")
             
+            record_change(self.session, guild_id, FORUM_AGENTS)
             await self.session.commit()
             return modified_count
             
@@ -2657,6 +3392,9 @@ class CampaignOperations:
             await self.session.commit()
             await self.session.refresh(campaign)
             
+            # Submissions must score with the new release cadence
+            ChallengeSubmissionOperations.clear_scoring_cache()
+            
             return campaign
             
         except IntegrityError as e:
@@ -3034,13 +3772,26 @@ class CampaignOperations:
             raise DatabaseOperationError(f"Failed to get campaign challenge count: {e}") from e
 
 
+# Advisory lock namespace for generating one squad's challenge input
+INPUT_GENERATION_LOCK_ID = 7_305_003
+
+
 class ChallengeInputOperations:
     """Database operations for challenge input management system.
     
     Handles squad-specific challenge input generation, storage, and retrieval.
     Ensures all squad members receive the same input data for fairness.
+    
+    Input generation is single-flight: concurrent requests for the same squad
+    in this process wait on one generation, an advisory lock serializes
+    generation across API processes on PostgreSQL, and the insert skips rows
+    that already exist, so the generator runs once per squad and every
+    member gets the stored input.
     """
     
+    # (challenge_id, squad_id) -> generation in progress in this process
+    _generations: Dict[Tuple[UUID, UUID], asyncio.Task] = {}
+    
     def __init__(self, session: AsyncSession):
         """Initialize with database session.
         
@@ -3070,33 +3821,192 @@ class ChallengeInputOperations:
             ScriptExecutionError: If script execution fails
         """
         try:
-            # First, try to get existing input
+            # First, try to get existing (possibly pre-generated) input
             existing_input = await self.get_input_by_squad(challenge_id, squad_id)
             if existing_input:
+                if existing_input.first_fetched_at is None:
+                    await self._mark_fetched(challenge_id, squad_id)
                 return existing_input.input_data, existing_input.result_data
             
             # If no existing input, generate new one
             if not script:
                 raise DatabaseOperationError("No script provided for input generation")
             
-            input_data, result_data = await self._execute_script(script)
+            # Join a generation already running for the squad, or start one
+            # in its own task and session so that a caller going away
+            # doesn't cancel it for the rest of the squad
+            key = (challenge_id, squad_id)
+            generation = self._generations.get(key)
+            if generation is None:
+                generation = asyncio.create_task(self._generate_detached(challenge_id, squad_id, script))
+                self._generations[key] = generation
+                generation.add_done_callback(lambda task: self._finish_generation(key, task))
+            # Don't keep this session's transaction open while waiting
+            await self.session.commit()
+            return await asyncio.shield(generation)
             
-            # Store the generated input in database
-            challenge_input = ChallengeInput(
-                challenge_id=challenge_id,
-                squad_id=squad_id,
-                input_data=input_data,
-                result_data=result_data
+        except (ScriptExecutionError, DatabaseOperationError):
+            await self.session.rollback()
+            raise
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseOperationError(f"Failed to get or create challenge input: {e}") from e
+    
+    async def _generate_detached(
+        self,
+        challenge_id: UUID,
+        squad_id: UUID,
+        script: str
+    ) -> tuple[str, str]:
+        """Run ``_generate_input`` in a session of its own."""
+        async with AsyncSession(self.session.bind, expire_on_commit=False) as session:
+            return await ChallengeInputOperations(session)._generate_input(challenge_id, squad_id, script)
+    
+    @classmethod
+    def _finish_generation(cls, key: Tuple[UUID, UUID], task: asyncio.Task) -> None:
+        del cls._generations[key]
+        if not task.cancelled():
+            # Mark retrieved so a failure nobody waited on isn't logged
+            task.exception()
+    
+    async def _generate_input(
+        self,
+        challenge_id: UUID,
+        squad_id: UUID,
+        script: str
+    ) -> tuple[str, str]:
+        """Generate and store a squad's input unless another process already has."""
+        if self.session.bind.dialect.name == "postgresql":
+            # Held until commit, so other API processes wait here and then
+            # find the stored row instead of running the generator again
+            await self.session.execute(
+                text("SELECT pg_advisory_xact_lock(:namespace, hashtext(:key))"),
+                {"namespace": INPUT_GENERATION_LOCK_ID, "key": f"{challenge_id}:{squad_id}"}
             )
+            existing_input = await self.get_input_by_squad(challenge_id, squad_id)
+            if existing_input:
+                await self._mark_fetched(challenge_id, squad_id)
+                return existing_input.input_data, existing_input.result_data
+        
+        input_data, result_data = await self._execute_script(script)
+        
+        # Store the generated input unless a row appeared meanwhile (from
+        # pre-generation, or another process on SQLite)
+        dialect_insert = (
+            postgresql_insert if self.session.bind.dialect.name == "postgresql" else sqlite_insert
+        )
+        stmt = dialect_insert(ChallengeInput).values(
+            challenge_id=challenge_id,
+            squad_id=squad_id,
+            input_data=input_data,
+            result_data=result_data,
+            first_fetched_at=datetime.now(timezone.utc)
+        ).on_conflict_do_nothing(
+            index_elements=[ChallengeInput.challenge_id, ChallengeInput.squad_id]
+        )
+        result = await self.session.execute(stmt)
+        
+        if result.rowcount == 0:
+            # Everyone in the squad gets the stored input
+            existing_input = await self.get_input_by_squad(challenge_id, squad_id)
+            await self._mark_fetched(challenge_id, squad_id)
+            return existing_input.input_data, existing_input.result_data
+        
+        await self.session.commit()
+        return input_data, result_data
+    
+    async def _mark_fetched(self, challenge_id: UUID, squad_id: UUID) -> None:
+        """Start a squad's scoring timer on its first fetch of a pre-generated input."""
+        await self.session.execute(
+            update(ChallengeInput).where(
+                ChallengeInput.challenge_id == challenge_id,
+                ChallengeInput.squad_id == squad_id,
+                ChallengeInput.first_fetched_at.is_(None)
+            ).values(first_fetched_at=datetime.now(timezone.utc))
+        )
+        await self.session.commit()
+    
+    async def pregenerate_inputs(self, challenge: Challenge) -> int:
+        """Generate inputs for every active squad that doesn't have one yet.
+        
+        Run when a challenge is released (or about to be), so squads fetching
+        their input right after the announcement read a stored row instead of
+        each waiting for the generator. Scripts run concurrently, bounded by
+        the script runner's workers, and the results are inserted in one
+        statement. Rows are created without ``first_fetched_at``, so a squad's
+        scoring timer still starts on its first fetch.
+        
+        Args:
+            challenge: Challenge with its campaign loaded
             
-            self.session.add(challenge_input)
-            await self.session.commit()
-            
-            return input_data, result_data
+        Returns:
+            Number of inputs created
             
+        Raises:
+            DatabaseOperationError: If the squads can't be read or the inputs
+                can't be stored
+        """
+        if not challenge.input_generator_script:
+            return 0
+        
+        try:
+            existing = select(ChallengeInput.squad_id).where(
+                ChallengeInput.challenge_id == challenge.id
+            )
+            result = await self.session.execute(
+                select(Squad.id).where(
+                    Squad.guild_id == challenge.campaign.guild_id,
+                    Squad.is_active.is_(True),
+                    Squad.id.not_in(existing)
+                )
+            )
+            squad_ids = list(result.scalars().all())
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to find squads for input generation: {e}") from e
+        
+        # Leave squads that are generating on demand right now to that request
+        squad_ids = [
+            squad_id for squad_id in squad_ids
+            if (challenge.id, squad_id) not in self._generations
+        ]
+        if not squad_ids:
+            return 0
+        
+        outputs = await asyncio.gather(
+            *(self._execute_script(challenge.input_generator_script) for _ in squad_ids),
+            return_exceptions=True
+        )
+        
+        rows = []
+        for squad_id, output in zip(squad_ids, outputs):
+            if isinstance(output, BaseException):
+                # That squad's input is generated on demand instead
+                logger.warning(f"Failed to pre-generate input for squad {squad_id}: {output}")
+                continue
+            input_data, result_data = output
+            rows.append({
+                "challenge_id": challenge.id,
+                "squad_id": squad_id,
+                "input_data": input_data,
+                "result_data": result_data,
+            })
+        if not rows:
+            return 0
+        
+        try:
+            # A squad that fetched on demand meanwhile keeps its own input
+            dialect_insert = (
+                postgresql_insert if self.session.bind.dialect.name == "postgresql" else sqlite_insert
+            )
+            stmt = dialect_insert(ChallengeInput).values(rows).on_conflict_do_nothing(
+                index_elements=[ChallengeInput.challenge_id, ChallengeInput.squad_id]
+            )
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+            return result.rowcount
         except Exception as e:
             await self.session.rollback()
-            raise DatabaseOperationError(f"Failed to get or create challenge input: {e}") from e
+            raise DatabaseOperationError(f"Failed to store pre-generated inputs: {e}") from e
     
     async def get_input_by_squad(
         self, 
@@ -3149,6 +4059,10 @@ class ChallengeInputOperations:
     async def _execute_script(self, script: str) -> tuple[str, str]:
         """Execute Python script to generate input and result data.
         
+        The script runs in the script runner's worker processes, so it can't
+        block the event loop and is bounded by the configured time and
+        output limits.
+        
         Args:
             script: Python script code to execute
             
@@ -3158,53 +4072,32 @@ class ChallengeInputOperations:
         Raises:
             ScriptExecutionError: If script execution fails or output is invalid
         """
-        import json
-        import io
-        from contextlib import redirect_stdout
+        output = (await get_script_runner().run(script)).strip()
         
+        # Parse JSON output
         try:
-            # Capture stdout
-            captured_output = io.StringIO()
-            
-            # Allow unrestricted script execution with full Python capabilities
-            # These scripts are trusted and need access to arbitrary imports
-            exec_globals = {'__builtins__': __builtins__}
-            
-            # Execute the script with captured stdout and full Python environment
-            with redirect_stdout(captured_output):
-                exec(script, exec_globals)
-            
-            # Get the output
-            output = captured_output.getvalue().strip()
-            
-            # Parse JSON output
-            try:
-                output_data = json.loads(output)
-            except json.JSONDecodeError as e:
-                raise ScriptExecutionError(f"Script output is not valid JSON: {e}")
-            
-            # Validate required keys
-            if not isinstance(output_data, dict):
-                raise ScriptExecutionError("Script output must be a JSON object")
-            
-            if "input" not in output_data or "result" not in output_data:
-                raise ScriptExecutionError("Script output must contain 'input' and 'result' keys")
-            
-            # Convert values to strings for database storage
-            input_data = str(output_data["input"])
-            result_data = str(output_data["result"])
-            
-            return input_data, result_data
-            
-        except Exception as e:
-            if isinstance(e, ScriptExecutionError):
-                raise
-            raise ScriptExecutionError(f"Script execution failed: {e}") from e
+            output_data = json.loads(output)
+        except json.JSONDecodeError as e:
+            raise ScriptExecutionError(f"Script output is not valid JSON: {e}")
+        
+        # Validate required keys
+        if not isinstance(output_data, dict):
+            raise ScriptExecutionError("Script output must be a JSON object")
+        
+        if "input" not in output_data or "result" not in output_data:
+            raise ScriptExecutionError("Script output must contain 'input' and 'result' keys")
+        
+        # Convert values to strings for database storage
+        input_data = str(output_data["input"])
+        result_data = str(output_data["result"])
+        
+        return input_data, result_data
 
 
-class ScriptExecutionError(Exception):
-    """Exception raised when script execution fails."""
-    pass
+class ChallengeScoring(NamedTuple):
+    """Challenge metadata needed to score a submission."""
+    campaign_id: UUID
+    release_cadence_hours: int
 
 
 class ChallengeSubmissionOperations:
@@ -3214,6 +4107,13 @@ class ChallengeSubmissionOperations:
     of first successful submissions per squad.
     """
     
+    # Seconds a challenge's scoring metadata is reused; campaigns are rarely
+    # edited, and edits in this process clear the cache immediately
+    SCORING_CACHE_TTL = 300.0
+    
+    # challenge_id -> (expires at, metadata), shared by all instances
+    _scoring_cache: Dict[UUID, Tuple[float, ChallengeScoring]] = {}
+    
     def __init__(self, session: AsyncSession):
         """Initialize with database session.
         
@@ -3228,16 +4128,24 @@ class ChallengeSubmissionOperations:
         squad_id: UUID,
         user_id: str,
         username: str,
-        submitted_solution: str
+        submitted_solution: str,
+        challenge: Optional[Challenge] = None
     ) -> tuple[bool, bool, Optional[int]]:
         """Submit a solution and check if it matches the expected result.
         
+        A correct submission is inserted as the squad's first success unless
+        one already exists; the partial unique index on first successes
+        decides that atomically, so concurrent correct submissions can't both
+        score.
+        
         Args:
             challenge_id: UUID of the challenge
             squad_id: UUID of the squad
             user_id: Discord user ID of the submitter
             username: Username for audit purposes
             submitted_solution: The solution text submitted by the user
+            challenge: The challenge with its campaign loaded, if the caller
+                already has it
             
         Returns:
             Tuple of (is_correct, is_first_success, points_earned)
@@ -3254,36 +4162,57 @@ class ChallengeSubmissionOperations:
             if not challenge_input:
                 raise ValueError("No input/result data found for this challenge and squad. Generate input first.")
             
+            scoring = await self._get_scoring(challenge_id, challenge)
+            
             # Compare submitted solution with expected result
             expected_result = challenge_input.result_data.strip()
             submitted_solution_clean = submitted_solution.strip()
             is_correct = expected_result == submitted_solution_clean
             
-            # Check if this squad already has a successful submission
+            submission = {
+                "challenge_id": challenge_id,
+                "squad_id": squad_id,
+                "user_id": user_id,
+                "username": username,
+                "submitted_solution": submitted_solution,
+                "is_correct": is_correct,
+            }
+            dialect_insert = (
+                postgresql_insert if self.session.bind.dialect.name == "postgresql" else sqlite_insert
+            )
+            
             is_first_success = False
             points_earned = None
             
             if is_correct:
-                existing_success = await self._get_first_success_for_squad(challenge_id, squad_id)
-                is_first_success = existing_success is None
+                # Without a campaign's cadence a first success still counts,
+                # for 0 points
+                points = 0
+                if scoring is not None:
+                    timer_started_at = challenge_input.first_fetched_at or challenge_input.created_at
+                    points = self._calculate_points(scoring.release_cadence_hours, timer_started_at)
                 
-                # Calculate points for first successful submission
+                # Insert as the first success; skipped if the squad already has one
+                stmt = dialect_insert(ChallengeSubmission).values(
+                    **submission, is_first_success=True, points_earned=points
+                ).on_conflict_do_nothing(
+                    index_elements=[ChallengeSubmission.challenge_id, ChallengeSubmission.squad_id],
+                    index_where=FIRST_SUCCESS_PREDICATE
+                ).returning(ChallengeSubmission.id)
+                is_first_success = (await self.session.execute(stmt)).first() is not None
                 if is_first_success:
-                    points_earned = await self._calculate_points(challenge_id, challenge_input.created_at)
+                    points_earned = points
             
-            # Create submission record
-            submission = ChallengeSubmission(
-                challenge_id=challenge_id,
-                squad_id=squad_id,
-                user_id=user_id,
-                username=username,
-                submitted_solution=submitted_solution,
-                is_correct=is_correct,
-                is_first_success=is_first_success,
-                points_earned=points_earned
-            )
+            if not is_first_success:
+                await self.session.execute(
+                    insert(ChallengeSubmission).values(**submission, is_first_success=False)
+                )
             
-            self.session.add(submission)
+            # Keep the campaign scoreboard in step with the submission
+            if scoring is not None:
+                await record_submission(
+                    self.session, scoring.campaign_id, squad_id, challenge_id, is_first_success, points_earned
+                )
             await self.session.commit()
             
             return is_correct, is_first_success, points_earned
@@ -3294,6 +4223,38 @@ class ChallengeSubmissionOperations:
                 raise
             raise DatabaseOperationError(f"Failed to submit solution: {e}") from e
     
+    async def _get_scoring(
+        self,
+        challenge_id: UUID,
+        challenge: Optional[Challenge] = None
+    ) -> Optional[ChallengeScoring]:
+        """Get a challenge's scoring metadata from the caller, the cache or the database."""
+        now = time.monotonic()
+        if challenge is not None and challenge.campaign is not None:
+            scoring = ChallengeScoring(challenge.campaign_id, challenge.campaign.release_cadence_hours)
+        else:
+            cached = self._scoring_cache.get(challenge_id)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+            
+            result = await self.session.execute(
+                select(Challenge.campaign_id, Campaign.release_cadence_hours)
+                .join(Campaign, Campaign.id == Challenge.campaign_id)
+                .where(Challenge.id == challenge_id)
+            )
+            row = result.first()
+            if row is None:
+                return None
+            scoring = ChallengeScoring(row.campaign_id, row.release_cadence_hours)
+        
+        self._scoring_cache[challenge_id] = (now + self.SCORING_CACHE_TTL, scoring)
+        return scoring
+    
+    @classmethod
+    def clear_scoring_cache(cls) -> None:
+        """Drop cached scoring metadata, e.g. after a campaign is edited."""
+        cls._scoring_cache.clear()
+    
     async def _get_first_success_for_squad(
         self, 
         challenge_id: UUID, 
@@ -3350,7 +4311,7 @@ class ChallengeSubmissionOperations:
         except Exception as e:
             raise DatabaseOperationError(f"Failed to get squad submissions: {e}") from e
     
-    async def _calculate_points(self, challenge_id: UUID, input_generated_at: datetime) -> int:
+    def _calculate_points(self, release_cadence_hours: int, timer_started_at: datetime) -> int:
         """Calculate points earned based on timing.
         
         Points are based on the campaign's release cadence:
@@ -3359,52 +4320,52 @@ class ChallengeSubmissionOperations:
         - Minimum points = 0
         
         Args:
-            challenge_id: UUID of the challenge
-            input_generated_at: When the input was generated (start of timer)
+            release_cadence_hours: Hours between the campaign's releases
+            timer_started_at: When the squad first fetched its input
             
         Returns:
             Points earned (0 or positive integer)
         """
-        try:
-            # Get the challenge and its campaign to access release cadence
-            challenge_query = select(Challenge).options(
-                selectinload(Challenge.campaign)
-            ).where(Challenge.id == challenge_id)
-            
-            result = await self.session.execute(challenge_query)
-            challenge = result.scalar_one_or_none()
-            
-            if not challenge or not challenge.campaign:
-                # If we can't get cadence info, return 0 points
-                return 0
-            
-            # Convert release cadence from hours to seconds
-            release_cadence_seconds = challenge.campaign.release_cadence_hours * 3600
-            
-            # Calculate max possible points (cadence / 30)
-            max_points = release_cadence_seconds // 30
-            
-            # Calculate time taken from input generation to now
-            current_time = datetime.now(timezone.utc)
-            if input_generated_at.tzinfo is None:
-                input_generated_at = input_generated_at.replace(tzinfo=timezone.utc)
-            
-            time_taken_seconds = (current_time - input_generated_at).total_seconds()
-            
-            # Calculate points lost (time taken / 30, rounded down)
-            points_lost = int(time_taken_seconds // 30)
-            
-            # Calculate final points (max - lost, minimum 0)
-            points_earned = max(0, max_points - points_lost)
-            
-            # Debug logging for points calculation
-            logger.info(f"Points calculation: release_cadence={release_cadence_seconds}s, max_points={max_points}, time_taken={time_taken_seconds}s, points_lost={points_lost}, final_points={points_earned}")
-            
-            return points_earned
+        # Convert release cadence from hours to seconds
+        release_cadence_seconds = release_cadence_hours * 3600
+        
+        # Calculate max possible points (cadence / 30)
+        max_points = release_cadence_seconds // 30
+        
+        # Calculate time taken from the first input fetch to now
+        current_time = datetime.now(timezone.utc)
+        if timer_started_at.tzinfo is None:
+            timer_started_at = timer_started_at.replace(tzinfo=timezone.utc)
+        
+        time_taken_seconds = (current_time - timer_started_at).total_seconds()
+        
+        # Calculate points lost (time taken / 30, rounded down)
+        points_lost = int(time_taken_seconds // 30)
+        
+        # Calculate final points (max - lost, minimum 0)
+        points_earned = max(0, max_points - points_lost)
+        
+        # Debug logging for points calculation
+        logger.info(f"Points calculation: release_cadence={release_cadence_seconds}s, max_points={max_points}, time_taken={time_taken_seconds}s, points_lost={points_lost}, final_points={points_earned}")
+        
+        return points_earned
+    
+    async def get_campaign_standings(self, campaign_id: UUID) -> CampaignStandings:
+        """Get a campaign's scoreboard, per-challenge breakdown and counts.
+        
+        Read from the incrementally maintained campaign_squad_scores rows
+        rather than aggregated from the submissions.
+        
+        Args:
+            campaign_id: Campaign UUID
             
+        Returns:
+            CampaignStandings for the campaign
+        """
+        try:
+            return await get_campaign_standings(self.session, campaign_id)
         except Exception as e:
-            # If calculation fails, return 0 points rather than failing the submission
-            return 0
+            raise DatabaseOperationError(f"Failed to get campaign standings: {e}") from e
     
     async def get_campaign_scoreboard(self, campaign_id: UUID) -> List[Dict[str, Any]]:
         """Get scoreboard data for a campaign with squad rankings by total points.
@@ -3415,46 +4376,8 @@ class ChallengeSubmissionOperations:
         Returns:
             List of dictionaries containing squad names, total points, and submission counts
         """
-        try:
-            # Query to get scoreboard data grouped by squad
-            query = select(
-                Squad.name.label("squad_name"),
-                Squad.id.label("squad_id"),
-                func.coalesce(func.sum(ChallengeSubmission.points_earned), 0).label("total_points"),
-                func.count(ChallengeSubmission.id).filter(
-                    ChallengeSubmission.is_first_success == True
-                ).label("successful_submissions")
-            ).select_from(
-                Squad
-            ).outerjoin(
-                ChallengeSubmission, Squad.id == ChallengeSubmission.squad_id
-            ).outerjoin(
-                Challenge, ChallengeSubmission.challenge_id == Challenge.id
-            ).where(
-                Challenge.campaign_id == campaign_id
-            ).group_by(
-                Squad.id, Squad.name
-            ).order_by(
-                func.coalesce(func.sum(ChallengeSubmission.points_earned), 0).desc()
-            )
-            
-            result = await self.session.execute(query)
-            rows = result.fetchall()
-            
-            # Convert to list of dictionaries
-            scoreboard = []
-            for row in rows:
-                scoreboard.append({
-                    "squad_name": row.squad_name,
-                    "squad_id": row.squad_id,
-                    "total_points": row.total_points,
-                    "successful_submissions": row.successful_submissions
-                })
-            
-            return scoreboard
-            
-        except Exception as e:
-            raise DatabaseOperationError(f"Failed to get campaign scoreboard: {e}") from e
+        standings = await self.get_campaign_standings(campaign_id)
+        return standings.scoreboard
     
     async def get_detailed_campaign_scoreboard(self, campaign_id: UUID) -> Dict[str, Any]:
         """Get detailed scoreboard data organized by challenge.
@@ -3465,87 +4388,11 @@ class ChallengeSubmissionOperations:
         Returns:
             Dictionary with challenge breakdown and overall squad totals
         """
-        try:
-            # Get all successful submissions organized by challenge
-            submissions_query = select(
-                Challenge.title.label("challenge_title"),
-                Challenge.id.label("challenge_id"),
-                ChallengeSubmission.points_earned,
-                Squad.name.label("squad_name"),
-                Squad.id.label("squad_id")
-            ).select_from(
-                Challenge
-            ).join(
-                ChallengeSubmission, Challenge.id == ChallengeSubmission.challenge_id
-            ).join(
-                Squad, ChallengeSubmission.squad_id == Squad.id
-            ).where(
-                and_(
-                    Challenge.campaign_id == campaign_id,
-                    ChallengeSubmission.is_correct == True,
-                    ChallengeSubmission.is_first_success == True
-                )
-            ).order_by(Challenge.title, Squad.name)
-            
-            result = await self.session.execute(submissions_query)
-            submissions = result.fetchall()
-            
-            # Group data by challenge
-            challenges_breakdown = {}
-            squad_totals = {}
-            
-            for submission in submissions:
-                challenge_title = submission.challenge_title
-                squad_name = submission.squad_name
-                squad_id = submission.squad_id
-                points = submission.points_earned or 0
-                
-                # Track challenge breakdown
-                if challenge_title not in challenges_breakdown:
-                    challenges_breakdown[challenge_title] = []
-                
-                challenges_breakdown[challenge_title].append({
-                    "squad_name": squad_name,
-                    "squad_id": str(squad_id),
-                    "points_earned": points
-                })
-                
-                # Track squad totals
-                if squad_id not in squad_totals:
-                    squad_totals[squad_id] = {
-                        "squad_name": squad_name,
-                        "squad_id": str(squad_id),
-                        "total_points": 0,
-                        "challenges_completed": 0
-                    }
-                
-                squad_totals[squad_id]["total_points"] += points
-                squad_totals[squad_id]["challenges_completed"] += 1
-            
-            # Convert to lists and sort
-            challenges_list = []
-            for challenge_title, squads in challenges_breakdown.items():
-                # Sort squads by points descending
-                squads.sort(key=lambda x: x["points_earned"], reverse=True)
-                challenges_list.append({
-                    "challenge_title": challenge_title,
-                    "submissions": squads
-                })
-            
-            # Sort challenges alphabetically
-            challenges_list.sort(key=lambda x: x["challenge_title"])
-            
-            # Convert squad totals to list and sort by total points
-            squad_totals_list = list(squad_totals.values())
-            squad_totals_list.sort(key=lambda x: x["total_points"], reverse=True)
-            
-            return {
-                "challenges_breakdown": challenges_list,
-                "squad_totals": squad_totals_list
-            }
-            
-        except Exception as e:
-            raise DatabaseOperationError(f"Failed to get detailed campaign scoreboard: {e}") from e
+        standings = await self.get_campaign_standings(campaign_id)
+        return {
+            "challenges_breakdown": standings.challenges_breakdown,
+            "squad_totals": standings.squad_totals
+        }
     
     async def get_campaign_submission_count(self, campaign_id: UUID) -> int:
         """Get the total number of submissions for a campaign.
@@ -3556,20 +4403,8 @@ class ChallengeSubmissionOperations:
         Returns:
             Total number of submissions across all challenges in the campaign
         """
-        try:
-            query = select(func.count(ChallengeSubmission.id)).select_from(
-                ChallengeSubmission
-            ).join(
-                Challenge, ChallengeSubmission.challenge_id == Challenge.id
-            ).where(
-                Challenge.campaign_id == campaign_id
-            )
-            
-            result = await self.session.execute(query)
-            return result.scalar() or 0
-            
-        except Exception as e:
-            raise DatabaseOperationError(f"Failed to get campaign submission count: {e}") from e
+        standings = await self.get_campaign_standings(campaign_id)
+        return standings.total_submissions
 
 
 class ScheduledMessageOperations:
@@ -3906,6 +4741,7 @@ class SquadSaleEventOperations:
             )
             
             self.session.add(sale_event)
+            record_change(self.session, guild_id, SQUAD_SALES)
             await self.session.commit()
             await self.session.refresh(sale_event)
             
@@ -4028,6 +4864,7 @@ class SquadSaleEventOperations:
             
             event.updated_at = datetime.now(timezone.utc)
             
+            record_change(self.session, guild_id, SQUAD_SALES)
             await self.session.commit()
             await self.session.refresh(event)
             
@@ -4058,6 +4895,7 @@ class SquadSaleEventOperations:
                 return False
             
             await self.session.delete(event)
+            record_change(self.session, guild_id, SQUAD_SALES)
             await self.session.commit()
             return True
             
@@ -4121,6 +4959,7 @@ class SquadSaleEventOperations:
             event.is_active = not event.is_active
             event.updated_at = datetime.now(timezone.utc)
             
+            record_change(self.session, guild_id, SQUAD_SALES)
             await self.session.commit()
             await self.session.refresh(event)
             
@@ -0,0 +1,183 @@
+"""Ranked per-guild bytes leaderboard backed by Redis sorted sets.
+
+Each guild's balances live in a sorted set keyed ``leaderboard:{guild_id}``
+so the top of the leaderboard and any member's rank are O(log n) lookups
+instead of a sort over bytes_balances.
+
+Balance changes are recorded on the SQLAlchemy session with
+``record_balance`` and pushed to Redis only after the session commits, so a
+rolled back transfer never reaches the leaderboard. A sentinel member marks
+a set as fully loaded; updates are ignored until a read has rebuilt the set
+from the database, and the set expires periodically so any drift is
+corrected by the next rebuild.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from smarter_dev.shared.config import get_settings
+from smarter_dev.web.commit_queue import CommitQueue
+from smarter_dev.web.models import BytesBalance
+
+logger = logging.getLogger(__name__)
+
+# Member present in every fully loaded set, scored below any balance
+LOADED_MARKER = "__loaded__"
+
+
+def record_balance(session: AsyncSession, guild_id: str, user_id: str, balance: int) -> None:
+    """Queue a user's new balance for the leaderboard once the session commits."""
+    pending_balances.pending(session)[(guild_id, user_id)] = balance
+
+
+class Leaderboard:
+    """Guild leaderboards stored as Redis sorted sets scored by balance."""
+
+    # KEYS[1] = guild sorted set; ARGV = user_id, balance pairs
+    UPDATE_SCRIPT = """
+if not redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+    return 0
+end
+for i = 2, #ARGV, 2 do
+    redis.call('ZADD', KEYS[1], ARGV[i + 1], ARGV[i])
+end
+return 1
+"""
+
+    def __init__(
+        self,
+        redis_client=None,
+        key_prefix: str = "leaderboard",
+        ttl_seconds: int = 900,
+        enabled: bool = True
+    ):
+        self._redis = redis_client
+        self.key_prefix = key_prefix
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._script = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _get_redis(self):
+        if self._redis is None:
+            from smarter_dev.shared.redis_client import get_redis_client
+            self._redis = get_redis_client()
+        return self._redis
+
+    def _get_script(self):
+        """Register the update script on first use."""
+        if self._script is None:
+            self._script = self._get_redis().register_script(self.UPDATE_SCRIPT)
+        return self._script
+
+    def _key(self, guild_id: str) -> str:
+        return f"{self.key_prefix}:{guild_id}"
+
+    async def apply(self, updates: Dict[Tuple[str, str], int]) -> None:
+        """Write new balances to the loaded guild sets.
+
+        Guilds whose set is not loaded are skipped; their next read rebuilds
+        the set from the database. If Redis fails, the affected sets are
+        dropped so they are rebuilt rather than served stale.
+        """
+        by_guild: Dict[str, List] = {}
+        for (guild_id, user_id), balance in updates.items():
+            by_guild.setdefault(guild_id, []).extend([user_id, balance])
+
+        for guild_id, args in by_guild.items():
+            try:
+                await self._get_script()(keys=[self._key(guild_id)], args=[LOADED_MARKER, *args])
+            except Exception as e:
+                logger.warning(f"Failed to update leaderboard for guild {guild_id}: {e}")
+                try:
+                    await self._get_redis().delete(self._key(guild_id))
+                except Exception:
+                    pass
+
+    def schedule(self, updates: Dict[Tuple[str, str], int]) -> None:
+        """Apply updates in the background without blocking the caller."""
+        if not self.enabled or not updates:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.apply(updates))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def rebuild(self, session: AsyncSession, guild_id: str) -> int:
+        """Reload a guild's set from bytes_balances.
+
+        Returns:
+            Number of members loaded
+        """
+        result = await session.execute(
+            select(BytesBalance.user_id, BytesBalance.balance)
+            .where(BytesBalance.guild_id == guild_id)
+        )
+        mapping = {user_id: balance for user_id, balance in result.all()}
+        mapping[LOADED_MARKER] = float("-inf")
+
+        key = self._key(guild_id)
+        async with self._get_redis().pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.zadd(key, mapping)
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+        return len(mapping) - 1
+
+    async def _ensure_loaded(self, session: AsyncSession, guild_id: str) -> None:
+        if await self._get_redis().zscore(self._key(guild_id), LOADED_MARKER) is None:
+            await self.rebuild(session, guild_id)
+
+    async def top(self, session: AsyncSession, guild_id: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """Get the highest balances in a guild.
+
+        Returns:
+            (user_id, balance) pairs ordered by balance descending
+        """
+        await self._ensure_loaded(session, guild_id)
+        entries = await self._get_redis().zrevrangebyscore(
+            self._key(guild_id), "+inf", "(-inf", start=0, num=limit, withscores=True
+        )
+        return [(user_id, int(score)) for user_id, score in entries]
+
+    async def rank(self, session: AsyncSession, guild_id: str, user_id: str) -> Optional[int]:
+        """Get a user's 1-based position in the guild, or None if they have no balance."""
+        await self._ensure_loaded(session, guild_id)
+        position = await self._get_redis().zrevrank(self._key(guild_id), user_id)
+        return position + 1 if position is not None else None
+
+
+def _publish_balances(updates: Dict[Tuple[str, str], int]) -> None:
+    get_leaderboard().schedule(updates)
+
+
+# Balances recorded on each session, pushed to Redis once it commits
+pending_balances: CommitQueue[Dict[Tuple[str, str], int]] = CommitQueue(
+    "leaderboard_updates", dict, _publish_balances
+)
+
+
+# Global leaderboard, configured from settings on first use
+leaderboard: Optional[Leaderboard] = None
+
+
+def get_leaderboard() -> Leaderboard:
+    """Get the global leaderboard."""
+    global leaderboard
+    if leaderboard is None:
+        settings = get_settings()
+        leaderboard = Leaderboard(
+            ttl_seconds=settings.leaderboard_cache_ttl,
+            enabled=settings.leaderboard_cache_enabled
+        )
+    return leaderboard
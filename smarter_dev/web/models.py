@@ -16,6 +16,7 @@ from sqlalchemy import Integer
 from sqlalchemy import JSON
 from sqlalchemy import String
 from sqlalchemy import Text
+from sqlalchemy import text
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import Mapped, relationship
 from sqlalchemy.orm import mapped_column
@@ -79,6 +80,12 @@ class BytesBalance(Base):
         doc="Date of last daily reward claim"
     )
     
+    # Leaderboard queries scan this index backwards for balance DESC
+    __table_args__ = (
+        Index("ix_bytes_balances_guild_balance", "guild_id", "balance"),
+        Index("ix_bytes_balances_guild_last_daily", "guild_id", "last_daily"),
+    )
+    
     def __init__(self, **kwargs):
         """Initialize BytesBalance with default values."""
         # Set defaults for fields not provided
@@ -162,8 +169,10 @@ class BytesTransaction(Base):
         Index("ix_bytes_transactions_created_at", "created_at"),  # Missing from specification
         Index("ix_bytes_transactions_giver_id", "giver_id"),  
         Index("ix_bytes_transactions_receiver_id", "receiver_id"),
-        Index("ix_bytes_transactions_guild_giver", "guild_id", "giver_id"),
-        Index("ix_bytes_transactions_guild_receiver", "guild_id", "receiver_id"),
+        # Keyset pagination indexes for transaction history, newest first
+        Index("ix_bytes_transactions_guild_giver_created", "guild_id", "giver_id", "created_at", "id"),
+        Index("ix_bytes_transactions_guild_receiver_created", "guild_id", "receiver_id", "created_at", "id"),
+        Index("ix_bytes_transactions_guild_created", "guild_id", "created_at", "id"),
     )
     
     def __init__(self, **kwargs):
@@ -420,6 +429,41 @@ class SquadMembership(Base):
         super().__init__(**kwargs)
 
 
+class GuildMember(Base):
+    """Latest known profile of a user in a guild.
+    
+    Denormalized from bytes activity so member listings can show display
+    names with a keyed join instead of scanning transaction history.
+    Updated by transfers, daily claims and squad joins.
+    """
+    
+    __tablename__ = "guild_members"
+    
+    # Compound primary key
+    guild_id: Mapped[str] = mapped_column(
+        String,
+        primary_key=True,
+        doc="Discord guild (server) snowflake ID"
+    )
+    user_id: Mapped[str] = mapped_column(
+        String,
+        primary_key=True,
+        doc="Discord user snowflake ID"
+    )
+    
+    username: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        doc="Most recently seen display name"
+    )
+    last_seen_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        doc="Timestamp of the user's latest bytes or squad activity"
+    )
+
+
 class APIKey(Base):
     """API key model for secure authentication and access control.
     
@@ -591,6 +635,10 @@ class SecurityLog(Base):
     authentication attempts, rate limiting events, and administrative
     operations. Provides comprehensive audit trail for compliance
     and security monitoring.
+    
+    On PostgreSQL the table is range-partitioned by day on ``created_at``
+    (see smarter_dev.web.security_log_partitions), so its physical primary
+    key is ``(id, created_at)``.
     """
     
     __tablename__ = "security_logs"
@@ -679,6 +727,8 @@ class SecurityLog(Base):
         Index("ix_security_logs_api_key_timestamp", "api_key_id", "timestamp"),
         Index("ix_security_logs_user_timestamp", "user_identifier", "timestamp"),
         Index("ix_security_logs_ip_timestamp", "ip_address", "timestamp"),
+        # Matches the rate limiter's per-key, per-action window counts
+        Index("ix_security_logs_api_key_action_created", "api_key_id", "action", "created_at"),
     )
     
     def __init__(self, **kwargs):
@@ -1620,8 +1670,15 @@ class ChallengeInput(Base):
         nullable=False,
         doc="Expected result/solution for the input data"
     )
-    
-    # Note: created_at and updated_at are automatically added by Base class
+    first_fetched_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="When a squad member first fetched the input (start of the scoring timer)"
+    )
+
+    # Note: created_at and updated_at are automatically added by Base class.
+    # Inputs may be generated ahead of release, so created_at is not used for
+    # scoring.
     
     # Relationships
     challenge: Mapped["Challenge"] = relationship(
@@ -1775,6 +1832,11 @@ class ScheduledMessage(Base):
         return f"<ScheduledMessage(title='{self.title}', scheduled={self.scheduled_time}, status='{status}')>"
 
 
+# Rows covered by the one-first-success-per-squad unique index; also the
+# ON CONFLICT target predicate when inserting a first success
+FIRST_SUCCESS_PREDICATE = text("is_first_success")
+
+
 class ChallengeSubmission(Base):
     """Model for tracking challenge solution submissions and success records."""
     
@@ -1857,6 +1919,14 @@ class ChallengeSubmission(Base):
         Index("ix_challenge_submissions_challenge_squad", "challenge_id", "squad_id"),
         Index("ix_challenge_submissions_user_submitted", "user_id", "submitted_at"),
         Index("ix_challenge_submissions_first_success", "is_first_success", "submitted_at"),
+        Index(
+            "uq_challenge_submissions_first_success",
+            "challenge_id",
+            "squad_id",
+            unique=True,
+            postgresql_where=FIRST_SUCCESS_PREDICATE,
+            sqlite_where=FIRST_SUCCESS_PREDICATE,
+        ),
     )
     
     def __repr__(self) -> str:
@@ -1866,6 +1936,72 @@ class ChallengeSubmission(Base):
         return f"<ChallengeSubmission(challenge_id={self.challenge_id}, squad_id={self.squad_id}, status='{status}'{first})>"
 
 
+class CampaignSquadScore(Base):
+    """Running campaign totals for one squad.
+
+    Updated in the same transaction as each submission (see
+    smarter_dev.web.campaign_scores) so the scoreboard reads a few rows
+    instead of aggregating every submission in the campaign.
+    """
+
+    __tablename__ = "campaign_squad_scores"
+
+    campaign_id: Mapped[UUID] = mapped_column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("campaigns.id", ondelete="CASCADE"),
+        primary_key=True,
+        doc="UUID of the campaign"
+    )
+    squad_id: Mapped[UUID] = mapped_column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("squads.id", ondelete="CASCADE"),
+        primary_key=True,
+        doc="UUID of the squad"
+    )
+
+    total_points: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Points from the squad's first successful submissions"
+    )
+    challenges_completed: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Challenges the squad has solved"
+    )
+    submission_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Submissions by the squad, correct or not"
+    )
+    challenge_points: Mapped[dict] = mapped_column(
+        JSON,
+        nullable=False,
+        default=dict,
+        doc="Points per solved challenge, keyed by challenge UUID"
+    )
+
+    # Database constraints and indexes
+    __table_args__ = (
+        Index("ix_campaign_squad_scores_campaign_points", "campaign_id", "total_points"),
+    )
+
+    def __init__(self, **kwargs):
+        """Initialize CampaignSquadScore with zero totals."""
+        kwargs.setdefault('total_points', 0)
+        kwargs.setdefault('challenges_completed', 0)
+        kwargs.setdefault('submission_count', 0)
+        kwargs.setdefault('challenge_points', {})
+        super().__init__(**kwargs)
+
+    def __repr__(self) -> str:
+        """String representation of the campaign squad score."""
+        return f"<CampaignSquadScore(campaign_id={self.campaign_id}, squad_id={self.squad_id}, points={self.total_points})>"
+
+
 class SquadSaleEvent(Base):
     """Squad sale event model for timed discount events on squad joining/switching.
     
@@ -2244,4 +2380,115 @@ class RepeatingMessage(Base):
     def __repr__(self) -> str:
         """String representation of the repeating message."""
         status = "active" if self.is_active else "inactive"
-        return f"<RepeatingMessage(guild_id='{self.guild_id}', channel_id='{self.channel_id}', status='{status}')>"
\ No newline at end of file
+        return f"<RepeatingMessage(guild_id='{self.guild_id}', channel_id='{self.channel_id}', status='{status}')>"
+
+class DailyStats(Base):
+    """Per-day activity rollup for the admin dashboard.
+    
+    One row per UTC day, refreshed by the stats rollup task (see
+    smarter_dev.web.stats_rollup) so the dashboard reads totals from a few
+    rows instead of aggregating the source tables on every load.
+    """
+    
+    __tablename__ = "daily_stats"
+    
+    day: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+        doc="UTC day the counts cover"
+    )
+    
+    transaction_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        doc="Bytes transactions created on the day"
+    )
+    api_request_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        doc="Authenticated API requests logged on the day"
+    )
+    help_conversation_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        doc="Help agent conversations started on the day"
+    )
+    help_tokens: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        doc="Tokens used by help agent conversations started on the day"
+    )
+    help_response_time_total_ms: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        doc="Sum of recorded help agent response times"
+    )
+    help_response_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        doc="Help agent conversations with a recorded response time"
+    )
+    forum_tokens: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        doc="Tokens used by forum agent responses on the day"
+    )
+    
+    def __init__(self, **kwargs):
+        """Initialize DailyStats with zero counts."""
+        for column in (
+            'transaction_count', 'api_request_count', 'help_conversation_count', 'help_tokens',
+            'help_response_time_total_ms', 'help_response_count', 'forum_tokens'
+        ):
+            kwargs.setdefault(column, 0)
+        super().__init__(**kwargs)
+
+
+class GuildStats(Base):
+    """Current per-guild totals for the admin dashboard.
+    
+    Refreshed by the stats rollup task. The row with guild_id ``*`` holds
+    totals across all guilds, where users are counted once even if they
+    are in several guilds.
+    """
+    
+    __tablename__ = "guild_stats"
+    
+    guild_id: Mapped[str] = mapped_column(
+        String,
+        primary_key=True,
+        doc="Discord guild snowflake ID, or * for all guilds"
+    )
+    
+    user_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        doc="Users with a bytes balance"
+    )
+    squad_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        doc="Squads in the guild"
+    )
+    bytes_total: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        doc="Bytes in circulation"
+    )
+    
+    def __init__(self, **kwargs):
+        """Initialize GuildStats with zero counts."""
+        kwargs.setdefault('user_count', 0)
+        kwargs.setdefault('squad_count', 0)
+        kwargs.setdefault('bytes_total', 0)
+        super().__init__(**kwargs)
@@ -7,22 +7,34 @@ Rate limiting tiers:
 - 10 requests per second (burst protection)
 - 180 requests per minute (short-term abuse prevention)
 - 2500 requests per 15 minutes (sustained abuse prevention)
+
+Request counting is delegated to a pluggable backend:
+- ``database``: counts ``api_request`` rows in security_logs (original behavior)
+- ``memory``: in-process sliding log, suitable for single-replica deployments
+- ``redis``: sliding log in a sorted set, all windows checked in one atomic script
 """
 
 from __future__ import annotations
 
+import bisect
+import itertools
+import logging
 import time
+from abc import ABC, abstractmethod
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Optional, Tuple, NamedTuple
+from typing import Dict, List, Optional, Tuple, NamedTuple
 from dataclasses import dataclass
 
 from fastapi import HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
+from smarter_dev.shared.config import Settings, get_settings
 from smarter_dev.web.crud import APIKeyOperations
 from smarter_dev.web.models import APIKey
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class RateLimitWindow:
@@ -42,52 +54,41 @@ class RateLimitResult(NamedTuple):
     retry_after: int
 
 
-class MultiTierRateLimiter:
-    """Multi-tier rate limiter using PostgreSQL for reliable tracking.
-    
-    Implements multiple rate limiting windows with different time frames
-    to provide comprehensive protection against abuse.
-    """
-    
-    def __init__(self):
-        self.api_key_ops = APIKeyOperations()
+class RateLimitBackend(ABC):
+    """Storage backend that tracks API requests for the multi-tier rate limiter."""
+
+    @abstractmethod
+    async def hit(
+        self,
+        api_key: APIKey,
+        windows: list[RateLimitWindow],
+        current_time: datetime,
+        db: AsyncSession,
+        request: Request
+    ) -> list[int]:
+        """Count usage in every window and record the request if it is allowed.
         
-        # Define rate limiting windows (from strictest to most lenient)
-        self.windows = [
-            RateLimitWindow("second", 1, 0, "second"),  # Will be filled from API key
-            RateLimitWindow("minute", 60, 0, "minute"),  # Will be filled from API key  
-            RateLimitWindow("15min", 900, 0, "15min"),   # Will be filled from API key
-        ]
-    
-    def _get_windows_for_api_key(self, api_key: APIKey) -> list[RateLimitWindow]:
-        """Get rate limiting windows configured for a specific API key."""
-        return [
-            RateLimitWindow("second", 1, api_key.rate_limit_per_second, "second"),
-            RateLimitWindow("minute", 60, api_key.rate_limit_per_minute, "minute"),
-            RateLimitWindow("15min", 900, api_key.rate_limit_per_15_minutes, "15min"),
-        ]
-    
-    def _get_next_tier_window(self, windows: list[RateLimitWindow], current_window: RateLimitWindow) -> RateLimitWindow:
-        """Get the next tier window for escalation when current window is exceeded.
+        The request is only recorded when every window is still below its
+        limit, so rejected requests never consume budget.
         
         Args:
-            windows: List of all rate limit windows (in order from strictest to most lenient)
-            current_window: The window that was exceeded
+            api_key: The API key making the request
+            windows: Rate limiting windows (from strictest to most lenient)
+            current_time: Time of the request
+            db: Database session
+            request: FastAPI request object
             
         Returns:
-            The next tier window to escalate to, or the same window if it's the highest tier
+            Usage count for each window observed before this request
         """
-        try:
-            current_index = windows.index(current_window)
-            # Return next window if available, otherwise stay at current (highest tier)
-            if current_index + 1 < len(windows):
-                return windows[current_index + 1]
-            else:
-                return current_window  # Already at highest tier
-        except ValueError:
-            # If current window not found, return the highest tier window
-            return windows[-1]
+
+
+class DatabaseRateLimitBackend(RateLimitBackend):
+    """Counts ``api_request`` rows in the security_logs table.
     
+    Costs one COUNT query per window plus a log insert per request.
+    """
+
     async def _get_usage_count_for_window(
         self, 
         api_key: APIKey, 
@@ -131,12 +132,223 @@ class MultiTierRateLimiter:
         from smarter_dev.web.security_logger import get_security_logger
         
         security_logger = get_security_logger()
+        # Written synchronously: the next request's COUNT must see this row
         await security_logger.log_api_request(
             session=db,
             api_key=api_key,
             request=request,
-            success=True
+            success=True,
+            defer=False
         )
+
+    async def hit(
+        self,
+        api_key: APIKey,
+        windows: list[RateLimitWindow],
+        current_time: datetime,
+        db: AsyncSession,
+        request: Request
+    ) -> list[int]:
+        """Count usage per window and log the request if all windows pass."""
+        counts = []
+        for window in windows:
+            usage_count = await self._get_usage_count_for_window(
+                api_key, db, window, current_time
+            )
+            counts.append(usage_count)
+            if usage_count >= window.limit:
+                return counts
+        
+        await self._log_api_request(api_key, db, request)
+        return counts
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """In-process sliding log of request timestamps per API key.
+    
+    Only accurate when a single replica serves the API; every process keeps
+    its own counters.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._logs: Dict[str, List[float]] = {}
+
+    def _evict_idle_keys(self, cutoff: float) -> None:
+        """Drop keys whose newest request is older than the longest window."""
+        idle = [key for key, log in self._logs.items() if not log or log[-1] < cutoff]
+        for key in idle:
+            del self._logs[key]
+
+    async def hit(
+        self,
+        api_key: APIKey,
+        windows: list[RateLimitWindow],
+        current_time: datetime,
+        db: AsyncSession,
+        request: Request
+    ) -> list[int]:
+        """Count usage per window from the local log and append the request."""
+        # No awaits below: the check-and-record is atomic within the event loop
+        now = current_time.timestamp()
+        longest = max(window.duration_seconds for window in windows)
+        key = str(api_key.id)
+        
+        log = self._logs.get(key)
+        if log is None:
+            if len(self._logs) >= self.max_keys:
+                self._evict_idle_keys(now - longest)
+            log = self._logs.setdefault(key, [])
+        
+        # Trim entries that have fallen out of every window
+        expired = bisect.bisect_left(log, now - longest)
+        if expired:
+            del log[:expired]
+        
+        counts = []
+        for window in windows:
+            usage_count = len(log) - bisect.bisect_left(log, now - window.duration_seconds)
+            counts.append(usage_count)
+            if usage_count >= window.limit:
+                return counts
+        
+        bisect.insort(log, now)
+        return counts
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Sliding log stored in a Redis sorted set per API key.
+    
+    All windows are counted and the request is recorded by a single Lua
+    script, so the check is atomic across replicas and costs one round trip.
+    Falls back to a local in-memory log if Redis is unavailable.
+    """
+
+    # KEYS[1] = sorted set for the API key
+    # ARGV[1] = now (seconds), ARGV[2] = unique member, ARGV[3] = longest window,
+    # ARGV[4..] = (duration, limit) pairs from strictest to most lenient
+    SLIDING_LOG_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local longest = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', '(' .. (now - longest))
+local counts = {}
+for i = 4, #ARGV, 2 do
+    local duration = tonumber(ARGV[i])
+    local limit = tonumber(ARGV[i + 1])
+    local count = redis.call('ZCOUNT', key, now - duration, '+inf')
+    table.insert(counts, count)
+    if count >= limit then
+        return counts
+    end
+end
+redis.call('ZADD', key, now, ARGV[2])
+redis.call('EXPIRE', key, longest + 1)
+return counts
+"""
+
+    def __init__(self, redis_client=None, key_prefix: str = "ratelimit"):
+        self._redis = redis_client
+        self.key_prefix = key_prefix
+        self._script = None
+        self._sequence = itertools.count()
+        self._fallback = InMemoryRateLimitBackend()
+
+    def _get_script(self):
+        """Register the sliding log script on first use."""
+        if self._script is None:
+            if self._redis is None:
+                from smarter_dev.shared.redis_client import get_redis_client
+                self._redis = get_redis_client()
+            self._script = self._redis.register_script(self.SLIDING_LOG_SCRIPT)
+        return self._script
+
+    async def hit(
+        self,
+        api_key: APIKey,
+        windows: list[RateLimitWindow],
+        current_time: datetime,
+        db: AsyncSession,
+        request: Request
+    ) -> list[int]:
+        """Count usage per window and record the request in one script call."""
+        now = current_time.timestamp()
+        longest = max(window.duration_seconds for window in windows)
+        member = f"{now:.6f}:{id(self)}:{next(self._sequence)}"
+        args = [now, member, longest]
+        for window in windows:
+            args.extend([window.duration_seconds, window.limit])
+        
+        try:
+            counts = await self._get_script()(
+                keys=[f"{self.key_prefix}:{api_key.id}"],
+                args=args
+            )
+        except Exception as e:
+            logger.warning(f"Redis rate limit check failed, using local counters: {e}")
+            return await self._fallback.hit(api_key, windows, current_time, db, request)
+        
+        return [int(count) for count in counts]
+
+
+def create_rate_limit_backend(settings: Optional[Settings] = None) -> RateLimitBackend:
+    """Create the rate limit backend selected by ``settings.rate_limit_backend``."""
+    settings = settings or get_settings()
+    backend = settings.rate_limit_backend
+    
+    if backend == "memory":
+        return InMemoryRateLimitBackend()
+    if backend == "redis":
+        return RedisRateLimitBackend()
+    return DatabaseRateLimitBackend()
+
+
+class MultiTierRateLimiter:
+    """Multi-tier rate limiter with pluggable request counting.
+    
+    Implements multiple rate limiting windows with different time frames
+    to provide comprehensive protection against abuse.
+    """
+    
+    def __init__(self, backend: Optional[RateLimitBackend] = None):
+        self.api_key_ops = APIKeyOperations()
+        self.backend = backend or create_rate_limit_backend()
+        
+        # Define rate limiting windows (from strictest to most lenient)
+        self.windows = [
+            RateLimitWindow("second", 1, 0, "second"),  # Will be filled from API key
+            RateLimitWindow("minute", 60, 0, "minute"),  # Will be filled from API key  
+            RateLimitWindow("15min", 900, 0, "15min"),   # Will be filled from API key
+        ]
+    
+    def _get_windows_for_api_key(self, api_key: APIKey) -> list[RateLimitWindow]:
+        """Get rate limiting windows configured for a specific API key."""
+        return [
+            RateLimitWindow("second", 1, api_key.rate_limit_per_second, "second"),
+            RateLimitWindow("minute", 60, api_key.rate_limit_per_minute, "minute"),
+            RateLimitWindow("15min", 900, api_key.rate_limit_per_15_minutes, "15min"),
+        ]
+    
+    def _get_next_tier_window(self, windows: list[RateLimitWindow], current_window: RateLimitWindow) -> RateLimitWindow:
+        """Get the next tier window for escalation when current window is exceeded.
+        
+        Args:
+            windows: List of all rate limit windows (in order from strictest to most lenient)
+            current_window: The window that was exceeded
+            
+        Returns:
+            The next tier window to escalate to, or the same window if it's the highest tier
+        """
+        try:
+            current_index = windows.index(current_window)
+            # Return next window if available, otherwise stay at current (highest tier)
+            if current_index + 1 < len(windows):
+                return windows[current_index + 1]
+            else:
+                return current_window  # Already at highest tier
+        except ValueError:
+            # If current window not found, return the highest tier window
+            return windows[-1]
     
     async def check_rate_limits(
         self, 
@@ -159,14 +371,13 @@ class MultiTierRateLimiter:
         current_time = datetime.now(timezone.utc)
         windows = self._get_windows_for_api_key(api_key)
         
+        # Count every window and record the request in one backend call
+        usage_counts = await self.backend.hit(api_key, windows, current_time, db, request)
+        
         # Check each rate limiting window
         rate_limit_results = []
         
-        for window in windows:
-            usage_count = await self._get_usage_count_for_window(
-                api_key, db, window, current_time
-            )
-            
+        for window, usage_count in zip(windows, usage_counts):
             remaining = max(0, window.limit - usage_count)
             reset_time = current_time + timedelta(seconds=window.duration_seconds)
             retry_after = window.duration_seconds
@@ -210,8 +421,7 @@ class MultiTierRateLimiter:
                     retry_after=0
                 ))
         
-        # All rate limits passed - log the request and add headers
-        await self._log_api_request(api_key, db, request)
+        # All rate limits passed - the backend has recorded the request
         await self._add_rate_limit_headers(response, windows, rate_limit_results, current_time)
     
     async def _add_rate_limit_headers(
@@ -0,0 +1,339 @@
+"""Out-of-process execution of challenge input generator scripts.
+
+Generator scripts used to run with ``exec()`` on the web server's event
+loop, so a slow script stalled every request in the worker, and the
+process-wide ``redirect_stdout`` let concurrent runs interleave output.
+
+``ScriptRunner`` keeps a small pool of worker processes started ahead of
+time, with the modules generators commonly use already imported. Each
+worker runs one script at a time with its stdout captured privately, and
+every run is bounded by:
+
+- a wall-clock timeout, after which the worker is killed and replaced
+- a CPU-time limit (``RLIMIT_CPU``, where supported), so a busy loop dies
+  even if the parent is slow to notice
+- an output size cap
+
+Workers are also replaced after a number of runs so module state that
+scripts leave behind (``random.seed``, monkeypatching) can't accumulate.
+Queue wait and execution time are kept in latency histograms and exported
+alongside the API's request metrics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+import importlib
+import io
+import logging
+import multiprocessing
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from smarter_dev.shared.config import get_settings
+from smarter_dev.shared.request_metrics import LatencyHistogram
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Modules imported by each worker at startup so scripts don't pay for them
+DEFAULT_WARM_IMPORTS: Tuple[str, ...] = (
+    "collections",
+    "datetime",
+    "itertools",
+    "json",
+    "math",
+    "random",
+    "string",
+)
+
+
+class ScriptExecutionError(Exception):
+    """Exception raised when script execution fails."""
+    pass
+
+
+class OutputLimitExceeded(Exception):
+    """Raised inside a worker when a script prints too much."""
+    pass
+
+
+class _CappedOutput(io.StringIO):
+    """StringIO that refuses to grow past a size limit."""
+
+    def __init__(self, limit: int):
+        super().__init__()
+        self._limit = limit
+        self._size = 0
+
+    def write(self, text: str) -> int:
+        self._size += len(text)
+        if self._size > self._limit:
+            raise OutputLimitExceeded(f"Script output exceeded {self._limit} characters")
+        return super().write(text)
+
+
+def _run_job(script: str, cpu_seconds: float, max_output: int) -> Tuple[str, str]:
+    """Run one script in the worker; returns ("ok", output) or ("error", message)."""
+    if resource is not None and cpu_seconds > 0:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = usage.ru_utime + usage.ru_stime
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = int(used + cpu_seconds) + 1
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+    output = _CappedOutput(max_output)
+    try:
+        # Scripts are trusted and may import anything they need
+        with redirect_stdout(output):
+            exec(script, {"__builtins__": builtins})
+    except OutputLimitExceeded as e:
+        return "error", str(e)
+    except BaseException as e:
+        return "error", f"{type(e).__name__}: {e}"
+    return "ok", output.getvalue()
+
+
+def _worker_main(conn, warm_imports: Tuple[str, ...], max_output: int) -> None:
+    """Worker process entry point: run scripts received over ``conn``."""
+    for name in warm_imports:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+    conn.send("ready")
+
+    while True:
+        try:
+            script, cpu_seconds = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        conn.send(_run_job(script, cpu_seconds, max_output))
+
+
+@dataclass
+class _Worker:
+    process: Any
+    conn: Any
+    runs: int = 0
+
+
+class ScriptRunner:
+    """Pool of worker processes that run generator scripts with limits."""
+
+    # Seconds a new worker may take to import its modules
+    _STARTUP_TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        workers: int = 2,
+        wall_timeout: float = 10.0,
+        cpu_timeout: float = 5.0,
+        max_output: int = 1_000_000,
+        max_runs_per_worker: int = 100,
+        warm_imports: Tuple[str, ...] = DEFAULT_WARM_IMPORTS
+    ):
+        """Initialize the runner; workers start on ``start`` or first use.
+
+        Args:
+            workers: Worker processes, and so scripts run at once
+            wall_timeout: Seconds a run may take before its worker is killed
+            cpu_timeout: CPU seconds a run may use (0 disables the limit)
+            max_output: Characters a script may print
+            max_runs_per_worker: Runs after which a worker is replaced
+            warm_imports: Modules each worker imports at startup
+        """
+        self._size = workers
+        self._wall_timeout = wall_timeout
+        self._cpu_timeout = cpu_timeout
+        self._max_output = max_output
+        self._max_runs_per_worker = max_runs_per_worker
+        self._warm_imports = warm_imports
+        # Spawned rather than forked: the parent runs an event loop and threads
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: Optional[asyncio.Queue] = None
+        self._start_lock = asyncio.Lock()
+
+        # Metrics
+        self.queue_wait = LatencyHistogram()
+        self.execution_time = LatencyHistogram()
+        self.runs = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.worker_restarts = 0
+
+    @property
+    def started(self) -> bool:
+        return self._idle is not None
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self._warm_imports, self._max_output),
+            name="challenge-script-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        # Wait for the warm imports so startup isn't charged to the first run
+        try:
+            ready = parent_conn.poll(self._STARTUP_TIMEOUT) and parent_conn.recv() == "ready"
+        except EOFError:
+            ready = False
+        if not ready:
+            process.kill()
+            raise ScriptExecutionError("Script worker failed to start")
+        return _Worker(process=process, conn=parent_conn)
+
+    async def start(self) -> None:
+        """Start the worker processes."""
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+            idle: asyncio.Queue = asyncio.Queue()
+            for _ in range(self._size):
+                idle.put_nowait(await asyncio.to_thread(self._spawn))
+            self._idle = idle
+            logger.info(f"Started {self._size} challenge script workers")
+
+    async def run(self, script: str) -> str:
+        """Run a script in a worker and return what it printed.
+
+        Raises:
+            ScriptExecutionError: If the script fails, times out or exceeds
+                a limit
+        """
+        if self._idle is None:
+            await self.start()
+
+        queued_at = time.perf_counter()
+        worker = await self._idle.get()
+        if worker is None:
+            # An earlier replacement failed to start; try again
+            try:
+                worker = await asyncio.to_thread(self._spawn)
+            except BaseException:
+                self._idle.put_nowait(None)
+                raise
+        started_at = time.perf_counter()
+        self.queue_wait.record((started_at - queued_at) * 1000)
+        self.runs += 1
+
+        failed = True
+        try:
+            status, payload = await asyncio.to_thread(self._execute, worker, script)
+            failed = False
+        finally:
+            self.execution_time.record((time.perf_counter() - started_at) * 1000)
+            worker.runs += 1
+            try:
+                # A worker that timed out or died can't be reused
+                if failed or worker.runs >= self._max_runs_per_worker:
+                    if failed:
+                        self.failures += 1
+                    retired, worker = worker, None
+                    worker = await self._replace(retired)
+            finally:
+                # Always give the slot back, empty if the replacement failed
+                # to start, so the pool can't shrink and leave runs waiting
+                self._idle.put_nowait(worker)
+
+        if status != "ok":
+            self.failures += 1
+            raise ScriptExecutionError(f"Script execution failed: {payload}")
+        return payload
+
+    def _execute(self, worker: _Worker, script: str) -> Tuple[str, str]:
+        """Send a job to a worker and wait for its answer (blocking)."""
+        try:
+            worker.conn.send((script, self._cpu_timeout))
+            if not worker.conn.poll(self._wall_timeout):
+                self.timeouts += 1
+                raise ScriptExecutionError(f"Script timed out after {self._wall_timeout}s")
+            return worker.conn.recv()
+        except (EOFError, OSError) as e:
+            # The worker died, most likely killed by RLIMIT_CPU
+            worker.process.join(timeout=1)
+            raise ScriptExecutionError(
+                f"Script worker exited with code {worker.process.exitcode} "
+                f"(CPU limit {self._cpu_timeout}s): {e}"
+            ) from e
+
+    async def _replace(self, worker: _Worker) -> _Worker:
+        self.worker_restarts += 1
+        await asyncio.to_thread(self._stop_worker, worker)
+        return await asyncio.to_thread(self._spawn)
+
+    @staticmethod
+    def _stop_worker(worker: _Worker) -> None:
+        worker.conn.close()
+        if worker.process.is_alive():
+            worker.process.kill()
+        worker.process.join(timeout=5)
+
+    async def close(self) -> None:
+        """Stop all worker processes."""
+        if self._idle is None:
+            return
+        idle, self._idle = self._idle, None
+        while not idle.empty():
+            worker = idle.get_nowait()
+            if worker is not None:
+                await asyncio.to_thread(self._stop_worker, worker)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get run counters and latency summaries."""
+        return {
+            "workers": self._size,
+            "idle_workers": self._idle.qsize() if self._idle is not None else 0,
+            "runs": self.runs,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "worker_restarts": self.worker_restarts,
+            "queue_wait": self.queue_wait.snapshot(),
+            "execution_time": self.execution_time.snapshot(),
+        }
+
+    def render_prometheus(self, prefix: str) -> str:
+        """Counters and latency quantiles in the Prometheus text format."""
+        lines = []
+        for name in ("runs", "failures", "timeouts", "worker_restarts"):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {getattr(self, name)}")
+        for name, histogram in (("queue_wait_ms", self.queue_wait), ("execution_ms", self.execution_time)):
+            lines.append(f"# TYPE {prefix}_{name} summary")
+            for quantile in (0.5, 0.9, 0.99):
+                lines.append(
+                    f'{prefix}_{name}{{quantile="{quantile}"}} {histogram.percentile(quantile * 100):.3f}'
+                )
+            lines.append(f"{prefix}_{name}_sum {histogram.total:.3f}")
+            lines.append(f"{prefix}_{name}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+# Global runner, configured from settings on first use
+script_runner: Optional[ScriptRunner] = None
+
+
+def get_script_runner() -> ScriptRunner:
+    """Get the global challenge script runner."""
+    global script_runner
+    if script_runner is None:
+        settings = get_settings()
+        script_runner = ScriptRunner(
+            workers=settings.challenge_script_workers,
+            wall_timeout=settings.challenge_script_timeout,
+            cpu_timeout=settings.challenge_script_cpu_limit,
+            max_output=settings.challenge_script_max_output,
+        )
+    return script_runner
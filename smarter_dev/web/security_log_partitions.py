@@ -0,0 +1,249 @@
+"""Partition management and retention for the security_logs table.
+
+On PostgreSQL, security_logs is range-partitioned by ``created_at`` into
+daily partitions named ``security_logs_pYYYYMMDD``. Retention drops whole
+partitions instead of deleting rows, and a maintenance task keeps a few days
+of partitions created ahead of time so inserts never land in the default
+partition.
+
+On databases without partitioning (SQLite in tests, or PostgreSQL before the
+migration ran) retention falls back to a row DELETE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from smarter_dev.shared.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "security_logs"
+PARTITION_PREFIX = "security_logs_p"
+DEFAULT_PARTITION = "security_logs_default"
+
+# Serializes maintenance across replicas (arbitrary constant)
+MAINTENANCE_LOCK_ID = 7_305_001
+
+
+def partition_name(day: date) -> str:
+    """Get the partition table name for a day."""
+    return f"{PARTITION_PREFIX}{day:%Y%m%d}"
+
+
+def partition_day(name: str) -> Optional[date]:
+    """Parse the day from a partition table name, or None if it is not daily."""
+    if not name.startswith(PARTITION_PREFIX):
+        return None
+    try:
+        return datetime.strptime(name[len(PARTITION_PREFIX):], "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+def create_partition_sql(day: date) -> str:
+    """Build the DDL that creates the partition for a day if it is missing."""
+    start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    end = start + timedelta(days=1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(day)} "
+        f"PARTITION OF {PARENT_TABLE} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+@dataclass
+class MaintenanceResult:
+    """Outcome of a security log maintenance run."""
+    partitioned: bool
+    created: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+    deleted_rows: int = 0
+
+
+async def is_partitioned(session: AsyncSession) -> bool:
+    """Check whether security_logs is a partitioned PostgreSQL table."""
+    if session.bind.dialect.name != "postgresql":
+        return False
+
+    result = await session.execute(
+        text("""
+            SELECT 1
+            FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            WHERE c.relname = :table
+        """),
+        {"table": PARENT_TABLE}
+    )
+    return result.scalar() is not None
+
+
+async def list_partitions(session: AsyncSession) -> List[str]:
+    """List the partitions attached to security_logs."""
+    result = await session.execute(
+        text("""
+            SELECT child.relname
+            FROM pg_inherits i
+            JOIN pg_class parent ON parent.oid = i.inhparent
+            JOIN pg_class child ON child.oid = i.inhrelid
+            WHERE parent.relname = :table
+            ORDER BY child.relname
+        """),
+        {"table": PARENT_TABLE}
+    )
+    return [row[0] for row in result.fetchall()]
+
+
+async def ensure_partitions(
+    session: AsyncSession,
+    days_ahead: int = 7,
+    today: Optional[date] = None
+) -> List[str]:
+    """Create daily partitions from today through ``days_ahead`` days ahead.
+
+    Returns:
+        Names of partitions that did not exist before
+    """
+    today = today or datetime.now(timezone.utc).date()
+    existing = set(await list_partitions(session))
+
+    created = []
+    for offset in range(days_ahead + 1):
+        day = today + timedelta(days=offset)
+        name = partition_name(day)
+        if name in existing:
+            continue
+        await session.execute(text(create_partition_sql(day)))
+        created.append(name)
+
+    return created
+
+
+async def drop_expired_partitions(
+    session: AsyncSession,
+    retention_days: int = 90,
+    today: Optional[date] = None
+) -> List[str]:
+    """Drop daily partitions that hold only rows older than the retention period.
+
+    Returns:
+        Names of the dropped partitions
+    """
+    today = today or datetime.now(timezone.utc).date()
+    cutoff = today - timedelta(days=retention_days)
+
+    dropped = []
+    for name in await list_partitions(session):
+        day = partition_day(name)
+        # A partition covers [day, day + 1); keep it while any of it is retained
+        if day is None or day + timedelta(days=1) > cutoff:
+            continue
+        await session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        dropped.append(name)
+
+    return dropped
+
+
+async def run_security_log_maintenance(
+    session: AsyncSession,
+    retention_days: int = 90,
+    days_ahead: int = 7
+) -> MaintenanceResult:
+    """Create upcoming partitions and apply retention.
+
+    Uses a transaction-scoped advisory lock so only one replica runs the
+    DDL at a time. Falls back to deleting old rows when the table is not
+    partitioned.
+    """
+    if not await is_partitioned(session):
+        from smarter_dev.web.security_logger import get_security_logger
+        deleted = await get_security_logger().delete_old_logs(session, retention_days)
+        return MaintenanceResult(partitioned=False, deleted_rows=deleted)
+
+    locked = await session.execute(
+        text("SELECT pg_try_advisory_xact_lock(:lock_id)"),
+        {"lock_id": MAINTENANCE_LOCK_ID}
+    )
+    if not locked.scalar():
+        logger.info("Security log maintenance already running on another replica")
+        return MaintenanceResult(partitioned=True)
+
+    created = await ensure_partitions(session, days_ahead)
+    dropped = await drop_expired_partitions(session, retention_days)
+    await session.commit()
+
+    if created or dropped:
+        logger.info(f"Security log partitions created: {created}, dropped: {dropped}")
+
+    return MaintenanceResult(partitioned=True, created=created, dropped=dropped)
+
+
+class SecurityLogMaintenanceTask:
+    """Periodically runs security log partition maintenance in the background."""
+
+    def __init__(
+        self,
+        interval_minutes: int = 60,
+        retention_days: int = 90,
+        days_ahead: int = 7
+    ):
+        self.interval_minutes = interval_minutes
+        self.retention_days = retention_days
+        self.days_ahead = days_ahead
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the maintenance loop."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the maintenance loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self) -> MaintenanceResult:
+        """Run a single maintenance pass in its own session."""
+        from smarter_dev.shared.database import get_db_session_context
+
+        async with get_db_session_context() as session:
+            return await run_security_log_maintenance(
+                session,
+                retention_days=self.retention_days,
+                days_ahead=self.days_ahead
+            )
+
+    async def _run(self) -> None:
+        """Run maintenance on startup and then every interval."""
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Security log maintenance failed: {e}")
+            await asyncio.sleep(self.interval_minutes * 60)
+
+
+def create_maintenance_task() -> SecurityLogMaintenanceTask:
+    """Create the maintenance task from settings."""
+    settings = get_settings()
+    return SecurityLogMaintenanceTask(
+        interval_minutes=settings.security_log_maintenance_interval_minutes,
+        retention_days=settings.security_log_retention_days,
+        days_ahead=settings.security_log_partition_days_ahead,
+    )
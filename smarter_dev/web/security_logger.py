@@ -3,30 +3,190 @@
 This module provides comprehensive security logging capabilities for the API
 including authentication events, API key operations, rate limiting violations,
 and administrative actions.
+
+High-volume per-request events (API key usage and API requests) can be
+deferred to a background writer that batches them into multi-row INSERTs,
+keeping the inserts off the request latency path.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional, Dict, Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import Request
-from sqlalchemy import select, delete, func, and_, or_
+from sqlalchemy import select, delete, func, and_, or_, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from smarter_dev.shared.config import get_settings
 from smarter_dev.web.models import SecurityLog, APIKey
 
 logger = logging.getLogger(__name__)
 
 
+class SecurityLogWriter:
+    """Background writer that batches security log rows into multi-row INSERTs.
+    
+    Events are taken from a bounded queue and flushed every ``flush_interval_ms``
+    or as soon as ``batch_size`` rows are waiting. When the queue is full the
+    ``overflow_policy`` decides what happens: ``drop`` discards the new event,
+    ``block`` waits up to ``block_timeout_ms`` for space before dropping it.
+    """
+
+    # Queued by stop() so the writer flushes everything queued before it
+    _STOP = object()
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval_ms: int = 250,
+        overflow_policy: str = "drop",
+        block_timeout_ms: int = 50
+    ):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout_ms / 1000
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the background writer is accepting events."""
+        return self._task is not None and not self._task.done() and not self._stopping
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+        logger.info("Security log writer started")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop accepting events and flush everything still queued.
+        
+        Args:
+            timeout: Maximum seconds to wait for the queue to drain
+        """
+        if self._task is None:
+            return
+        
+        task, self._task = self._task, None
+        self._stopping = True
+        try:
+            await asyncio.wait_for(self._queue.put(self._STOP), timeout=timeout)
+            await asyncio.wait_for(task, timeout=timeout)
+        except asyncio.TimeoutError:
+            task.cancel()
+            remaining = self._queue.qsize()
+            self.dropped += remaining
+            logger.warning(f"Security log writer dropped {remaining} events on shutdown")
+        
+        logger.info(f"Security log writer stopped: {self.get_stats()}")
+
+    async def submit(self, row: Dict[str, Any]) -> bool:
+        """Queue a security log row for writing.
+        
+        Returns:
+            True if the row was queued, False if it was dropped
+        """
+        if not self.running:
+            return False
+        
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            if self.overflow_policy != "block":
+                self.dropped += 1
+                return False
+            try:
+                await asyncio.wait_for(self._queue.put(row), timeout=self.block_timeout)
+            except asyncio.TimeoutError:
+                self.dropped += 1
+                return False
+        
+        self.enqueued += 1
+        return True
+
+    async def _run(self) -> None:
+        """Flush batches until the stop marker is reached."""
+        stopping = False
+        while not stopping:
+            # Wait for the first row, then give the batch time to fill
+            batch = []
+            row = await self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if row is self._STOP:
+                    stopping = True
+                    break
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+            
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """Write a batch of rows with a single multi-row INSERT."""
+        if not batch:
+            return
+        
+        from smarter_dev.shared.database import get_db_session_context
+        
+        try:
+            async with get_db_session_context() as session:
+                await session.execute(insert(SecurityLog), batch)
+                await session.commit()
+            self.written += len(batch)
+            self.batches += 1
+        except Exception as e:
+            self.failed += len(batch)
+            logger.error(f"Failed to write {len(batch)} security log events: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer counters."""
+        return {
+            "running": self.running,
+            "queue_size": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_size": self.max_queue_size,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+
 class SecurityLogger:
     """Comprehensive security logging and audit trail system."""
 
-    def __init__(self):
+    def __init__(self, writer: Optional[SecurityLogWriter] = None):
         """Initialize the security logger."""
         self.logger = logging.getLogger(f"{__name__}.SecurityLogger")
+        self.writer = writer
 
     async def log_event(
         self,
@@ -39,7 +199,8 @@ class SecurityLogger:
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
         request_id: Optional[str] = None,
-        event_metadata: Optional[Dict[str, Any]] = None
+        event_metadata: Optional[Dict[str, Any]] = None,
+        defer: bool = False
     ) -> Optional[SecurityLog]:
         """Log a security event.
         
@@ -54,6 +215,9 @@ class SecurityLogger:
             user_agent: Client user agent
             request_id: Request correlation ID
             event_metadata: Additional structured metadata
+            defer: Hand the event to the background writer instead of
+                writing it on the session (falls back to the session if the
+                writer is not running)
             
         Returns:
             SecurityLog: The created log entry, or None if logging failed
@@ -65,6 +229,26 @@ class SecurityLogger:
             f"Security event: {action} - {'SUCCESS' if success else 'FAILURE'} - {details}"
         )
         
+        if defer and self.writer is not None and self.writer.running:
+            now = datetime.now(timezone.utc)
+            await self.writer.submit({
+                "id": uuid4(),
+                "action": action,
+                "api_key_id": api_key_id,
+                "user_identifier": user_identifier,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "request_id": request_id,
+                "success": success,
+                "details": details,
+                "event_metadata": event_metadata,
+                # Rate limit queries filter on created_at, so keep the event time
+                "timestamp": now,
+                "created_at": now,
+                "updated_at": now,
+            })
+            return None
+        
         try:
             security_log = SecurityLog(
                 action=action,
@@ -163,8 +347,8 @@ class SecurityLogger:
         request: Request,
         success: bool = True,
         error_message: Optional[str] = None
-    ) -> SecurityLog:
-        """Log API key usage event."""
+    ) -> Optional[SecurityLog]:
+        """Log API key usage event (deferred to the background writer)."""
         details = f"API key '{api_key.key_prefix}***' used successfully"
         if not success and error_message:
             details = f"API key '{api_key.key_prefix}***' usage failed: {error_message}"
@@ -183,7 +367,8 @@ class SecurityLogger:
                 "api_key_prefix": api_key.key_prefix,
                 "endpoint": str(request.url.path),
                 "method": request.method
-            }
+            },
+            defer=True
         )
 
     async def log_authentication_failed(
@@ -215,9 +400,14 @@ class SecurityLogger:
         session: AsyncSession,
         api_key: APIKey,
         request: Request,
-        success: bool = True
-    ) -> SecurityLog:
-        """Log an API request for rate limiting tracking."""
+        success: bool = True,
+        defer: bool = True
+    ) -> Optional[SecurityLog]:
+        """Log an API request for rate limiting tracking.
+        
+        Deferred to the background writer by default; pass ``defer=False``
+        when the row must be visible to the next request's rate limit count.
+        """
         return await self.log_event(
             session=session,
             action="api_request",
@@ -232,7 +422,8 @@ class SecurityLogger:
                 "method": request.method,
                 "path": str(request.url.path),
                 "query_params": dict(request.query_params)
-            }
+            },
+            defer=defer
         )
     
     async def log_rate_limit_exceeded(
@@ -422,7 +613,32 @@ class SecurityLogger:
         session: AsyncSession,
         retention_days: int = 90
     ) -> int:
-        """Clean up old security logs beyond retention period."""
+        """Clean up old security logs beyond retention period.
+        
+        On a partitioned table whole daily partitions are dropped and the
+        number of dropped partitions is returned; otherwise old rows are
+        deleted and the number of deleted rows is returned.
+        """
+        from smarter_dev.web.security_log_partitions import (
+            drop_expired_partitions,
+            is_partitioned,
+        )
+        
+        if await is_partitioned(session):
+            dropped = await drop_expired_partitions(session, retention_days)
+            await session.commit()
+            if dropped:
+                self.logger.info(f"Dropped security log partitions older than {retention_days} days: {dropped}")
+            return len(dropped)
+        
+        return await self.delete_old_logs(session, retention_days)
+
+    async def delete_old_logs(
+        self,
+        session: AsyncSession,
+        retention_days: int = 90
+    ) -> int:
+        """Delete security log rows older than the retention period."""
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
         
         stmt = delete(SecurityLog).where(SecurityLog.timestamp < cutoff_date)
@@ -480,7 +696,15 @@ class SecurityLogger:
 
 
 # Global security logger instance
-security_logger = SecurityLogger()
+_settings = get_settings()
+security_logger = SecurityLogger(
+    writer=SecurityLogWriter(
+        max_queue_size=_settings.security_log_queue_size,
+        batch_size=_settings.security_log_batch_size,
+        flush_interval_ms=_settings.security_log_flush_interval_ms,
+        overflow_policy=_settings.security_log_overflow_policy,
+    )
+)
 
 
 def get_security_logger() -> SecurityLogger:
@@ -0,0 +1,324 @@
+"""Pre-aggregated statistics for the admin dashboard.
+
+A background task rolls activity up into two small tables:
+
+- ``daily_stats``: one row per UTC day with transaction, API request, help
+  conversation and token counts. Each run recomputes only the last stored
+  day onwards, so late rows for that day are picked up and older days are
+  never scanned again. API request counts outlive security log retention.
+- ``guild_stats``: current user, squad and bytes totals per guild, plus an
+  all-guilds row.
+
+The dashboard then reads the rollup in a single query.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, case, delete, distinct, func, insert, literal_column, select, text, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from smarter_dev.shared.config import get_settings
+from smarter_dev.web.models import (
+    BytesBalance,
+    BytesTransaction,
+    DailyStats,
+    ForumAgentResponse,
+    GuildStats,
+    HelpConversation,
+    SecurityLog,
+    Squad,
+)
+
+logger = logging.getLogger(__name__)
+
+# guild_stats row holding totals across all guilds
+ALL_GUILDS = "*"
+
+# Serializes rollups across replicas (arbitrary constant)
+ROLLUP_LOCK_ID = 7_305_002
+
+DAILY_COUNT_COLUMNS = (
+    "transaction_count",
+    "api_request_count",
+    "help_conversation_count",
+    "help_tokens",
+    "help_response_time_total_ms",
+    "help_response_count",
+    "forum_tokens",
+)
+
+
+@dataclass
+class DashboardStats:
+    """Dashboard totals read from the rollup tables."""
+    total_users: int = 0
+    total_transactions: int = 0
+    total_squads: int = 0
+    total_bytes: int = 0
+    total_conversations: int = 0
+    help_tokens: int = 0
+    forum_tokens: int = 0
+    conversations_today: int = 0
+    api_requests_today: int = 0
+    avg_response_time_ms: Optional[int] = None
+    guilds: Dict[str, GuildStats] = field(default_factory=dict)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.help_tokens + self.forum_tokens
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the rollup has never been refreshed."""
+        return ALL_GUILDS not in self.guilds
+
+
+def _utc_day(session: AsyncSession, column):
+    """SQL expression for the UTC calendar day of a timestamp column."""
+    if session.bind.dialect.name == "postgresql":
+        # Inline the zone so the GROUP BY matches the SELECT expression
+        return func.date(func.timezone(literal_column("'UTC'"), column))
+    # SQLite stores timestamps as UTC text
+    return func.date(column)
+
+
+def _as_date(value) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+async def _aggregate_by_day(session: AsyncSession, column, since: Optional[datetime], *aggregates, where=None):
+    """Run aggregates grouped by the UTC day of ``column``, from ``since`` onwards."""
+    day = _utc_day(session, column).label("day")
+    stmt = select(day, *aggregates).group_by(day)
+    if since is not None:
+        stmt = stmt.where(column >= since)
+    if where is not None:
+        stmt = stmt.where(where)
+    result = await session.execute(stmt)
+    return {_as_date(row[0]): row[1:] for row in result.all()}
+
+
+async def refresh_daily_stats(session: AsyncSession, today: Optional[date] = None) -> List[date]:
+    """Recompute daily_stats from the last stored day through today.
+
+    On the first run every day with activity is rolled up.
+
+    Returns:
+        The days written
+    """
+    today = today or datetime.now(timezone.utc).date()
+    last_day = await session.scalar(select(func.max(DailyStats.day)))
+    first_day = min(_as_date(last_day), today) if last_day else None
+    since = datetime.combine(first_day, time.min, tzinfo=timezone.utc) if first_day else None
+
+    rows: Dict[date, dict] = {today: {}}
+
+    def merge(by_day, *columns):
+        for day, values in by_day.items():
+            rows.setdefault(day, {}).update(
+                {column: int(value or 0) for column, value in zip(columns, values)}
+            )
+
+    merge(
+        await _aggregate_by_day(session, BytesTransaction.created_at, since, func.count()),
+        "transaction_count"
+    )
+    merge(
+        await _aggregate_by_day(
+            session, SecurityLog.created_at, since, func.count(),
+            # verify_api_key logs one api_key_used row per authenticated
+            # request whichever rate limit backend is selected; api_request
+            # rows only exist with the database backend
+            where=and_(SecurityLog.action == "api_key_used", SecurityLog.success == True)
+        ),
+        "api_request_count"
+    )
+    merge(
+        await _aggregate_by_day(
+            session, HelpConversation.started_at, since,
+            func.count(),
+            func.sum(HelpConversation.tokens_used),
+            func.sum(HelpConversation.response_time_ms),
+            func.count(HelpConversation.response_time_ms)
+        ),
+        "help_conversation_count", "help_tokens", "help_response_time_total_ms", "help_response_count"
+    )
+    merge(
+        await _aggregate_by_day(
+            session, ForumAgentResponse.created_at, since, func.sum(ForumAgentResponse.tokens_used)
+        ),
+        "forum_tokens"
+    )
+
+    stmt = delete(DailyStats)
+    if first_day is not None:
+        stmt = stmt.where(DailyStats.day >= first_day)
+    await session.execute(stmt)
+    await session.execute(insert(DailyStats), [
+        {"day": day, **{column: values.get(column, 0) for column in DAILY_COUNT_COLUMNS}}
+        for day, values in sorted(rows.items())
+    ])
+
+    return sorted(rows)
+
+
+async def refresh_guild_stats(session: AsyncSession) -> int:
+    """Recompute guild_stats from balances and squads.
+
+    Returns:
+        Number of guilds written, not counting the all-guilds row
+    """
+    balances = await session.execute(
+        select(BytesBalance.guild_id, func.count(), func.coalesce(func.sum(BytesBalance.balance), 0))
+        .group_by(BytesBalance.guild_id)
+    )
+    squads = await session.execute(
+        select(Squad.guild_id, func.count()).group_by(Squad.guild_id)
+    )
+    overall = (await session.execute(
+        select(func.count(distinct(BytesBalance.user_id)), func.coalesce(func.sum(BytesBalance.balance), 0))
+    )).one()
+
+    rows: Dict[str, dict] = {}
+    for guild_id, user_count, bytes_total in balances.all():
+        rows[guild_id] = {"user_count": user_count, "bytes_total": bytes_total}
+    squad_total = 0
+    for guild_id, squad_count in squads.all():
+        rows.setdefault(guild_id, {})["squad_count"] = squad_count
+        squad_total += squad_count
+    rows[ALL_GUILDS] = {"user_count": overall[0], "bytes_total": overall[1], "squad_count": squad_total}
+
+    await session.execute(delete(GuildStats))
+    await session.execute(insert(GuildStats), [
+        {
+            "guild_id": guild_id,
+            "user_count": values.get("user_count", 0),
+            "squad_count": values.get("squad_count", 0),
+            "bytes_total": values.get("bytes_total", 0),
+        }
+        for guild_id, values in rows.items()
+    ])
+
+    return len(rows) - 1
+
+
+async def run_stats_rollup(session: AsyncSession, today: Optional[date] = None) -> bool:
+    """Refresh both rollup tables and commit.
+
+    Uses a transaction-scoped advisory lock so only one replica refreshes
+    at a time.
+
+    Returns:
+        False if another replica was already refreshing
+    """
+    if session.bind.dialect.name == "postgresql":
+        locked = await session.execute(
+            text("SELECT pg_try_advisory_xact_lock(:lock_id)"),
+            {"lock_id": ROLLUP_LOCK_ID}
+        )
+        if not locked.scalar():
+            logger.info("Stats rollup already running on another replica")
+            return False
+
+    await refresh_daily_stats(session, today)
+    await refresh_guild_stats(session)
+    await session.commit()
+    return True
+
+
+async def get_dashboard_stats(session: AsyncSession, today: Optional[date] = None) -> DashboardStats:
+    """Read dashboard totals and per-guild stats from the rollup in one query."""
+    today = today or datetime.now(timezone.utc).date()
+
+    def total(column):
+        return func.coalesce(func.sum(column), 0)
+
+    totals = select(
+        total(DailyStats.transaction_count).label("transactions"),
+        total(DailyStats.help_conversation_count).label("conversations"),
+        total(DailyStats.help_tokens).label("help_tokens"),
+        total(DailyStats.forum_tokens).label("forum_tokens"),
+        total(DailyStats.help_response_time_total_ms).label("response_time_total_ms"),
+        total(DailyStats.help_response_count).label("responses"),
+        total(case((DailyStats.day == today, DailyStats.help_conversation_count), else_=0)).label("conversations_today"),
+        total(case((DailyStats.day == today, DailyStats.api_request_count), else_=0)).label("api_requests_today"),
+    ).subquery()
+
+    result = await session.execute(
+        select(totals, GuildStats).select_from(totals).outerjoin(GuildStats, true())
+    )
+    rows = result.all()
+
+    first = rows[0]
+    stats = DashboardStats(
+        total_transactions=first.transactions,
+        total_conversations=first.conversations,
+        help_tokens=first.help_tokens,
+        forum_tokens=first.forum_tokens,
+        conversations_today=first.conversations_today,
+        api_requests_today=first.api_requests_today,
+        avg_response_time_ms=(
+            int(first.response_time_total_ms / first.responses) if first.responses else None
+        ),
+        guilds={row.GuildStats.guild_id: row.GuildStats for row in rows if row.GuildStats is not None},
+    )
+    overall = stats.guilds.get(ALL_GUILDS)
+    if overall is not None:
+        stats.total_users = overall.user_count
+        stats.total_squads = overall.squad_count
+        stats.total_bytes = overall.bytes_total
+    return stats
+
+
+class StatsRollupTask:
+    """Periodically refreshes the stats rollup in the background."""
+
+    def __init__(self, interval_minutes: int = 5):
+        self.interval_minutes = interval_minutes
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the rollup loop."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the rollup loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self) -> bool:
+        """Run a single rollup in its own session."""
+        from smarter_dev.shared.database import get_db_session_context
+
+        async with get_db_session_context() as session:
+            return await run_stats_rollup(session)
+
+    async def _run(self) -> None:
+        """Refresh on startup and then every interval."""
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Stats rollup failed: {e}")
+            await asyncio.sleep(self.interval_minutes * 60)
+
+
+def create_stats_rollup_task() -> StatsRollupTask:
+    """Create the rollup task from settings."""
+    return StatsRollupTask(interval_minutes=get_settings().stats_rollup_interval_minutes)
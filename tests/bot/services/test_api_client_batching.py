@@ -0,0 +1,197 @@
+"""Tests for sharing GETs and batching POSTs in the bot API client."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from smarter_dev.bot.services.api_client import APIClient
+from smarter_dev.bot.services.bytes_service import BytesService
+from smarter_dev.bot.services.exceptions import AlreadyClaimedError, NetworkError
+
+API_KEY = "sk-" + "a" * 43
+
+
+def client(**kwargs) -> APIClient:
+    return APIClient("http://test", API_KEY, **kwargs)
+
+
+class TestGetCoalescing:
+    """Test sharing identical in-flight GETs."""
+
+    async def test_identical_gets_share_one_request(self):
+        api = client(coalesce_gets=True)
+        started = asyncio.Event()
+
+        async def slow_request(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"balance": 10})
+
+        with patch.object(api, "_request", AsyncMock(side_effect=slow_request)) as request:
+            responses = await asyncio.gather(*[
+                api.get("/guilds/1/bytes/balance/2", params={"a": 1}) for _ in range(5)
+            ])
+
+        assert request.await_count == 1
+        assert all(response.json() == {"balance": 10} for response in responses)
+
+    async def test_different_params_are_not_shared(self):
+        api = client(coalesce_gets=True)
+        request = AsyncMock(return_value=httpx.Response(200, json={}))
+
+        with patch.object(api, "_request", request):
+            await asyncio.gather(
+                api.get("/guilds/1/bytes/leaderboard", params={"limit": 10}),
+                api.get("/guilds/1/bytes/leaderboard", params={"limit": 25}),
+            )
+
+        assert request.await_count == 2
+
+    async def test_failures_reach_every_waiter(self):
+        api = client(coalesce_gets=True)
+
+        async def failing_request(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            raise NetworkError("down")
+
+        with patch.object(api, "_request", AsyncMock(side_effect=failing_request)):
+            results = await asyncio.gather(
+                *[api.get("/health") for _ in range(3)], return_exceptions=True
+            )
+
+        assert all(isinstance(result, NetworkError) for result in results)
+        assert api._inflight_gets == {}
+
+    async def test_cancelling_the_first_caller_keeps_the_request(self):
+        api = client(coalesce_gets=True)
+        release = asyncio.Event()
+
+        async def slow_request(*args, **kwargs):
+            await release.wait()
+            return httpx.Response(200, json={"ok": True})
+
+        with patch.object(api, "_request", AsyncMock(side_effect=slow_request)) as request:
+            first = asyncio.create_task(api.get("/health"))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(api.get("/health"))
+            await asyncio.sleep(0)
+            first.cancel()
+            release.set()
+            response = await asyncio.wait_for(second, timeout=1)
+
+        assert first.cancelled()
+        assert response.json() == {"ok": True}
+        assert request.await_count == 1
+        assert api._inflight_gets == {}
+
+
+class TestPostBatching:
+    """Test collecting concurrent POSTs into bulk requests."""
+
+    async def test_items_in_one_window_are_sent_together(self):
+        api = client(batch_window=0.01)
+        request = AsyncMock(return_value=httpx.Response(200, json={"results": [
+            {"status_code": 200, "body": {"user": "a"}},
+            {"status_code": 409, "body": {"detail": "claimed"}},
+        ]}))
+
+        with patch.object(api, "_request", request):
+            first, second = await asyncio.gather(
+                api.post_batched("/guilds/1/bytes/daily/batch", {"user_id": "a"}),
+                api.post_batched("/guilds/1/bytes/daily/batch", {"user_id": "b"}),
+            )
+
+        request.assert_awaited_once()
+        assert request.await_args.kwargs["json_data"] == {"items": [{"user_id": "a"}, {"user_id": "b"}]}
+        assert (first.status_code, first.json()) == (200, {"user": "a"})
+        assert (second.status_code, second.json()) == (409, {"detail": "claimed"})
+
+    async def test_full_batch_is_sent_without_waiting(self):
+        api = client(batch_window=60, max_batch_size=2)
+        request = AsyncMock(return_value=httpx.Response(200, json={"results": [
+            {"status_code": 200, "body": {}},
+            {"status_code": 200, "body": {}},
+        ]}))
+
+        with patch.object(api, "_request", request):
+            await asyncio.wait_for(asyncio.gather(
+                api.post_batched("/batch", {"n": 1}),
+                api.post_batched("/batch", {"n": 2}),
+            ), timeout=1)
+
+        request.assert_awaited_once()
+        assert api._batch_flushers == {}
+
+    async def test_cancelling_the_caller_that_fills_a_batch_keeps_the_others(self):
+        api = client(batch_window=60, max_batch_size=2)
+        release = asyncio.Event()
+
+        async def slow_request(*args, **kwargs):
+            await release.wait()
+            return httpx.Response(200, json={"results": [
+                {"status_code": 200, "body": {"n": 1}},
+                {"status_code": 200, "body": {"n": 2}},
+            ]})
+
+        with patch.object(api, "_request", AsyncMock(side_effect=slow_request)):
+            first = asyncio.create_task(api.post_batched("/batch", {"n": 1}))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(api.post_batched("/batch", {"n": 2}))
+            await asyncio.sleep(0)
+            second.cancel()
+            release.set()
+            response = await asyncio.wait_for(first, timeout=1)
+
+        assert second.cancelled()
+        assert response.json() == {"n": 1}
+
+    async def test_batch_failure_reaches_every_item(self):
+        api = client(batch_window=0.01)
+
+        with patch.object(api, "_request", AsyncMock(side_effect=NetworkError("down"))):
+            results = await asyncio.gather(
+                api.post_batched("/batch", {"n": 1}),
+                api.post_batched("/batch", {"n": 2}),
+                return_exceptions=True
+            )
+
+        assert all(isinstance(result, NetworkError) for result in results)
+
+    async def test_batching_disabled_by_default(self):
+        assert client().batching_enabled is False
+
+
+class TestBatchedDailyClaims:
+    """Test BytesService sending daily claims through the bulk endpoint."""
+
+    async def test_concurrent_claims_share_one_request(self):
+        api = client(batch_window=0.01)
+        balance = {
+            "guild_id": "1", "user_id": "2", "balance": 10, "total_received": 10,
+            "total_sent": 0, "streak_count": 1, "last_daily": "2024-01-15",
+        }
+        request = AsyncMock(return_value=httpx.Response(200, json={"results": [
+            {"status_code": 200, "body": {
+                "balance": balance, "reward_amount": 10, "streak_bonus": 1,
+                "next_claim_at": "2024-01-16T00:00:00Z",
+            }},
+            {"status_code": 409, "body": {"detail": "Daily reward has already been claimed today."}},
+        ]}))
+        service = BytesService(api)
+        await service.initialize()
+
+        with patch.object(api, "_request", request):
+            claimed, already = await asyncio.gather(
+                service.claim_daily("1", "2", "alice"),
+                service.claim_daily("1", "3", "bob"),
+                return_exceptions=True
+            )
+
+        request.assert_awaited_once()
+        assert request.await_args.args[1] == "/guilds/1/bytes/daily/batch"
+        assert claimed.earned == 10
+        assert claimed.balance.balance == 10
+        assert isinstance(already, AlreadyClaimedError)
@@ -0,0 +1,72 @@
+"""Tests for bot API client connection setup and latency reporting."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from smarter_dev.bot.services.api_client import APIClient
+
+API_KEY = "sk-" + "a" * 43
+
+
+class TestConnections:
+    """Test HTTP/2 mode and connection warmup."""
+
+    async def test_http2_needs_https(self):
+        api = APIClient("http://api.test", API_KEY, http2=True)
+
+        await api._ensure_client()
+
+        assert api._http2 is False
+        await api.close()
+
+    async def test_http2_pins_a_small_pool(self):
+        api = APIClient("https://api.test", API_KEY, http2=True, http2_connections=3)
+
+        with patch.dict("sys.modules", {"h2": object()}), \
+                patch("smarter_dev.bot.services.api_client.httpx.AsyncClient") as client_class:
+            await api._ensure_client()
+
+        kwargs = client_class.call_args.kwargs
+        assert kwargs["http2"] is True
+        assert kwargs["limits"].max_connections == 3
+        assert kwargs["limits"].max_keepalive_connections == 3
+
+    async def test_warmup_reports_successful_connections(self):
+        api = APIClient("http://api.test", API_KEY)
+        await api._ensure_client()
+        api._client.get = AsyncMock(side_effect=[httpx.Response(200), httpx.ConnectError("refused")])
+
+        warmed = await api.warmup(connections=2)
+
+        assert warmed == 1
+        assert api._client.get.await_args.args[0] == "http://api.test/health"
+        await api.close()
+
+
+class TestLatencyPercentiles:
+    """Test response time percentiles reported by health checks."""
+
+    async def health_details(self, api):
+        with patch.object(api, "get", AsyncMock(return_value=httpx.Response(200))):
+            return (await api.health_check()).details
+
+    async def test_percentiles_come_from_the_latency_histogram(self):
+        api = APIClient("http://api.test", API_KEY)
+        for duration in range(1, 101):
+            api.metrics.record("GET", "/health", float(duration), status_code=200)
+
+        details = await self.health_details(api)
+
+        for p in (50, 95, 99):
+            assert details[f"p{p}_response_time_ms"] == api.metrics.latency.percentile(p)
+        assert 45 <= details["p50_response_time_ms"] <= 55
+
+    async def test_no_percentiles_before_requests(self):
+        api = APIClient("http://api.test", API_KEY)
+
+        details = await self.health_details(api)
+
+        assert "p50_response_time_ms" not in details
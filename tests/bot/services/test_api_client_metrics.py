@@ -0,0 +1,140 @@
+"""Tests for per-route request metrics in the bot API client."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import httpx
+from prometheus_client.parser import text_string_to_metric_families
+
+from smarter_dev.bot.metrics_server import METRICS_PREFIX, MetricsServer
+from smarter_dev.bot.services.api_client import APIClient, RetryConfig
+from smarter_dev.shared.request_metrics import LatencyHistogram, RequestMetrics, route_template
+
+API_KEY = "sk-" + "a" * 43
+
+
+class TestRequestMetrics:
+    """Test histograms and the metrics registry."""
+
+    def test_route_template_collapses_ids(self):
+        assert route_template("/guilds/123/bytes/balance/456?x=1") == "/guilds/{id}/bytes/balance/{id}"
+        assert (
+            route_template("/challenges/0f8fad5b-d9cb-469f-a165-70867728950e/input")
+            == "/challenges/{uuid}/input"
+        )
+        assert route_template("/health") == "/health"
+
+    def test_histogram_percentiles_are_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 1001):
+            histogram.record(float(value))
+
+        assert abs(histogram.percentile(50) - 500) / 500 < 0.07
+        assert abs(histogram.percentile(99) - 990) / 990 < 0.07
+        assert histogram.percentile(100) == 1000
+        assert histogram.mean == 500.5
+
+    def test_empty_histogram(self):
+        assert LatencyHistogram().percentile(99) == 0.0
+
+    def test_routes_beyond_limit_are_grouped(self):
+        metrics = RequestMetrics(max_routes=2)
+        for route in ("/a", "/b", "/c", "/d"):
+            metrics.record("GET", route, 1.0, status_code=200)
+
+        routes = metrics.snapshot()["routes"]
+        assert set(routes) == {"GET /a", "GET /b", "GET other"}
+        assert routes["GET other"]["requests"] == 2
+
+    def test_prometheus_output(self):
+        metrics = RequestMetrics()
+        metrics.record("GET", "/health", 12.0, status_code=200, bytes_received=20)
+        metrics.record("GET", "/health", 5.0, status_code=503)
+
+        text = metrics.render_prometheus("test")
+
+        assert 'test_requests_total{method="GET",route="/health"} 2' in text
+        assert 'test_request_errors_total{method="GET",route="/health"} 1' in text
+        assert 'test_response_bytes_total{method="GET",route="/health"} 20' in text
+        assert 'test_request_duration_ms_count{method="GET",route="/health"} 2' in text
+
+    def test_prometheus_output_parses(self):
+        metrics = RequestMetrics()
+        metrics.record("GET", "/health", 12.0, status_code=200)
+        metrics.record("POST", "/guilds/{id}/bytes/daily", 30.0, status_code=200)
+
+        families = {
+            family.name: family
+            for family in text_string_to_metric_families(metrics.render_prometheus("test"))
+        }
+
+        assert families["test_requests"].type == "counter"
+        assert len(families["test_requests"].samples) == 2
+        assert families["test_request_duration_ms"].type == "summary"
+        assert len(families["test_request_duration_ms"].samples) == 10
+
+
+class TestAPIClientMetrics:
+    """Test what the client records per request."""
+
+    async def make_client(self, *responses, **kwargs):
+        api = APIClient(
+            "http://api.test", API_KEY,
+            retry_config=RetryConfig(max_retries=2, base_delay=0, jitter=False),
+            **kwargs
+        )
+        await api._ensure_client()
+        api._client.request = AsyncMock(side_effect=list(responses))
+        return api
+
+    async def test_records_route_size_and_request_id(self):
+        request = httpx.Request("POST", "http://api.test/guilds/1/bytes/transactions", content=b"{}")
+        api = await self.make_client(httpx.Response(200, content=b'{"ok": true}', request=request))
+
+        await api.post("/guilds/1/bytes/transactions", json_data={})
+
+        stats = api.metrics.snapshot()["routes"]["POST /guilds/{id}/bytes/transactions"]
+        assert stats["requests"] == 1
+        assert stats["bytes_sent"] == 2
+        assert stats["bytes_received"] == 12
+        assert stats["status_codes"] == {200: 1}
+        headers = api._client.request.await_args.kwargs["headers"]
+        assert len(headers["x-request-id"]) == 32
+        await api.close()
+
+    async def test_retries_share_request_id_and_count_once(self):
+        api = await self.make_client(
+            httpx.ConnectError("refused"), httpx.ConnectError("refused"), httpx.Response(200)
+        )
+
+        await api.get("/guilds/1/bytes/config")
+
+        calls = api._client.request.await_args_list
+        assert len({call.kwargs["headers"]["x-request-id"] for call in calls}) == 1
+        stats = api.metrics.snapshot()["routes"]["GET /guilds/{id}/bytes/config"]
+        assert stats["requests"] == 1
+        assert stats["retries"] == 2
+        await api.close()
+
+    async def test_failed_request_counts_as_error(self):
+        api = await self.make_client(*[httpx.ConnectError("refused")] * 3)
+
+        try:
+            await api.get("/health")
+        except Exception:
+            pass
+
+        stats = api.metrics.snapshot()["routes"]["GET /health"]
+        assert stats["errors"] == 1
+        assert stats["status_codes"] == {}
+        await api.close()
+
+    async def test_metrics_server_renders_client_metrics(self):
+        api = await self.make_client(httpx.Response(200))
+        await api.get("/health")
+
+        response = await MetricsServer(api).handle_metrics(None)
+
+        assert f'{METRICS_PREFIX}_requests_total{{method="GET",route="/health"}} 1' in response.text
+        await api.close()
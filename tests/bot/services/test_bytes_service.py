@@ -210,6 +210,66 @@ class TestBytesServiceBalances:
         # Should wrap in ServiceError
         with pytest.raises(ServiceError, match="Failed to get balance"):
             await bytes_service.get_balance(test_guild_id, test_user_id)
+    
+    async def test_get_balances_fetches_uncached_users_in_one_request(
+        self,
+        bytes_service,
+        mock_api_client,
+        mock_cache_manager,
+        test_guild_id,
+        test_user_id,
+        test_user_id_2,
+        balance_api_response
+    ):
+        """Test batch balance retrieval uses the cache and fills it."""
+        cached = {**balance_api_response, "user_id": "111111111111111111", "balance": 7}
+        await mock_cache_manager.set(f"bytesservice:balance:{test_guild_id}:111111111111111111", cached)
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json = Mock(return_value={
+            "guild_id": test_guild_id,
+            "balances": [balance_api_response],
+            "missing": [test_user_id_2]
+        })
+        mock_api_client.get.return_value = mock_response
+        
+        balances = await bytes_service.get_balances(
+            test_guild_id, ["111111111111111111", test_user_id, test_user_id_2]
+        )
+        
+        assert set(balances) == {"111111111111111111", test_user_id}
+        assert balances["111111111111111111"].balance == 7
+        assert balances[test_user_id].balance == 100
+        mock_api_client.get.assert_called_once_with(
+            f"/guilds/{test_guild_id}/bytes/balances",
+            params={"user_ids": f"{test_user_id},{test_user_id_2}"},
+            timeout=10.0
+        )
+        
+        # Fetched and missing users are now served from the cache
+        balance = await bytes_service.get_balance(test_guild_id, test_user_id, use_cache=True)
+        assert balance.balance == 100
+        with pytest.raises(ResourceNotFoundError):
+            await bytes_service.get_balance(test_guild_id, test_user_id_2, use_cache=True)
+        assert mock_api_client.get.call_count == 1
+    
+    async def test_get_balances_chunks_large_requests(
+        self,
+        bytes_service,
+        mock_api_client,
+        test_guild_id
+    ):
+        """Test batch balance retrieval splits requests at the API limit."""
+        user_ids = [str(100000000000000000 + i) for i in range(150)]
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json = Mock(return_value={"guild_id": test_guild_id, "balances": [], "missing": []})
+        mock_api_client.get.return_value = mock_response
+        
+        await bytes_service.get_balances(test_guild_id, user_ids, use_cache=False)
+        
+        chunks = [call.kwargs["params"]["user_ids"].split(",") for call in mock_api_client.get.call_args_list]
+        assert [len(chunk) for chunk in chunks] == [100, 50]
 
 
 class TestBytesServiceDailyClaims:
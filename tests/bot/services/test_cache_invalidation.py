@@ -0,0 +1,100 @@
+"""Tests for evicting bot cache entries on web change events."""
+
+from __future__ import annotations
+
+import json
+
+from smarter_dev.bot.services.cache_invalidation import CacheInvalidationListener, keys_for_change
+from smarter_dev.bot.services.tiered_cache import TieredCache
+from smarter_dev.web.cache_events import CHANGES_CHANNEL, encode_change
+
+
+def change(guild_id, entity):
+    return json.dumps({"guild_id": guild_id, "entity": entity})
+
+
+async def fill(cache, *keys):
+    for key in keys:
+        await cache.set(key, {"key": key}, ttl=600)
+
+
+class TestCacheInvalidationListener:
+    """Test mapping change events onto cache keys."""
+
+    def test_channel_and_message_match_the_web_side(self):
+        from smarter_dev.bot.services import cache_invalidation
+
+        assert cache_invalidation.CHANGES_CHANNEL == CHANGES_CHANNEL
+        assert json.loads(encode_change("1", "squads")) == json.loads(change("1", "squads"))
+
+    async def test_bytes_config_change_evicts_only_that_guild(self):
+        cache = TieredCache()
+        await fill(cache, "bytesservice:config:1", "bytesservice:config:2", "bytesservice:balance:1:u")
+        listener = CacheInvalidationListener(cache)
+
+        await listener.handle_message(change("1", "bytes_config"))
+
+        assert await cache.get("bytesservice:config:1") is None
+        assert await cache.get("bytesservice:config:2") is not None
+        assert await cache.get("bytesservice:balance:1:u") is not None
+
+    async def test_squads_change_evicts_all_squad_keys_for_guild(self):
+        cache = TieredCache()
+        await fill(
+            cache,
+            "squadsservice:squads:1:False",
+            "squadsservice:squad:1:abc",
+            "squadsservice:squad_members:1:abc",
+            "squadsservice:user_squad:1:u",
+            "squadsservice:squads:2:False",
+        )
+        listener = CacheInvalidationListener(cache)
+
+        await listener.handle_message(change("1", "squads"))
+
+        assert await cache.get("squadsservice:squads:1:False") is None
+        assert await cache.get("squadsservice:squad:1:abc") is None
+        assert await cache.get("squadsservice:squad_members:1:abc") is None
+        assert await cache.get("squadsservice:user_squad:1:u") is None
+        assert await cache.get("squadsservice:squads:2:False") is not None
+
+    async def test_sale_change_keeps_memberships(self):
+        cache = TieredCache()
+        await fill(cache, "squadsservice:squads:1:True", "squadsservice:user_squad:1:u")
+        listener = CacheInvalidationListener(cache)
+
+        await listener.handle_message(change("1", "squad_sales"))
+
+        assert await cache.get("squadsservice:squads:1:True") is None
+        assert await cache.get("squadsservice:user_squad:1:u") is not None
+
+    async def test_invalid_and_unknown_events_are_ignored(self):
+        cache = TieredCache()
+        await fill(cache, "bytesservice:config:1")
+        listener = CacheInvalidationListener(cache)
+
+        assert await listener.handle_message("not json") == 0
+        assert await listener.handle_message(json.dumps({"entity": "squads"})) == 0
+        assert await listener.handle_message(change("1", "unknown")) == 0
+        assert await cache.get("bytesservice:config:1") is not None
+
+    async def test_evict_all_clears_every_guild(self):
+        cache = TieredCache()
+        await fill(
+            cache,
+            "bytesservice:config:1",
+            "forumagentservice:forum_agents:2",
+            "squadsservice:squad:3:abc",
+            "bytesservice:balance:1:u",
+        )
+        listener = CacheInvalidationListener(cache)
+
+        await listener.evict_all()
+
+        assert await cache.get("bytesservice:config:1") is None
+        assert await cache.get("forumagentservice:forum_agents:2") is None
+        assert await cache.get("squadsservice:squad:3:abc") is None
+        assert await cache.get("bytesservice:balance:1:u") is not None
+
+    def test_keys_for_unknown_entity(self):
+        assert keys_for_change("1", "unknown") == []
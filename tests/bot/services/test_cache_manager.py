@@ -0,0 +1,204 @@
+"""Tests for the Redis cache manager."""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from smarter_dev.bot.services.cache_manager import (
+    CLEAR_TAG_SCRIPT,
+    FLAG_RAW,
+    FLAG_ZLIB,
+    SET_TAGGED_SCRIPT,
+    CacheManager,
+    SerializationStrategy,
+    msgpack,
+)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.deleted = []
+
+    def delete(self, key):
+        self.deleted.append(key)
+
+    async def execute(self):
+        return [await self.redis.delete(key) for key in self.deleted]
+
+
+class FakeRedis:
+    """Just enough of Redis for the cache manager, scripts included."""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+        self.ttls = {}
+        self.scans = 0
+
+    async def ping(self):
+        return True
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+    async def delete(self, key):
+        existed = key in self.values or key in self.sets
+        self.values.pop(key, None)
+        self.sets.pop(key, None)
+        return int(existed)
+
+    async def scan_iter(self, match, count):
+        import fnmatch
+        self.scans += 1
+        for key in list(self.values):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def register_script(self, script):
+        if script == SET_TAGGED_SCRIPT:
+            async def set_tagged(keys, args):
+                key, tag = keys
+                ttl, value = args
+                await self.setex(key, ttl, value)
+                self.sets.setdefault(tag, set()).add(key)
+                self.ttls[tag] = max(self.ttls.get(tag, -1), int(ttl))
+                return 1
+            return set_tagged
+        if script == CLEAR_TAG_SCRIPT:
+            async def clear_tag(keys, args=None):
+                members = self.sets.pop(keys[0], set())
+                return sum([await self.delete(member) for member in members])
+            return clear_tag
+        raise AssertionError("unexpected script")
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+async def cache():
+    redis = FakeRedis()
+    with patch("smarter_dev.bot.services.cache_manager.redis.from_url", return_value=redis):
+        manager = CacheManager(redis_url="redis://localhost:6379/0")
+        async with manager:
+            yield manager, redis
+
+
+class TestTagInvalidation:
+    """Test clearing per-guild namespaces through tag sets."""
+
+    async def test_guild_namespace_is_cleared_without_scanning(self, cache):
+        manager, redis = cache
+        await manager.set("bytesservice:leaderboard:1:10", [1])
+        await manager.set("bytesservice:leaderboard:1:25", [2])
+        await manager.set("bytesservice:leaderboard:2:10", [3])
+
+        deleted = await manager.clear_pattern("bytesservice:leaderboard:1:*")
+
+        assert deleted == 2
+        assert redis.scans == 0
+        assert await manager.get("bytesservice:leaderboard:1:10") is None
+        assert await manager.get("bytesservice:leaderboard:1:25") is None
+        assert await manager.get("bytesservice:leaderboard:2:10") == [3]
+        assert "bot:tag:bytesservice:leaderboard:1" not in redis.sets
+
+    async def test_tag_set_outlives_its_members(self, cache):
+        manager, redis = cache
+        await manager.set("squadsservice:squad:1:a", {"id": "a"}, ttl=300)
+        await manager.set("squadsservice:squad:1:b", {"__missing__": True}, ttl=30)
+
+        assert redis.ttls["bot:tag:squadsservice:squad:1"] == 300
+
+    async def test_short_keys_are_not_tagged(self, cache):
+        manager, redis = cache
+        await manager.set("bytesservice:config:1", {"daily_amount": 10})
+
+        assert redis.sets == {}
+        assert await manager.get("bytesservice:config:1") == {"daily_amount": 10}
+
+    async def test_other_patterns_fall_back_to_scanning(self, cache):
+        manager, redis = cache
+        await manager.set("bytesservice:config:1", {"daily_amount": 10})
+        await manager.set("squadsservice:squads:2:True", [])
+
+        assert await manager.clear_pattern("bytesservice:config:*") == 1
+        assert await manager.clear_pattern("squadsservice:squads:*:*") == 1
+        assert redis.scans == 2
+        assert await manager.get("squadsservice:squads:2:True") is None
+
+    @pytest.mark.parametrize(
+        "pattern, scope",
+        [
+            ("bytesservice:transactions:1:*", "bytesservice:transactions:1"),
+            ("bytesservice:config:*", None),
+            ("squadsservice:squads:*:*", None),
+            ("bytesservice:balance:1:u", None),
+            ("bytesservice:balance:1:u*", None),
+        ],
+    )
+    def test_pattern_scope(self, pattern, scope):
+        assert CacheManager._pattern_scope(pattern) == scope
+
+
+class TestCompression:
+    """Test transparent compression of large values."""
+
+    async def test_large_values_are_compressed(self, cache):
+        manager, redis = cache
+        value = [{"user_id": str(i), "balance": 100} for i in range(200)]
+
+        await manager.set("bytesservice:leaderboard:1:200", value)
+
+        assert redis.values["bot:bytesservice:leaderboard:1:200"][:1] == FLAG_ZLIB
+        assert await manager.get("bytesservice:leaderboard:1:200") == value
+
+    async def test_small_values_are_stored_raw(self, cache):
+        manager, redis = cache
+        await manager.set("bytesservice:config:1", {"daily_amount": 10})
+
+        assert redis.values["bot:bytesservice:config:1"][:1] == FLAG_RAW
+
+    async def test_values_written_without_a_flag_are_still_read(self, cache):
+        manager, redis = cache
+        redis.values["bot:bytesservice:config:1"] = json.dumps({"daily_amount": 10}).encode()
+
+        assert await manager.get("bytesservice:config:1") == {"daily_amount": 10}
+
+
+@pytest.mark.skipif(msgpack is None, reason="msgpack is not installed")
+class TestMsgpackSerialization:
+    """Test the msgpack serialization strategy."""
+
+    def test_model_types_round_trip(self):
+        value = {
+            "transactions": [
+                {"id": uuid4(), "amount": 10, "created_at": datetime(2024, 1, 15, tzinfo=timezone.utc)},
+                {"id": uuid4(), "amount": 20, "created_at": None},
+            ],
+            "last_daily": date(2024, 1, 15),
+        }
+
+        encoded = SerializationStrategy.serialize_msgpack(value)
+
+        assert SerializationStrategy.deserialize_msgpack(encoded) == value
+
+    def test_lists_of_same_shaped_dicts_are_stored_as_tables(self):
+        rows = [{"user_id": str(i), "balance": i} for i in range(50)]
+
+        encoded = SerializationStrategy.serialize_msgpack(rows)
+
+        assert encoded.count(b"balance") == 1
+        assert SerializationStrategy.deserialize_msgpack(encoded) == rows
@@ -0,0 +1,117 @@
+"""Tests for the daily claim store."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+from smarter_dev.bot.services.daily_claim_store import DailyClaimStore
+
+TODAY = date(2026, 10, 17)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, args))
+
+    async def execute(self):
+        for name, args in self.commands:
+            await getattr(self.redis, name)(*args)
+
+
+class FakeRedis:
+    """Just enough of a set store for the claim store."""
+
+    def __init__(self):
+        self.sets = {}
+        self.expiry = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    async def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    async def expire(self, key, seconds):
+        self.expiry[key] = seconds
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+
+class TestDailyClaimStore:
+    """Test local claim tracking, warming and Redis write-through."""
+
+    async def test_marks_are_local_and_reset_at_midnight(self):
+        store = DailyClaimStore()
+
+        await store.mark_claimed("1", "alice", today=TODAY)
+
+        assert store.has_claimed("1", "alice", today=TODAY)
+        assert not store.has_claimed("2", "alice", today=TODAY)
+        assert not store.has_claimed("1", "alice", today=TODAY + timedelta(days=1))
+        assert len(store) == 0
+
+    async def test_warm_loads_claimers_from_api(self):
+        store = DailyClaimStore()
+        fetch = AsyncMock(side_effect=lambda guild_id: {"1": ["alice", "bob"], "2": []}[guild_id])
+
+        loaded = await store.warm(["1", "2"], fetch, today=TODAY)
+
+        assert loaded == 2
+        assert store.has_claimed("1", "bob", today=TODAY)
+        assert fetch.await_count == 2
+
+    async def test_warm_skips_guilds_that_fail_to_load(self):
+        store = DailyClaimStore()
+        fetch = AsyncMock(side_effect=[RuntimeError("down"), ["carol"]])
+
+        loaded = await store.warm(["1", "2"], fetch, today=TODAY)
+
+        assert loaded == 1
+        assert store.has_claimed("2", "carol", today=TODAY)
+
+    async def test_redis_shares_claims_across_processes(self):
+        redis = FakeRedis()
+        first = DailyClaimStore(redis_client=redis)
+        fetch = AsyncMock(return_value=["alice"])
+
+        await first.warm(["1"], fetch, today=TODAY)
+        await first.mark_claimed("1", "bob", today=TODAY)
+
+        assert redis.sets["daily_claims:2026-10-17:1"] == {"alice", "bob"}
+        assert redis.expiry["daily_claims:2026-10-17:1"] == first.ttl_seconds
+
+        # A restarted process warms from Redis without calling the API
+        second = DailyClaimStore(redis_client=redis)
+        second_fetch = AsyncMock()
+        loaded = await second.warm(["1"], second_fetch, today=TODAY)
+
+        assert loaded == 2
+        assert second.has_claimed("1", "bob", today=TODAY)
+        second_fetch.assert_not_awaited()
+
+    async def test_redis_failure_keeps_local_claim(self):
+        redis = FakeRedis()
+        redis.pipeline = lambda: (_ for _ in ()).throw(ConnectionError("down"))
+        store = DailyClaimStore(redis_client=redis)
+
+        await store.mark_claimed("1", "alice", today=TODAY)
+
+        assert store.has_claimed("1", "alice", today=TODAY)
+
+    async def test_close_releases_redis_client(self):
+        redis = FakeRedis()
+        redis.close = AsyncMock()
+        store = DailyClaimStore(redis_client=redis)
+
+        await store.close()
+        await store.mark_claimed("1", "alice", today=TODAY)
+
+        redis.close.assert_awaited_once()
+        assert not store.has_redis
+        assert store.has_claimed("1", "alice", today=TODAY)
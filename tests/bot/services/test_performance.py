@@ -710,4 +710,62 @@ class TestPerformanceEdgeCases:
         
         # Cleanup
         cleanup_tasks = [service.cleanup() for service in services]
-        await asyncio.gather(*cleanup_tasks)
\ No newline at end of file
+        await asyncio.gather(*cleanup_tasks)
+
+class TestCacheSerializationPerformance:
+    """Compare cached payload size and decode time across serializations."""
+    
+    @staticmethod
+    def transaction_page(count: int = 50) -> dict:
+        return {
+            "transactions": [
+                {
+                    "id": uuid4(),
+                    "guild_id": "123456789012345678",
+                    "giver_id": f"11111111111111111{i % 10}",
+                    "giver_username": f"giver{i % 10}",
+                    "receiver_id": f"22222222222222222{i % 10}",
+                    "receiver_username": f"receiver{i % 10}",
+                    "amount": 10 + i,
+                    "reason": "Thanks for the help" if i % 2 else None,
+                    "created_at": datetime(2024, 1, 15, 12, i % 60, tzinfo=timezone.utc),
+                }
+                for i in range(count)
+            ],
+            "next_cursor": "2024-01-15T12:00:00+00:00|abc",
+        }
+    
+    @staticmethod
+    def measure(manager: CacheManager, value, rounds: int = 200):
+        encoded = manager._encode(value)
+        start_time = time.perf_counter()
+        for _ in range(rounds):
+            manager._decode(encoded)
+        return len(encoded), (time.perf_counter() - start_time) / rounds * 1_000_000
+    
+    def test_compressed_json_is_smaller_than_plain_json(self):
+        page = self.transaction_page()
+        plain = CacheManager("redis://localhost:6379/0", compression_threshold=None)
+        compressed = CacheManager("redis://localhost:6379/0")
+        
+        plain_size, plain_us = self.measure(plain, page)
+        compressed_size, compressed_us = self.measure(compressed, page)
+        
+        assert compressed_size < plain_size / 2
+        print(f"json: {plain_size} bytes, {plain_us:.0f}us decode")
+        print(f"json+zlib: {compressed_size} bytes, {compressed_us:.0f}us decode")
+    
+    def test_msgpack_against_json(self):
+        pytest.importorskip("msgpack")
+        page = self.transaction_page()
+        json_manager = CacheManager("redis://localhost:6379/0", compression_threshold=None)
+        msgpack_manager = CacheManager(
+            "redis://localhost:6379/0", serialization="msgpack", compression_threshold=None
+        )
+        
+        json_size, json_us = self.measure(json_manager, page)
+        msgpack_size, msgpack_us = self.measure(msgpack_manager, page)
+        
+        assert msgpack_size < json_size
+        print(f"json: {json_size} bytes, {json_us:.0f}us decode")
+        print(f"msgpack: {msgpack_size} bytes, {msgpack_us:.0f}us decode")
@@ -0,0 +1,221 @@
+"""Tests for client-side pacing of API requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from smarter_dev.bot.services.api_client import APIClient, RetryConfig
+from smarter_dev.bot.services.exceptions import RateLimitError
+from smarter_dev.bot.services.rate_scheduler import (
+    Priority,
+    RateLimitScheduler,
+    current_priority,
+    request_priority,
+)
+
+
+def headers(second, minute=100, fifteen=1000, limits=(10, 180, 2500)):
+    return {
+        "x-ratelimit-limit-second": str(limits[0]),
+        "x-ratelimit-remaining-second": str(second),
+        "x-ratelimit-limit-minute": str(limits[1]),
+        "x-ratelimit-remaining-minute": str(minute),
+        "x-ratelimit-limit-15min": str(limits[2]),
+        "x-ratelimit-remaining-15min": str(fifteen),
+    }
+
+
+class TestRateLimitScheduler:
+    """Test token bucket pacing and priorities."""
+
+    async def test_requests_within_budget_do_not_wait(self):
+        scheduler = RateLimitScheduler(windows=(("second", 1.0, 5),))
+
+        tickets = [await scheduler.acquire() for _ in range(5)]
+
+        assert tickets == [1, 2, 3, 4, 5]
+        assert scheduler.queued == 0
+
+    async def test_requests_over_budget_are_paced(self):
+        scheduler = RateLimitScheduler(windows=(("second", 0.1, 2),))
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        for _ in range(4):
+            await scheduler.acquire()
+
+        # Two extra tokens at 20/s
+        assert loop.time() - start >= 0.09
+        assert scheduler.queued == 2
+
+    async def test_interactive_requests_jump_the_queue(self):
+        scheduler = RateLimitScheduler(windows=(("second", 0.05, 1),))
+        await scheduler.acquire()
+        order = []
+
+        async def request(name, priority):
+            await scheduler.acquire(priority)
+            order.append(name)
+
+        background = asyncio.create_task(request("background", Priority.BACKGROUND))
+        normal = asyncio.create_task(request("normal", Priority.NORMAL))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(request("interactive", Priority.INTERACTIVE))
+        await asyncio.gather(background, normal, interactive)
+
+        assert order == ["interactive", "normal", "background"]
+
+    async def test_background_leaves_a_reserve(self):
+        scheduler = RateLimitScheduler(
+            windows=(("second", 1.0, 100), ("minute", 60.0, 10)),
+            background_reserve=0.5
+        )
+        for _ in range(5):
+            await scheduler.acquire(Priority.BACKGROUND)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(scheduler.acquire(Priority.BACKGROUND), timeout=0.05)
+        await asyncio.wait_for(scheduler.acquire(Priority.INTERACTIVE), timeout=0.05)
+        scheduler.close()
+
+    async def test_headers_correct_budget_for_requests_in_flight(self):
+        scheduler = RateLimitScheduler()
+        first = await scheduler.acquire()
+        await scheduler.acquire()
+        await scheduler.acquire()
+
+        scheduler.update(headers(second=3), first)
+
+        # Server saw the first request with 3 left; two more went out since
+        assert scheduler.get_stats()["budget"]["second"] == 1
+
+    async def test_headers_raise_budget_when_server_has_more(self):
+        scheduler = RateLimitScheduler(windows=(("second", 1.0, 2),))
+        await scheduler.acquire()
+        ticket = await scheduler.acquire()
+
+        scheduler.update(headers(second=20, limits=(25, 180, 2500)), ticket)
+
+        assert scheduler.get_stats()["budget"]["second"] == 20
+
+    async def test_exhausted_window_waits_for_reset(self):
+        scheduler = RateLimitScheduler(windows=(("second", 0.2, 2),))
+        await scheduler.acquire()
+        ticket = await scheduler.acquire()
+        reset = int(time.time())
+
+        scheduler.update({
+            "x-ratelimit-limit-second": "2",
+            "x-ratelimit-remaining-second": "0",
+            "x-ratelimit-reset-second": str(reset),
+        }, ticket)
+
+        # No trickle of tokens before the reset, then the whole window back
+        await asyncio.sleep(0.15)
+        assert scheduler.get_stats()["budget"]["second"] == 0
+        await asyncio.sleep(0.1)
+        assert scheduler.get_stats()["budget"]["second"] == 2
+
+    async def test_throttle_pauses_requests(self):
+        scheduler = RateLimitScheduler()
+        scheduler.throttle(0.05)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        await scheduler.acquire(Priority.INTERACTIVE)
+
+        assert loop.time() - start >= 0.04
+        assert scheduler.throttled == 1
+
+    async def test_cancelled_waiters_are_skipped(self):
+        scheduler = RateLimitScheduler(windows=(("second", 0.05, 1),))
+        await scheduler.acquire()
+
+        waiter = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        assert await asyncio.wait_for(scheduler.acquire(), timeout=1) == 2
+
+    async def test_priority_context(self):
+        assert current_priority() == Priority.NORMAL
+        with request_priority(Priority.BACKGROUND):
+            assert current_priority() == Priority.BACKGROUND
+            assert await asyncio.create_task(asyncio.sleep(0, current_priority())) == Priority.BACKGROUND
+        assert current_priority() == Priority.NORMAL
+
+
+class TestAPIClientPacing:
+    """Test the API client feeding response headers into the scheduler."""
+
+    async def test_response_headers_update_budget(self):
+        scheduler = RateLimitScheduler()
+        api = APIClient("http://api.test", "sk-" + "a" * 43, rate_limiter=scheduler)
+        await api._ensure_client()
+        api._client.request = AsyncMock(return_value=httpx.Response(200, headers=headers(second=4)))
+
+        await api.get("/health")
+
+        assert scheduler.get_stats()["budget"]["second"] == 4
+        await api.close()
+
+    async def test_429_pauses_later_requests(self):
+        scheduler = RateLimitScheduler()
+        api = APIClient(
+            "http://api.test", "sk-" + "a" * 43,
+            retry_config=RetryConfig(max_retries=0),
+            rate_limiter=scheduler
+        )
+        await api._ensure_client()
+        api._client.request = AsyncMock(return_value=httpx.Response(
+            429, json={"detail": "slow down"}, headers={"retry-after": "30", **headers(second=0)}
+        ))
+
+        with pytest.raises(RateLimitError):
+            await api.get("/health")
+
+        assert scheduler.throttled == 1
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(scheduler.acquire(Priority.INTERACTIVE), timeout=0.05)
+        await api.close()
+
+    async def test_no_429s_from_sliding_log_server(self):
+        duration, limit = 0.3, 3
+        log = []
+        statuses = []
+
+        async def sliding_log_server(method, url, **kwargs):
+            now = time.time()
+            log[:] = [sent for sent in log if sent > now - duration]
+            if len(log) >= limit:
+                status = 429
+            else:
+                log.append(now)
+                status = 200
+            statuses.append(status)
+            return httpx.Response(status, json={}, headers={
+                "retry-after": "1",
+                "x-ratelimit-limit-second": str(limit),
+                "x-ratelimit-remaining-second": str(limit - len(log)),
+                "x-ratelimit-reset-second": str(int(now + duration)),
+            })
+
+        scheduler = RateLimitScheduler(windows=(("second", duration, limit),))
+        api = APIClient(
+            "http://api.test", "sk-" + "a" * 43,
+            retry_config=RetryConfig(max_retries=0),
+            rate_limiter=scheduler
+        )
+        await api._ensure_client()
+        api._client.request = sliding_log_server
+
+        for _ in range(3 * limit):
+            await api.get("/health")
+
+        assert statuses == [200] * (3 * limit)
+        await api.close()
@@ -0,0 +1,226 @@
+"""Tests for the two-tier bot service cache."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from smarter_dev.bot.services.base import MISSING
+from smarter_dev.bot.services.bytes_service import BytesService
+from smarter_dev.bot.services.exceptions import ResourceNotFoundError
+from smarter_dev.bot.services.tiered_cache import TieredCache
+
+
+class FakeRemote:
+    """Dict-backed stand-in for the Redis cache manager."""
+
+    def __init__(self):
+        self.values = {}
+        self.get = AsyncMock(side_effect=self._get)
+        self.set = AsyncMock(side_effect=self._set)
+
+    async def _get(self, key):
+        return self.values.get(key)
+
+    async def _set(self, key, value, ttl=None):
+        self.values[key] = value
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def clear_pattern(self, pattern):
+        matching = [key for key in self.values if key.startswith(pattern.rstrip("*"))]
+        for key in matching:
+            del self.values[key]
+        return len(matching)
+
+
+def response(status_code, data):
+    return Mock(status_code=status_code, json=Mock(return_value=data))
+
+
+class TestTieredCache:
+    """Test the LRU tier, the shared tier and coalescing."""
+
+    async def test_local_hit_skips_remote(self):
+        remote = FakeRemote()
+        cache = TieredCache(remote=remote)
+
+        await cache.set("bytesservice:leaderboard:1", [1, 2])
+
+        assert await cache.get("bytesservice:leaderboard:1") == [1, 2]
+        remote.get.assert_not_awaited()
+        assert remote.values["bytesservice:leaderboard:1"] == [1, 2]
+
+    async def test_remote_hit_fills_local_tier(self):
+        remote = FakeRemote()
+        remote.values["squadsservice:squads:1:False"] = ["alpha"]
+        cache = TieredCache(remote=remote)
+
+        assert await cache.get("squadsservice:squads:1:False") == ["alpha"]
+        assert await cache.get("squadsservice:squads:1:False") == ["alpha"]
+
+        assert remote.get.await_count == 1
+        stats = await cache.get_stats()
+        assert stats["local_hits"] == 1
+        assert stats["remote_hits"] == 1
+        assert stats["hit_rate"] == 1.0
+
+    async def test_lru_evicts_least_recently_used(self):
+        cache = TieredCache(max_entries=2)
+
+        await cache.set("a:x:1", 1)
+        await cache.set("a:x:2", 2)
+        await cache.get("a:x:1")
+        await cache.set("a:x:3", 3)
+
+        assert await cache.get("a:x:2") is None
+        assert await cache.get("a:x:1") == 1
+        assert (await cache.get_stats())["evictions"] == 1
+
+    async def test_namespace_ttl_caps_local_lifetime(self):
+        cache = TieredCache(local_ttls={"balance": 5})
+
+        with patch("smarter_dev.bot.services.tiered_cache.time.monotonic", return_value=100.0):
+            await cache.set("bytesservice:balance:1:2", {"balance": 1}, ttl=300)
+            await cache.set("bytesservice:config:1", {"daily_amount": 10}, ttl=300)
+        with patch("smarter_dev.bot.services.tiered_cache.time.monotonic", return_value=106.0):
+            assert await cache.get("bytesservice:balance:1:2") is None
+            assert await cache.get("bytesservice:config:1") == {"daily_amount": 10}
+
+    async def test_clear_pattern_clears_both_tiers(self):
+        remote = FakeRemote()
+        cache = TieredCache(remote=remote)
+        await cache.set("bytesservice:leaderboard:1:10", [1])
+        await cache.set("bytesservice:leaderboard:2:10", [2])
+
+        await cache.clear_pattern("bytesservice:leaderboard:1:*")
+
+        assert "bytesservice:leaderboard:1:10" not in remote.values
+        assert await cache.get("bytesservice:leaderboard:1:10") is None
+        assert await cache.get("bytesservice:leaderboard:2:10") == [2]
+
+    async def test_remote_failure_falls_back_to_local(self):
+        remote = FakeRemote()
+        remote.set.side_effect = ConnectionError("down")
+        remote.get.side_effect = ConnectionError("down")
+        cache = TieredCache(remote=remote)
+
+        await cache.set("a:x:1", 1)
+
+        assert await cache.get("a:x:1") == 1
+        assert await cache.get("a:x:2") is None
+        assert (await cache.get_stats())["remote_errors"] == 2
+
+    async def test_remote_delete_failure_still_evicts_locally(self):
+        remote = FakeRemote()
+        remote.delete = AsyncMock(side_effect=ConnectionError("down"))
+        cache = TieredCache(remote=remote)
+        await cache.set("a:x:1", 1)
+
+        await cache.delete("a:x:1")
+
+        assert "a:x:1" not in cache._entries
+        assert (await cache.get_stats())["remote_errors"] == 1
+
+    async def test_concurrent_loads_are_coalesced(self):
+        cache = TieredCache()
+        release = asyncio.Event()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "value"
+
+        tasks = [asyncio.create_task(cache.coalesce("k", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["value"] * 5
+        assert calls == 1
+        assert (await cache.get_stats())["coalesced_requests"] == 4
+
+    async def test_coalesced_failure_reaches_every_caller(self):
+        cache = TieredCache()
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            raise RuntimeError("boom")
+
+        tasks = [asyncio.create_task(cache.coalesce("k", loader)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def test_cancelling_the_first_caller_keeps_the_load(self):
+        cache = TieredCache()
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            return "value"
+
+        first = asyncio.create_task(cache.coalesce("k", loader))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.coalesce("k", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "value"
+        assert first.cancelled()
+        assert cache._inflight == {}
+
+
+class TestServiceCaching:
+    """Test services running on the tiered cache."""
+
+    @pytest.fixture
+    async def service(self):
+        api_client = Mock()
+        api_client.get = AsyncMock()
+        service = BytesService(api_client, TieredCache())
+        await service.initialize()
+        return service
+
+    async def test_concurrent_leaderboard_reads_make_one_request(self, service):
+        release = asyncio.Event()
+
+        async def slow_get(*args, **kwargs):
+            await release.wait()
+            return response(200, {"users": [{"user_id": "1", "balance": 5}]})
+
+        service._api_client.get.side_effect = slow_get
+
+        tasks = [asyncio.create_task(service.get_leaderboard("123", 10)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert [len(entries) for entries in results] == [1, 1, 1]
+        assert service._api_client.get.await_count == 1
+
+        await service.get_leaderboard("123", 10)
+        assert service._api_client.get.await_count == 1
+
+        stats = await service.get_service_stats()
+        assert stats["cache"]["coalesced_requests"] == 2
+        assert stats["cache"]["local_hits"] == 1
+
+    async def test_missing_balance_is_negatively_cached(self, service):
+        service._api_client.get.return_value = response(404, {"detail": "not found"})
+
+        for _ in range(2):
+            with pytest.raises(ResourceNotFoundError):
+                await service.get_balance("123456789012345678", "223456789012345678", use_cache=True)
+
+        assert service._api_client.get.await_count == 1
+        key = service._build_cache_key("balance", "123456789012345678", "223456789012345678")
+        assert await service._cache_manager.get(key) == MISSING
@@ -16,6 +16,7 @@ from smarter_dev.bot.services.models import (
     DailyClaimResult, 
     TransferResult,
     BytesTransaction,
+    TransactionPage,
     Squad,
     UserSquadResponse,
     JoinSquadResult
@@ -272,7 +273,10 @@ class TestBytesCommands:
                 created_at=datetime.now()
             )
         ]
-        mock_bytes_service.get_transaction_history.return_value = transactions
+        mock_bytes_service.get_transaction_page.return_value = TransactionPage(
+            transactions=transactions,
+            next_cursor="1760700000000000_" + "0" * 32
+        )
         
         # Setup context with proper service structure  
         mock_context.bot = Mock()
@@ -290,7 +294,7 @@ class TestBytesCommands:
         await history_command(mock_context)
         
         # Verify service call
-        mock_bytes_service.get_transaction_history.assert_called_once_with(
+        mock_bytes_service.get_transaction_page.assert_called_once_with(
             "123456789", user_id="987654321", limit=10
         )
         
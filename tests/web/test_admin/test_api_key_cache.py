@@ -0,0 +1,134 @@
+"""Tests for the verified API key cache."""
+
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from smarter_dev.web.api_key_cache import APIKeyCache, APIKeySnapshot
+
+
+def make_api_key(**overrides):
+    """Create an API key stand-in with the fields the snapshot copies."""
+    api_key = Mock()
+    api_key.id = uuid4()
+    api_key.name = "Bot Key"
+    api_key.key_prefix = "sk-abc123de"
+    api_key.scopes = ["bytes:read", "bytes:write"]
+    api_key.is_active = True
+    api_key.expires_at = None
+    api_key.created_by = "admin"
+    api_key.usage_count = 3
+    api_key.rate_limit_per_second = 10
+    api_key.rate_limit_per_minute = 180
+    api_key.rate_limit_per_15_minutes = 2500
+    api_key.rate_limit_per_hour = 10000
+    for field, value in overrides.items():
+        setattr(api_key, field, value)
+    return api_key
+
+
+class TestAPIKeySnapshot:
+    """Test immutable API key snapshots."""
+
+    def test_snapshot_copies_fields(self):
+        api_key = make_api_key()
+        snapshot = APIKeySnapshot.from_model(api_key)
+
+        assert snapshot.id == api_key.id
+        assert snapshot.scopes == ("bytes:read", "bytes:write")
+        assert snapshot.rate_limit_per_minute == 180
+        assert snapshot.is_valid
+
+    def test_snapshot_is_immutable(self):
+        snapshot = APIKeySnapshot.from_model(make_api_key())
+
+        with pytest.raises(AttributeError):
+            snapshot.is_active = False
+
+    def test_snapshot_expiry(self):
+        past = datetime.now(timezone.utc) - timedelta(minutes=1)
+        snapshot = APIKeySnapshot.from_model(make_api_key(expires_at=past))
+
+        assert snapshot.is_expired
+        assert not snapshot.is_valid
+
+
+class TestAPIKeyCache:
+    """Test cache lookups, eviction and invalidation."""
+
+    def test_hit_and_miss_counters(self):
+        cache = APIKeyCache(ttl_seconds=60, max_size=10, pubsub_enabled=False)
+
+        assert cache.get("hash") is None
+        cache.set("hash", make_api_key())
+        assert cache.get("hash") is not None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_entries_expire_after_ttl(self):
+        cache = APIKeyCache(ttl_seconds=60, max_size=10, pubsub_enabled=False)
+        cache.set("hash", make_api_key())
+
+        with patch("smarter_dev.web.api_key_cache.time.monotonic", return_value=10**12):
+            assert cache.get("hash") is None
+
+    def test_expired_keys_are_not_served(self):
+        cache = APIKeyCache(ttl_seconds=60, max_size=10, pubsub_enabled=False)
+        past = datetime.now(timezone.utc) - timedelta(seconds=1)
+        cache.set("hash", make_api_key(expires_at=past))
+
+        assert cache.get("hash") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = APIKeyCache(ttl_seconds=60, max_size=2, pubsub_enabled=False)
+        cache.set("first", make_api_key())
+        cache.set("second", make_api_key())
+        cache.get("first")
+        cache.set("third", make_api_key())
+
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_zero_ttl_disables_cache(self):
+        cache = APIKeyCache(ttl_seconds=0, max_size=10, pubsub_enabled=False)
+        snapshot = cache.set("hash", make_api_key())
+
+        assert isinstance(snapshot, APIKeySnapshot)
+        assert cache.get("hash") is None
+
+    async def test_invalidate_removes_entries_by_key_id(self):
+        cache = APIKeyCache(ttl_seconds=60, max_size=10, pubsub_enabled=False)
+        api_key = make_api_key()
+        other_key = make_api_key()
+        cache.set("hash", api_key)
+        cache.set("other", other_key)
+
+        await cache.invalidate(api_key.id)
+
+        assert cache.get("hash") is None
+        assert cache.get("other") is not None
+
+    async def test_invalidate_publishes_to_other_replicas(self):
+        cache = APIKeyCache(ttl_seconds=60, max_size=10, pubsub_enabled=True)
+        redis_client = Mock()
+        redis_client.publish = AsyncMock(return_value=1)
+        key_id = uuid4()
+
+        with patch("smarter_dev.shared.redis_client.get_redis_client", return_value=redis_client):
+            await cache.invalidate(key_id)
+
+        redis_client.publish.assert_awaited_once_with("api_keys:invalidate", str(key_id))
+
+    async def test_publish_failure_does_not_raise(self):
+        cache = APIKeyCache(ttl_seconds=60, max_size=10, pubsub_enabled=True)
+        redis_client = Mock()
+        redis_client.publish = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        with patch("smarter_dev.shared.redis_client.get_redis_client", return_value=redis_client):
+            await cache.invalidate(uuid4())
@@ -0,0 +1,97 @@
+"""Tests for cache change events published by the web app."""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from smarter_dev.web import cache_events as cache_events_module
+from smarter_dev.web.cache_events import (
+    BYTES_CONFIG,
+    CHANGES_CHANNEL,
+    SQUADS,
+    ChangePublisher,
+    record_change,
+)
+
+
+class TestCommitHooks:
+    """Test that changes are published only after commit."""
+
+    @pytest.fixture
+    async def session(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with AsyncSession(engine) as session:
+            yield session
+        await engine.dispose()
+
+    async def test_changes_are_published_after_commit(self, session):
+        publisher = Mock()
+        with patch.object(cache_events_module, "get_change_publisher", return_value=publisher):
+            await session.connection()
+            record_change(session, "guild", SQUADS)
+            record_change(session, "guild", SQUADS)
+            record_change(session, "guild", BYTES_CONFIG)
+            publisher.schedule.assert_not_called()
+            await session.commit()
+
+        publisher.schedule.assert_called_once_with({("guild", SQUADS), ("guild", BYTES_CONFIG)})
+
+    async def test_changes_are_discarded_on_rollback(self, session):
+        publisher = Mock()
+        with patch.object(cache_events_module, "get_change_publisher", return_value=publisher):
+            await session.connection()
+            record_change(session, "guild", SQUADS)
+            await session.rollback()
+            await session.connection()
+            await session.commit()
+
+        publisher.schedule.assert_not_called()
+
+    async def test_savepoints_publish_with_the_outer_commit(self, session):
+        publisher = Mock()
+        with patch.object(cache_events_module, "get_change_publisher", return_value=publisher):
+            await session.connection()
+            async with session.begin_nested():
+                record_change(session, "guild", SQUADS)
+            # Releasing a savepoint is not the commit
+            publisher.schedule.assert_not_called()
+            with pytest.raises(ValueError):
+                async with session.begin_nested():
+                    record_change(session, "other", SQUADS)
+                    raise ValueError
+            await session.commit()
+
+        publisher.schedule.assert_called_once_with({("guild", SQUADS)})
+
+
+class TestChangePublisher:
+    """Test publishing change events to Redis."""
+
+    async def test_publishes_one_message_per_change(self):
+        redis = Mock(publish=AsyncMock())
+        publisher = ChangePublisher(redis_client=redis)
+
+        await publisher.publish([("1", BYTES_CONFIG), ("2", SQUADS)])
+
+        messages = [call.args for call in redis.publish.await_args_list]
+        assert [channel for channel, _ in messages] == [CHANGES_CHANNEL, CHANGES_CHANNEL]
+        assert json.loads(messages[0][1]) == {"guild_id": "1", "entity": BYTES_CONFIG}
+        assert json.loads(messages[1][1]) == {"guild_id": "2", "entity": SQUADS}
+
+    async def test_publish_failures_are_swallowed(self):
+        redis = Mock(publish=AsyncMock(side_effect=ConnectionError("down")))
+        publisher = ChangePublisher(redis_client=redis)
+
+        await publisher.publish([("1", SQUADS), ("2", SQUADS)])
+
+        assert redis.publish.await_count == 2
+
+    def test_disabled_publisher_schedules_nothing(self):
+        redis = Mock(publish=AsyncMock())
+        publisher = ChangePublisher(redis_client=redis, enabled=False)
+
+        publisher.schedule({("1", SQUADS)})
+
+        redis.publish.assert_not_called()
@@ -0,0 +1,57 @@
+"""Tests for work queued on a session until it commits."""
+
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from smarter_dev.web.commit_queue import CommitQueue
+
+flushed = Mock()
+queue = CommitQueue("test_commit_queue", list, flushed)
+
+
+@pytest.fixture
+async def session():
+    flushed.reset_mock()
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+async def test_flushed_once_after_commit(session):
+    await session.connection()
+    queue.pending(session).extend([1, 2])
+    flushed.assert_not_called()
+
+    await session.commit()
+    await session.connection()
+    await session.commit()
+
+    flushed.assert_called_once_with([1, 2])
+
+
+async def test_nested_savepoint_rollback_keeps_outer_items(session):
+    await session.connection()
+    async with session.begin_nested():
+        queue.pending(session).append(1)
+        with pytest.raises(ValueError):
+            async with session.begin_nested():
+                queue.pending(session).append(2)
+                raise ValueError
+        queue.pending(session).append(3)
+    await session.commit()
+
+    flushed.assert_called_once_with([1, 3])
+
+
+async def test_rollback_discards_everything(session):
+    await session.connection()
+    async with session.begin_nested():
+        queue.pending(session).append(1)
+    await session.rollback()
+    await session.connection()
+    await session.commit()
+
+    flushed.assert_not_called()
@@ -0,0 +1,177 @@
+"""Tests for the Redis-backed guild leaderboard."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from smarter_dev.web import leaderboard as leaderboard_module
+from smarter_dev.web.crud import BytesOperations
+from smarter_dev.web.leaderboard import LOADED_MARKER, Leaderboard, record_balance
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        for name, args, kwargs in self.commands:
+            await getattr(self.redis, name)(*args, **kwargs)
+
+
+class FakeRedis:
+    """Just enough of a sorted set store for the leaderboard."""
+
+    def __init__(self):
+        self.sets = {}
+
+    async def delete(self, key):
+        self.sets.pop(key, None)
+
+    async def zadd(self, key, mapping):
+        self.sets.setdefault(key, {}).update({member: float(score) for member, score in mapping.items()})
+
+    async def expire(self, key, seconds):
+        pass
+
+    async def zscore(self, key, member):
+        return self.sets.get(key, {}).get(member)
+
+    def _ordered(self, key):
+        return sorted(self.sets.get(key, {}).items(), key=lambda item: (-item[1], item[0]))
+
+    async def zrevrangebyscore(self, key, max, min, start, num, withscores):
+        entries = [(member, score) for member, score in self._ordered(key) if score != float("-inf")]
+        return entries[start:start + num]
+
+    async def zrevrank(self, key, member):
+        members = [m for m, _ in self._ordered(key)]
+        return members.index(member) if member in members else None
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def register_script(self, script):
+        async def run(keys, args):
+            if await self.zscore(keys[0], args[0]) is None:
+                return 0
+            pairs = args[1:]
+            await self.zadd(keys[0], dict(zip(pairs[::2], pairs[1::2])))
+            return 1
+        return run
+
+
+def make_session(rows):
+    session = AsyncMock()
+    session.execute.return_value = Mock(all=Mock(return_value=rows))
+    return session
+
+
+class TestLeaderboard:
+    """Test ranking, loading and updates."""
+
+    async def test_top_and_rank_rebuild_from_database(self):
+        board = Leaderboard(redis_client=FakeRedis())
+        session = make_session([("alice", 300), ("bob", 500), ("carol", 100)])
+
+        assert await board.top(session, "guild", limit=2) == [("bob", 500), ("alice", 300)]
+        assert await board.rank(session, "guild", "carol") == 3
+        assert await board.rank(session, "guild", "nobody") is None
+        # The second read used the loaded set
+        assert session.execute.await_count == 1
+
+    async def test_updates_apply_only_to_loaded_sets(self):
+        redis = FakeRedis()
+        board = Leaderboard(redis_client=redis)
+
+        await board.apply({("guild", "alice"): 50})
+        assert "leaderboard:guild" not in redis.sets
+
+        await board.rebuild(make_session([("alice", 50), ("bob", 20)]), "guild")
+        await board.apply({("guild", "bob"): 90})
+
+        assert await board.rank(make_session([]), "guild", "bob") == 1
+        assert LOADED_MARKER in redis.sets["leaderboard:guild"]
+
+    async def test_failed_update_drops_the_set(self):
+        redis = Mock()
+        redis.register_script.return_value = AsyncMock(side_effect=ConnectionError("redis down"))
+        redis.delete = AsyncMock()
+        board = Leaderboard(redis_client=redis)
+
+        await board.apply({("guild", "alice"): 50})
+
+        redis.delete.assert_awaited_once_with("leaderboard:guild")
+
+
+class TestCommitHooks:
+    """Test that balances reach the leaderboard only after commit."""
+
+    @pytest.fixture
+    async def session(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with AsyncSession(engine) as session:
+            yield session
+        await engine.dispose()
+
+    async def test_balances_are_published_after_commit(self, session):
+        board = Mock()
+        with patch.object(leaderboard_module, "get_leaderboard", return_value=board):
+            await session.connection()
+            record_balance(session, "guild", "alice", 70)
+            board.schedule.assert_not_called()
+            await session.commit()
+
+        board.schedule.assert_called_once_with({("guild", "alice"): 70})
+
+    async def test_balances_are_discarded_on_rollback(self, session):
+        board = Mock()
+        with patch.object(leaderboard_module, "get_leaderboard", return_value=board):
+            await session.connection()
+            record_balance(session, "guild", "alice", 70)
+            await session.rollback()
+            await session.connection()
+            await session.commit()
+
+        board.schedule.assert_not_called()
+
+    async def test_savepoints_publish_with_the_outer_commit(self, session):
+        board = Mock()
+        with patch.object(leaderboard_module, "get_leaderboard", return_value=board):
+            await session.connection()
+            async with session.begin_nested():
+                record_balance(session, "guild", "alice", 70)
+            # Releasing a savepoint is not the commit
+            board.schedule.assert_not_called()
+            with pytest.raises(ValueError):
+                async with session.begin_nested():
+                    record_balance(session, "guild", "bob", 30)
+                    raise ValueError
+            await session.commit()
+
+        board.schedule.assert_called_once_with({("guild", "alice"): 70})
+
+
+class TestRankFallback:
+    """Test the database fallback when Redis is unavailable."""
+
+    async def test_rank_counts_higher_balances(self):
+        board = Mock(enabled=True)
+        board.rank = AsyncMock(side_effect=ConnectionError("redis down"))
+        session = AsyncMock()
+        session.scalar.side_effect = [250, 4]
+
+        with patch("smarter_dev.web.crud.get_leaderboard", return_value=board):
+            rank = await BytesOperations().get_rank(session, "guild", "alice")
+
+        assert rank == 5
@@ -0,0 +1,180 @@
+"""Tests for the pluggable multi-tier rate limit counter backends."""
+
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, Response
+
+from smarter_dev.shared.config import override_settings
+from smarter_dev.web.multi_tier_rate_limiter import (
+    DatabaseRateLimitBackend,
+    InMemoryRateLimitBackend,
+    MultiTierRateLimiter,
+    RateLimitWindow,
+    RedisRateLimitBackend,
+    create_rate_limit_backend,
+)
+
+
+def make_api_key(per_second=3, per_minute=5, per_15_minutes=8):
+    """Create a minimal API key stand-in with multi-tier limits."""
+    api_key = Mock()
+    api_key.id = uuid4()
+    api_key.key_prefix = "sk-test"
+    api_key.created_by = "tester"
+    api_key.rate_limit_per_second = per_second
+    api_key.rate_limit_per_minute = per_minute
+    api_key.rate_limit_per_15_minutes = per_15_minutes
+    return api_key
+
+
+def make_windows(api_key):
+    return [
+        RateLimitWindow("second", 1, api_key.rate_limit_per_second, "second"),
+        RateLimitWindow("minute", 60, api_key.rate_limit_per_minute, "minute"),
+        RateLimitWindow("15min", 900, api_key.rate_limit_per_15_minutes, "15min"),
+    ]
+
+
+class TestInMemoryRateLimitBackend:
+    """Test the in-process sliding log backend."""
+
+    async def test_counts_accumulate_per_window(self):
+        backend = InMemoryRateLimitBackend()
+        api_key = make_api_key()
+        windows = make_windows(api_key)
+        now = datetime.now(timezone.utc)
+
+        assert await backend.hit(api_key, windows, now, None, None) == [0, 0, 0]
+        assert await backend.hit(api_key, windows, now, None, None) == [1, 1, 1]
+
+    async def test_rejected_request_is_not_recorded(self):
+        backend = InMemoryRateLimitBackend()
+        api_key = make_api_key(per_second=2)
+        windows = make_windows(api_key)
+        now = datetime.now(timezone.utc)
+
+        await backend.hit(api_key, windows, now, None, None)
+        await backend.hit(api_key, windows, now, None, None)
+
+        # Second window is full; the check stops there and nothing is recorded
+        assert await backend.hit(api_key, windows, now, None, None) == [2]
+        assert await backend.hit(api_key, windows, now, None, None) == [2]
+
+    async def test_old_requests_slide_out_of_window(self):
+        backend = InMemoryRateLimitBackend()
+        api_key = make_api_key(per_second=1)
+        windows = make_windows(api_key)
+        now = datetime.now(timezone.utc)
+
+        await backend.hit(api_key, windows, now, None, None)
+        later = now + timedelta(seconds=2)
+
+        assert await backend.hit(api_key, windows, later, None, None) == [0, 1, 1]
+
+    async def test_keys_are_tracked_independently(self):
+        backend = InMemoryRateLimitBackend()
+        first, second = make_api_key(), make_api_key()
+        now = datetime.now(timezone.utc)
+
+        await backend.hit(first, make_windows(first), now, None, None)
+
+        assert await backend.hit(second, make_windows(second), now, None, None) == [0, 0, 0]
+
+
+class TestRedisRateLimitBackend:
+    """Test the Redis sliding log backend without a live server."""
+
+    async def test_single_script_call_per_request(self):
+        script = AsyncMock(return_value=[1, 4, 7])
+        redis_client = Mock()
+        redis_client.register_script.return_value = script
+        backend = RedisRateLimitBackend(redis_client)
+        api_key = make_api_key()
+
+        counts = await backend.hit(
+            api_key, make_windows(api_key), datetime.now(timezone.utc), None, None
+        )
+
+        assert counts == [1, 4, 7]
+        script.assert_awaited_once()
+        kwargs = script.await_args.kwargs
+        assert kwargs["keys"] == [f"ratelimit:{api_key.id}"]
+        # now, member, longest window, then (duration, limit) per window
+        assert kwargs["args"][2] == 900
+        assert kwargs["args"][3:] == [1, 3, 60, 5, 900, 8]
+
+    async def test_falls_back_to_local_counters_on_redis_error(self):
+        script = AsyncMock(side_effect=ConnectionError("redis down"))
+        redis_client = Mock()
+        redis_client.register_script.return_value = script
+        backend = RedisRateLimitBackend(redis_client)
+        api_key = make_api_key()
+        now = datetime.now(timezone.utc)
+
+        assert await backend.hit(api_key, make_windows(api_key), now, None, None) == [0, 0, 0]
+        assert await backend.hit(api_key, make_windows(api_key), now, None, None) == [1, 1, 1]
+
+
+class TestMultiTierRateLimiterBackends:
+    """Test that the limiter keeps its headers and escalation with any backend."""
+
+    async def test_allowed_request_sets_per_window_headers(self):
+        limiter = MultiTierRateLimiter(backend=InMemoryRateLimitBackend())
+        api_key = make_api_key()
+        response = Response()
+
+        await limiter.check_rate_limits(api_key, None, Mock(), response)
+
+        assert response.headers["x-ratelimit-limit-second"] == "3"
+        assert response.headers["x-ratelimit-remaining-second"] == "3"
+        assert response.headers["x-ratelimit-remaining-minute"] == "5"
+        assert response.headers["x-ratelimit-remaining-15min"] == "8"
+
+    async def test_exceeded_second_window_escalates_to_minute(self):
+        limiter = MultiTierRateLimiter(backend=InMemoryRateLimitBackend())
+        limiter._log_rate_limit_violation = AsyncMock()
+        api_key = make_api_key(per_second=2)
+
+        for _ in range(2):
+            await limiter.check_rate_limits(api_key, None, Mock(), Response())
+
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.check_rate_limits(api_key, None, Mock(), Response())
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers["retry-after"] == "60"
+        assert "2 requests per second" in exc_info.value.detail
+        limiter._log_rate_limit_violation.assert_awaited_once()
+
+    async def test_database_backend_logs_allowed_requests(self):
+        backend = DatabaseRateLimitBackend()
+        backend._get_usage_count_for_window = AsyncMock(return_value=0)
+        backend._log_api_request = AsyncMock()
+        api_key = make_api_key()
+
+        counts = await backend.hit(
+            api_key, make_windows(api_key), datetime.now(timezone.utc), None, None
+        )
+
+        assert counts == [0, 0, 0]
+        backend._log_api_request.assert_awaited_once()
+
+
+class TestCreateRateLimitBackend:
+    """Test backend selection from settings."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("database", DatabaseRateLimitBackend),
+        ("memory", InMemoryRateLimitBackend),
+        ("redis", RedisRateLimitBackend),
+    ])
+    def test_backend_from_settings(self, name, expected):
+        settings = override_settings(rate_limit_backend=name)
+        assert isinstance(create_rate_limit_backend(settings), expected)
+
+    def test_invalid_backend_rejected(self):
+        with pytest.raises(ValueError):
+            override_settings(rate_limit_backend="memcached")
@@ -0,0 +1,90 @@
+"""Tests for security log partition management and retention."""
+
+from datetime import date
+from unittest.mock import AsyncMock, Mock, patch
+
+from smarter_dev.web import security_log_partitions
+from smarter_dev.web.security_log_partitions import (
+    create_partition_sql,
+    drop_expired_partitions,
+    ensure_partitions,
+    partition_day,
+    partition_name,
+    run_security_log_maintenance,
+)
+
+
+def make_session(dialect="postgresql"):
+    session = AsyncMock()
+    session.bind = Mock()
+    session.bind.dialect.name = dialect
+    return session
+
+
+def executed_sql(session):
+    return [str(call.args[0]) for call in session.execute.await_args_list]
+
+
+class TestPartitionNames:
+    """Test partition naming helpers."""
+
+    def test_partition_name_round_trip(self):
+        day = date(2026, 3, 9)
+
+        assert partition_name(day) == "security_logs_p20260309"
+        assert partition_day(partition_name(day)) == day
+
+    def test_non_daily_partitions_are_ignored(self):
+        assert partition_day("security_logs_default") is None
+        assert partition_day("security_logs_pbogus") is None
+
+    def test_partition_covers_one_utc_day(self):
+        sql = create_partition_sql(date(2026, 12, 31))
+
+        assert "security_logs_p20261231 PARTITION OF security_logs" in sql
+        assert "FROM ('2026-12-31T00:00:00+00:00') TO ('2027-01-01T00:00:00+00:00')" in sql
+
+
+class TestPartitionMaintenance:
+    """Test partition creation and retention by dropping partitions."""
+
+    async def test_ensure_partitions_creates_only_missing_days(self):
+        session = make_session()
+        existing = ["security_logs_default", "security_logs_p20260101"]
+
+        with patch.object(security_log_partitions, "list_partitions", AsyncMock(return_value=existing)):
+            created = await ensure_partitions(session, days_ahead=2, today=date(2026, 1, 1))
+
+        assert created == ["security_logs_p20260102", "security_logs_p20260103"]
+        assert len(executed_sql(session)) == 2
+
+    async def test_drop_expired_partitions_keeps_retained_days(self):
+        session = make_session()
+        existing = [
+            "security_logs_default",
+            "security_logs_p20260101",
+            "security_logs_p20260109",
+            "security_logs_p20260110",
+            "security_logs_p20260111",
+        ]
+
+        with patch.object(security_log_partitions, "list_partitions", AsyncMock(return_value=existing)):
+            dropped = await drop_expired_partitions(session, retention_days=10, today=date(2026, 1, 20))
+
+        assert dropped == ["security_logs_p20260101", "security_logs_p20260109"]
+        assert executed_sql(session) == [
+            "DROP TABLE IF EXISTS security_logs_p20260101",
+            "DROP TABLE IF EXISTS security_logs_p20260109",
+        ]
+
+    async def test_unpartitioned_table_falls_back_to_delete(self):
+        session = make_session(dialect="sqlite")
+        security_logger = Mock()
+        security_logger.delete_old_logs = AsyncMock(return_value=42)
+
+        with patch("smarter_dev.web.security_logger.get_security_logger", return_value=security_logger):
+            result = await run_security_log_maintenance(session, retention_days=30)
+
+        assert not result.partitioned
+        assert result.deleted_rows == 42
+        security_logger.delete_old_logs.assert_awaited_once_with(session, 30)
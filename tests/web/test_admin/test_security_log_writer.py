@@ -0,0 +1,123 @@
+"""Tests for the batched background security log writer."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from smarter_dev.web.security_logger import SecurityLogWriter, SecurityLogger
+
+
+@pytest.fixture
+def mock_session_context():
+    """Patch the session context used by the writer and collect batches."""
+    batches = []
+    session = AsyncMock()
+
+    async def execute(stmt, rows):
+        batches.append(list(rows))
+
+    session.execute.side_effect = execute
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=False)
+
+    with patch("smarter_dev.shared.database.get_db_session_context", return_value=context):
+        yield batches
+
+
+def make_row(i):
+    return {"action": "api_request", "success": True, "details": f"request {i}"}
+
+
+class TestSecurityLogWriter:
+    """Test batching, overflow handling and draining."""
+
+    async def test_rows_are_written_in_batches(self, mock_session_context):
+        writer = SecurityLogWriter(batch_size=3, flush_interval_ms=1000)
+        writer.start()
+
+        for i in range(7):
+            assert await writer.submit(make_row(i))
+        await writer.stop()
+
+        assert [len(batch) for batch in mock_session_context] == [3, 3, 1]
+        stats = writer.get_stats()
+        assert stats["written"] == 7
+        assert stats["batches"] == 3
+        assert stats["dropped"] == 0
+
+    async def test_flushes_partial_batch_after_interval(self, mock_session_context):
+        writer = SecurityLogWriter(batch_size=100, flush_interval_ms=10)
+        writer.start()
+
+        await writer.submit(make_row(0))
+        await asyncio.sleep(0.05)
+
+        assert len(mock_session_context) == 1
+        await writer.stop()
+
+    async def test_drop_policy_counts_overflow(self, mock_session_context):
+        writer = SecurityLogWriter(max_queue_size=2, batch_size=10, overflow_policy="drop")
+        writer.start()
+
+        # The writer task has not run yet, so the queue fills up
+        results = [await writer.submit(make_row(i)) for i in range(4)]
+        await writer.stop()
+
+        assert results == [True, True, False, False]
+        assert writer.get_stats()["dropped"] == 2
+        assert writer.get_stats()["written"] == 2
+
+    async def test_submit_rejected_when_not_running(self):
+        writer = SecurityLogWriter()
+
+        assert not await writer.submit(make_row(0))
+
+    async def test_failed_flush_is_counted(self):
+        writer = SecurityLogWriter(batch_size=1, flush_interval_ms=1)
+
+        with patch(
+            "smarter_dev.shared.database.get_db_session_context",
+            side_effect=RuntimeError("database down")
+        ):
+            writer.start()
+            await writer.submit(make_row(0))
+            await writer.stop()
+
+        assert writer.get_stats()["failed"] == 1
+
+
+class TestDeferredLogging:
+    """Test that per-request events go through the writer when it runs."""
+
+    async def test_api_request_is_deferred(self, mock_session_context):
+        writer = SecurityLogWriter(batch_size=10, flush_interval_ms=1)
+        security_logger = SecurityLogger(writer=writer)
+        session = AsyncMock()
+        api_key = Mock(id="key-id", created_by="admin", key_prefix="sk-test")
+        request = Mock(method="GET", headers={}, query_params={})
+        request.url.path = "/guilds/1/bytes/balance/2"
+
+        writer.start()
+        result = await security_logger.log_api_request(session, api_key, request)
+        await writer.stop()
+
+        assert result is None
+        session.add.assert_not_called()
+        row = mock_session_context[0][0]
+        assert row["action"] == "api_request"
+        assert row["created_at"] == row["timestamp"]
+
+    async def test_falls_back_to_session_without_writer(self):
+        security_logger = SecurityLogger(writer=SecurityLogWriter())
+        session = AsyncMock()
+        session.add = Mock()
+        api_key = Mock(id=None, created_by="admin", key_prefix="sk-test")
+        request = Mock(method="GET", headers={}, query_params={})
+        request.url.path = "/health"
+
+        result = await security_logger.log_api_request(session, api_key, request)
+
+        assert result is not None
+        session.add.assert_called_once()
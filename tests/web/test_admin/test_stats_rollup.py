@@ -0,0 +1,196 @@
+"""Tests for the admin dashboard stats rollup."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import Request, Response
+from sqlalchemy import MetaData, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from smarter_dev.shared.config import override_settings
+from smarter_dev.web.crud import APIKeyOperations
+from smarter_dev.web.models import (
+    APIKey,
+    BytesBalance,
+    BytesTransaction,
+    DailyStats,
+    ForumAgent,
+    ForumAgentResponse,
+    GuildStats,
+    HelpConversation,
+    SecurityLog,
+    Squad,
+)
+from smarter_dev.web.multi_tier_rate_limiter import MultiTierRateLimiter, create_rate_limit_backend
+from smarter_dev.web.security_logger import SecurityLogger
+from smarter_dev.web.stats_rollup import (
+    ALL_GUILDS,
+    get_dashboard_stats,
+    refresh_daily_stats,
+    run_stats_rollup,
+)
+
+TODAY = date(2026, 10, 17)
+
+
+def at(day: date, hour: int = 12) -> datetime:
+    return datetime(day.year, day.month, day.day, hour, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def session_maker():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    # Some models declare the same index twice, so copy the tables without
+    # their indexes; the rollup queries don't depend on them
+    metadata = MetaData()
+    for model in (
+        APIKey, BytesBalance, BytesTransaction, DailyStats, ForumAgent,
+        ForumAgentResponse, GuildStats, HelpConversation, SecurityLog, Squad,
+    ):
+        model.__table__.to_metadata(metadata).indexes.clear()
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def transaction(guild_id: str, day: date) -> BytesTransaction:
+    return BytesTransaction(
+        guild_id=guild_id, giver_id="alice", giver_username="Alice",
+        receiver_id="bob", receiver_username="Bob", amount=5, created_at=at(day)
+    )
+
+
+def conversation(day: date, tokens: int, response_time_ms) -> HelpConversation:
+    return HelpConversation(
+        session_id=str(uuid4()), guild_id="1", channel_id="2", user_id="3", user_username="Carol",
+        interaction_type="mention", user_question="?", bot_response="!", tokens_used=tokens,
+        response_time_ms=response_time_ms, started_at=at(day), last_activity_at=at(day)
+    )
+
+
+async def seed(session_maker) -> None:
+    yesterday = TODAY - timedelta(days=1)
+    async with session_maker() as session:
+        session.add_all([
+            BytesBalance(guild_id="1", user_id="alice", balance=100),
+            BytesBalance(guild_id="1", user_id="bob", balance=50),
+            BytesBalance(guild_id="2", user_id="alice", balance=25),
+            Squad(guild_id="1", role_id="10", name="Alpha"),
+            Squad(guild_id="2", role_id="20", name="Beta"),
+            transaction("1", yesterday),
+            transaction("1", TODAY),
+            transaction("2", TODAY),
+            SecurityLog(action="api_key_used", success=True, details="used", created_at=at(TODAY, 1)),
+            SecurityLog(action="api_key_used", success=True, details="used", created_at=at(TODAY, 2)),
+            SecurityLog(action="api_key_used", success=True, details="used", created_at=at(yesterday)),
+            # Only the database rate limit backend writes these, alongside api_key_used
+            SecurityLog(action="api_request", success=True, details="GET", created_at=at(TODAY, 1)),
+            conversation(yesterday, 100, 200),
+            conversation(TODAY, 50, None),
+        ])
+        await session.commit()
+
+
+class TestStatsRollup:
+    """Test refreshing and reading the rollup."""
+
+    async def test_dashboard_reads_rollup_totals(self, session_maker):
+        await seed(session_maker)
+
+        async with session_maker() as session:
+            assert await run_stats_rollup(session, today=TODAY)
+            stats = await get_dashboard_stats(session, today=TODAY)
+
+        assert stats.total_users == 2
+        assert stats.total_bytes == 175
+        assert stats.total_squads == 2
+        assert stats.total_transactions == 3
+        assert stats.api_requests_today == 2
+        assert stats.total_conversations == 2
+        assert stats.conversations_today == 1
+        assert stats.help_tokens == 150
+        assert stats.avg_response_time_ms == 200
+        assert stats.guilds[ALL_GUILDS].user_count == 2
+        assert stats.guilds["1"].user_count == 2
+        assert stats.guilds["2"].squad_count == 1
+        assert not stats.is_empty
+
+    async def test_empty_rollup_is_reported(self, session_maker):
+        async with session_maker() as session:
+            stats = await get_dashboard_stats(session, today=TODAY)
+
+        assert stats.is_empty
+        assert stats.total_transactions == 0
+        assert stats.avg_response_time_ms is None
+
+    async def test_refresh_only_recomputes_recent_days(self, session_maker):
+        await seed(session_maker)
+        async with session_maker() as session:
+            await run_stats_rollup(session, today=TODAY)
+
+        # Older activity arriving late is not rescanned; the last stored day is
+        async with session_maker() as session:
+            session.add_all([
+                transaction("1", TODAY - timedelta(days=1)),
+                transaction("1", TODAY),
+            ])
+            await session.commit()
+            days = await refresh_daily_stats(session, today=TODAY)
+            await session.commit()
+            rows = {row.day: row for row in (await session.execute(select(DailyStats))).scalars()}
+
+        assert days == [TODAY]
+        assert rows[TODAY - timedelta(days=1)].transaction_count == 1
+        assert rows[TODAY].transaction_count == 3
+
+    async def test_admin_stats_report_requests_today(self, session_maker):
+        await seed(session_maker)
+        async with session_maker() as session:
+            session.add(APIKey(
+                name="bot", key_hash="h" * 64, key_prefix="sk-test", scopes=[],
+                created_by="admin", usage_count=7
+            ))
+            await session.commit()
+            await run_stats_rollup(session)
+            stats = await APIKeyOperations().get_admin_stats(session)
+
+        assert stats["total_api_keys"] == 1
+        assert stats["active_api_keys"] == 1
+        assert stats["total_api_requests"] == 7
+        assert stats["top_api_consumers"][0]["usage_count"] == 7
+        assert isinstance(stats["api_requests_today"], int)
+
+    @pytest.mark.parametrize("backend_name", ["memory", "redis"])
+    async def test_requests_counted_without_database_backend(self, session_maker, backend_name):
+        backend = create_rate_limit_backend(override_settings(rate_limit_backend=backend_name))
+        if backend_name == "redis":
+            redis_client = Mock()
+            redis_client.register_script.return_value = AsyncMock(return_value=[0, 0, 0])
+            backend._redis = redis_client
+        limiter = MultiTierRateLimiter(backend=backend)
+        api_key = APIKey(
+            id=uuid4(), name="bot", key_hash="h" * 64, key_prefix="sk-test", scopes=[],
+            created_by="admin", rate_limit_per_second=10, rate_limit_per_minute=100,
+            rate_limit_per_15_minutes=1000
+        )
+        request = Request({
+            "type": "http", "method": "GET", "path": "/api/v1/health", "query_string": b"",
+            "headers": [], "client": ("127.0.0.1", 1234),
+        })
+
+        async with session_maker() as session:
+            for _ in range(3):
+                # What verify_api_key and the rate limit dependency do per request
+                await SecurityLogger().log_api_key_used(session, api_key, request)
+                await limiter.check_rate_limits(api_key, session, request, Response())
+            await run_stats_rollup(session)
+            stats = await get_dashboard_stats(session)
+            admin_stats = await APIKeyOperations().get_admin_stats(session)
+
+        assert stats.api_requests_today == 3
+        assert admin_stats["api_requests_today"] == 3
@@ -12,10 +12,14 @@ from smarter_dev.web.admin.discord import GuildNotFoundError, DiscordAPIError
 class TestAdminDashboard:
     """Test suite for admin dashboard view."""
     
+    @patch("smarter_dev.web.admin.views.get_dashboard_stats")
     @patch("smarter_dev.web.admin.views.get_db_session_context")
     @patch("smarter_dev.web.admin.views.get_bot_guilds")
-    def test_dashboard_success(self, mock_get_guilds, mock_db_session, authenticated_client):
+    def test_dashboard_success(self, mock_get_guilds, mock_db_session, mock_get_stats, authenticated_client):
         """Test successful dashboard rendering."""
+        from smarter_dev.web.models import GuildStats
+        from smarter_dev.web.stats_rollup import ALL_GUILDS, DashboardStats
+        
         # Mock Discord API
         mock_get_guilds.return_value = []
         
@@ -24,14 +28,19 @@ class TestAdminDashboard:
         mock_db_session.return_value.__aenter__.return_value = mock_session
         mock_db_session.return_value.__aexit__.return_value = None
         
-        # Mock database queries
-        mock_session.execute.return_value.scalar.return_value = 10
+        # Mock the stats rollup
+        mock_get_stats.return_value = DashboardStats(
+            total_users=10,
+            api_requests_today=1234,
+            guilds={ALL_GUILDS: GuildStats(guild_id=ALL_GUILDS, user_count=10)}
+        )
         
         response = authenticated_client.get("/admin/")
         
         assert response.status_code == 200
         assert b"Dashboard" in response.content
         assert b"Total Users" in response.content
+        assert b"1,234" in response.content
     
     @patch("smarter_dev.web.admin.views.get_bot_guilds")
     def test_dashboard_discord_api_error(self, mock_get_guilds, authenticated_client):
@@ -56,6 +56,82 @@ def api_settings():
     )
 
 
+@pytest.fixture
+async def locking_db_engine():
+    """Create a file-backed SQLite engine for the bytes tables that serializes writers.
+    
+    Each session opens its transaction with BEGIN IMMEDIATE, which takes the
+    write lock up front the way row locks do on PostgreSQL, so concurrent
+    sessions queue instead of failing. Only the bytes, member, squad and
+    challenge tables are created.
+    """
+    import os
+    import tempfile
+    import uuid
+    
+    from sqlalchemy import event
+    from sqlalchemy.schema import CreateTable
+    from smarter_dev.web.models import (
+        BytesBalance, BytesConfig, BytesTransaction, GuildMember, Squad, SquadMembership,
+        Campaign, CampaignSquadScore, Challenge, ChallengeInput, ChallengeSubmission
+    )
+    
+    db_path = os.path.join(tempfile.mkdtemp(), f"bytes_{uuid.uuid4().hex}.db")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}",
+        connect_args={"timeout": 30},
+        pool_size=20,
+        max_overflow=0,
+    )
+    
+    @event.listens_for(engine.sync_engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def begin_immediate(connection):
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+    
+    tables = [
+        BytesBalance.__table__,
+        BytesConfig.__table__,
+        BytesTransaction.__table__,
+        GuildMember.__table__,
+        Squad.__table__,
+        SquadMembership.__table__,
+        Campaign.__table__,
+        Challenge.__table__,
+        ChallengeInput.__table__,
+        ChallengeSubmission.__table__,
+        CampaignSquadScore.__table__,
+    ]
+    
+    def create_tables(sync_conn):
+        # The campaign and challenge models declare some indexes twice (index=True
+        # plus __table_args__), so create each index name only once
+        created = set()
+        for table in tables:
+            sync_conn.execute(CreateTable(table))
+            for index in table.indexes:
+                if index.name not in created:
+                    created.add(index.name)
+                    index.create(sync_conn)
+    
+    async with engine.begin() as conn:
+        await conn.run_sync(create_tables)
+    
+    yield engine
+    
+    await engine.dispose()
+    os.remove(db_path)
+
+
+@pytest.fixture
+def locking_session_maker(locking_db_engine) -> async_sessionmaker[AsyncSession]:
+    """Create a session maker bound to the locking engine."""
+    return async_sessionmaker(locking_db_engine, expire_on_commit=False)
+
+
 @pytest.fixture(scope="function")
 async def real_db_engine(api_settings):
     """Create a fresh isolated database engine for each test."""
@@ -372,8 +448,10 @@ def mock_bytes_operations():
         mock_instance.get_or_create_balance = AsyncMock()
         mock_instance.create_transaction = AsyncMock()
         mock_instance.get_leaderboard = AsyncMock()
+        mock_instance.get_rank = AsyncMock(return_value=None)
         mock_instance.get_transaction_history = AsyncMock()
         mock_instance.update_daily_reward = AsyncMock()
+        mock_instance.claim_daily = AsyncMock()
         mock_instance.reset_streak = AsyncMock()
         
         yield mock_instance
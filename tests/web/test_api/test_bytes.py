@@ -735,5 +735,6 @@ class TestTransactionHistory:
             mock_bytes_operations.get_transaction_history.call_args[0][0],  # session
             test_guild_id,
             test_user_id,
-            20  # default limit
+            21,  # default limit plus one to detect a next page
+            before=None
         )
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""Tests for fetching the balances of several users at once."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+
+from smarter_dev.web.api.routers.bytes import get_balances
+from smarter_dev.web.models import BytesBalance
+
+GUILD_ID = "123456789012345678"
+
+
+async def fetch(session_maker, user_ids):
+    async with session_maker() as session:
+        return await get_balances(
+            request=Mock(state=Mock(request_id="test")),
+            response=Mock(),
+            api_key=Mock(),
+            rate_limit_check=None,
+            user_ids=user_ids,
+            guild_id=GUILD_ID,
+            db=session,
+            metadata={}
+        )
+
+
+async def test_returns_existing_balances_and_reports_missing(locking_session_maker):
+    async with locking_session_maker() as session:
+        session.add(BytesBalance(guild_id=GUILD_ID, user_id="111", balance=10))
+        session.add(BytesBalance(guild_id=GUILD_ID, user_id="222", balance=20))
+        session.add(BytesBalance(guild_id="999", user_id="333", balance=30))
+        await session.commit()
+
+    result = await fetch(locking_session_maker, "111, 222,333,111")
+
+    assert result.guild_id == GUILD_ID
+    assert {balance.user_id: balance.balance for balance in result.balances} == {"111": 10, "222": 20}
+    assert result.missing == ["333"]
+
+    # Missing balances are not created
+    async with locking_session_maker() as session:
+        assert await session.scalar(select(func.count()).select_from(BytesBalance)) == 3
+
+
+@pytest.mark.parametrize("user_ids", ["", " , ", "abc", ",".join(str(i) for i in range(1, 102))])
+async def test_rejects_invalid_requests(locking_session_maker, user_ids):
+    with pytest.raises(HTTPException) as exc_info:
+        await fetch(locking_session_maker, user_ids)
+
+    assert exc_info.value.status_code == 400
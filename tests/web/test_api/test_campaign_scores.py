@@ -0,0 +1,108 @@
+"""Tests for the incrementally maintained campaign scoreboard."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import update
+
+from smarter_dev.web.campaign_scores import check_campaign_scores, rebuild_campaign_scores
+from smarter_dev.web.crud import ChallengeSubmissionOperations
+from smarter_dev.web.models import Campaign, CampaignSquadScore, Challenge, ChallengeInput, Squad
+
+
+@pytest.fixture
+async def campaign(locking_session_maker):
+    """Campaign with two challenges and two squads that have their inputs."""
+    async with locking_session_maker() as session:
+        campaign = Campaign(
+            guild_id="123",
+            title="Campaign",
+            description="",
+            start_time=datetime.now(timezone.utc),
+            release_cadence_hours=24,
+            announcement_channels=[],
+            created_by="admin",
+        )
+        squads = [Squad(guild_id="123", role_id=f"role{i}", name=f"Squad {i}") for i in range(2)]
+        session.add(campaign)
+        session.add_all(squads)
+        await session.flush()
+        challenges = [
+            Challenge(campaign_id=campaign.id, title=f"Challenge {i}", description="", order_position=i)
+            for i in (1, 2)
+        ]
+        session.add_all(challenges)
+        await session.flush()
+        for challenge in challenges:
+            for squad in squads:
+                session.add(ChallengeInput(
+                    challenge_id=challenge.id,
+                    squad_id=squad.id,
+                    input_data="input",
+                    result_data="42",
+                    first_fetched_at=datetime.now(timezone.utc)
+                ))
+        await session.commit()
+        return campaign.id, [c.id for c in challenges], [s.id for s in squads]
+
+
+async def submit(session_maker, challenge_id, squad_id, solution):
+    async with session_maker() as session:
+        return await ChallengeSubmissionOperations(session).submit_solution(
+            challenge_id, squad_id, "111", "user", solution
+        )
+
+
+async def standings(session_maker, campaign_id):
+    async with session_maker() as session:
+        return await ChallengeSubmissionOperations(session).get_campaign_standings(campaign_id)
+
+
+async def test_submissions_update_standings(locking_session_maker, campaign):
+    campaign_id, (first, second), (alpha, beta) = campaign
+    full_points = 24 * 3600 // 30
+
+    await submit(locking_session_maker, first, alpha, "wrong")
+    await submit(locking_session_maker, first, alpha, "42")
+    await submit(locking_session_maker, first, alpha, "42")
+    await submit(locking_session_maker, second, alpha, "42")
+    await submit(locking_session_maker, second, beta, "wrong")
+
+    result = await standings(locking_session_maker, campaign_id)
+
+    assert result.total_submissions == 5
+    assert result.total_challenges == 2
+    assert [(row["squad_id"], row["total_points"], row["successful_submissions"]) for row in result.scoreboard] == [
+        (alpha, 2 * full_points, 2),
+        (beta, 0, 0),
+    ]
+    assert result.squad_totals == [{
+        "squad_name": "Squad 0", "squad_id": str(alpha), "total_points": 2 * full_points, "challenges_completed": 2
+    }]
+    assert [entry["challenge_title"] for entry in result.challenges_breakdown] == ["Challenge 1", "Challenge 2"]
+    assert result.challenges_breakdown[0]["submissions"] == [
+        {"squad_name": "Squad 0", "squad_id": str(alpha), "points_earned": full_points}
+    ]
+
+    async with locking_session_maker() as session:
+        assert await check_campaign_scores(session, campaign_id) == []
+
+
+async def test_rebuild_repairs_drift(locking_session_maker, campaign):
+    campaign_id, (first, _), (alpha, _) = campaign
+    await submit(locking_session_maker, first, alpha, "42")
+
+    async with locking_session_maker() as session:
+        await session.execute(update(CampaignSquadScore).values(total_points=1))
+        await session.commit()
+
+    async with locking_session_maker() as session:
+        assert await check_campaign_scores(session) == [(campaign_id, alpha)]
+        assert await rebuild_campaign_scores(session, campaign_id) == 1
+    async with locking_session_maker() as session:
+        assert await check_campaign_scores(session) == []
+
+    result = await standings(locking_session_maker, campaign_id)
+    assert result.scoreboard[0]["total_points"] == 24 * 3600 // 30
@@ -0,0 +1,138 @@
+"""Tests for generating challenge inputs ahead of the first fetch."""
+
+from __future__ import annotations
+
+import itertools
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from smarter_dev.web.crud import (
+    CampaignOperations,
+    ChallengeInputOperations,
+    ChallengeSubmissionOperations,
+)
+from smarter_dev.web.models import Campaign, Challenge, ChallengeInput, Squad
+from smarter_dev.web.script_runner import ScriptExecutionError
+
+GUILD_ID = "123456789012345678"
+
+
+class FakeRunner:
+    """Returns a distinct generator result per run; scripts named 'fail' raise."""
+
+    def __init__(self):
+        self._counter = itertools.count(1)
+        self.runs = 0
+
+    async def run(self, script):
+        self.runs += 1
+        if script == "fail":
+            raise ScriptExecutionError("Script execution failed: boom")
+        n = next(self._counter)
+        return f'{{"input": "input {n}", "result": "{n}"}}'
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    runner = FakeRunner()
+    monkeypatch.setattr("smarter_dev.web.crud.get_script_runner", lambda: runner)
+    return runner
+
+
+async def create_challenge(session_maker, script="generate"):
+    async with session_maker() as session:
+        campaign = Campaign(
+            guild_id=GUILD_ID,
+            title="Campaign",
+            description="",
+            start_time=datetime.now(timezone.utc),
+            release_cadence_hours=24,
+            announcement_channels=[],
+            created_by="admin",
+        )
+        session.add(campaign)
+        await session.flush()
+        challenge = Challenge(
+            campaign_id=campaign.id,
+            title="Challenge",
+            description="",
+            order_position=1,
+            input_generator_script=script,
+        )
+        squads = [
+            Squad(guild_id=GUILD_ID, role_id=f"role{i}", name=f"Squad {i}") for i in range(3)
+        ]
+        squads.append(Squad(guild_id=GUILD_ID, role_id="role3", name="Inactive", is_active=False))
+        squads.append(Squad(guild_id="999", role_id="role4", name="Other guild"))
+        session.add(challenge)
+        session.add_all(squads)
+        await session.commit()
+        return challenge.id, [squad.id for squad in squads]
+
+
+async def pregenerate(session_maker, challenge_id):
+    async with session_maker() as session:
+        challenge = await CampaignOperations(session).get_challenge_with_campaign(challenge_id)
+        return await ChallengeInputOperations(session).pregenerate_inputs(challenge)
+
+
+async def test_generates_inputs_for_active_squads(locking_session_maker, runner):
+    challenge_id, squad_ids = await create_challenge(locking_session_maker)
+
+    assert await pregenerate(locking_session_maker, challenge_id) == 3
+
+    async with locking_session_maker() as session:
+        inputs = (await session.execute(select(ChallengeInput))).scalars().all()
+    assert {row.squad_id for row in inputs} == set(squad_ids[:3])
+    assert all(row.first_fetched_at is None for row in inputs)
+
+    # A second pass has nothing left to do
+    assert await pregenerate(locking_session_maker, challenge_id) == 0
+    assert runner.runs == 3
+
+
+async def test_keeps_inputs_squads_already_fetched(locking_session_maker, runner):
+    challenge_id, squad_ids = await create_challenge(locking_session_maker)
+    async with locking_session_maker() as session:
+        fetched = await ChallengeInputOperations(session).get_or_create_input(
+            challenge_id, squad_ids[0], "generate"
+        )
+
+    assert await pregenerate(locking_session_maker, challenge_id) == 2
+
+    async with locking_session_maker() as session:
+        row = await ChallengeInputOperations(session).get_input_by_squad(challenge_id, squad_ids[0])
+    assert (row.input_data, row.result_data) == fetched
+    assert row.first_fetched_at is not None
+
+
+async def test_failed_generation_is_left_for_on_demand(locking_session_maker, runner):
+    challenge_id, _ = await create_challenge(locking_session_maker, script="fail")
+
+    assert await pregenerate(locking_session_maker, challenge_id) == 0
+
+
+async def test_first_fetch_starts_the_timer(locking_session_maker, runner):
+    challenge_id, squad_ids = await create_challenge(locking_session_maker)
+    await pregenerate(locking_session_maker, challenge_id)
+
+    # Backdate generation to well before anyone fetched
+    async with locking_session_maker() as session:
+        row = await ChallengeInputOperations(session).get_input_by_squad(challenge_id, squad_ids[0])
+        row.created_at = datetime.now(timezone.utc) - timedelta(hours=12)
+        await session.commit()
+
+    async with locking_session_maker() as session:
+        input_data, result_data = await ChallengeInputOperations(session).get_or_create_input(
+            challenge_id, squad_ids[0], "generate"
+        )
+    async with locking_session_maker() as session:
+        is_correct, is_first_success, points = await ChallengeSubmissionOperations(session).submit_solution(
+            challenge_id, squad_ids[0], "111", "user", result_data
+        )
+
+    assert is_correct and is_first_success
+    # Full points (24h cadence / 30s), not the ones left 12 hours after generation
+    assert points == 24 * 3600 // 30
@@ -0,0 +1,127 @@
+"""Tests for generating each squad's challenge input only once."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from smarter_dev.web.crud import ChallengeInputOperations
+from smarter_dev.web.models import Campaign, Challenge, ChallengeInput, Squad
+from smarter_dev.web.script_runner import ScriptExecutionError
+
+
+class SlowRunner:
+    """Counts runs and takes a moment so callers overlap."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.runs = 0
+
+    async def run(self, script):
+        self.runs += 1
+        await asyncio.sleep(0.05)
+        if self.fail:
+            raise ScriptExecutionError("Script execution failed: boom")
+        return f'{{"input": "input {self.runs}", "result": "{self.runs}"}}'
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    runner = SlowRunner()
+    monkeypatch.setattr("smarter_dev.web.crud.get_script_runner", lambda: runner)
+    return runner
+
+
+@pytest.fixture
+async def squad_challenge(locking_session_maker):
+    async with locking_session_maker() as session:
+        campaign = Campaign(
+            guild_id="123",
+            title="Campaign",
+            description="",
+            start_time=datetime.now(timezone.utc),
+            release_cadence_hours=24,
+            announcement_channels=[],
+            created_by="admin",
+        )
+        squad = Squad(guild_id="123", role_id="role", name="Squad")
+        session.add_all([campaign, squad])
+        await session.flush()
+        challenge = Challenge(campaign_id=campaign.id, title="Challenge", description="", order_position=1)
+        session.add(challenge)
+        await session.commit()
+        return challenge.id, squad.id
+
+
+async def get_or_create(session_maker, challenge_id, squad_id):
+    async with session_maker() as session:
+        return await ChallengeInputOperations(session).get_or_create_input(challenge_id, squad_id, "generate")
+
+
+async def test_concurrent_requests_generate_once(locking_session_maker, squad_challenge, runner):
+    challenge_id, squad_id = squad_challenge
+
+    results = await asyncio.gather(
+        *(get_or_create(locking_session_maker, challenge_id, squad_id) for _ in range(5))
+    )
+
+    assert runner.runs == 1
+    assert set(results) == {("input 1", "1")}
+    async with locking_session_maker() as session:
+        assert await session.scalar(select(func.count()).select_from(ChallengeInput)) == 1
+
+
+async def test_generation_survives_the_first_caller_going_away(locking_session_maker, squad_challenge, runner):
+    challenge_id, squad_id = squad_challenge
+
+    first = asyncio.create_task(get_or_create(locking_session_maker, challenge_id, squad_id))
+    while not ChallengeInputOperations._generations:
+        await asyncio.sleep(0.001)
+    second = asyncio.create_task(get_or_create(locking_session_maker, challenge_id, squad_id))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == ("input 1", "1")
+    assert runner.runs == 1
+    async with locking_session_maker() as session:
+        assert await session.scalar(select(func.count()).select_from(ChallengeInput)) == 1
+
+
+async def test_existing_row_wins_over_new_generation(locking_session_maker, squad_challenge, runner):
+    challenge_id, squad_id = squad_challenge
+    async with locking_session_maker() as session:
+        session.add(ChallengeInput(
+            challenge_id=challenge_id, squad_id=squad_id, input_data="stored", result_data="42"
+        ))
+        await session.commit()
+
+    # As if the row was pre-generated after this request found none
+    async with locking_session_maker() as session:
+        result = await ChallengeInputOperations(session)._generate_input(challenge_id, squad_id, "generate")
+
+    assert result == ("stored", "42")
+    async with locking_session_maker() as session:
+        row = await ChallengeInputOperations(session).get_input_by_squad(challenge_id, squad_id)
+    assert row.first_fetched_at is not None
+
+
+async def test_waiters_share_the_generation(monkeypatch):
+    runner = SlowRunner(fail=True)
+    monkeypatch.setattr("smarter_dev.web.crud.get_script_runner", lambda: runner)
+    challenge_id, squad_id = uuid4(), uuid4()
+
+    async def request():
+        ops = ChallengeInputOperations(session=AsyncMock())
+        ops.get_input_by_squad = AsyncMock(return_value=None)
+        return await ops.get_or_create_input(challenge_id, squad_id, "generate")
+
+    results = await asyncio.gather(request(), request(), request(), return_exceptions=True)
+
+    assert runner.runs == 1
+    assert all(isinstance(result, ScriptExecutionError) for result in results)
+    assert ChallengeInputOperations._generations == {}
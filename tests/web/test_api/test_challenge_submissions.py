@@ -0,0 +1,103 @@
+"""Tests for recording challenge submissions."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import func, select
+
+from smarter_dev.web.crud import CampaignOperations, ChallengeSubmissionOperations
+from smarter_dev.web.models import Campaign, Challenge, ChallengeInput, ChallengeSubmission, Squad
+
+FULL_POINTS = 24 * 3600 // 30
+
+
+@pytest.fixture
+async def squads_challenge(locking_session_maker):
+    """Challenge with two squads that have fetched their input."""
+    async with locking_session_maker() as session:
+        campaign = Campaign(
+            guild_id="123",
+            title="Campaign",
+            description="",
+            start_time=datetime.now(timezone.utc),
+            release_cadence_hours=24,
+            announcement_channels=[],
+            created_by="admin",
+        )
+        squads = [Squad(guild_id="123", role_id=f"role{i}", name=f"Squad {i}") for i in range(2)]
+        session.add(campaign)
+        session.add_all(squads)
+        await session.flush()
+        challenge = Challenge(campaign_id=campaign.id, title="Challenge", description="", order_position=1)
+        session.add(challenge)
+        await session.flush()
+        for squad in squads:
+            session.add(ChallengeInput(
+                challenge_id=challenge.id,
+                squad_id=squad.id,
+                input_data="input",
+                result_data="42",
+                first_fetched_at=datetime.now(timezone.utc)
+            ))
+        await session.commit()
+        return campaign.id, challenge.id, [squad.id for squad in squads]
+
+
+async def submit(session_maker, challenge_id, squad_id, solution, challenge=None):
+    async with session_maker() as session:
+        return await ChallengeSubmissionOperations(session).submit_solution(
+            challenge_id, squad_id, "111", "user", solution, challenge=challenge
+        )
+
+
+async def test_only_one_concurrent_success_scores(locking_session_maker, squads_challenge):
+    _, challenge_id, (squad_id, _) = squads_challenge
+
+    results = await asyncio.gather(
+        *(submit(locking_session_maker, challenge_id, squad_id, "42") for _ in range(4))
+    )
+
+    assert sorted(results, key=lambda result: result[1]) == [(True, False, None)] * 3 + [(True, True, FULL_POINTS)]
+    async with locking_session_maker() as session:
+        assert await session.scalar(select(func.count()).select_from(ChallengeSubmission)) == 4
+
+
+async def test_incorrect_submission_is_recorded(locking_session_maker, squads_challenge):
+    _, challenge_id, (squad_id, _) = squads_challenge
+
+    assert await submit(locking_session_maker, challenge_id, squad_id, "41") == (False, False, None)
+    assert await submit(locking_session_maker, challenge_id, squad_id, " 42\n") == (True, True, FULL_POINTS)
+
+
+async def test_uses_loaded_challenge(locking_session_maker, squads_challenge):
+    _, challenge_id, (squad_id, _) = squads_challenge
+    async with locking_session_maker() as session:
+        challenge = await CampaignOperations(session).get_challenge_with_campaign(challenge_id)
+    challenge.campaign.release_cadence_hours = 1
+
+    result = await submit(locking_session_maker, challenge_id, squad_id, "42", challenge=challenge)
+
+    # Scored with the cadence of the object passed in
+    assert result == (True, True, 3600 // 30)
+
+
+async def test_campaign_edit_clears_cached_cadence(locking_session_maker, squads_challenge):
+    campaign_id, challenge_id, (first_squad, second_squad) = squads_challenge
+    await submit(locking_session_maker, challenge_id, first_squad, "42")
+
+    async with locking_session_maker() as session:
+        await CampaignOperations(session).update_campaign(campaign_id, "123", release_cadence_hours=2)
+
+    assert await submit(locking_session_maker, challenge_id, second_squad, "42") == (True, True, 2 * 3600 // 30)
+
+
+async def test_first_success_without_cadence_scores_zero(locking_session_maker, squads_challenge, monkeypatch):
+    _, challenge_id, (squad_id, _) = squads_challenge
+    monkeypatch.setattr(ChallengeSubmissionOperations, "_get_scoring", AsyncMock(return_value=None))
+
+    assert await submit(locking_session_maker, challenge_id, squad_id, "42") == (True, True, 0)
+    assert await submit(locking_session_maker, challenge_id, squad_id, "42") == (True, False, None)
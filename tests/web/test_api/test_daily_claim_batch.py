@@ -0,0 +1,79 @@
+"""Tests for claiming daily rewards for several users in one request."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, Mock, patch
+
+from sqlalchemy import func, select
+
+from smarter_dev.shared.date_provider import get_date_provider
+from smarter_dev.web import leaderboard as leaderboard_module
+from smarter_dev.web.api.routers.bytes import claim_daily_batch
+from smarter_dev.web.api.schemas import DailyClaimBatchRequest, DailyClaimRequest
+from smarter_dev.web.crud import BytesOperations, DatabaseOperationError
+from smarter_dev.web.models import BytesBalance, BytesTransaction
+
+GUILD_ID = "123456789012345678"
+
+
+async def run_batch(session_maker, user_ids):
+    batch = DailyClaimBatchRequest(
+        items=[DailyClaimRequest(user_id=user_id, username=f"User {user_id}") for user_id in user_ids]
+    )
+    async with session_maker() as session:
+        response = await claim_daily_batch(
+            request=Mock(),
+            response=Mock(),
+            batch_request=batch,
+            api_key=Mock(),
+            rate_limit_check=None,
+            guild_id=GUILD_ID,
+            db=session,
+            metadata={}
+        )
+    return response.results
+
+
+async def test_batch_claims_each_user_independently(locking_session_maker):
+    async with locking_session_maker() as session:
+        session.add(BytesBalance(guild_id=GUILD_ID, user_id="111", last_daily=get_date_provider().today()))
+        await session.commit()
+
+    results = await run_batch(locking_session_maker, ["222", "111", "333", "222"])
+
+    assert [result.status_code for result in results] == [200, 409, 200, 409]
+    assert results[0].body["balance"]["user_id"] == "222"
+    assert results[0].body["reward_amount"] > 0
+    assert "next_claim_at" in results[0].body
+    assert "already been claimed" in results[1].body["detail"]
+
+    async with locking_session_maker() as session:
+        claimed = await session.scalars(
+            select(BytesBalance.user_id).where(BytesBalance.last_daily == get_date_provider().today())
+        )
+        transactions = await session.scalar(select(func.count()).select_from(BytesTransaction))
+
+    assert sorted(claimed) == ["111", "222", "333"]
+    assert transactions == 2
+
+
+async def test_conflict_keeps_earlier_claims_for_leaderboard(locking_session_maker):
+    async with locking_session_maker() as session:
+        session.add(BytesBalance(guild_id=GUILD_ID, user_id="111", last_daily=get_date_provider().today()))
+        await session.commit()
+
+    board = Mock()
+    with patch.object(leaderboard_module, "get_leaderboard", return_value=board):
+        results = await run_batch(locking_session_maker, ["222", "111"])
+
+    assert [result.status_code for result in results] == [200, 409]
+    board.schedule.assert_called_once_with({(GUILD_ID, "222"): results[0].body["balance"]["balance"]})
+
+
+async def test_database_errors_are_not_exposed(locking_session_maker):
+    failure = DatabaseOperationError("Failed to claim daily reward: UPDATE bytes_balances ...")
+    with patch.object(BytesOperations, "claim_daily", AsyncMock(side_effect=failure)):
+        results = await run_batch(locking_session_maker, ["222"])
+
+    assert results[0].status_code == 500
+    assert results[0].body == {"detail": "Internal server error"}
@@ -0,0 +1,152 @@
+"""Load tests for the atomic daily claim.
+
+These tests replay the burst that happens when the day rolls over at
+00:00 UTC: every active member claims at once, and the bot retries some
+claims. Each claim runs in its own session against a real database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from smarter_dev.web.crud import BytesOperations, ConflictError
+from smarter_dev.web.models import BytesBalance, BytesConfig, BytesTransaction, Squad, SquadMembership
+
+GUILD_ID = "123456789012345678"
+CLAIM_DATE = date(2024, 1, 15)
+
+
+async def claim(session_maker, user_id: str, claim_date: date = CLAIM_DATE):
+    """Claim the daily reward in its own session, as the API does per request."""
+    async with session_maker() as session:
+        try:
+            result = await BytesOperations().claim_daily(
+                session, GUILD_ID, user_id, f"User {user_id}", claim_date
+            )
+            await session.commit()
+            return result
+        except ConflictError:
+            await session.rollback()
+            return None
+
+
+class TestMidnightBurst:
+    """Replay the claim burst at the daily reset."""
+
+    async def test_burst_with_retries_claims_once_per_user(self, locking_session_maker):
+        """Every member claims exactly once even when requests are retried."""
+        async with locking_session_maker() as session:
+            session.add(BytesConfig(guild_id=GUILD_ID, starting_balance=100, daily_amount=10, streak_bonuses={"8": 2}))
+            session.add_all([
+                BytesBalance(
+                    guild_id=GUILD_ID,
+                    user_id=f"returning_{i}",
+                    balance=500,
+                    total_received=500,
+                    streak_count=7,
+                    last_daily=CLAIM_DATE - timedelta(days=1)
+                )
+                for i in range(150)
+            ])
+            await session.commit()
+
+        members = [f"returning_{i}" for i in range(150)] + [f"new_{i}" for i in range(150)]
+        # A third of the members have their claim retried by the bot
+        requests = members + members[::3]
+        random.Random(0).shuffle(requests)
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*[claim(locking_session_maker, user_id) for user_id in requests])
+        elapsed = time.perf_counter() - started
+        print(f"Midnight burst: {len(requests) / elapsed:.0f} claims/s")
+
+        claimed = [result for result in results if result is not None]
+        assert len(claimed) == len(members)
+        assert {result.balance.user_id for result in claimed} == set(members)
+
+        async with locking_session_maker() as session:
+            balances = {
+                balance.user_id: balance
+                for balance in (await session.execute(select(BytesBalance))).scalars()
+            }
+            transactions = await session.scalar(select(func.count()).select_from(BytesTransaction))
+
+        assert transactions == len(members)
+        # Returning members hit the day 8 milestone, new members get the starting balance
+        assert balances["returning_0"].balance == 520
+        assert balances["returning_0"].streak_count == 8
+        assert balances["new_0"].balance == 100
+        assert balances["new_0"].streak_count == 1
+        assert all(balance.last_daily == CLAIM_DATE for balance in balances.values())
+        assert elapsed < 60
+
+    async def test_next_day_continues_streak(self, locking_session_maker):
+        first = await claim(locking_session_maker, "member")
+        again = await claim(locking_session_maker, "member")
+        next_day = await claim(locking_session_maker, "member", CLAIM_DATE + timedelta(days=1))
+
+        assert first.reward_amount == 100
+        assert again is None
+        assert next_day.balance.streak_count == 2
+        assert next_day.balance.balance == 100 + next_day.reward_amount
+
+    async def test_claim_assigns_default_squad(self, locking_session_maker):
+        squad_id = uuid4()
+        async with locking_session_maker() as session:
+            session.add(Squad(id=squad_id, guild_id=GUILD_ID, role_id="1", name="Default", is_default=True))
+            await session.commit()
+
+        result = await claim(locking_session_maker, "member")
+
+        assert result.squad_id == squad_id
+        async with locking_session_maker() as session:
+            membership = await session.scalar(select(SquadMembership).where(SquadMembership.user_id == "member"))
+        assert membership.squad_id == squad_id
+
+
+class TestDailyClaimStatement:
+    """Test the PostgreSQL claim path."""
+
+    def make_session(self, row):
+        session = AsyncMock()
+        session.bind = Mock()
+        session.bind.dialect.name = "postgresql"
+        session.execute.return_value = Mock(one_or_none=Mock(return_value=row))
+        session.merge = AsyncMock(side_effect=lambda balance, load: balance)
+        session.info = {}
+        return session
+
+    async def test_claim_is_one_round_trip(self):
+        row = Mock(
+            guild_id=GUILD_ID, user_id="member", balance=120, total_received=120, total_sent=0,
+            streak_count=8, last_daily=CLAIM_DATE, created_at=None, updated_at=None,
+            reward_amount=20, streak_bonus=2, assigned_squad_id=None
+        )
+        session = self.make_session(row)
+
+        result = await BytesOperations().claim_daily(session, GUILD_ID, "member", "Member", CLAIM_DATE)
+
+        assert session.execute.await_count == 1
+        sql = str(session.execute.await_args.args[0])
+        params = session.execute.await_args.args[1]
+        assert "FOR UPDATE" in sql
+        assert "b.last_daily < EXCLUDED.last_daily" in sql
+        assert "INSERT INTO squad_memberships" in sql
+        assert params["previous_date"] == CLAIM_DATE - timedelta(days=1)
+        assert result.balance.balance == 120
+        assert result.reward_amount == 20
+        assert result.streak_bonus == 2
+
+    async def test_repeated_claim_is_conflict(self):
+        session = self.make_session(None)
+
+        with pytest.raises(ConflictError):
+            await BytesOperations().claim_daily(session, GUILD_ID, "member", "Member", CLAIM_DATE)
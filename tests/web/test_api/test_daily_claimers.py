@@ -0,0 +1,31 @@
+"""Tests for listing a day's daily reward claimers."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from smarter_dev.web.crud import BytesOperations
+from smarter_dev.web.models import BytesBalance
+
+GUILD_ID = "123456789012345678"
+TODAY = date(2026, 10, 17)
+
+
+async def test_daily_claimers_lists_todays_claims(locking_session_maker):
+    async with locking_session_maker() as session:
+        session.add_all([
+            BytesBalance(guild_id=GUILD_ID, user_id="alice", last_daily=TODAY),
+            BytesBalance(guild_id=GUILD_ID, user_id="bob", last_daily=TODAY - timedelta(days=1)),
+            BytesBalance(guild_id=GUILD_ID, user_id="carol"),
+            BytesBalance(guild_id="other", user_id="dave", last_daily=TODAY),
+        ])
+        await session.commit()
+
+    async with locking_session_maker() as session:
+        await BytesOperations().claim_daily(session, GUILD_ID, "erin", "Erin", TODAY)
+        await session.commit()
+
+    async with locking_session_maker() as session:
+        claimers = await BytesOperations().get_daily_claimers(session, GUILD_ID, TODAY)
+
+    assert sorted(claimers) == ["alice", "erin"]
@@ -0,0 +1,91 @@
+"""Tests for the denormalized guild_members profile table."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from smarter_dev.web.crud import BytesOperations, GuildMemberOperations, SquadOperations
+from smarter_dev.web.models import BytesBalance, GuildMember, Squad, SquadMembership
+
+GUILD_ID = "123456789012345678"
+
+
+async def read_members(session_maker) -> dict:
+    async with session_maker() as session:
+        result = await session.execute(select(GuildMember).where(GuildMember.guild_id == GUILD_ID))
+        return {member.user_id: member for member in result.scalars()}
+
+
+class TestRecordActivity:
+    """Test profile upserts from bytes activity."""
+
+    async def test_transfer_records_both_users(self, locking_session_maker):
+        async with locking_session_maker() as session:
+            session.add(BytesBalance(guild_id=GUILD_ID, user_id="alice", balance=100))
+            await session.commit()
+
+        async with locking_session_maker() as session:
+            await BytesOperations().create_transaction(session, GUILD_ID, "alice", "Alice", "bob", "Bob", 10)
+            await session.commit()
+        async with locking_session_maker() as session:
+            await BytesOperations().create_transaction(session, GUILD_ID, "alice", "Alice2", "bob", "Bob", 10)
+            await session.commit()
+
+        members = await read_members(locking_session_maker)
+        assert members["alice"].username == "Alice2"
+        assert members["bob"].username == "Bob"
+
+    async def test_daily_claim_records_user(self, locking_session_maker):
+        async with locking_session_maker() as session:
+            await BytesOperations().claim_daily(session, GUILD_ID, "carol", "Carol", date(2026, 10, 17))
+            await session.commit()
+
+        members = await read_members(locking_session_maker)
+        assert members["carol"].username == "Carol"
+        assert "SYSTEM" not in members
+
+    async def test_older_activity_does_not_overwrite_newer(self, locking_session_maker):
+        now = datetime.now(timezone.utc)
+        async with locking_session_maker() as session:
+            await GuildMemberOperations().record_activity(session, GUILD_ID, {"dave": "New"}, seen_at=now)
+            await GuildMemberOperations().record_activity(
+                session, GUILD_ID, {"dave": "Old"}, seen_at=now - timedelta(minutes=5)
+            )
+            await session.commit()
+
+        members = await read_members(locking_session_maker)
+        assert members["dave"].username == "New"
+
+    async def test_missing_usernames_are_skipped(self, locking_session_maker):
+        async with locking_session_maker() as session:
+            await GuildMemberOperations().record_activity(session, GUILD_ID, {"erin": None, "SYSTEM": "System"})
+            await session.commit()
+
+        assert await read_members(locking_session_maker) == {}
+
+
+class TestSquadMembersListing:
+    """Test that the members listing reads names from guild_members."""
+
+    async def test_members_use_profile_usernames(self, locking_session_maker):
+        async with locking_session_maker() as session:
+            squad = Squad(guild_id=GUILD_ID, role_id="999", name="Alpha")
+            session.add(squad)
+            await session.flush()
+            session.add_all([
+                SquadMembership(squad_id=squad.id, user_id="alice", guild_id=GUILD_ID),
+                SquadMembership(squad_id=squad.id, user_id="bob", guild_id=GUILD_ID),
+            ])
+            await GuildMemberOperations().record_activity(session, GUILD_ID, {"alice": "Alice"})
+            await session.commit()
+
+        async with locking_session_maker() as session:
+            members = await SquadOperations().get_all_guild_squad_members(session, GUILD_ID)
+            searched = await SquadOperations().get_all_guild_squad_members(
+                session, GUILD_ID, username_search="ali"
+            )
+
+        assert {m["user_id"]: m["username"] for m in members} == {"alice": "Alice", "bob": "bob"}
+        assert [m["user_id"] for m in searched] == ["alice"]
@@ -0,0 +1,43 @@
+"""Tests for server-side request spans and the metrics endpoint."""
+
+from __future__ import annotations
+
+from httpx import AsyncClient
+
+from smarter_dev.web.api.app import api, request_metrics
+from smarter_dev.web.api.dependencies import verify_api_key
+
+
+class TestRequestMetrics:
+    """Test per-route metrics recorded by the request ID middleware."""
+
+    async def test_request_id_is_echoed(self, api_client: AsyncClient):
+        response = await api_client.get("/health", headers={"x-request-id": "abc123"})
+
+        assert response.headers["x-request-id"] == "abc123"
+
+    async def test_requests_are_recorded_by_route_template(self, api_client: AsyncClient):
+        before = request_metrics.snapshot()["routes"].get("GET /health", {}).get("requests", 0)
+
+        await api_client.get("/health")
+
+        stats = request_metrics.snapshot()["routes"]["GET /health"]
+        assert stats["requests"] == before + 1
+        assert stats["status_codes"][200] >= 1
+
+    async def test_metrics_requires_auth(self, api_client: AsyncClient):
+        response = await api_client.get("/metrics")
+
+        assert response.status_code in (401, 403)
+
+    async def test_metrics_exports_prometheus_text(self, api_client: AsyncClient):
+        api.dependency_overrides[verify_api_key] = lambda: None
+        try:
+            await api_client.get("/health")
+            response = await api_client.get("/metrics")
+        finally:
+            api.dependency_overrides.pop(verify_api_key)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'smarter_dev_api_requests_total{method="GET",route="/health"}' in response.text
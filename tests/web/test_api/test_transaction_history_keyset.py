@@ -0,0 +1,121 @@
+"""Tests for keyset-paginated transaction history."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from smarter_dev.web.crud import (
+    BytesOperations,
+    decode_transaction_cursor,
+    encode_transaction_cursor,
+)
+from smarter_dev.web.models import BytesTransaction
+
+GUILD_ID = "123456789012345678"
+START = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+async def seed_transactions(session_maker, count: int) -> list:
+    """Seed transfers between three users, two per timestamp to exercise the id tie-break."""
+    users = ["alice", "bob", "carol"]
+    transactions = []
+    for i in range(count):
+        giver, receiver = users[i % 3], users[(i + 1) % 3]
+        transactions.append(BytesTransaction(
+            id=uuid4(),
+            guild_id=GUILD_ID,
+            giver_id=giver,
+            giver_username=giver.title(),
+            receiver_id=receiver,
+            receiver_username=receiver.title(),
+            amount=i + 1,
+            created_at=START + timedelta(seconds=i // 2),
+        ))
+    async with session_maker() as session:
+        session.add_all(transactions)
+        await session.commit()
+    return transactions
+
+
+async def read_all_pages(session_maker, user_id, limit):
+    pages = []
+    cursor = None
+    while True:
+        async with session_maker() as session:
+            page = await BytesOperations().get_transaction_history(
+                session, GUILD_ID, user_id, limit, before=cursor
+            )
+        if not page:
+            return pages
+        pages.append(page)
+        cursor = decode_transaction_cursor(encode_transaction_cursor(page[-1]))
+
+
+def newest_first(transactions):
+    return sorted(transactions, key=lambda tx: (tx.created_at, tx.id), reverse=True)
+
+
+class TestTransactionCursor:
+    """Test cursor encoding."""
+
+    def test_cursor_round_trip(self):
+        tx = BytesTransaction(id=uuid4(), created_at=START + timedelta(microseconds=123456))
+
+        created_at, tx_id = decode_transaction_cursor(encode_transaction_cursor(tx))
+
+        assert created_at == tx.created_at
+        assert tx_id == tx.id
+
+    def test_cursor_fits_in_custom_id(self):
+        tx = BytesTransaction(id=uuid4(), created_at=datetime(2100, 1, 1, tzinfo=timezone.utc))
+
+        assert len(f"history_page:20:{encode_transaction_cursor(tx)}") <= 100
+
+    @pytest.mark.parametrize("cursor", ["", "abc", "123", "123_nothex"])
+    def test_malformed_cursor_is_rejected(self, cursor):
+        with pytest.raises(ValueError):
+            decode_transaction_cursor(cursor)
+
+
+class TestKeysetPagination:
+    """Test walking history page by page."""
+
+    async def test_user_pages_cover_history_without_overlap(self, locking_session_maker):
+        transactions = await seed_transactions(locking_session_maker, 25)
+        expected = newest_first([
+            tx for tx in transactions if "alice" in (tx.giver_id, tx.receiver_id)
+        ])
+
+        pages = await read_all_pages(locking_session_maker, "alice", 4)
+
+        assert all(len(page) <= 4 for page in pages)
+        assert [tx.id for page in pages for tx in page] == [tx.id for tx in expected]
+
+    async def test_guild_pages_cover_history_without_overlap(self, locking_session_maker):
+        transactions = await seed_transactions(locking_session_maker, 11)
+
+        pages = await read_all_pages(locking_session_maker, None, 3)
+
+        assert [len(page) for page in pages] == [3, 3, 3, 2]
+        assert [tx.id for page in pages for tx in page] == [tx.id for tx in newest_first(transactions)]
+
+    async def test_page_is_stable_when_newer_transactions_arrive(self, locking_session_maker):
+        await seed_transactions(locking_session_maker, 10)
+        async with locking_session_maker() as session:
+            first = await BytesOperations().get_transaction_history(session, GUILD_ID, limit=5)
+            cursor = (first[-1].created_at, first[-1].id)
+            second = await BytesOperations().get_transaction_history(session, GUILD_ID, limit=5, before=cursor)
+
+        async with locking_session_maker() as session:
+            session.add(BytesTransaction(
+                id=uuid4(), guild_id=GUILD_ID, giver_id="alice", giver_username="Alice",
+                receiver_id="bob", receiver_username="Bob", amount=1,
+                created_at=START + timedelta(days=1),
+            ))
+            await session.commit()
+            again = await BytesOperations().get_transaction_history(session, GUILD_ID, limit=5, before=cursor)
+
+        assert [tx.id for tx in again] == [tx.id for tx in second]
@@ -0,0 +1,169 @@
+"""Concurrency tests for bytes transfers.
+
+These tests run many transfers at once against a real database, each in its
+own session, and check that balances are never overdrawn, bytes are
+conserved, and opposite transfers between the same users do not deadlock.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import List
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import func, select
+
+from smarter_dev.web.crud import BytesOperations, ConflictError
+from smarter_dev.web.models import BytesBalance, BytesTransaction
+
+GUILD_ID = "123456789012345678"
+
+
+async def seed_balances(session_maker, balances: dict) -> None:
+    async with session_maker() as session:
+        session.add_all([
+            BytesBalance(guild_id=GUILD_ID, user_id=user_id, balance=balance, total_received=balance)
+            for user_id, balance in balances.items()
+        ])
+        await session.commit()
+
+
+async def transfer(session_maker, giver_id: str, receiver_id: str, amount: int) -> bool:
+    """Run one transfer in its own session, as the API does per request."""
+    async with session_maker() as session:
+        try:
+            await BytesOperations().create_transaction(
+                session, GUILD_ID, giver_id, "Giver", receiver_id, "Receiver", amount
+            )
+            await session.commit()
+            return True
+        except ConflictError:
+            await session.rollback()
+            return False
+
+
+async def read_balances(session_maker) -> dict:
+    async with session_maker() as session:
+        result = await session.execute(select(BytesBalance))
+        return {balance.user_id: balance for balance in result.scalars()}
+
+
+class TestConcurrentTransfers:
+    """Test transfers racing against each other."""
+
+    async def test_concurrent_transfers_never_overdraw(self, locking_session_maker):
+        """Only as many transfers succeed as the giver's balance covers."""
+        await seed_balances(locking_session_maker, {"giver": 100})
+        receivers = [f"receiver_{i}" for i in range(30)]
+
+        results = await asyncio.gather(*[
+            transfer(locking_session_maker, "giver", receiver_id, 10) for receiver_id in receivers
+        ])
+
+        balances = await read_balances(locking_session_maker)
+        assert sum(results) == 10
+        assert balances["giver"].balance == 0
+        assert balances["giver"].total_sent == 100
+        assert sum(balances[r].balance for r in receivers if r in balances) == 100
+
+        async with locking_session_maker() as session:
+            count = await session.scalar(select(func.count()).select_from(BytesTransaction))
+        assert count == 10
+
+    async def test_opposite_transfers_do_not_deadlock(self, locking_session_maker):
+        """Transfers in both directions between two users all complete."""
+        await seed_balances(locking_session_maker, {"alice": 500, "bob": 500})
+
+        tasks = []
+        for i in range(40):
+            giver, receiver = ("alice", "bob") if i % 2 == 0 else ("bob", "alice")
+            tasks.append(transfer(locking_session_maker, giver, receiver, 5))
+        results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=30)
+
+        balances = await read_balances(locking_session_maker)
+        assert all(results)
+        assert balances["alice"].balance == 500
+        assert balances["bob"].balance == 500
+        assert balances["alice"].total_sent == 100
+        assert balances["bob"].total_received == 600
+
+    async def test_transfer_throughput(self, locking_session_maker):
+        """Many independent transfers complete quickly and conserve bytes."""
+        users: List[str] = [f"user_{i}" for i in range(20)]
+        await seed_balances(locking_session_maker, {user_id: 1000 for user_id in users})
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*[
+            transfer(locking_session_maker, users[i % 20], users[(i + 7) % 20], 3) for i in range(200)
+        ])
+        elapsed = time.perf_counter() - started
+
+        balances = await read_balances(locking_session_maker)
+        print(f"Transfer throughput: {len(results) / elapsed:.0f} transfers/s")
+        assert all(results)
+        assert sum(balance.balance for balance in balances.values()) == 20 * 1000
+        assert elapsed < 30
+
+
+class TestTransferStatements:
+    """Test the shape of the transfer statements."""
+
+    async def test_postgresql_transfer_is_one_round_trip(self):
+        """On PostgreSQL the locks, debit, credit and insert share one statement."""
+        session = AsyncMock()
+        session.bind = Mock()
+        session.bind.dialect.name = "postgresql"
+        session.add = Mock()
+        session.expire = Mock()
+        session.identity_map = {}
+        session.info = {}
+        row = Mock(created_at=Mock(), giver_balance=100)
+        session.execute.return_value = Mock(one=Mock(return_value=row))
+        bytes_ops = BytesOperations()
+        bytes_ops._auto_assign_default_squad_if_needed = AsyncMock()
+
+        transaction = await bytes_ops.create_transaction(
+            session, GUILD_ID, "giver", "Giver", "receiver", "Receiver", 25
+        )
+
+        assert session.execute.await_count == 1
+        sql = str(session.execute.await_args.args[0])
+        assert "FOR UPDATE" in sql
+        assert "bytes_balances.balance >= :amount" in sql
+        assert "INSERT INTO bytes_transactions" in sql
+        assert transaction.created_at is row.created_at
+        session.add.assert_called_once_with(transaction)
+
+    async def test_postgresql_refused_debit_reports_balance(self):
+        session = AsyncMock()
+        session.bind = Mock()
+        session.bind.dialect.name = "postgresql"
+        session.execute.return_value = Mock(one=Mock(return_value=Mock(created_at=None, giver_balance=30)))
+
+        with pytest.raises(ConflictError, match="Insufficient balance: 30 < 50"):
+            await BytesOperations().create_transaction(
+                session, GUILD_ID, "giver", "Giver", "receiver", "Receiver", 50
+            )
+
+    async def test_new_giver_has_insufficient_balance(self, locking_session_maker):
+        assert not await transfer(locking_session_maker, "new_giver", "new_receiver", 1)
+
+    async def test_loaded_balances_are_refreshed(self, locking_session_maker):
+        """Balances already in the session reflect the transfer afterwards."""
+        await seed_balances(locking_session_maker, {"giver": 50, "receiver": 0})
+
+        async with locking_session_maker() as session:
+            giver = (await session.execute(
+                select(BytesBalance).where(BytesBalance.user_id == "giver")
+            )).scalar_one()
+            transaction = await BytesOperations().create_transaction(
+                session, GUILD_ID, "giver", "Giver", "receiver", "Receiver", 20
+            )
+            await session.commit()
+            await session.refresh(giver)
+
+            assert giver.balance == 30
+            assert transaction.id is not None
+            assert await session.get(BytesTransaction, transaction.id) is transaction
@@ -0,0 +1,143 @@
+"""Tests for running challenge generator scripts in worker processes."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+from smarter_dev.web.crud import ChallengeInputOperations
+from smarter_dev.web.script_runner import ScriptExecutionError, ScriptRunner
+
+GENERATOR = """
+import json
+import random
+random.seed(4)
+numbers = [random.randint(1, 100) for _ in range(5)]
+print(json.dumps({"input": " ".join(map(str, numbers)), "result": sum(numbers)}))
+"""
+
+
+@pytest.fixture
+async def runner():
+    runner = ScriptRunner(workers=2, wall_timeout=5.0, cpu_timeout=2.0, max_output=1000)
+    await runner.start()
+    yield runner
+    await runner.close()
+
+
+class TestScriptRunner:
+    """Test the worker pool and its limits."""
+
+    async def test_runs_script_and_returns_output(self, runner):
+        output = await runner.run(GENERATOR)
+
+        data = json.loads(output)
+        assert sum(map(int, data["input"].split())) == data["result"]
+        assert runner.get_stats()["runs"] == 1
+
+    async def test_concurrent_runs_keep_output_separate(self, runner):
+        scripts = [f"import time\ntime.sleep(0.05)\nprint({i})" for i in range(6)]
+
+        outputs = await asyncio.gather(*(runner.run(script) for script in scripts))
+
+        assert [output.strip() for output in outputs] == [str(i) for i in range(6)]
+        assert runner.queue_wait.count == 6
+
+    async def test_script_errors_are_reported(self, runner):
+        with pytest.raises(ScriptExecutionError, match="ZeroDivisionError"):
+            await runner.run("1 / 0")
+
+        # The worker is still usable afterwards
+        assert (await runner.run("print('ok')")).strip() == "ok"
+
+    async def test_output_is_capped(self, runner):
+        with pytest.raises(ScriptExecutionError, match="output exceeded"):
+            await runner.run("print('x' * 5000)")
+
+    async def test_wall_clock_timeout_replaces_worker(self):
+        runner = ScriptRunner(workers=1, wall_timeout=0.5, cpu_timeout=0)
+        try:
+            with pytest.raises(ScriptExecutionError, match="timed out"):
+                await runner.run("import time\ntime.sleep(30)")
+
+            assert runner.timeouts == 1
+            assert runner.worker_restarts == 1
+            assert (await runner.run("print('next')")).strip() == "next"
+        finally:
+            await runner.close()
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="RLIMIT_CPU enforcement differs by platform")
+    async def test_cpu_limit_kills_busy_script(self):
+        runner = ScriptRunner(workers=1, wall_timeout=20.0, cpu_timeout=1.0)
+        try:
+            with pytest.raises(ScriptExecutionError, match="exited"):
+                await runner.run("while True:\n    pass")
+
+            assert runner.timeouts == 0
+            assert (await runner.run("print('alive')")).strip() == "alive"
+        finally:
+            await runner.close()
+
+    async def test_workers_are_recycled(self):
+        runner = ScriptRunner(workers=1, max_runs_per_worker=2)
+        try:
+            for _ in range(3):
+                await runner.run("pass")
+
+            assert runner.worker_restarts == 1
+        finally:
+            await runner.close()
+
+    async def test_failed_replacement_keeps_the_slot(self, monkeypatch):
+        runner = ScriptRunner(workers=1, max_runs_per_worker=1)
+        try:
+            await runner.start()
+            spawn = runner._spawn
+
+            def failing_spawn():
+                raise ScriptExecutionError("Script worker failed to start")
+
+            monkeypatch.setattr(runner, "_spawn", failing_spawn)
+            with pytest.raises(ScriptExecutionError, match="failed to start"):
+                await runner.run("pass")
+            assert runner.get_stats()["idle_workers"] == 1
+
+            # The next run starts a worker for the empty slot
+            monkeypatch.setattr(runner, "_spawn", spawn)
+            output = await asyncio.wait_for(runner.run("print('back')"), timeout=30)
+            assert output.strip() == "back"
+        finally:
+            await runner.close()
+
+    async def test_prometheus_output(self, runner):
+        await runner.run("pass")
+
+        text = runner.render_prometheus("scripts")
+
+        assert "scripts_runs_total 1" in text
+        assert "scripts_execution_ms_count 1" in text
+
+
+class TestChallengeInputScripts:
+    """Test parsing generator output into challenge input."""
+
+    async def test_execute_script_parses_output(self, runner, monkeypatch):
+        monkeypatch.setattr("smarter_dev.web.crud.get_script_runner", lambda: runner)
+
+        input_data, result_data = await ChallengeInputOperations(session=None)._execute_script(GENERATOR)
+
+        assert sum(map(int, input_data.split())) == int(result_data)
+
+    @pytest.mark.parametrize("script, message", [
+        ("print('not json')", "not valid JSON"),
+        ("print('[1, 2]')", "JSON object"),
+        ("print('{\"input\": 1}')", "'input' and 'result'"),
+    ])
+    async def test_execute_script_rejects_bad_output(self, runner, monkeypatch, script, message):
+        monkeypatch.setattr("smarter_dev.web.crud.get_script_runner", lambda: runner)
+
+        with pytest.raises(ScriptExecutionError, match=message):
+            await ChallengeInputOperations(session=None)._execute_script(script)